@@ -0,0 +1,7 @@
+# api — service HTTP des CAT pour l'intégration DPI (aucune dépendance Streamlit)
+# Application ASGI brute (api.application), client en processus (api.client), lancement : python -m api
+
+from .application import ApplicationCAT, application
+from .client import ClientLocal, Reponse
+
+__all__ = ["ApplicationCAT", "application", "ClientLocal", "Reponse"]
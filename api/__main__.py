@@ -0,0 +1,33 @@
+# api/__main__.py — python -m api : sert l'application avec uvicorn (workers pré-forkés, keep-alive)
+# uvicorn n'est pas requis par l'application Streamlit : pip install -r requirements-api.txt
+
+import argparse
+import os
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m api", description="Service HTTP des CAT (ASGI).")
+    parser.add_argument("--hote", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="processus pré-forkés")
+    parser.add_argument("--keep-alive", type=int, default=30, help="secondes de keep-alive HTTP")
+    args = parser.parse_args()
+
+    try:
+        import uvicorn  # importé ici seulement : l'application elle-même n'en dépend pas
+    except ImportError:
+        raise SystemExit("uvicorn est requis pour servir l'API : pip install -r requirements-api.txt")
+
+    uvicorn.run(
+        "api.application:application",
+        host=args.hote,
+        port=args.port,
+        workers=args.workers,
+        timeout_keep_alive=args.keep_alive,
+        access_log=False,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
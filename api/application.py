@@ -0,0 +1,163 @@
+# api/application.py — service ASGI brut (sans framework) : un endpoint POST par fonction du moteur
+#   GET  /sante        → {"statut": "ok"}
+#   GET  /v1           → liste des endpoints et de leurs champs
+#   POST /v1/<nom>     → {"resultat": ...} ; 422 si le corps ne respecte pas la signature
+# Keep-alive, pool de workers pré-forkés : assurés par le serveur ASGI (cf. api/__main__.py).
+# Les fonctions du moteur sont appelées directement dans la boucle d'événements, sans run_in_executor :
+# un appel est du calcul pur, sans E/S, de l'ordre de quelques dizaines de µs (médiane ~25 µs, p99 ~60 µs),
+# moins que le coût d'un passage par un pool de threads.
+# Un endpoint qui ferait des E/S ou un calcul long devra être déporté (loop.run_in_executor).
+# Toute autre exception du moteur ou de la sérialisation → 500 au format d'erreur du service (tracée au journal).
+
+from importlib import import_module
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+import json
+import logging
+
+from .validation import ErreurValidation, Schema
+
+try:
+    import orjson  # dépendance optionnelle : sérialisation ~5× plus rapide
+except ImportError:
+    orjson = None
+
+TAILLE_MAX_CORPS = 64 * 1024
+
+journal = logging.getLogger(__name__)
+
+# nom d'endpoint → (spécialité, fonction appelée) ; plan_hbp expose la nouvelle signature nommée
+ENDPOINTS: Dict[str, Tuple[str, str]] = {
+    "plan_hbp": ("hbp", "_plan_hbp_core"),
+    "plan_prostate_localise": ("prostate", "plan_prostate_localise"),
+    "plan_prostate_recidive": ("prostate", "plan_prostate_recidive"),
+    "plan_prostate_metastatique": ("prostate", "plan_prostate_metastatique"),
+    "plan_rein_local": ("rein", "plan_rein_local"),
+    "plan_rein_meta": ("rein", "plan_rein_meta"),
+    "plan_rein_biopsy": ("rein", "plan_rein_biopsy"),
+    "calc_imdc": ("rein", "calc_imdc"),
+    "calc_mskcc": ("rein", "calc_mskcc"),
+    "stratifier_tvnim": ("vessie", "stratifier_tvnim"),
+    "plan_tvnim": ("vessie", "plan_tvnim"),
+    "plan_tvim": ("vessie", "plan_tvim"),
+    "plan_meta": ("vessie", "plan_meta"),
+    "stratifier_tves_risque": ("tves", "stratifier_tves_risque"),
+    "plan_tves_localise": ("tves", "plan_tves_localise"),
+    "plan_tves_metastatique": ("tves", "plan_tves_metastatique"),
+    "plan_lithiase": ("lithiase", "plan_lithiase"),
+    "plan_cystite": ("infectio", "plan_cystite"),
+    "plan_pna": ("infectio", "plan_pna"),
+    "plan_grossesse": ("infectio", "plan_grossesse"),
+    "plan_prostatite": ("infectio", "plan_prostatite"),
+}
+
+Envoi = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+def _natif(x: Any) -> Any:
+    # ResultatCAT / OptionCAT (moteur.resultat) → dict sérialisable
+    if hasattr(x, "vers_dict"):
+        return x.vers_dict()
+    raise TypeError(f"Type non sérialisable en JSON : {type(x).__name__}")
+
+
+def _json(x: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(x, default=_natif)
+    return json.dumps(x, ensure_ascii=False, separators=(",", ":"), default=_natif).encode("utf-8")
+
+
+class Endpoint:
+    def __init__(self, nom: str, specialite: str, attribut: str):
+        self.nom = nom
+        self.fonction = getattr(import_module(f"moteur.{specialite}"), attribut)
+        self.schema = Schema(self.fonction)
+
+    def __call__(self, corps: Any) -> Any:
+        return self.fonction(**self.schema.valider(corps))
+
+
+class ApplicationCAT:
+    """Application ASGI 3 ; les fonctions du moteur sont importées à la construction (worker chaud)."""
+
+    def __init__(self, noms: Optional[List[str]] = None, taille_max_corps: int = TAILLE_MAX_CORPS):
+        self.endpoints = {nom: Endpoint(nom, *ENDPOINTS[nom]) for nom in (noms or ENDPOINTS)}
+        self.taille_max_corps = taille_max_corps
+        self._catalogue = _json({"endpoints": [
+            {"chemin": f"/v1/{nom}", "methode": "POST", "champs": e.schema.decrire()}
+            for nom, e in self.endpoints.items()
+        ]})
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable[[], Awaitable[Dict[str, Any]]],
+                       send: Envoi) -> None:
+        if scope["type"] == "http":
+            await self._http(scope, receive, send)
+        elif scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+
+    async def _http(self, scope: Dict[str, Any], receive: Callable[[], Awaitable[Dict[str, Any]]],
+                    send: Envoi) -> None:
+        chemin, methode = scope["path"], scope["method"]
+        if chemin == "/sante":
+            return await _repondre(send, 200, b'{"statut":"ok"}')
+        if chemin in ("/v1", "/v1/"):
+            return await _repondre(send, 200, self._catalogue)
+        if not chemin.startswith("/v1/"):
+            return await _erreur(send, 404, "chemin inconnu")
+        endpoint = self.endpoints.get(chemin[4:])
+        if endpoint is None:
+            return await _erreur(send, 404, f"endpoint inconnu : {chemin[4:]}")
+        if methode != "POST":
+            return await _erreur(send, 405, "méthode non autorisée (POST attendu)", [(b"allow", b"POST")])
+
+        morceaux, taille = [], 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                return
+            morceau = message.get("body", b"")
+            taille += len(morceau)
+            if taille > self.taille_max_corps:
+                return await _erreur(send, 413, f"corps trop volumineux (max {self.taille_max_corps} octets)")
+            morceaux.append(morceau)
+            if not message.get("more_body", False):
+                break
+        try:
+            corps = json.loads(b"".join(morceaux) or b"{}")
+        except ValueError:
+            return await _erreur(send, 400, "JSON invalide")
+        try:
+            reponse = _json({"resultat": endpoint(corps)})
+        except ErreurValidation as e:
+            return await _erreur(send, 422, str(e), details=e.details)
+        except Exception:
+            journal.exception("Erreur interne sur %s", chemin)
+            return await _erreur(send, 500, "erreur interne")
+        await _repondre(send, 200, reponse)
+
+
+async def _repondre(send: Envoi, statut: int, corps: bytes,
+                    entetes: Optional[List[Tuple[bytes, bytes]]] = None) -> None:
+    await send({
+        "type": "http.response.start",
+        "status": statut,
+        "headers": [(b"content-type", b"application/json; charset=utf-8"),
+                    (b"content-length", str(len(corps)).encode("ascii")), *(entetes or [])],
+    })
+    await send({"type": "http.response.body", "body": corps})
+
+
+async def _erreur(send: Envoi, statut: int, message: str, entetes: Optional[List[Tuple[bytes, bytes]]] = None,
+                  details: Optional[List[Dict[str, str]]] = None) -> None:
+    corps: Dict[str, Any] = {"erreur": message}
+    if details:
+        corps["details"] = details
+    await _repondre(send, statut, _json(corps), entetes)
+
+
+application = ApplicationCAT()
@@ -0,0 +1,73 @@
+# api/client.py — client en processus : appelle l'application ASGI sans réseau (tests, intégration)
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+import asyncio
+import json
+
+
+@dataclass(frozen=True)
+class Reponse:
+    statut: int
+    entetes: Dict[str, str]
+    contenu: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.contenu)
+
+
+class ClientLocal:
+    """Exécute des requêtes sur une application ASGI dans une boucle d'événements dédiée."""
+
+    def __init__(self, app: Any = None):
+        if app is None:
+            from .application import application as app
+        self.app = app
+        self._boucle = asyncio.new_event_loop()
+
+    async def requete_async(self, methode: str, chemin: str, corps: bytes = b"") -> Reponse:
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": methode, "scheme": "http", "path": chemin, "raw_path": chemin.encode("ascii"),
+            "query_string": b"", "headers": [(b"content-type", b"application/json")],
+            "client": ("127.0.0.1", 0), "server": ("testserver", 80),
+        }
+        recu = False
+
+        async def receive() -> Dict[str, Any]:
+            nonlocal recu
+            if recu:
+                return {"type": "http.disconnect"}
+            recu = True
+            return {"type": "http.request", "body": corps, "more_body": False}
+
+        statut, entetes, morceaux = 500, {}, []
+
+        async def send(message: Dict[str, Any]) -> None:
+            nonlocal statut, entetes
+            if message["type"] == "http.response.start":
+                statut = message["status"]
+                entetes = {k.decode("latin-1"): v.decode("latin-1") for k, v in message.get("headers", [])}
+            elif message["type"] == "http.response.body":
+                morceaux.append(message.get("body", b""))
+
+        await self.app(scope, receive, send)
+        return Reponse(statut, entetes, b"".join(morceaux))
+
+    def requete(self, methode: str, chemin: str, corps: bytes = b"") -> Reponse:
+        return self._boucle.run_until_complete(self.requete_async(methode, chemin, corps))
+
+    def get(self, chemin: str) -> Reponse:
+        return self.requete("GET", chemin)
+
+    def post(self, chemin: str, donnees: Any) -> Reponse:
+        return self.requete("POST", chemin, json.dumps(donnees).encode("utf-8"))
+
+    def fermer(self) -> None:
+        self._boucle.close()
+
+    def __enter__(self) -> "ClientLocal":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.fermer()
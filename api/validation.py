@@ -0,0 +1,106 @@
+# api/validation.py — validation des corps JSON d'après la signature des fonctions du moteur
+# Le schéma est déduit une fois par fonction (inspect.signature + annotations) : pas de modèle à maintenir.
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, get_args, get_origin
+import inspect
+import types
+
+_VIDE = inspect.Parameter.empty
+
+
+def _types_acceptes(annotation: Any) -> Tuple[Optional[Tuple[type, ...]], bool]:
+    """(types JSON acceptés ou None = tout, None autorisé ?) pour une annotation."""
+    if annotation is _VIDE or annotation is Any:
+        return None, True
+    if get_origin(annotation) in (Union, types.UnionType):
+        membres = get_args(annotation)
+        nullable = type(None) in membres
+        acceptes: Tuple[type, ...] = ()
+        for m in membres:
+            if m is not type(None):
+                sous, _ = _types_acceptes(m)
+                if sous is None:
+                    return None, nullable
+                acceptes += sous
+        return acceptes, nullable
+    if annotation is float:
+        return (int, float), False  # 3 est un PSA valide
+    if isinstance(annotation, type):
+        return (annotation,), False
+    return None, True
+
+
+def _nom_type(types_: Tuple[type, ...]) -> str:
+    noms = {bool: "booléen", int: "entier", float: "nombre", str: "chaîne"}
+    if float in types_:
+        types_ = tuple(t for t in types_ if t is not int)  # un nombre englobe les entiers
+    return " | ".join(dict.fromkeys(noms.get(t, t.__name__) for t in types_))
+
+
+@dataclass(frozen=True)
+class Champ:
+    nom: str
+    types: Optional[Tuple[type, ...]]
+    nullable: bool
+    obligatoire: bool
+    defaut: Any = None
+
+    def verifier(self, valeur: Any) -> Optional[str]:
+        if valeur is None:
+            return None if self.nullable else "valeur nulle non autorisée"
+        if self.types is None:
+            return None
+        # bool est une sous-classe d'int : True n'est pas un âge valide
+        if isinstance(valeur, bool) and bool not in self.types:
+            return f"attendu : {_nom_type(self.types)}"
+        if not isinstance(valeur, self.types):
+            return f"attendu : {_nom_type(self.types)}"
+        return None
+
+    def decrire(self) -> Dict[str, Any]:
+        d = {"nom": self.nom, "type": _nom_type(self.types) if self.types else "libre",
+             "obligatoire": self.obligatoire}
+        if self.nullable:
+            d["nullable"] = True
+        if not self.obligatoire:
+            d["defaut"] = self.defaut
+        return d
+
+
+class ErreurValidation(ValueError):
+    def __init__(self, details: List[Dict[str, str]]):
+        super().__init__(f"{len(details)} erreur(s) de validation")
+        self.details = details
+
+
+class Schema:
+    """Champs attendus par une fonction, dans l'ordre de sa signature."""
+
+    def __init__(self, fonction: Callable[..., Any]):
+        self.champs: Dict[str, Champ] = {}
+        for nom, p in inspect.signature(fonction).parameters.items():
+            types_, nullable = _types_acceptes(p.annotation)
+            obligatoire = p.default is _VIDE
+            self.champs[nom] = Champ(nom, types_, nullable or (not obligatoire and p.default is None),
+                                     obligatoire, None if obligatoire else p.default)
+
+    def valider(self, corps: Any) -> Dict[str, Any]:
+        """Renvoie les kwargs à passer à la fonction ; lève ErreurValidation avec toutes les erreurs."""
+        if not isinstance(corps, dict):
+            raise ErreurValidation([{"champ": "", "erreur": "objet JSON attendu"}])
+        erreurs = [{"champ": nom, "erreur": "champ inconnu"} for nom in corps if nom not in self.champs]
+        for nom, champ in self.champs.items():
+            if nom not in corps:
+                if champ.obligatoire:
+                    erreurs.append({"champ": nom, "erreur": "champ obligatoire"})
+                continue
+            erreur = champ.verifier(corps[nom])
+            if erreur:
+                erreurs.append({"champ": nom, "erreur": erreur})
+        if erreurs:
+            raise ErreurValidation(erreurs)
+        return corps
+
+    def decrire(self) -> List[Dict[str, Any]]:
+        return [c.decrire() for c in self.champs.values()]
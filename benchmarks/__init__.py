@@ -0,0 +1,5 @@
+# benchmarks — mesures de performance du moteur et des rapports
+# Lancement : python -m benchmarks [-n 2000] [--enregistrer v1] [--comparer v1]
+# Chaque cas = une fonction + un profil de moteur.generateur (distributions réalistes, graine fixe).
+# Mesures : latence par appel (p50/p90/p99, perf_counter_ns), allocations (tracemalloc), débit.
+# Les références (baselines) sont des JSON dans benchmarks/baselines/ pour comparer deux versions.
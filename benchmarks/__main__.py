@@ -0,0 +1,103 @@
+# benchmarks/__main__.py — python -m benchmarks : mesure, enregistrement et comparaison aux références
+
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List
+import argparse
+import fnmatch
+import json
+import platform
+import sys
+
+from .cas import CAS
+from .mesure import mesurer
+
+DOSSIER_REFERENCES = Path(__file__).resolve().parent / "baselines"
+
+
+def _chemin_reference(nom: str) -> Path:
+    return DOSSIER_REFERENCES / f"{nom}.json"
+
+
+def executer(n: int, graine: int, filtres: List[str], cache: bool) -> Dict[str, Dict[str, float]]:
+    resultats = {}
+    for nom, cas in CAS.items():
+        if filtres and not any(fnmatch.fnmatch(nom, f) for f in filtres):
+            continue
+        resultats[nom] = mesurer(cas.fonction(cache), cas.entrees(n, graine))
+    return resultats
+
+
+def afficher(resultats: Dict[str, Dict[str, float]], reference: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'cas':28s} {'p50 µs':>9s} {'p90 µs':>9s} {'p99 µs':>9s} {'appels/s':>11s} {'Ko/appel':>9s}  vs réf. p50")
+    for nom, r in resultats.items():
+        ecart = ""
+        if nom in reference:
+            ecart = f"{(r['p50_ns'] / reference[nom]['p50_ns'] - 1) * 100:+6.1f} %"
+        print(f"{nom:28s} {r['p50_ns'] / 1e3:9.2f} {r['p90_ns'] / 1e3:9.2f} {r['p99_ns'] / 1e3:9.2f} "
+              f"{r['debit_par_s']:11,.0f} {r['octets_moyen'] / 1024:9.2f}  {ecart}")
+
+
+def regressions(resultats: Dict[str, Dict[str, float]], reference: Dict[str, Dict[str, float]],
+                tolerance: float) -> List[str]:
+    """Cas dont la médiane dépasse la référence de plus de `tolerance` (0.25 = +25 %)."""
+    return [
+        nom for nom, r in resultats.items()
+        if nom in reference and r["p50_ns"] > reference[nom]["p50_ns"] * (1 + tolerance)
+    ]
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmarks du moteur clinique.")
+    parser.add_argument("-n", type=int, default=2000, help="appels mesurés par cas")
+    parser.add_argument("--graine", type=int, default=0, help="graine des entrées synthétiques")
+    parser.add_argument("--filtre", action="append", default=[], help="motif de nom de cas (ex. 'plan_rein_*')")
+    parser.add_argument("--cache", action="store_true", help="mesurer les versions moteur.cache des plan_*")
+    parser.add_argument("--enregistrer", metavar="NOM", help="enregistre les résultats comme référence NOM")
+    parser.add_argument("--comparer", metavar="NOM", help="compare à la référence NOM (code retour 1 si régression)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="écart de p50 toléré (défaut 0.25 = +25 %%)")
+    parser.add_argument("--demarrage", action="store_true",
+                        help="rapport de démarrage à froid (-X importtime) au lieu des cas ; "
+                             "code retour 1 au-delà de DEMARRAGE_CIBLE_MS")
+    args = parser.parse_args(argv)
+
+    if args.demarrage:
+        from .demarrage import CIBLE_MS, depassements, rapport
+        lents = depassements(rapport())
+        if lents:
+            print(f"\nDémarrage au-delà de la cible ({CIBLE_MS:.0f} ms) : {', '.join(lents)}")
+            return 1
+        return 0
+
+    reference: Dict[str, Any] = {}
+    if args.comparer:
+        reference = json.loads(_chemin_reference(args.comparer).read_text(encoding="utf-8"))["resultats"]
+
+    resultats = executer(args.n, args.graine, args.filtre, args.cache)
+    afficher(resultats, reference)
+
+    if args.enregistrer:
+        DOSSIER_REFERENCES.mkdir(exist_ok=True)
+        contenu = {
+            "meta": {
+                "date": datetime.now().isoformat(timespec="seconds"),
+                "python": platform.python_version(),
+                "plateforme": platform.platform(),
+                "n": args.n, "graine": args.graine, "cache": args.cache,
+            },
+            "resultats": resultats,
+        }
+        _chemin_reference(args.enregistrer).write_text(json.dumps(contenu, indent=2, ensure_ascii=False), encoding="utf-8")
+        print(f"Référence enregistrée : {_chemin_reference(args.enregistrer)}")
+
+    if reference:
+        lentes = regressions(resultats, reference, args.tolerance)
+        if lentes:
+            print(f"Régressions (> +{args.tolerance:.0%} sur p50) : {', '.join(lentes)}")
+            return 1
+        print("Aucune régression.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,81 @@
+# benchmarks/cas.py — cas de mesure : fonction cible + profil de moteur.generateur
+
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from moteur.generateur import generer
+
+Entree = Tuple[Tuple[Any, ...], Dict[str, Any]]  # (args, kwargs)
+
+
+@dataclass(frozen=True)
+class Cas:
+    """Fonction mesurée (résolue à la demande, `module:nom`), profil d'entrées et adaptation éventuelle."""
+    cible: str
+    profil: str
+    preparer: Optional[Callable[[Dict[str, Any]], Entree]] = None  # défaut : l'enregistrement en kwargs
+
+    def fonction(self, cache: bool = False) -> Callable[..., Any]:
+        module, nom = self.cible.split(":")
+        if cache and nom.startswith("plan_"):
+            module = "moteur.cache"  # versions mémoïsées / tables précalculées
+        return getattr(import_module(module), nom)
+
+    def entrees(self, n: int, graine: int) -> List[Entree]:
+        preparer = self.preparer or (lambda e: ((), e))
+        return [preparer(e) for e in generer(self.profil, n, graine)]
+
+
+# ----- rapports : entrées = sorties réalistes du moteur -----
+
+def _sections(e: Dict[str, Any]) -> Dict[str, List[str]]:
+    from moteur import plan_hbp
+    plan = plan_hbp(**e)
+    return {
+        "Données": [f"{k}: {v}" for k, v in plan["donnees"]],
+        "Traitement (options)": plan["traitement"],
+        "Notes": plan["notes"],
+    }
+
+
+def _rapport_texte(e: Dict[str, Any]) -> Entree:
+    return ("CAT HBP", _sections(e)), {}
+
+
+def _kv_table(e: Dict[str, Any]) -> Entree:
+    from moteur import plan_hbp
+    return (plan_hbp(**e)["donnees"],), {}
+
+
+def _exports(e: Dict[str, Any]) -> Entree:
+    return ("CAT HBP", _sections(e), "CAT_HBP"), {}
+
+
+CAS: Dict[str, Cas] = {
+    "plan_hbp": Cas("moteur.hbp:plan_hbp", "hbp"),
+    "plan_prostate_localise": Cas("moteur.prostate:plan_prostate_localise", "prostate_localise"),
+    "plan_prostate_recidive": Cas("moteur.prostate:plan_prostate_recidive", "prostate_recidive"),
+    "plan_prostate_metastatique": Cas("moteur.prostate:plan_prostate_metastatique", "prostate_metastatique"),
+    "plan_rein_local": Cas("moteur.rein:plan_rein_local", "rein_local"),
+    "calc_imdc": Cas("moteur.rein:calc_imdc", "imdc"),
+    "calc_mskcc": Cas("moteur.rein:calc_mskcc", "mskcc"),
+    "plan_rein_meta": Cas("moteur.rein:plan_rein_meta", "rein_meta"),
+    "plan_rein_biopsy": Cas("moteur.rein:plan_rein_biopsy", "rein_biopsie"),
+    "stratifier_tvnim": Cas("moteur.vessie:stratifier_tvnim", "tvnim"),
+    "plan_tvnim": Cas("moteur.vessie:plan_tvnim", "tvnim_risque"),
+    "plan_tvim": Cas("moteur.vessie:plan_tvim", "tvim"),
+    "plan_meta": Cas("moteur.vessie:plan_meta", "vessie_meta"),
+    "stratifier_tves_risque": Cas("moteur.tves:stratifier_tves_risque", "tves"),
+    "plan_tves_localise": Cas("moteur.tves:plan_tves_localise", "tves_localise"),
+    "plan_tves_metastatique": Cas("moteur.tves:plan_tves_metastatique", "tves_metastatique"),
+    "plan_lithiase": Cas("moteur.lithiase:plan_lithiase", "lithiase"),
+    "plan_cystite": Cas("moteur.infectio:plan_cystite", "cystite"),
+    "plan_pna": Cas("moteur.infectio:plan_pna", "pna"),
+    "plan_grossesse": Cas("moteur.infectio:plan_grossesse", "grossesse"),
+    "plan_prostatite": Cas("moteur.infectio:plan_prostatite", "prostatite"),
+    "build_report_text": Cas("moteur.rapport:build_report_text", "hbp", _rapport_texte),
+    "kv_table_html": Cas("moteur.rapport:kv_table_html", "hbp", _kv_table),
+    "offer_exports": Cas("moteur.rapport:exports", "hbp", _exports),
+    "rapport_pdf": Cas("moteur.pdf:rapport_pdf", "hbp", _rapport_texte),
+}
@@ -0,0 +1,87 @@
+# benchmarks/demarrage.py — coût de démarrage à froid : `python -X importtime` par point d'entrée
+# Chaque mesure tourne dans un interpréteur neuf (rien en sys.modules) : c'est ce que paie un
+# déploiement mis à l'échelle zéro à chaque réveil. Bytecode déjà compilé (cf. .devcontainer).
+
+from dataclasses import dataclass
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Dict, List, Sequence
+import os
+import subprocess
+import sys
+
+RACINE = Path(__file__).resolve().parent.parent
+
+# point d'entrée → ce qu'il représente
+POINTS_ENTREE: Dict[str, str] = {
+    "moteur": "paquet moteur seul (imports paresseux)",
+    "moteur.cache": "moteur + versions mémoïsées",
+    "vues.accueil": "page d'accueil Streamlit (streamlit compris)",
+    "api.application": "service ASGI",
+}
+REPETITIONS = 3  # meilleur temps mur sur N interpréteurs neufs
+CIBLE_MS = float(os.getenv("DEMARRAGE_CIBLE_MS", "0"))  # 0 : pas de cible
+
+
+@dataclass(frozen=True)
+class Import:
+    module: str
+    niveau: int       # profondeur dans l'arbre d'imports (0 = importé directement)
+    propre_us: int
+    cumule_us: int
+
+
+def importtime(module: str) -> List[Import]:
+    """Lignes `-X importtime` de `import module` dans un interpréteur neuf (imports de site/.pth exclus)."""
+    sortie = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=RACINE, capture_output=True, text=True, check=True,
+    ).stderr
+    imports: List[Import] = []
+    for ligne in sortie.splitlines():
+        if not ligne.startswith("import time:") or "[us]" in ligne:
+            continue
+        propre, cumule, nom = ligne[len("import time:"):].split("|")
+        niveau = (len(nom) - len(nom.lstrip()) - 1) // 2
+        if niveau == 0 and nom.strip() == "site":
+            # `site` (et ses .pth) se termine avant le script : tout ce qui précède est payé même par `pass`
+            imports.clear()
+            continue
+        imports.append(Import(nom.strip(), niveau, int(propre), int(cumule)))
+    return imports
+
+
+def temps_mur_ms(module: str) -> float:
+    """Meilleur temps mur (ms) de `python -c "import module"`, interpréteur compris."""
+    meilleur = None
+    for _ in range(REPETITIONS):
+        t0 = perf_counter_ns()
+        subprocess.run([sys.executable, "-c", f"import {module}"], cwd=RACINE, check=True)
+        duree = (perf_counter_ns() - t0) / 1e6
+        meilleur = duree if meilleur is None else min(meilleur, duree)
+    return meilleur
+
+
+def rapport(points: Sequence[str] = tuple(POINTS_ENTREE), top: int = 10) -> Dict[str, Dict[str, float]]:
+    """Affiche, par point d'entrée, le temps d'import, le temps mur et les modules les plus coûteux."""
+    vide = temps_mur_ms("sys")  # interpréteur nu : soustrait pour isoler le coût des imports
+    resultats = {}
+    for point in points:
+        imports = importtime(point)
+        total_us = sum(i.cumule_us for i in imports if i.niveau == 0)
+        mur = temps_mur_ms(point)
+        resultats[point] = {"imports_ms": total_us / 1e3, "mur_ms": mur, "mur_net_ms": mur - vide,
+                            "modules": len(imports)}
+        print(f"\n{point} — {POINTS_ENTREE.get(point, '')}")
+        print(f"  imports {total_us / 1e3:8.1f} ms   temps mur {mur:8.1f} ms (net {mur - vide:.1f} ms)   "
+              f"{len(imports)} modules")
+        for i in sorted(imports, key=lambda i: -i.propre_us)[:top]:
+            print(f"    {i.propre_us / 1e3:7.2f} ms propre  {i.cumule_us / 1e3:8.2f} ms cumulé  {i.module}")
+    return resultats
+
+
+def depassements(resultats: Dict[str, Dict[str, float]], cible_ms: float = CIBLE_MS) -> List[str]:
+    """Points d'entrée dont le temps mur dépasse la cible de démarrage à froid (aucun si cible nulle)."""
+    if not cible_ms:
+        return []
+    return [point for point, r in resultats.items() if r["mur_ms"] > cible_ms]
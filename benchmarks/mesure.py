@@ -0,0 +1,62 @@
+# benchmarks/mesure.py — chronométrage, allocations et débit d'un cas
+
+from statistics import mean, quantiles
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List
+import gc
+import tracemalloc
+
+from .cas import Entree
+
+ECHAUFFEMENT = 50      # appels non mesurés (imports, tables, caches CPU)
+ECHANTILLON_MEMOIRE = 200  # appels rejoués sous tracemalloc (très lent : sous-échantillon)
+
+
+def _chronometrer(fonction: Callable[..., Any], entrees: List[Entree]) -> List[int]:
+    durees = []
+    horloge = perf_counter_ns
+    for args, kwargs in entrees:
+        t0 = horloge()
+        fonction(*args, **kwargs)
+        durees.append(horloge() - t0)
+    return durees
+
+
+def _allocations(fonction: Callable[..., Any], entrees: List[Entree]) -> Dict[str, float]:
+    # pic mémoire par appel (octets alloués au-delà de l'état initial), tracemalloc isolé du chronométrage
+    pics = []
+    tracemalloc.start()
+    try:
+        for args, kwargs in entrees[:ECHANTILLON_MEMOIRE]:
+            tracemalloc.reset_peak()
+            avant = tracemalloc.get_traced_memory()[0]
+            fonction(*args, **kwargs)
+            pics.append(tracemalloc.get_traced_memory()[1] - avant)
+    finally:
+        tracemalloc.stop()
+    return {"octets_moyen": mean(pics), "octets_max": max(pics)}
+
+
+def mesurer(fonction: Callable[..., Any], entrees: List[Entree]) -> Dict[str, float]:
+    """Latence (ns : moyenne, p50, p90, p99), débit (appels/s) et pic d'allocation par appel."""
+    for args, kwargs in entrees[:ECHAUFFEMENT]:
+        fonction(*args, **kwargs)
+    gc_actif = gc.isenabled()
+    gc.disable()  # pas de pause GC au milieu d'une mesure
+    try:
+        t0 = perf_counter_ns()
+        durees = _chronometrer(fonction, entrees)
+        total = perf_counter_ns() - t0
+    finally:
+        if gc_actif:
+            gc.enable()
+    centiles = quantiles(durees, n=100, method="inclusive")
+    return {
+        "n": len(durees),
+        "moyenne_ns": mean(durees),
+        "p50_ns": centiles[49],
+        "p90_ns": centiles[89],
+        "p99_ns": centiles[98],
+        "debit_par_s": len(durees) / (total / 1e9),
+        **_allocations(fonction, entrees),
+    }
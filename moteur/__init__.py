@@ -0,0 +1,43 @@
+# moteur — logique clinique pure (aucune dépendance Streamlit)
+# Importable depuis les workers batch / serveurs d'API sans charger l'UI.
+# L'application Streamlit (app2.py) ne fait que l'afficher.
+# Chargement paresseux par spécialité (PEP 562) : `from moteur import plan_cystite` n'importe
+# que moteur.infectio ; les sous-modules restent ensuite dans sys.modules d'un rerun à l'autre.
+
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+from .commun import _to_bool, _norm
+
+_SPECIALITES: Dict[str, Tuple[str, ...]] = {
+    "hbp": ("classer_ipss", "eval_suspicion_adk", "plan_hbp", "sections_hbp"),
+    "prostate": (
+        "ClinicalT", "NStage", "MStage", "GradeGroup", "PatientPCa",
+        "normalize_cT", "ct_rank", "prostate_risk_damico",
+        "DAMICO_LOCALISE_FORM_SCHEMA", "damico_localise_from_inputs",
+        "plan_prostate_localise", "sections_prostate_localise", "detect_recurrence", "plan_prostate_recidive",
+        "plan_prostate_metastatique", "recommend_from_patient",
+    ),
+    "rein": ("plan_rein_local", "sections_rein_local", "calc_imdc", "calc_mskcc", "plan_rein_meta", "plan_rein_biopsy"),
+    "vessie": ("stratifier_tvnim", "plan_tvnim", "donnees_tvnim", "sections_tvnim", "plan_tvim", "plan_meta"),
+    "tves": ("stratifier_tves_risque", "plan_tves_localise", "sections_tves_localise", "plan_tves_metastatique"),
+    "lithiase": ("classer_cn_severite", "choix_technique_selon_calcul", "plan_lithiase", "sections_lithiase"),
+    "infectio": ("plan_cystite", "plan_pna", "plan_grossesse", "plan_prostatite", "sections_infectio"),
+    "cohorte": ("CohortePCa", "recommend_from_cohort"),
+    "resultat": ("ResultatCAT", "OptionCAT"),
+}
+_ORIGINE = {nom: specialite for specialite, noms in _SPECIALITES.items() for nom in noms}
+
+__all__ = [nom for noms in _SPECIALITES.values() for nom in noms]
+
+
+def __getattr__(nom: str) -> Any:
+    specialite = _ORIGINE.get(nom)
+    if specialite is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    valeur = globals()[nom] = getattr(import_module(f".{specialite}", __name__), nom)
+    return valeur
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
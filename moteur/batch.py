@@ -0,0 +1,323 @@
+# moteur/batch.py — évaluation par lots des CAT sur des cohortes tabulaires
+# Entrée : DataFrame pandas (ou fichier CSV/JSONL/Parquet lu par morceaux, cf. moteur.generateur).
+# Sortie : DataFrame {categorie, options, notes} aligné sur l'index d'entrée.
+# Les fichiers sont traités morceau par morceau : un million de lignes ne tient jamais en mémoire d'un bloc.
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+import json
+import math
+
+import pandas as pd
+
+from .commun import _to_bool
+from .hbp import plan_hbp, eval_suspicion_adk, classer_ipss
+from .prostate import plan_prostate_localise, normalize_cT
+from .rein import plan_rein_local
+from .tves import plan_tves_localise
+from .vessie import stratifier_tvnim, plan_tvnim
+from .lithiase import plan_lithiase, classer_cn_severite
+from .infectio import plan_cystite, plan_pna
+
+COLONNES_RESULTAT = ["categorie", "options", "notes"]
+TAILLE_MORCEAU = 50_000
+PROFILS_MAX = 100_000  # profils distincts gardés d'un morceau à l'autre (au-delà : table vidée)
+
+# =========================
+# Adaptateurs par module : entrées nommées → (catégorie, options, notes)
+# =========================
+
+def _lot_hbp(**e) -> Tuple[str, List[str], List[str]]:
+    plan = plan_hbp(**e)
+    suspect_adk, _, _ = eval_suspicion_adk(e["psa_total"], e["volume_ml"], e["tr_suspect"])
+    categorie = "Orientation ADK" if suspect_adk else f"HBP — SBAU {classer_ipss(e['ipss'])}"
+    return categorie, plan["traitement"], plan["notes"]
+
+
+def _lot_prostate_localise(**e):
+    plan = plan_prostate_localise(**e)
+    return plan["risque"], [f"{o['label']} : {o['details']}" for o in plan["options"]], plan["notes"]
+
+
+def _lot_rein_local(**e):
+    plan = plan_rein_local(**e)
+    return e["cT"], plan["traitement"], plan["notes"]
+
+
+def _lot_tves_localise(**e):
+    plan = plan_tves_localise(**e)
+    return plan["stratification"][0][1], plan["traitement"], plan["notes"]
+
+
+def _lot_tvnim(**e):
+    risque = stratifier_tvnim(**e)
+    traitement, suivi, protocoles, notes_second_look = plan_tvnim(risque)
+    return risque, traitement + protocoles, notes_second_look
+
+
+def _lot_lithiase(**e):
+    plan = plan_lithiase(**e)
+    severite = classer_cn_severite(e["fievre"], e["hyperalgique"], e["oligoanurie"], e["doute_diag"])
+    return severite, plan["traitement"], plan["notes"]
+
+
+def _lot_cystite(**e):
+    plan = plan_cystite(**e)
+    return plan["classification"][0][1], plan["traitement"], plan["notes"]
+
+
+def _lot_pna(**e):
+    plan = plan_pna(**e)
+    return plan["classification"][0][1], plan["traitement"], plan["notes"]
+
+
+@dataclass(frozen=True)
+class ModuleLot:
+    """Description d'un module évaluable en lot : colonnes attendues et adaptateur."""
+    evaluer: Callable[..., Tuple[str, List[str], List[str]]]
+    colonnes: Tuple[str, ...]
+    booleens: FrozenSet[str] = frozenset()
+    defauts: Dict[str, Any] = field(default_factory=dict)  # colonnes facultatives → valeur par défaut
+    canoniseurs: Dict[str, Callable[[Any], Any]] = field(default_factory=dict)  # colonne → forme canonique
+    entiers: FrozenSet[str] = frozenset()  # colonnes entières (int rendu valeur par valeur, cf. _entier)
+
+
+_INFECTIO_RISQUE = (
+    "homme", "grossesse", "age_ge65_fragile", "anomalies_uro", "immunodep",
+    "irc_significative", "sonde", "diabete_non_controle",
+)
+
+MODULES_LOT: Dict[str, ModuleLot] = {
+    "hbp": ModuleLot(
+        _lot_hbp,
+        ("age", "volume_ml", "ipss", "psa_total", "tr_suspect", "anticoag", "ci_chirurgie", "refus_chir",
+         "infections_recid", "retention", "calculs", "hematurie_recid", "ir_post_obstacle", "echec_medical",
+         "stockage_predominant", "rpm_ml", "dysfonction_erectile"),
+        frozenset({"tr_suspect", "anticoag", "ci_chirurgie", "refus_chir", "infections_recid", "retention",
+                   "calculs", "hematurie_recid", "ir_post_obstacle", "echec_medical",
+                   "stockage_predominant", "dysfonction_erectile"}),
+        {"stockage_predominant": False, "rpm_ml": None, "dysfonction_erectile": False},
+        entiers=frozenset({"age", "volume_ml", "ipss", "rpm_ml"}),
+    ),
+    "prostate_localise": ModuleLot(
+        _lot_prostate_localise,
+        ("psa", "isup", "cT", "esperance_vie_ans"),
+        canoniseurs={"cT": normalize_cT},  # libellé canonique dès l'ingestion : rang cT lu en table par le moteur
+        entiers=frozenset({"isup", "esperance_vie_ans"}),
+    ),
+    "rein_local": ModuleLot(
+        _lot_rein_local,
+        ("cT", "cN_pos", "thrombus", "rein_unique_ou_CKD", "tumeur_hilaire", "exophytique",
+         "age", "haut_risque_op", "biopsie_dispo"),
+        frozenset({"cN_pos", "rein_unique_ou_CKD", "tumeur_hilaire", "exophytique", "haut_risque_op", "biopsie_dispo"}),
+        {"thrombus": "Aucun"},
+        entiers=frozenset({"age"}),
+    ),
+    "tves_localise": ModuleLot(
+        _lot_tves_localise,
+        ("grade_biopsie", "cytologie_hg_positive", "taille_cm", "multifocal", "invasion_imagerie", "hydron",
+         "kss_faisable", "accepte_suivi_strict", "localisation"),
+        frozenset({"cytologie_hg_positive", "multifocal", "invasion_imagerie", "hydron", "kss_faisable",
+                   "accepte_suivi_strict"}),
+    ),
+    "tvnim": ModuleLot(
+        _lot_tvnim,
+        ("stade", "grade", "taille_mm", "nombre", "cis_associe", "lvi", "urethre_prostatique", "formes_agressives"),
+        frozenset({"cis_associe", "lvi", "urethre_prostatique", "formes_agressives"}),
+        {"cis_associe": False, "lvi": False, "urethre_prostatique": False, "formes_agressives": False},
+        entiers=frozenset({"taille_mm"}),
+    ),
+    "lithiase": ModuleLot(
+        _lot_lithiase,
+        ("fievre", "hyperalgique", "oligoanurie", "doute_diag", "grossesse", "anticoag",
+         "localisation", "taille_mm", "douleur_actuelle"),
+        frozenset({"fievre", "hyperalgique", "oligoanurie", "doute_diag", "grossesse", "anticoag", "douleur_actuelle"}),
+        {"taille_mm": None},
+        entiers=frozenset({"taille_mm"}),
+    ),
+    "cystite": ModuleLot(
+        _lot_cystite,
+        ("age", "fievre_ge_38_5", "lombalgies", "douleurs_intenses", "hematurie", "recidivante")
+        + _INFECTIO_RISQUE + ("seps_sbp_lt90", "seps_hr_gt120", "confusion", "vomissements"),
+        frozenset({"fievre_ge_38_5", "lombalgies", "douleurs_intenses", "hematurie", "recidivante",
+                   "seps_sbp_lt90", "seps_hr_gt120", "confusion", "vomissements"}) | frozenset(_INFECTIO_RISQUE),
+        entiers=frozenset({"age"}),
+    ),
+    "pna": ModuleLot(
+        _lot_pna,
+        ("fievre_ge_38_5", "douleur_lombaire", "vomissements") + _INFECTIO_RISQUE
+        + ("seps_sbp_lt90", "seps_hr_gt120", "confusion"),
+        frozenset({"fievre_ge_38_5", "douleur_lombaire", "vomissements",
+                   "seps_sbp_lt90", "seps_hr_gt120", "confusion"}) | frozenset(_INFECTIO_RISQUE),
+    ),
+}
+
+
+def _module_lot(module: str) -> ModuleLot:
+    try:
+        return MODULES_LOT[module]
+    except KeyError:
+        raise ValueError(f"Module inconnu pour l'évaluation en lot : {module!r} (attendu : {', '.join(MODULES_LOT)}).")
+
+
+def _manquant(v: Any) -> bool:
+    return v is None or (isinstance(v, float) and math.isnan(v))
+
+
+def _entier(v: Any) -> Any:
+    # colonne entière mêlée de vides : pandas la lit en float64 (69 → 69.0, affiché « 69.0 mL »)
+    return int(v) if isinstance(v, float) and v.is_integer() else v
+
+
+def _colonne(df: pd.DataFrame, nom: str, spec: ModuleLot) -> List[Any]:
+    """Extrait une colonne en scalaires Python (pas de numpy.int64), booléens via _to_bool, libellés canonisés."""
+    if nom not in df.columns:
+        if nom not in spec.defauts:
+            raise ValueError(f"Colonne obligatoire absente : {nom!r}.")
+        return [spec.defauts[nom]] * len(df)
+    valeurs = df[nom].tolist()
+    if nom in spec.booleens:
+        defaut = spec.defauts.get(nom, False)
+        return [defaut if _manquant(v) else _to_bool(v) for v in valeurs]
+    if nom in spec.entiers:
+        valeurs = [_entier(v) for v in valeurs]  # NaN laissé tel quel : remplacé par le défaut ci-dessous
+    if nom in spec.canoniseurs:
+        canon = spec.canoniseurs[nom]
+        return [canon(v) for v in valeurs]
+    if nom in spec.defauts:
+        defaut = spec.defauts[nom]
+        return [defaut if _manquant(v) else v for v in valeurs]
+    return valeurs
+
+
+# =========================
+# API publique
+# =========================
+
+def enregistrements(df: pd.DataFrame, module: str) -> Iterator[Dict[str, Any]]:
+    """Lignes de `df` en entrées nommées normalisées (booléens, défauts) pour le module demandé."""
+    spec = _module_lot(module)
+    colonnes = [_colonne(df, nom, spec) for nom in spec.colonnes]
+    for valeurs in zip(*colonnes):
+        yield dict(zip(spec.colonnes, valeurs))
+
+
+Profils = Dict[Any, Tuple[str, List[str], List[str]]]
+
+
+def evaluer_lot(df: pd.DataFrame, module: str, profils: Optional[Profils] = None) -> pd.DataFrame:
+    """
+    Évalue chaque ligne de `df` avec le module demandé ; renvoie {categorie, options, notes} (même index).
+    Chaque profil d'entrées normalisées distinct n'est évalué qu'une fois : les lignes qui le partagent
+    reçoivent les mêmes objets (listes d'options/notes partagées, à ne pas modifier en place).
+    `profils` : table partagée entre morceaux d'un même module ; attrs["profils_distincts"] : appels au moteur.
+    """
+    spec = _module_lot(module)
+    colonnes = [_colonne(df, nom, spec) for nom in spec.colonnes]
+    if profils is None:
+        profils = {}
+    lignes: List[Tuple[str, List[str], List[str]]] = []
+    appels = 0
+    for valeurs in zip(*colonnes):
+        cle = (valeurs, tuple(map(type, valeurs)))  # 2 et 2.0 s'affichent différemment : le type compte
+        try:
+            resultat = profils.get(cle)
+        except TypeError:  # valeur non hachable (liste JSONL…) : ligne évaluée seule
+            cle, resultat = None, None
+        if resultat is None:
+            resultat = spec.evaluer(**dict(zip(spec.colonnes, valeurs)))
+            appels += 1
+            if cle is not None:
+                profils[cle] = resultat
+        lignes.append(resultat)
+    categories, options, notes = (list(c) for c in zip(*lignes)) if lignes else ([], [], [])
+    res = pd.DataFrame(dict(zip(COLONNES_RESULTAT, (categories, options, notes))), index=df.index)
+    res.attrs["profils_distincts"] = appels
+    return res
+
+
+def evaluer_par_morceaux(morceaux: Iterable[pd.DataFrame], module: str) -> Iterator[pd.DataFrame]:
+    """Version flux : un DataFrame de résultats par morceau d'entrée (mémoire bornée par la taille d'un morceau)."""
+    _module_lot(module)
+    profils: Profils = {}
+    for morceau in morceaux:
+        if len(profils) > PROFILS_MAX:
+            profils.clear()
+        yield evaluer_lot(morceau, module, profils)
+
+
+def _est_parquet(chemin: str) -> bool:
+    return str(chemin).lower().endswith((".parquet", ".pq"))
+
+
+def lire_morceaux(chemin: str, taille: int = TAILLE_MORCEAU) -> Iterator[pd.DataFrame]:
+    """Lit un CSV, un JSONL (une ligne = un patient) ou un Parquet par morceaux de `taille` lignes."""
+    if _est_parquet(chemin):
+        import pyarrow.parquet as pq  # dépendance optionnelle (Parquet uniquement)
+        for lot in pq.ParquetFile(chemin).iter_batches(batch_size=taille):
+            yield lot.to_pandas()
+    elif str(chemin).lower().endswith((".jsonl", ".ndjson")):
+        with pd.read_json(chemin, lines=True, chunksize=taille, dtype=False) as lecteur:
+            yield from lecteur
+    else:
+        yield from pd.read_csv(chemin, chunksize=taille)
+
+
+def _json_partage(valeurs: Iterable[Any]) -> List[str]:
+    # listes partagées entre lignes d'un même profil (evaluer_lot) : une sérialisation par objet
+    textes: Dict[int, str] = {}
+    sortie = []
+    for v in valeurs:
+        t = textes.get(id(v))
+        if t is None:
+            t = textes[id(v)] = json.dumps(v, ensure_ascii=False)
+        sortie.append(t)
+    return sortie
+
+
+def evaluer_fichier(entree: str, sortie: str, module: str, taille: int = TAILLE_MORCEAU) -> int:
+    """
+    Évalue un fichier de cohorte complet en flux et écrit les résultats (CSV ou Parquet selon l'extension).
+    Les colonnes d'entrée sont recopiées devant les colonnes de résultat. Retourne le nombre de lignes traitées.
+    En CSV, `options` et `notes` sont sérialisées en JSON.
+    """
+    n = 0
+    writer = None
+    profils: Profils = {}
+    try:
+        for morceau in lire_morceaux(entree, taille):
+            if len(profils) > PROFILS_MAX:
+                profils.clear()
+            res = pd.concat([morceau, evaluer_lot(morceau, module, profils)], axis=1)
+            if _est_parquet(sortie):
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(res, preserve_index=False)
+                if writer is None:
+                    # listes de chaînes explicites : un premier morceau sans note serait typé list<null>
+                    schema = table.schema
+                    for col in ("options", "notes"):
+                        schema = schema.set(schema.get_field_index(col), pa.field(col, pa.list_(pa.string())))
+                    writer = pq.ParquetWriter(sortie, schema)
+                writer.write_table(table.cast(writer.schema))
+            else:
+                for col in ("options", "notes"):
+                    res[col] = _json_partage(res[col])
+                res.to_csv(sortie, mode="w" if n == 0 else "a", header=(n == 0), index=False)
+            n += len(morceau)
+    finally:
+        if writer is not None:
+            writer.close()
+    return n
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Évaluation par lots des CAT (CSV/JSONL/Parquet → CSV/Parquet).")
+    parser.add_argument("module", choices=sorted(MODULES_LOT))
+    parser.add_argument("entree")
+    parser.add_argument("sortie")
+    parser.add_argument("--taille", type=int, default=TAILLE_MORCEAU, help="lignes par morceau")
+    args = parser.parse_args()
+    print(f"{evaluer_fichier(args.entree, args.sortie, args.module, args.taille)} lignes évaluées.")
@@ -0,0 +1,170 @@
+# moteur/cache.py — mémoïsation LRU bornée devant toutes les fonctions plan_*
+# Clé = arguments normalisés (booléens Oui/Non via _to_bool, cT via normalize_cT) ;
+# les résultats sont figés (lecture seule) pour que le rendu ne puisse pas modifier une entrée partagée.
+# Les modules à entrées finies passent par les tables précalculées (moteur.tables), déjà O(1).
+# Versions mémoïsées créées au premier accès : une page n'importe que la spécialité qu'elle affiche.
+
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union, get_args, get_origin
+from importlib import import_module
+import inspect
+import os
+import threading
+
+from .commun import _to_bool, figer, lieur
+from . import tables as _tables
+
+TAILLE_MAX = int(os.getenv("MOTEUR_CACHE_TAILLE", "1024"))
+
+
+class CacheLRU:
+    """Cache LRU borné, partagé entre sessions (thread-safe), avec compteurs hits/misses/évictions."""
+
+    def __init__(self, taille_max: int = TAILLE_MAX):
+        self.taille_max = taille_max
+        self._donnees: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._verrou = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def obtenir(self, cle: Hashable, calcul: Callable[[], Any]) -> Any:
+        with self._verrou:
+            try:
+                valeur = self._donnees[cle]  # un seul hachage de la clé en cas de hit (+ move_to_end)
+            except KeyError:
+                self.misses += 1
+            else:
+                self._donnees.move_to_end(cle)
+                self.hits += 1
+                return valeur
+        valeur = figer(calcul())  # hors verrou : deux sessions peuvent calculer en parallèle
+        with self._verrou:
+            self._donnees[cle] = valeur
+            self._donnees.move_to_end(cle)
+            while len(self._donnees) > self.taille_max:
+                self._donnees.popitem(last=False)
+                self.evictions += 1
+        return valeur
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "taille": len(self._donnees),
+            "taille_max": self.taille_max,
+            "taux_hit": (self.hits / total) if total else 0.0,
+        }
+
+    def vider(self) -> None:
+        with self._verrou:
+            self._donnees.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+CACHE_PLANS = CacheLRU()
+
+
+def _cle_typee(v: Any) -> Any:
+    # 2 et 2.0 s'affichent différemment dans les "donnees" : le type fait partie de la clé
+    return (type(v), v)
+
+
+def _normaliseur_annotation(annotation: Any) -> Callable[[Any], Any]:
+    if annotation is bool:
+        return bool  # les plan_* testent la vérité Python (`if x`, "Oui" if x)
+    if get_origin(annotation) is Union and {bool, str} <= set(get_args(annotation)):
+        return _to_bool  # paramètres Oui/Non normalisés par la fonction elle-même
+    return _cle_typee
+
+
+def memoiser(fonction: Callable[..., Any], *, normaliseurs: Optional[Dict[str, Callable[[Any], Any]]] = None,
+             cache: CacheLRU = CACHE_PLANS) -> Callable[..., Any]:
+    """Enveloppe `fonction` derrière `cache` ; `normaliseurs` surcharge la normalisation déduite des annotations."""
+    sig = inspect.signature(fonction)
+    normaliseurs = normaliseurs or {}
+    norm = tuple(
+        normaliseurs.get(nom) or _normaliseur_annotation(p.annotation)
+        for nom, p in sig.parameters.items()
+    )
+    lier = lieur(sig)
+    nom_fonction = fonction.__qualname__
+
+    @wraps(fonction)
+    def enveloppe(*args: Any, **kwargs: Any) -> Any:
+        valeurs = lier(args, kwargs)
+        try:
+            cle = (nom_fonction, *[n(v) for n, v in zip(norm, valeurs)])
+            hash(cle)
+        except TypeError:  # argument non hachable : pas de cache
+            return figer(fonction(*args, **kwargs))
+        return cache.obtenir(cle, lambda: fonction(*args, **kwargs))
+
+    enveloppe.cache = cache
+    return enveloppe
+
+
+def stats() -> Dict[str, Any]:
+    return CACHE_PLANS.stats()
+
+
+# =========================
+# Versions mémoïsées de tous les plan_* (créées au premier accès)
+# =========================
+
+# nom → (spécialité, normaliseurs {paramètre: fonction de la spécialité})
+PLANS_MEMOISES: Dict[str, Tuple[str, Dict[str, str]]] = {
+    "plan_prostate_localise": ("prostate", {"cT": "normalize_cT"}),
+    "plan_prostate_recidive": ("prostate", {}),
+    "plan_rein_local": ("rein", {}),
+    "plan_rein_meta": ("rein", {}),
+    "plan_tvnim": ("vessie", {}),
+    "plan_tves_localise": ("tves", {}),
+    "plan_lithiase": ("lithiase", {}),
+    "plan_cystite": ("infectio", {}),
+    "plan_pna": ("infectio", {}),
+    "plan_grossesse": ("infectio", {}),
+}
+
+
+def _plan_hbp_memoise() -> Callable[..., Any]:
+    hbp = import_module(".hbp", __package__)
+    coeur = memoiser(hbp._plan_hbp_core)
+
+    def plan_hbp(*args, **kwargs):
+        return coeur(**hbp._args_hbp(*args, **kwargs))  # anciennes et nouvelles signatures → même clé
+
+    plan_hbp.__doc__ = hbp.plan_hbp.__doc__
+    return plan_hbp
+
+
+def _creer(nom: str) -> Callable[..., Any]:
+    if nom == "plan_hbp":
+        return _plan_hbp_memoise()
+    if nom in _tables.DEFINITIONS:
+        return _tables.table(nom)  # déjà O(1), pas de cache LRU devant
+    specialite, normaliseurs = PLANS_MEMOISES[nom]
+    module = import_module(f".{specialite}", __package__)
+    return memoiser(getattr(module, nom), normaliseurs={p: getattr(module, f) for p, f in normaliseurs.items()})
+
+
+def __getattr__(nom: str) -> Callable[..., Any]:
+    # PEP 562 : `from moteur.cache import plan_tvnim` n'importe que moteur.vessie
+    if nom == "plan_hbp" or nom in PLANS_MEMOISES or nom in _tables.DEFINITIONS:
+        fonction = globals()[nom] = _creer(nom)
+        return fonction
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+
+__all__ = [
+    "CacheLRU", "CACHE_PLANS", "memoiser", "stats",
+    "plan_hbp", "plan_prostate_localise", "plan_prostate_recidive", "plan_prostate_metastatique",
+    "plan_rein_local", "plan_rein_meta", "plan_rein_biopsy",
+    "plan_tvnim", "plan_tvim", "plan_meta",
+    "plan_tves_localise", "plan_tves_metastatique",
+    "plan_lithiase",
+    "plan_cystite", "plan_pna", "plan_grossesse", "plan_prostatite",
+]
@@ -0,0 +1,229 @@
+# moteur/cohorte.py — cohorte prostate en colonnes (struct-of-arrays) pour les registres
+# Un PatientPCa par homme coûte un objet, quatorze attributs et un dict `preferences` ; ici chaque
+# champ utile au triage est un tableau NumPy (énumérations stockées en petits entiers), soit 22 octets
+# par patient. recommend_from_cohort calcule en une passe le contexte (localisé / métastatique) et le
+# groupe de D'Amico de chaque ligne, sans créer d'objet Python par patient.
+
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import numpy as np
+
+from .prostate import (_CT_ORDER, ClinicalT, GradeGroup, MStage, NStage, PatientPCa,
+                       ct_rank, normalize_cT)
+from .vectorise import damico_code_vect
+
+# Codes : position dans l'énumération (ordre de déclaration)
+_T = tuple(ClinicalT)
+_N = tuple(NStage)
+_M = tuple(MStage)
+_RANG_T = np.array([_CT_ORDER[t.value] for t in _T] + [999], dtype=np.int16)  # code -1 : cT inconnu (rang 999 comme le scalaire)
+_CODE_T = {t.value: i for i, t in enumerate(_T)}
+_M1 = np.array([i for i, m in enumerate(_M) if m.value.startswith("M1")], dtype=np.int8)
+
+SETTINGS = np.array(["localise", "recidive", "metastatique"], dtype=object)
+LOCALISE, RECIDIVE, METASTATIQUE = range(3)
+RISQUES = np.array(["faible", "intermédiaire", "élevé", None], dtype=object)  # code -1 : sans objet (hors localisé)
+SEUIL_PSAD = 0.15  # même seuil que le triage ADK de moteur.hbp
+
+
+# =========================
+# Encodage des colonnes
+# =========================
+
+def _manquant(x: Any) -> bool:
+    return x is None or (isinstance(x, float) and x != x)
+
+
+def _valeur(x: Any) -> Any:
+    return x.value if isinstance(x, Enum) else x
+
+
+def _code_t(x: Any) -> int:
+    if _manquant(x):
+        return -1
+    return _CODE_T.get(normalize_cT(str(_valeur(x))), -1)
+
+
+def _code_stade(membres: tuple, inconnu: Enum, nom: str) -> Callable[[Any], int]:
+    # stade absent → « x » (non évalué) ; libellé non reconnu → erreur (ex. « M1 » sans sous-stade)
+    table = {m.value.upper(): i for i, m in enumerate(membres)}
+    attendus = ", ".join(m.value for m in membres)
+
+    def code(x: Any) -> int:
+        if _manquant(x) or x == "":
+            return table[inconnu.value.upper()]
+        cle = str(_valeur(x)).strip().upper()
+        if cle not in table:
+            raise ValueError(f"{nom} inconnu : {x!r} (attendu : {attendus}).")
+        return table[cle]
+    return code
+
+
+_code_n = _code_stade(_N, NStage.Nx, "Stade N")
+_code_m = _code_stade(_M, MStage.Mx, "Stade M")
+
+
+def _coder(valeurs: Iterable[Any], code: Callable[[Any], int]) -> np.ndarray:
+    # une conversion par valeur distincte (les registres n'ont qu'une poignée de stades)
+    memo: Dict[Any, int] = {}
+
+    def code_memo(x: Any) -> int:
+        try:
+            return memo[x]
+        except KeyError:
+            c = memo[x] = code(x)
+            return c
+
+    valeurs = list(valeurs) if not hasattr(valeurs, "__len__") else valeurs
+    return np.fromiter(map(code_memo, valeurs), dtype=np.int8, count=len(valeurs))
+
+
+def _colonne(valeurs: Any, n: int, dtype: Any, defaut: Any) -> np.ndarray:
+    if valeurs is None:
+        return np.full(n, defaut, dtype=dtype)
+    return np.asarray(valeurs, dtype=dtype)
+
+
+# =========================
+# Cohorte
+# =========================
+
+@dataclass(frozen=True)
+class CohortePCa:
+    """
+    Colonnes alignées (une ligne = un patient) : âge, PSA (ng/mL), codes cT / N / M
+    (position dans ClinicalT / NStage / MStage, -1 = cT inconnu), ISUP, densité PSA (NaN = non mesurée).
+    """
+    age: np.ndarray           # int16
+    psa: np.ndarray           # float64
+    clinical_t: np.ndarray    # int8
+    grade_group: np.ndarray   # int8
+    n_stage: np.ndarray       # int8
+    m_stage: np.ndarray       # int8
+    psa_density: np.ndarray   # float64
+
+    def __post_init__(self) -> None:
+        n = len(self.age)
+        for nom in ("psa", "clinical_t", "grade_group", "n_stage", "m_stage", "psa_density"):
+            if len(getattr(self, nom)) != n:
+                raise ValueError(f"Colonne {nom!r} de longueur {len(getattr(self, nom))} (attendu : {n}).")
+
+    def __len__(self) -> int:
+        return len(self.age)
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, nom).nbytes for nom in self.__dataclass_fields__)
+
+    @property
+    def rang_ct(self) -> np.ndarray:
+        return _RANG_T[self.clinical_t]
+
+    # ---------- construction ----------
+    @classmethod
+    def depuis_colonnes(cls, age: Any, psa: Any, clinical_t: Any, grade_group: Any,
+                        n_stage: Any = None, m_stage: Any = None, psa_density: Any = None) -> "CohortePCa":
+        """Colonnes (listes, tableaux, Series) de libellés ou d'énumérations ; N/M absents → N0/M0 comme PatientPCa."""
+        n = len(age)
+        return cls(
+            age=np.asarray(age, dtype=np.int16),
+            psa=np.asarray(psa, dtype=np.float64),
+            clinical_t=_coder(clinical_t, _code_t),
+            grade_group=np.asarray(grade_group).astype(np.int8),
+            n_stage=np.full(n, _N.index(NStage.N0), dtype=np.int8) if n_stage is None else _coder(n_stage, _code_n),
+            m_stage=np.full(n, _M.index(MStage.M0), dtype=np.int8) if m_stage is None else _coder(m_stage, _code_m),
+            psa_density=_colonne(psa_density, n, np.float64, np.nan),
+        )
+
+    @classmethod
+    def depuis_dataframe(cls, df: Any) -> "CohortePCa":
+        """DataFrame dont les colonnes portent les noms des champs de PatientPCa (optionnelles : n_stage, m_stage, psa_density)."""
+        return cls.depuis_colonnes(**{nom: df[nom] for nom in cls.__dataclass_fields__ if nom in df})
+
+    @classmethod
+    def depuis_patients(cls, patients: Iterable[PatientPCa]) -> "CohortePCa":
+        patients = list(patients)
+        return cls.depuis_colonnes(
+            age=[p.age for p in patients],
+            psa=[p.psa for p in patients],
+            clinical_t=[p.clinical_t for p in patients],
+            grade_group=[int(p.grade_group) for p in patients],
+            n_stage=[p.n_stage for p in patients],
+            m_stage=[p.m_stage for p in patients],
+            psa_density=[p.psa_density for p in patients],
+        )
+
+    def patient(self, i: int) -> PatientPCa:
+        """Ligne `i` sous forme de PatientPCa (pour recommend_from_patient sur un cas isolé)."""
+        code_t = int(self.clinical_t[i])
+        if code_t < 0:
+            raise ValueError(f"Ligne {i} : cT inconnu, pas de PatientPCa possible.")
+        densite = float(self.psa_density[i])
+        return PatientPCa(
+            age=int(self.age[i]), psa=float(self.psa[i]), clinical_t=_T[code_t],
+            grade_group=GradeGroup(int(self.grade_group[i])),
+            n_stage=_N[self.n_stage[i]], m_stage=_M[self.m_stage[i]],
+            psa_density=None if densite != densite else densite,
+        )
+
+
+# =========================
+# Recommandation vectorisée
+# =========================
+
+@dataclass(frozen=True)
+class RecoCohorte:
+    """Codes par ligne : setting (index de SETTINGS), risque D'Amico (index de RISQUES, -1 hors localisé), drapeaux."""
+    setting: np.ndarray            # int8
+    risque: np.ndarray             # int8
+    tres_haut_risque: np.ndarray   # bool — cN+ OU ≥2 (PSA>40, ISUP≥4, ≥cT3), localisé seulement
+    psad_suspecte: np.ndarray      # bool — PSAD > 0,15
+
+    def __len__(self) -> int:
+        return len(self.setting)
+
+    def settings(self) -> np.ndarray:
+        return SETTINGS[self.setting]
+
+    def risques(self) -> np.ndarray:
+        return RISQUES[self.risque]
+
+    def effectifs(self) -> Dict[Any, int]:
+        """{(setting, risque): nombre de patients}, pour les tableaux de bord de registre."""
+        cles, nombres = np.unique(self.setting.astype(np.int16) * 4 + (self.risque + 1), return_counts=True)
+        return {(SETTINGS[c // 4], RISQUES[c % 4 - 1]): int(k) for c, k in zip(cles.tolist(), nombres.tolist())}
+
+    def vers_dataframe(self, index: Any = None) -> Any:
+        import pandas as pd
+        return pd.DataFrame({
+            "setting": self.settings(), "risque": self.risques(),
+            "tres_haut_risque": self.tres_haut_risque, "psad_suspecte": self.psad_suspecte,
+        }, index=index)
+
+
+def recommend_from_cohort(cohorte: CohortePCa, *, contexte: Optional[Dict[str, Any]] = None) -> RecoCohorte:
+    """
+    Pendant colonne de recommend_from_patient : contexte["setting"] impose le même contexte à toute
+    la cohorte ; sinon chaque ligne est « metastatique » si M1a/b/c, « localise » sinon.
+    Le groupe de D'Amico (mêmes règles que prostate_risk_damico) n'est renseigné que pour le localisé.
+    """
+    n = len(cohorte)
+    setting = (contexte or {}).get("setting")
+    if setting is None:
+        codes_setting = np.where(np.isin(cohorte.m_stage, _M1), METASTATIQUE, LOCALISE).astype(np.int8)
+    elif setting in SETTINGS:
+        codes_setting = np.full(n, SETTINGS.tolist().index(setting), dtype=np.int8)
+    else:
+        raise ValueError("contexte['setting'] doit être 'localise', 'recidive' ou 'metastatique'.")
+
+    localise = codes_setting == LOCALISE
+    rang = cohorte.rang_ct
+    isup = cohorte.grade_group
+    risque = np.where(localise, damico_code_vect(cohorte.psa, isup, rang), -1).astype(np.int8)
+    flags = (cohorte.psa > 40).astype(np.int8) + (isup >= 4) + (rang >= ct_rank("T3a"))
+    vhr = localise & ((cohorte.n_stage == _N.index(NStage.N1)) | (flags >= 2))
+    with np.errstate(invalid="ignore"):
+        psad = cohorte.psa_density > SEUIL_PSAD
+    return RecoCohorte(setting=codes_setting, risque=risque, tres_haut_risque=vhr, psad_suspecte=psad)
@@ -0,0 +1,102 @@
+# moteur/commun.py — helpers partagés par les modules cliniques (sans Streamlit)
+
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, List, TypeVar
+import inspect
+import unicodedata
+
+T = TypeVar("T")
+TAILLE_CANON = 4096  # valeurs brutes retenues par canoniseur (saisies UI/CSV : une poignée de libellés)
+
+
+# -- canoniseur précompilé : valeur brute → forme canonique, calculée une fois par valeur distincte
+#    (table pré-remplie avec les libellés connus ; valeurs non hachables : calcul direct, sans mémoire).
+#    Le canoniseur prend un seul argument `x` : une fonction publique garde sa propre signature et l'appelle.
+def canoniseur(calcul: Callable[[Any], T], prerempli: Iterable[Hashable] = (),
+               taille_max: int = TAILLE_CANON) -> Callable[[Any], T]:
+    table: Dict[Hashable, T] = {v: calcul(v) for v in prerempli}
+
+    def canon(x: Any) -> T:
+        try:
+            return table[x]
+        except KeyError:
+            v = calcul(x)
+            if len(table) < taille_max:
+                table[x] = v
+            return v
+        except TypeError:  # non hachable (liste, tableau…)
+            return calcul(x)
+
+    canon.__name__ = canon.__qualname__ = calcul.__name__
+    canon.__doc__ = calcul.__doc__
+    canon.table = table
+    return canon
+
+
+# -- helper bool robuste (gère Oui/Non, true/false, 1/0, etc.)
+_VRAIS = frozenset({"1", "true", "vrai", "oui", "y", "yes"})
+
+
+def _to_bool(x: Any) -> bool:
+    if isinstance(x, bool): return x
+    if isinstance(x, (int, float)): return x != 0
+    if isinstance(x, str): return x.strip().lower() in _VRAIS
+    return bool(x)
+
+
+# True/1/1.0 et False/0/0.0 partagent une entrée (égaux et même hash) : même résultat
+_to_bool = canoniseur(_to_bool, prerempli=(True, False, "Oui", "Non", "oui", "non", "true", "false",
+                                           "True", "False", "1", "0", ""))
+
+
+# Aide: normalisation accent/casse pour comparaisons robustes (tests)
+def _norm(s: str) -> str:
+    return unicodedata.normalize("NFD", str(s)).encode("ascii", "ignore").decode("ascii").lower()
+
+
+# -- figer un résultat (dict/list → vue lecture seule/tuple) : partageable sans risque de mutation
+#    (les ResultatCAT de moteur.resultat, déjà immuables, passent tels quels)
+def figer(x: Any) -> Any:
+    if isinstance(x, dict):
+        return MappingProxyType({k: figer(v) for k, v in x.items()})
+    if isinstance(x, (list, tuple)):
+        return tuple(figer(v) for v in x)
+    return x
+
+
+# -- liaison rapide des arguments (enveloppes mémoïsées, tables de décision) : mêmes règles que la signature
+def lieur(sig: inspect.Signature) -> Callable[[tuple, Dict[str, Any]], List[Any]]:
+    """
+    (args, kwargs) → valeurs des paramètres dans l'ordre de la signature, défauts compris.
+    Chemin direct sans BoundArguments pour les appels usuels ; sig.bind (et ses TypeError) pour le reste.
+    """
+    def lent(args: tuple, kwargs: Dict[str, Any]) -> List[Any]:
+        lie = sig.bind(*args, **kwargs)
+        lie.apply_defaults()
+        return list(lie.arguments.values())
+
+    params = tuple(sig.parameters.values())
+    if any(p.kind in (p.POSITIONAL_ONLY, p.VAR_POSITIONAL, p.VAR_KEYWORD) for p in params):
+        return lent
+    noms = tuple(p.name for p in params)
+    n_positionnels = sum(p.kind is p.POSITIONAL_OR_KEYWORD for p in params)
+    defauts = {p.name: p.default for p in params if p.default is not p.empty}
+    # pour k arguments positionnels : paramètres restants et mots-clés acceptés
+    restes = [noms[k:] for k in range(n_positionnels + 1)]
+    acceptes = [frozenset(r) for r in restes]
+
+    def lier(args: tuple, kwargs: Dict[str, Any]) -> List[Any]:
+        k = len(args)
+        if k <= n_positionnels and kwargs.keys() <= acceptes[k]:
+            try:
+                return [*args, *[kwargs[nom] if nom in kwargs else defauts[nom] for nom in restes[k]]]
+            except KeyError:
+                pass
+        return lent(args, kwargs)  # mot-clé inconnu/en double, argument manquant : TypeError de sig.bind
+
+    return lier
+
+
+# -- lignes « clé: valeur » des sections de rapport (pages Streamlit et export en masse)
+def lignes_paires(paires: Iterable[Any]) -> List[str]:
+    return [f"{k}: {v}" for k, v in paires]
@@ -0,0 +1,121 @@
+# moteur/contexte.py — contexte patient partagé entre modules (une instance par session)
+# Les champs communs (âge, PSA, volume, cT, ISUP…) sont saisis une fois et pré-remplissent les pages
+# suivantes ; les stratifications dérivées (PSAD/triage ADK, D'Amico, IMDC) sont mémorisées avec leurs
+# valeurs d'entrée (la dernière par stratification) : passer d'un module à l'autre les relit au lieu de
+# les recalculer, et la mémoire reste bornée quelle que soit la durée de la session.
+# Aucune dépendance Streamlit : l'UI range l'objet dans st.session_state (vues.commun.patient) ;
+# chaque spécialité n'est importée qu'au premier calcul qui la concerne.
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from .commun import _to_bool
+
+# champ partagé → (libellé du bandeau, format d'affichage)
+LIBELLES: Dict[str, Tuple[str, str]] = {
+    "age": ("Âge", "{} ans"),
+    "psa": ("PSA", "{:.2f} ng/mL"),
+    "volume_ml": ("Volume prostatique", "{} mL"),
+    "tr_suspect": ("TR suspect", "{}"),
+    "cT": ("cT", "{}"),
+    "isup": ("ISUP", "{}"),
+    "esperance_vie_ans": ("Espérance de vie", "{} ans"),
+}
+
+
+@dataclass
+class ContextePatient:
+    """Champs partagés (None = pas encore saisi) et stratifications mémorisées par entrées."""
+    age: Optional[int] = None
+    psa: Optional[float] = None
+    volume_ml: Optional[int] = None
+    tr_suspect: Optional[bool] = None
+    cT: Optional[str] = None
+    isup: Optional[int] = None
+    esperance_vie_ans: Optional[int] = None
+    _derives: Dict[str, Tuple[Hashable, Any]] = field(default_factory=dict, repr=False)
+    _imdc: Optional[Tuple[int, str]] = field(default=None, repr=False)
+
+    # ---------- champs ----------
+    def maj(self, **champs: Any) -> None:
+        """Met à jour les champs partagés (noms inconnus refusés)."""
+        for nom, valeur in champs.items():
+            if nom not in LIBELLES:
+                raise TypeError(f"Champ de contexte patient inconnu : {nom!r}")
+            setattr(self, nom, valeur)
+
+    def valeur(self, nom: str, defaut: Any, mini: Any = None, maxi: Any = None) -> Any:
+        """
+        Valeur de pré-remplissage : celle du contexte si saisie, sinon `defaut`.
+        `mini`/`maxi` : bornes du widget de la page (une valeur saisie ailleurs sans ces bornes y est ramenée).
+        """
+        v = getattr(self, nom)
+        if v is None:
+            return defaut
+        if mini is not None and v < mini:
+            return mini
+        if maxi is not None and v > maxi:
+            return maxi
+        return v
+
+    def vider(self) -> None:
+        self.__init__()
+
+    @property
+    def renseigne(self) -> bool:
+        return any(getattr(self, nom) is not None for nom in LIBELLES) or self._imdc is not None
+
+    # ---------- dérivés mémorisés ----------
+    def _memo(self, genre: str, entrees: Hashable, calcul: Callable[[], Any]) -> Any:
+        # une entrée par stratification : (entrées, valeur) du dernier calcul, remplacée si les entrées changent
+        memo = self._derives.get(genre)
+        if memo is not None and memo[0] == entrees:
+            return memo[1]
+        valeur = calcul()
+        self._derives[genre] = (entrees, valeur)
+        return valeur
+
+    def suspicion_adk(self) -> Optional[Tuple[bool, List[str], Optional[float]]]:
+        """(orientation ADK, explications, PSAD) d'eval_suspicion_adk ; None si PSA/volume/TR manquants."""
+        if self.psa is None or self.volume_ml is None or self.tr_suspect is None:
+            return None
+        from .hbp import eval_suspicion_adk
+        entrees = (self.psa, self.volume_ml, _to_bool(self.tr_suspect))  # "Non" est vrai pour bool()
+        return self._memo("adk", entrees, lambda: eval_suspicion_adk(self.psa, self.volume_ml, self.tr_suspect))
+
+    def psad(self) -> Optional[float]:
+        adk = self.suspicion_adk()
+        return adk[2] if adk else None
+
+    def risque_damico(self) -> Optional[str]:
+        """Groupe de D'Amico (prostate localisée) ; None si PSA/ISUP/cT manquants."""
+        if self.psa is None or self.isup is None or self.cT is None:
+            return None
+        from .prostate import normalize_cT, prostate_risk_damico
+        entrees = (self.psa, self.isup, normalize_cT(self.cT))
+        return self._memo("damico", entrees, lambda: prostate_risk_damico(self.psa, self.isup, self.cT))
+
+    def imdc(self, *facteurs: bool) -> Tuple[int, str]:
+        """(score, groupe) IMDC pour les 6 facteurs de calc_imdc ; retient le dernier calcul pour le bandeau."""
+        from .rein import calc_imdc
+        entrees = tuple(bool(f) for f in facteurs)
+        self._imdc = self._memo("imdc", entrees, lambda: calc_imdc(*facteurs))
+        return self._imdc
+
+    # ---------- résumé ----------
+    def resume(self) -> List[Tuple[str, str]]:
+        """Paires (libellé, valeur) des champs saisis et des stratifications déjà disponibles."""
+        paires = []
+        for nom, (libelle, gabarit) in LIBELLES.items():
+            v = getattr(self, nom)
+            if v is not None:
+                paires.append((libelle, gabarit.format("Oui" if v is True else "Non" if v is False else v)))
+        psad = self.psad()
+        if psad is not None:
+            paires.append(("PSAD", f"{psad:.2f}"))
+        risque = self.risque_damico()
+        if risque is not None:
+            paires.append(("Risque D'Amico", risque))
+        if self._imdc is not None:
+            paires.append(("IMDC", f"{self._imdc[0]} — {self._imdc[1]}"))
+        return paires
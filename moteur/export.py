@@ -0,0 +1,233 @@
+# moteur/export.py — export en masse des CAT (liste RCP, cohorte) : ZIP (txt/html/pdf) ou HTML concaténé
+# Lecture par morceaux (moteur.batch), rendu réparti sur plusieurs processus (Pool.imap, ordre conservé),
+# écriture au fil de l'eau : la mémoire reste bornée par la taille d'un morceau, pas par la cohorte.
+
+from dataclasses import dataclass
+from importlib import import_module
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import html as ihtml
+import io
+import multiprocessing
+import os
+import re
+import unicodedata
+import zipfile
+
+from .pdf import ecrire_pdf
+from .rapport import build_report_text, ecrire_rapport
+
+TAILLE_MORCEAU = 5_000
+FORMATS = ("txt", "html", "pdf")
+
+
+# =========================
+# Sections de rapport par module (constructeurs du moteur, partagés avec les pages Streamlit)
+# =========================
+
+def _sections(module: str, plan: str, sections: str) -> Callable[..., Dict[str, List[str]]]:
+    # import différé : un worker du pool n'importe que le module clinique du rapport demandé
+    def construire(**e) -> Dict[str, List[str]]:
+        m = import_module(f"moteur.{module}")
+        return getattr(m, sections)(getattr(m, plan)(**e))
+    return construire
+
+
+def _sections_tvnim(stade, grade, taille_mm, nombre, cis_associe=False, lvi=False,
+                    urethre_prostatique=False, formes_agressives=False) -> Dict[str, List[str]]:
+    vessie = import_module("moteur.vessie")
+    risque = vessie.stratifier_tvnim(stade, grade, taille_mm, nombre, cis_associe, lvi,
+                                     urethre_prostatique, formes_agressives)
+    donnees = vessie.donnees_tvnim(stade, grade, taille_mm, nombre, cis_associe, lvi,
+                                   urethre_prostatique, formes_agressives)
+    return vessie.sections_tvnim(donnees, risque, *vessie.plan_tvnim(risque))
+
+
+@dataclass(frozen=True)
+class ModeleRapport:
+    titre: str
+    nom_fichier: str
+    sections: Callable[..., Dict[str, List[str]]]
+
+
+RAPPORTS: Dict[str, ModeleRapport] = {
+    "hbp": ModeleRapport("CAT HBP", "CAT_HBP", _sections("hbp", "plan_hbp", "sections_hbp")),
+    "prostate_localise": ModeleRapport("CAT Prostate Localisée", "CAT_Prostate_Localisee",
+                                       _sections("prostate", "plan_prostate_localise", "sections_prostate_localise")),
+    "rein_local": ModeleRapport("CAT Rein non métastatique", "CAT_Rein_Non_Metastatique",
+                                _sections("rein", "plan_rein_local", "sections_rein_local")),
+    "tves_localise": ModeleRapport("CAT TVES localisé", "CAT_TVES_Localise",
+                                   _sections("tves", "plan_tves_localise", "sections_tves_localise")),
+    "tvnim": ModeleRapport("CAT TVNIM", "CAT_TVNIM", _sections_tvnim),
+    "lithiase": ModeleRapport("CAT Lithiase", "CAT_Lithiase", _sections("lithiase", "plan_lithiase", "sections_lithiase")),
+    "cystite": ModeleRapport("CAT — Cystite", "CAT_Cystite", _sections("infectio", "plan_cystite", "sections_infectio")),
+    "pna": ModeleRapport("CAT — PNA", "CAT_PNA", _sections("infectio", "plan_pna", "sections_infectio")),
+}
+
+
+def _modele(module: str) -> ModeleRapport:
+    try:
+        return RAPPORTS[module]
+    except KeyError:
+        raise ValueError(f"Module inconnu pour l'export : {module!r} (attendu : {', '.join(RAPPORTS)}).")
+
+
+def sections_rapport(module: str, entree: Dict[str, Any]) -> Tuple[str, Dict[str, List[str]]]:
+    """(titre, sections) du rapport d'un patient, identiques à celles de la page du module."""
+    modele = _modele(module)
+    return modele.titre, modele.sections(**entree)
+
+
+def rapport_texte(module: str, entree: Dict[str, Any]) -> str:
+    return build_report_text(*sections_rapport(module, entree))
+
+
+# =========================
+# Rendu parallèle (un travail = un patient)
+# =========================
+
+Rendu = Tuple[str, str, Optional[str], Optional[bytes]]  # (identifiant, texte, HTML, PDF)
+
+
+def _rendre(travail: Tuple[str, str, Dict[str, Any], bool, bool]) -> Rendu:
+    module, ident, entree, avec_html, avec_pdf = travail
+    if not (avec_html or avec_pdf):
+        return ident, rapport_texte(module, entree), None, None
+    titre, sections = sections_rapport(module, entree)  # une seule évaluation du moteur pour tous les formats
+    txt, html = io.StringIO(), (io.StringIO() if avec_html else None)
+    ecrire_rapport(titre, sections, txt=txt, html=html, basename=f"{slug_identifiant(ident)}_{_modele(module).nom_fichier}")
+    pdf = None
+    if avec_pdf:
+        tampon = io.BytesIO()
+        ecrire_pdf(titre, sections, tampon)
+        pdf = tampon.getvalue()
+    return ident, txt.getvalue(), html.getvalue() if html else None, pdf
+
+
+def _travaux(morceaux: Iterable[Any], module: str, colonne_id: Optional[str],
+             avec_html: bool, avec_pdf: bool) -> Iterator[List[Tuple[str, str, Dict[str, Any], bool, bool]]]:
+    from .batch import enregistrements
+    n = 0
+    for df in morceaux:
+        ids = df[colonne_id].astype(str).tolist() if colonne_id else [None] * len(df)
+        lot = []
+        for ident, e in zip(ids, enregistrements(df, module)):
+            n += 1
+            lot.append((module, ident or f"{n:06d}", e, avec_html, avec_pdf))
+        yield lot
+
+
+def rendre_rapports(morceaux: Iterable[Any], module: str, processus: Optional[int] = None,
+                    colonne_id: Optional[str] = None, avec_html: bool = False,
+                    avec_pdf: bool = False) -> Iterator[Rendu]:
+    """
+    Flux (identifiant, texte, page HTML ou None, PDF ou None) dans l'ordre d'entrée ;
+    tous les formats d'un patient sortent d'une seule évaluation du moteur.
+    Le pool ne reçoit qu'un morceau à la fois (Pool.imap consomme son itérable d'entrée d'un trait :
+    on ne lui donne jamais toute la cohorte).
+    """
+    _modele(module)
+    processus = processus or os.cpu_count() or 1
+    if processus == 1:
+        for lot in _travaux(morceaux, module, colonne_id, avec_html, avec_pdf):
+            yield from map(_rendre, lot)
+        return
+    with multiprocessing.Pool(processus) as pool:
+        for lot in _travaux(morceaux, module, colonne_id, avec_html, avec_pdf):
+            yield from pool.imap(_rendre, lot, chunksize=max(1, len(lot) // (processus * 4)))
+
+
+# =========================
+# Noms d'entrées (identifiants fournis par l'utilisateur)
+# =========================
+
+_HORS_SLUG = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+def slug_identifiant(ident: Any) -> str:
+    """Identifiant → segment de nom de fichier sûr (ASCII, sans séparateur de chemin ni « .. »)."""
+    texte = unicodedata.normalize("NFKD", str(ident)).encode("ascii", "ignore").decode("ascii")
+    texte = _HORS_SLUG.sub("_", texte).strip("._")
+    return texte.replace("..", "_") or "patient"
+
+
+def _nommeur() -> Callable[[Any], str]:
+    """Identifiant → slug unique dans l'archive (doublons, ou identifiants confondus par le slug : -2, -3…)."""
+    vus: Dict[str, int] = {}
+
+    def nommer(ident: Any) -> str:
+        nom = base = slug_identifiant(ident)
+        while nom in vus:
+            vus[base] += 1
+            nom = f"{base}-{vus[base]}"
+        vus[nom] = 1
+        return nom
+    return nommer
+
+
+# =========================
+# Écrivains
+# =========================
+
+def exporter_zip(morceaux: Iterable[Any], sortie: str, module: str, formats: Sequence[str] = ("txt",),
+                 processus: Optional[int] = None, colonne_id: Optional[str] = None) -> int:
+    """Une entrée par patient et par format dans une archive ZIP écrite au fil de l'eau."""
+    inconnus = set(formats) - set(FORMATS)
+    if inconnus:
+        raise ValueError(f"Format(s) inconnu(s) : {', '.join(sorted(inconnus))} (attendu : {', '.join(FORMATS)}).")
+    base = _modele(module).nom_fichier
+    n = 0
+    nommer = _nommeur()
+    with zipfile.ZipFile(sortie, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        for ident, texte, html, pdf in rendre_rapports(morceaux, module, processus, colonne_id,
+                                                       "html" in formats, "pdf" in formats):
+            nom = f"{nommer(ident)}_{base}"
+            if "txt" in formats:
+                zf.writestr(f"{nom}.txt", texte)
+            if html is not None:
+                zf.writestr(f"{nom}.html", html)
+            if pdf is not None:
+                zf.writestr(f"{nom}.pdf", pdf, compress_type=zipfile.ZIP_STORED)  # flux déjà compressés
+            n += 1
+    return n
+
+
+def exporter_html(morceaux: Iterable[Any], sortie: str, module: str,
+                  processus: Optional[int] = None, colonne_id: Optional[str] = None) -> int:
+    """Un seul document HTML (une section par patient), imprimable pour la RCP."""
+    modele = _modele(module)
+    n = 0
+    with open(sortie, "w", encoding="utf-8") as f:
+        f.write(f"<!doctype html><html lang='fr'><meta charset='utf-8'><title>{ihtml.escape(modele.titre)} — export</title><body>\n")
+        for ident, texte, *_ in rendre_rapports(morceaux, module, processus, colonne_id):
+            f.write(f"<section><h2>{ihtml.escape(ident)}</h2><pre>{ihtml.escape(texte)}</pre></section>\n")
+            n += 1
+        f.write("</body></html>\n")
+    return n
+
+
+def exporter_fichier(entree: str, sortie: str, module: str, processus: Optional[int] = None,
+                     colonne_id: Optional[str] = None, formats: Sequence[str] = ("txt",),
+                     taille: int = TAILLE_MORCEAU) -> int:
+    """Cohorte CSV/JSONL/Parquet → ZIP (.zip) ou HTML concaténé (.html) ; retourne le nombre de rapports."""
+    from .batch import lire_morceaux
+    morceaux = lire_morceaux(entree, taille)
+    if str(sortie).lower().endswith(".zip"):
+        return exporter_zip(morceaux, sortie, module, formats, processus, colonne_id)
+    return exporter_html(morceaux, sortie, module, processus, colonne_id)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Export en masse des CAT d'une cohorte (ZIP ou HTML concaténé).")
+    parser.add_argument("module", choices=sorted(RAPPORTS))
+    parser.add_argument("entree", help="CSV, JSONL ou Parquet")
+    parser.add_argument("sortie", help=".zip (un fichier par patient) ou .html (document unique)")
+    parser.add_argument("--processus", type=int, default=None, help="processus de rendu (défaut : nb de cœurs)")
+    parser.add_argument("--colonne-id", default=None, help="colonne d'identifiant patient (noms de fichiers)")
+    parser.add_argument("--formats", default="txt", help="formats dans le ZIP, séparés par des virgules : txt, html, pdf")
+    parser.add_argument("--taille", type=int, default=TAILLE_MORCEAU, help="patients par morceau")
+    args = parser.parse_args()
+    n = exporter_fichier(args.entree, args.sortie, args.module, args.processus, args.colonne_id,
+                         tuple(args.formats.split(",")), args.taille)
+    print(f"{n} rapports exportés dans {args.sortie}.")
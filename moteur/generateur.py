@@ -0,0 +1,343 @@
+# moteur/generateur.py — générateur de patients synthétiques (graine fixe, distributions configurables)
+# Un profil = {champ: distribution} par module ; les profils des modules batch produisent exactement
+# les colonnes de moteur.batch.MODULES_LOT. Écriture en flux (JSONL / Parquet par lots) :
+# un corpus d'un million de patients ne réside jamais en mémoire.
+
+from dataclasses import asdict, dataclass
+from random import Random
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+import json
+
+TAILLE_LOT = 50_000
+
+
+# =========================
+# Distributions
+# =========================
+
+def _borner(x: float, bas: Optional[float], haut: Optional[float]) -> float:
+    if bas is not None:
+        x = max(x, bas)
+    if haut is not None:
+        x = min(x, haut)
+    return x
+
+
+def _arrondir(x: float, decimales: Optional[int]) -> Any:
+    # decimales=None → entier, sinon flottant arrondi
+    return int(round(x)) if decimales is None else round(x, decimales)
+
+
+@dataclass(frozen=True)
+class Bernoulli:
+    """Booléen vrai avec probabilité `p` (prévalence)."""
+    p: float
+
+    def tirer(self, rng: Random) -> bool:
+        return rng.random() < self.p
+
+
+@dataclass(frozen=True)
+class Choix:
+    """Valeur catégorielle, pondérée (poids relatifs) ou uniforme."""
+    valeurs: Tuple[Any, ...]
+    poids: Optional[Tuple[float, ...]] = None
+
+    def tirer(self, rng: Random) -> Any:
+        return rng.choices(self.valeurs, self.poids)[0]
+
+
+@dataclass(frozen=True)
+class Normale:
+    moyenne: float
+    ecart_type: float
+    bas: Optional[float] = None
+    haut: Optional[float] = None
+    decimales: Optional[int] = None
+
+    def tirer(self, rng: Random) -> Any:
+        return _arrondir(_borner(rng.gauss(self.moyenne, self.ecart_type), self.bas, self.haut), self.decimales)
+
+
+@dataclass(frozen=True)
+class LogNormale:
+    """Valeur positive asymétrique (PSA, volumes, tailles) : médiane × exp(N(0, sigma))."""
+    mediane: float
+    sigma: float
+    bas: Optional[float] = None
+    haut: Optional[float] = None
+    decimales: Optional[int] = None
+
+    def tirer(self, rng: Random) -> Any:
+        return _arrondir(_borner(self.mediane * rng.lognormvariate(0.0, self.sigma), self.bas, self.haut),
+                         self.decimales)
+
+
+@dataclass(frozen=True)
+class Triangulaire:
+    bas: float
+    haut: float
+    mode: float
+    decimales: Optional[int] = None
+
+    def tirer(self, rng: Random) -> Any:
+        return _arrondir(rng.triangular(self.bas, self.haut, self.mode), self.decimales)
+
+
+Distribution = Any  # Bernoulli | Choix | Normale | LogNormale | Triangulaire
+DISTRIBUTIONS = {cls.__name__: cls for cls in (Bernoulli, Choix, Normale, LogNormale, Triangulaire)}
+
+
+def distribution_depuis_dict(d: Dict[str, Any]) -> Distribution:
+    """{"type": "Bernoulli", "p": 0.1} → Bernoulli(0.1) (listes JSON converties en tuples)."""
+    d = dict(d)
+    try:
+        cls = DISTRIBUTIONS[d.pop("type")]
+    except KeyError:
+        raise ValueError(f"Distribution inconnue : {d!r} (attendu : {', '.join(DISTRIBUTIONS)}).")
+    return cls(**{k: tuple(v) if isinstance(v, list) else v for k, v in d.items()})
+
+
+def distribution_vers_dict(dist: Distribution) -> Dict[str, Any]:
+    return {"type": type(dist).__name__, **asdict(dist)}
+
+
+# =========================
+# Profils par module
+# =========================
+
+_RISQUE_IU = dict(homme=Bernoulli(0.15), grossesse=Bernoulli(0.03), age_ge65_fragile=Bernoulli(0.12),
+                  anomalies_uro=Bernoulli(0.08), immunodep=Bernoulli(0.05), irc_significative=Bernoulli(0.04),
+                  sonde=Bernoulli(0.04), diabete_non_controle=Bernoulli(0.05))
+_SEPSIS = dict(seps_sbp_lt90=Bernoulli(0.03), seps_hr_gt120=Bernoulli(0.04), confusion=Bernoulli(0.02))
+
+_TVES = dict(
+    grade_biopsie=Choix(("Bas grade", "Haut grade", "Indéterminé"), (40, 45, 15)),
+    cytologie_hg_positive=Bernoulli(0.3), taille_cm=LogNormale(1.8, 0.5, 0.3, 8, decimales=1),
+    multifocal=Bernoulli(0.2), invasion_imagerie=Bernoulli(0.25), hydron=Bernoulli(0.35),
+    kss_faisable=Bernoulli(0.6), accepte_suivi_strict=Bernoulli(0.7),
+)
+_IMDC_MSKCC = dict(karnofsky_lt80=Bernoulli(0.25), time_to_systemic_le_12mo=Bernoulli(0.5),
+                   hb_basse=Bernoulli(0.45), calcium_haut=Bernoulli(0.15))
+
+PROFILS: Dict[str, Dict[str, Distribution]] = {
+    # ----- modules batch (colonnes de moteur.batch.MODULES_LOT) -----
+    "hbp": dict(
+        age=Normale(68, 8, 45, 95), volume_ml=LogNormale(45, 0.45, 15, 250), ipss=Triangulaire(0, 35, 14),
+        psa_total=LogNormale(2.5, 0.8, 0.1, 100, decimales=1), tr_suspect=Bernoulli(0.05),
+        anticoag=Bernoulli(0.2), ci_chirurgie=Bernoulli(0.1), refus_chir=Bernoulli(0.1),
+        infections_recid=Bernoulli(0.06), retention=Bernoulli(0.08), calculs=Bernoulli(0.04),
+        hematurie_recid=Bernoulli(0.04), ir_post_obstacle=Bernoulli(0.03), echec_medical=Bernoulli(0.25),
+        stockage_predominant=Bernoulli(0.2), rpm_ml=LogNormale(60, 0.9, 0, 600),
+        dysfonction_erectile=Bernoulli(0.3),
+    ),
+    "prostate_localise": dict(
+        psa=LogNormale(8, 0.7, 0.5, 150, decimales=1), isup=Choix((1, 2, 3, 4, 5), (30, 30, 18, 12, 10)),
+        cT=Choix(("T1", "T2a", "T2b", "T2c", "T3a", "T3b", "T4"), (30, 20, 12, 10, 14, 9, 5)),
+        esperance_vie_ans=Choix((5, 8, 10, 12, 15, 20)),
+    ),
+    "rein_local": dict(
+        cT=Choix(("T1a", "T1b", "T2a", "T2b", "T3a", "T3b", "T3c", "T4"), (40, 20, 10, 5, 13, 6, 3, 3)),
+        cN_pos=Bernoulli(0.08),
+        thrombus=Choix(("Aucun", "Veine rénale", "VCC infra-hépatique", "VCC supra-hépatique/atrium"), (85, 9, 4, 2)),
+        rein_unique_ou_CKD=Bernoulli(0.12), tumeur_hilaire=Bernoulli(0.15), exophytique=Bernoulli(0.55),
+        age=Normale(64, 11, 25, 92), haut_risque_op=Bernoulli(0.15), biopsie_dispo=Bernoulli(0.3),
+    ),
+    "tvnim": dict(
+        stade=Choix(("pTa", "pT1"), (70, 30)), grade=Choix(("Bas grade", "Haut grade"), (55, 45)),
+        taille_mm=LogNormale(18, 0.6, 3, 80), nombre=Choix(("Unique", "Multiple", "Papillomatose vésicale"), (60, 35, 5)),
+        cis_associe=Bernoulli(0.1), lvi=Bernoulli(0.05), urethre_prostatique=Bernoulli(0.03),
+        formes_agressives=Bernoulli(0.05),
+    ),
+    "lithiase": dict(
+        fievre=Bernoulli(0.08), hyperalgique=Bernoulli(0.15), oligoanurie=Bernoulli(0.03), doute_diag=Bernoulli(0.05),
+        grossesse=Bernoulli(0.02), anticoag=Bernoulli(0.08),
+        localisation=Choix(("Uretère distal", "Uretère moyen", "Uretère proximal", "Rein (intracavicitaire)"),
+                           (45, 15, 25, 15)),
+        taille_mm=LogNormale(5, 0.5, 1, 40), douleur_actuelle=Bernoulli(0.6),
+    ),
+    "cystite": dict(
+        age=Normale(42, 18, 16, 95), fievre_ge_38_5=Bernoulli(0.05), lombalgies=Bernoulli(0.05),
+        douleurs_intenses=Bernoulli(0.1), hematurie=Bernoulli(0.2), recidivante=Bernoulli(0.15),
+        **_RISQUE_IU, **_SEPSIS, vomissements=Bernoulli(0.02),
+    ),
+    "pna": dict(
+        fievre_ge_38_5=Bernoulli(0.8), douleur_lombaire=Bernoulli(0.85), vomissements=Bernoulli(0.2),
+        **_RISQUE_IU, **_SEPSIS,
+    ),
+    # ----- autres fonctions du moteur -----
+    "prostate_recidive": dict(
+        type_initial=Choix(("Prostatectomie", "Radiothérapie")), psa_actuel=LogNormale(0.4, 1.2, 0.01, 50, decimales=2),
+        psa_nadir_post_rt=LogNormale(0.5, 0.8, 0.01, 5, decimales=2), confirmations=Choix((1, 2, 3)),
+    ),
+    "prostate_metastatique": dict(
+        testosterone_castration=Bernoulli(0.35), volume_eleve=Bernoulli(0.5), symptomes_osseux=Bernoulli(0.3),
+        deja_docetaxel=Bernoulli(0.25), deja_arpi=Bernoulli(0.3), alteration_HRR=Bernoulli(0.12),
+    ),
+    "imdc": dict(**_IMDC_MSKCC, neutro_hauts=Bernoulli(0.15), plaquettes_hautes=Bernoulli(0.15)),
+    "mskcc": dict(**_IMDC_MSKCC, ldh_haut=Bernoulli(0.12)),
+    "rein_meta": dict(
+        histo=Choix(("ccRCC", "non-ccRCC"), (80, 20)), score=Choix((0, 1, 2, 3, 4), (20, 30, 25, 15, 10)),
+        score_system_label=Choix(("IMDC (Heng)", "MSKCC (Motzer)")),
+        oligo=Bernoulli(0.15), bone=Bernoulli(0.3), brain=Bernoulli(0.08), liver=Bernoulli(0.15),
+        io_contra=Bernoulli(0.08),
+    ),
+    "rein_biopsie": dict(
+        indication_systemique=Bernoulli(0.1), indication_ablation=Bernoulli(0.15),
+        inoperable_haut_risque=Bernoulli(0.1), lesion_indet=Bernoulli(0.2),
+        suspicion_lymphome_metastase_infection=Bernoulli(0.05), rein_unique_ou_ckd=Bernoulli(0.1),
+        petite_masse_typique_et_chirurgie_prevue=Bernoulli(0.3),
+        bosniak=Choix(("Non applicable", "II", "IIF", "III", "IV"), (70, 5, 10, 8, 7)),
+        troubles_coag_non_corriges=Bernoulli(0.03),
+    ),
+    "tvnim_risque": dict(risque=Choix(("faible", "intermédiaire", "élevé"), (35, 30, 35))),
+    "tvim": dict(
+        t_cat=Choix(("T2", "T3", "T4a"), (55, 30, 15)), cN_pos=Bernoulli(0.2), metastases=Bernoulli(0.1),
+        cis_eligible=Bernoulli(0.6), hydron=Bernoulli(0.2), bonne_fct_v=Bernoulli(0.7), cis_diffus=Bernoulli(0.15),
+        post_op_high_risk=Bernoulli(0.3), neo_adjuvant_fait=Bernoulli(0.3),
+    ),
+    "vessie_meta": dict(
+        cis_eligible=Bernoulli(0.45), carbo_eligible=Bernoulli(0.8), platinum_naive=Bernoulli(0.7),
+        pdl1_pos=Bernoulli(0.3), prior_platinum=Bernoulli(0.3), prior_cpi=Bernoulli(0.2), bone_mets=Bernoulli(0.35),
+    ),
+    "tves": _TVES,
+    "tves_localise": dict(
+        **_TVES,
+        localisation=Choix(("Bassinets/caliciel", "Uretère proximal", "Uretère moyen", "Uretère distal")),
+    ),
+    "tves_metastatique": dict(
+        ev_pembro_eligible=Bernoulli(0.6), cis_eligible=Bernoulli(0.4), carbo_eligible=Bernoulli(0.8),
+        platinum_naif=Bernoulli(0.7), fgfr_alt=Bernoulli(0.15), prior_platinum=Bernoulli(0.3),
+        prior_io=Bernoulli(0.2), use_cis_gem_nivo=Bernoulli(0.2),
+    ),
+    "grossesse": dict(
+        type_tableau=Choix(("Bactériurie asymptomatique", "Cystite", "PNA"), (40, 40, 20)),
+        terme_9e_mois=Bernoulli(0.1), allergies_betalactamines=Bernoulli(0.08),
+        seps_sbp_lt90=Bernoulli(0.02), seps_hr_gt120=Bernoulli(0.03), vomissements=Bernoulli(0.1),
+    ),
+    "prostatite": dict(
+        fievre_ge_38_5=Bernoulli(0.8), douleurs_perineales=Bernoulli(0.6), dysurie=Bernoulli(0.7),
+        retention=Bernoulli(0.1), post_biopsie_prostate=Bernoulli(0.15), immunodep=Bernoulli(0.05),
+        irc_significative=Bernoulli(0.04), **_SEPSIS,
+    ),
+}
+
+
+# ----- cohérence entre champs (appliquée après tirage) -----
+
+def _coherence_rein_local(e: Dict[str, Any]) -> None:
+    if not e["cT"].startswith("T3"):
+        e["thrombus"] = "Aucun"  # thrombus veineux ⇒ au moins T3
+
+
+def _coherence_prostate_recidive(e: Dict[str, Any]) -> None:
+    if e["type_initial"] != "Radiothérapie":
+        e["psa_nadir_post_rt"] = None
+
+
+def _coherence_rein_meta(e: Dict[str, Any]) -> None:
+    s = e["score"]
+    e["group"] = "Bon pronostic (0)" if s == 0 else ("Intermédiaire (1–2)" if s <= 2 else "Mauvais (≥3)")
+
+
+def _coherence_hbp(e: Dict[str, Any]) -> None:
+    if e["retention"] and e["rpm_ml"] < 300:
+        e["rpm_ml"] = 300 + e["rpm_ml"]
+
+
+COHERENCE: Dict[str, Callable[[Dict[str, Any]], None]] = {
+    "rein_local": _coherence_rein_local,
+    "prostate_recidive": _coherence_prostate_recidive,
+    "rein_meta": _coherence_rein_meta,
+    "hbp": _coherence_hbp,
+}
+
+
+# =========================
+# API publique
+# =========================
+
+def profil(module: str, surcharges: Optional[Dict[str, Distribution]] = None) -> Dict[str, Distribution]:
+    """Profil du module, avec distributions surchargées champ par champ."""
+    try:
+        base = PROFILS[module]
+    except KeyError:
+        raise ValueError(f"Profil inconnu : {module!r} (attendu : {', '.join(PROFILS)}).")
+    inconnus = set(surcharges or ()) - set(base)
+    if inconnus:
+        raise ValueError(f"Champs inconnus pour {module!r} : {', '.join(sorted(inconnus))}.")
+    return {**base, **(surcharges or {})}
+
+
+def generer(module: str, n: int, graine: int = 0,
+            surcharges: Optional[Dict[str, Distribution]] = None) -> Iterator[Dict[str, Any]]:
+    """Flux de `n` enregistrements valides pour `module` ; même graine → même corpus."""
+    champs = tuple(profil(module, surcharges).items())
+    coherence = COHERENCE.get(module)
+    rng = Random(f"{module}:{graine}")
+    for _ in range(n):
+        e = {nom: dist.tirer(rng) for nom, dist in champs}
+        if coherence is not None:
+            coherence(e)
+        yield e
+
+
+def charger_config(chemin: str) -> Dict[str, Dict[str, Distribution]]:
+    """Surcharges depuis un JSON {module: {champ: {"type": ..., paramètres}}}."""
+    with open(chemin, encoding="utf-8") as f:
+        brut = json.load(f)
+    return {module: {champ: distribution_depuis_dict(d) for champ, d in champs.items()}
+            for module, champs in brut.items()}
+
+
+def ecrire_jsonl(chemin: str, module: str, n: int, graine: int = 0,
+                 surcharges: Optional[Dict[str, Distribution]] = None) -> int:
+    with open(chemin, "w", encoding="utf-8") as f:
+        for e in generer(module, n, graine, surcharges):
+            f.write(json.dumps(e, ensure_ascii=False))
+            f.write("\n")
+    return n
+
+
+def ecrire_parquet(chemin: str, module: str, n: int, graine: int = 0,
+                   surcharges: Optional[Dict[str, Distribution]] = None, taille: int = TAILLE_LOT) -> int:
+    import pyarrow as pa  # dépendance optionnelle (Parquet uniquement)
+    import pyarrow.parquet as pq
+
+    flux = generer(module, n, graine, surcharges)
+    writer = None
+    try:
+        while True:
+            lot = [e for _, e in zip(range(taille), flux)]
+            if not lot:
+                break
+            table = pa.Table.from_pylist(lot, schema=writer.schema if writer is not None else None)
+            if writer is None:
+                writer = pq.ParquetWriter(chemin, table.schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return n
+
+
+def ecrire(chemin: str, module: str, n: int, graine: int = 0,
+           surcharges: Optional[Dict[str, Distribution]] = None) -> int:
+    """Écrit `n` patients synthétiques en JSONL ou Parquet (selon l'extension)."""
+    if str(chemin).lower().endswith((".parquet", ".pq")):
+        return ecrire_parquet(chemin, module, n, graine, surcharges)
+    return ecrire_jsonl(chemin, module, n, graine, surcharges)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Génère une cohorte synthétique (JSONL/Parquet) pour un module.")
+    parser.add_argument("module", choices=sorted(PROFILS))
+    parser.add_argument("n", type=int)
+    parser.add_argument("sortie")
+    parser.add_argument("--graine", type=int, default=0)
+    parser.add_argument("--config", help="JSON de surcharges de distributions {module: {champ: {...}}}")
+    args = parser.parse_args()
+    surcharges = charger_config(args.config).get(args.module) if args.config else None
+    print(f"{ecrire(args.sortie, args.module, args.n, args.graine, surcharges)} patients écrits dans {args.sortie}.")
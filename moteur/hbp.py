@@ -0,0 +1,298 @@
+# moteur/hbp.py — Hypertrophie bénigne de la prostate (triage ADK + CAT)
+
+from typing import Optional, Any, List, Tuple, Dict, Union
+
+from .commun import _to_bool, lignes_paires
+from .incremental import PlanIncremental, Section
+from . import textes
+from .regles import JeuRegles, Regle
+from .resultat import ResultatCAT
+
+# =========================
+# LOGIQUE CLINIQUE — HBP (TR + PSAD) — signature sans lobe_median / preservation_ejac
+# Compatible avec ANCIEN/NOUVEAU appel grâce à un adaptateur positionnel
+# =========================
+
+def classer_ipss(ipss: int) -> str:
+    if ipss <= 7: return "légers"
+    if ipss <= 19: return "modérés"
+    return "sévères"
+
+# =========================
+# TRIAGE ADK (TR + PSAD si PSA ≥ 4)
+# =========================
+def eval_suspicion_adk(psa_total: float, volume_ml: int, tr_suspect: Union[bool,str,int,float]) -> Tuple[bool, List[str], Optional[float]]:
+    """
+    - TR suspect → ADK (IRM multiparamétrique + biopsies)
+    - PSA ≥ 4 → PSAD = PSA/volume ; si PSAD > 0,15 → ADK ; sinon HBP
+    - PSA < 4 → HBP
+    - Si PSA ≥ 4 mais volume inconnu/0 → mesurer le volume (TRUS/IRM) pour calculer PSAD
+    """
+    exp: List[str] = []
+    psad: Optional[float] = None
+    if _to_bool(tr_suspect):
+        exp.append("TR suspect → orientation ADK (IRM multiparamétrique puis biopsies).")
+        return True, exp, psad
+
+    if psa_total >= 4.0:
+        if volume_ml and volume_ml > 0:
+            psad = psa_total / float(volume_ml)
+            exp.append(f"Densité PSA (PSAD) = {psad:.2f}.")
+            if psad > 0.15:
+                exp.append("PSAD > 0,15 → critère suspect → IRM + biopsies (orientation ADK).")
+                return True, exp, psad
+            else:
+                exp.append("PSAD ≤ 0,15 → non suspect immédiat → poursuite de la CAT HBP.")
+        else:
+            exp.append("PSA ≥ 4 mais volume inconnu/0 → mesurer le volume (TRUS/IRM) pour calculer la PSAD.")
+    else:
+        exp.append("PSA < 4 → profil HBP (pas d’orientation ADK immédiate).")
+    return False, exp, psad
+
+# =========================
+# RÈGLES — options de traitement HBP (hors orientation ADK)
+# (1) indication chirurgicale stricte = échec médical ou complication ;
+# (2) sinon médical d'abord ; (3) sinon chirurgie si possible, alternatives/palliatif si CI ou refus
+# =========================
+REGLES_HBP = JeuRegles(
+    "hbp.options",
+    predicats={
+        "indication_chir": ("un_de", ("echec_medical", "infections_recid", "retention", "calculs",
+                                      "hematurie_recid", "ir_post_obstacle")),
+        "chir_impossible": ("un_de", ("ci_chirurgie", "refus_chir")),
+        "ipss_leger": ("ipss", "<=", 7),
+        "volume_gt_40": ("volume_ml", ">", 40),
+        "volume_30_70": ("volume_ml", "entre", (30, 70)),
+        "volume_ge_71": ("volume_ml", ">=", 71),
+        "volume_gt_80": ("volume_ml", ">", 80),
+        "volume_gt_100": ("volume_ml", ">", 100),
+        "volume_le_40": ("volume_ml", "<=", 40),
+        "rpm_lt_150": ("rpm_ml", "<", 150),
+        "risque_hemorragique": ("un_de", ("anticoag", "volume_30_70")),
+    },
+    regles=[
+        # (2) pas d'indication chirurgicale stricte, SBAU légers : STRICTEMENT 2 options
+        Regle("abstention", "abstention-surveillance — informer du faible risque évolutif + conseils hygiéno-diététiques,(réduire apports hydriques après 18h, diminuer caféine/alcool, traiter la constipation). ",
+              ("!indication_chir", "ipss_leger")),
+        Regle("alpha_mono", "traitement médical — α-bloquant (monothérapie). Action rapide, améliore SBAU et débit.",
+              ("!indication_chir", "ipss_leger")),
+        # (2) SBAU modérés/sévères
+        Regle("alpha_1re", "α-bloquant en première intention puis réévaluation clinique/IPSS pour vérifier amélioration ou échec sous traitement.",
+              ("!indication_chir", "!ipss_leger")),
+        Regle("i5ar", "inhibiteur de la 5α-réductase,effet en plusieurs mois, ↓volume ~20 %, ↓risque de RAU; PSA mesuré ≈ 50 % du réel  ",
+              ("!indication_chir", "!ipss_leger", "volume_gt_40")),
+        Regle("association", "association α-bloquant + I5AR si monothérapie insuffisante (efficacité supérieure; EI cumulatifs).",
+              ("!indication_chir", "!ipss_leger", "volume_gt_40")),
+        Regle("anticholinergique", "anticholinergique si SBAU de remplissage prédominants ET RPM < 150 mL (plutôt en ajout si persistance sous α-bloquant).",
+              ("!indication_chir", "!ipss_leger", "stockage_predominant", "rpm_lt_150")),
+        Regle("phytotherapie", "alternative — phytothérapie (Serenoa repens / Pygeum africanum) (tolérance bonne, efficacité modeste).",
+              ("!indication_chir", "!ipss_leger")),
+        # (3) indication chirurgicale stricte, chirurgie possible
+        Regle("rtup", "RTUP (mono/bipolaire) ou vaporisation endoscopique (laser/bipolaire) pour 30–70 mL.",
+              ("indication_chir", "!chir_impossible", "volume_30_70")),
+        Regle("enucleation", "énucléation endoscopique (HoLEP/ThuLEP/BipolEP) pour ≥ 70–100+ mL.",
+              ("indication_chir", "!chir_impossible", "volume_ge_71")),
+        Regle("adenomectomie", "adénomectomie sus-pubienne (ouverte/robot) si très gros volumes ou si énucléation indisponible.",
+              ("indication_chir", "!chir_impossible", "volume_gt_100")),
+        Regle("greenlight", "vaporisation laser (GreenLight) en cas de risque hémorragique/anticoagulants.",
+              ("indication_chir", "!chir_impossible", "risque_hemorragique")),
+        Regle("icp", "incision cervico-prostatique si petit volume (≤ 30–40 mL).",
+              ("indication_chir", "!chir_impossible", "volume_le_40")),
+        # (3) indication chirurgicale stricte, CI ou refus de la chirurgie
+        Regle("embolisation", "alternative — embolisation des artères prostatiques (diminution du volume) selon contexte.",
+              ("indication_chir", "chir_impossible", "volume_gt_80")),
+        Regle("palliatif", "palliatif — autosondages intermittents, ou sonde vésicale/cathéter sus-pubien à demeure.",
+              ("indication_chir", "chir_impossible")),
+    ],
+)
+
+NOTES_HBP = textes.enregistrer("hbp.notes", [
+    "Réévaluation après α-bloquant : une semaine (clinique, IPSS, tolérance).",
+    "Avant toute chirurgie : réaliser un ECBU ; information et consentement indispensables.",
+    "Complications chirurgicales : perop (saignement; TUR syndrome en monopolaire), précoces (RAU, hématurie/caillots, infection, TVP/EP, irritatifs), tardives (sténose urètre, sclérose du col).",
+    "RTUP bipolaire/lasers : sérum physiologique (pas de glycocolle). RTUP monopolaire : glycocolle (risque de TUR syndrome).",
+])
+
+# =========================
+# Coeur logique : NOUVELLE signature (sans lobe_median / preservation_ejac)
+# =========================
+def _plan_hbp_core(
+    age: int,
+    volume_ml: int,
+    ipss: int,
+    psa_total: float,
+    tr_suspect: Union[bool,str,int,float],
+    anticoag: Union[bool,str,int,float],
+    ci_chirurgie: Union[bool,str,int,float],
+    refus_chir: Union[bool,str,int,float],
+    infections_recid: Union[bool,str,int,float],
+    retention: Union[bool,str,int,float],
+    calculs: Union[bool,str,int,float],
+    hematurie_recid: Union[bool,str,int,float],
+    ir_post_obstacle: Union[bool,str,int,float],
+    echec_medical: Union[bool,str,int,float],
+    *,
+    stockage_predominant: Union[bool,str,int,float] = False,
+    rpm_ml: Optional[int] = None,
+    dysfonction_erectile: Union[bool,str,int,float] = False,
+) -> ResultatCAT:
+    # normalisation
+    tr_suspect        = _to_bool(tr_suspect)
+    anticoag          = _to_bool(anticoag)
+    ci_chirurgie      = _to_bool(ci_chirurgie)
+    refus_chir        = _to_bool(refus_chir)
+    infections_recid  = _to_bool(infections_recid)
+    retention         = _to_bool(retention)
+    calculs           = _to_bool(calculs)
+    hematurie_recid   = _to_bool(hematurie_recid)
+    ir_post_obstacle  = _to_bool(ir_post_obstacle)
+    echec_medical     = _to_bool(echec_medical)
+    stockage_predominant = _to_bool(stockage_predominant)
+
+    # (0) TRIAGE ADK, puis sections (mêmes fonctions que l'évaluation incrémentale PLAN_HBP)
+    adk = eval_suspicion_adk(psa_total, volume_ml, tr_suspect)
+    donnees = _donnees_hbp(age, volume_ml, ipss, psa_total, tr_suspect, anticoag, infections_recid, retention,
+                           calculs, hematurie_recid, ir_post_obstacle, echec_medical, stockage_predominant,
+                           rpm_ml, adk)
+    traitement = _traitement_hbp(adk, ipss, volume_ml, rpm_ml, anticoag, ci_chirurgie, refus_chir, echec_medical,
+                                 infections_recid, retention, calculs, hematurie_recid, ir_post_obstacle,
+                                 stockage_predominant)
+    return ResultatCAT(donnees=donnees, traitement=traitement, notes=_notes_hbp(adk))
+
+# =========================
+# Sections du plan HBP (partagées par _plan_hbp_core et PLAN_HBP)
+# =========================
+def _donnees_hbp(age, volume_ml, ipss, psa_total, tr_suspect, anticoag, infections_recid, retention, calculs,
+                 hematurie_recid, ir_post_obstacle, echec_medical, stockage_predominant, rpm_ml, adk) -> List[Tuple[str,str]]:
+    donnees: List[Tuple[str,str]] = [
+        ("Âge", f"{age} ans"),
+        ("Volume prostatique", f"{volume_ml} mL"),
+        ("IPSS", f"{ipss} ({classer_ipss(ipss)})"),
+        ("PSA total", f"{psa_total:.2f} ng/mL"),
+        ("TR suspect", "Oui" if tr_suspect else "Non"),
+        ("Anticoagulants/antiagrégants", "Oui" if anticoag else "Non"),
+        (
+            "Complications",
+            ", ".join([txt for ok, txt in [
+                (infections_recid, "IU récidivantes"),
+                (retention, "Rétention compliquée/sevrage impossible"),
+                (calculs, "Calcul vésical"),
+                (hematurie_recid, "Hématurie récidivante liée à l’HBP"),
+                (ir_post_obstacle, "IR obstructive liée à l’obstacle"),
+            ] if ok]) or "Aucune"
+        ),
+        ("Échec du traitement médical", "Oui" if echec_medical else "Non"),
+        ("LUTS de remplissage prédominants", "Oui" if stockage_predominant else "Non"),
+    ]
+    if rpm_ml is not None:
+        donnees.append(("Résidu post-mictionnel (RPM)", f"{rpm_ml} mL"))
+    psad = adk[2]
+    if psad is not None:
+        donnees.append(("Densité PSA (PSAD)", f"{psad:.2f}"))
+    return donnees
+
+
+def _traitement_hbp(adk, ipss, volume_ml, rpm_ml, anticoag, ci_chirurgie, refus_chir, echec_medical,
+                    infections_recid, retention, calculs, hematurie_recid, ir_post_obstacle,
+                    stockage_predominant) -> List[str]:
+    if adk[0]:
+        return [
+            "Option : IRM prostatique multiparamétrique, Biopsies prostatiques ciblées ± systématiques selon IRM.",
+        ]
+    # (1)–(3) options : règles déclaratives (REGLES_HBP) évaluées sur le contexte normalisé
+    return REGLES_HBP.options({
+        "ipss": ipss, "volume_ml": volume_ml, "rpm_ml": rpm_ml, "anticoag": anticoag,
+        "ci_chirurgie": ci_chirurgie, "refus_chir": refus_chir, "echec_medical": echec_medical,
+        "infections_recid": infections_recid, "retention": retention, "calculs": calculs,
+        "hematurie_recid": hematurie_recid, "ir_post_obstacle": ir_post_obstacle,
+        "stockage_predominant": stockage_predominant,
+    })
+
+
+def _notes_hbp(adk) -> List[str]:
+    # orientation ADK : explications du triage ; sinon notes HBP fixes
+    return adk[1] if adk[0] else textes.liste(NOTES_HBP)
+
+
+_BOOLEENS_HBP = (
+    "tr_suspect", "anticoag", "ci_chirurgie", "refus_chir", "infections_recid", "retention", "calculs",
+    "hematurie_recid", "ir_post_obstacle", "echec_medical", "stockage_predominant", "dysfonction_erectile",
+)
+
+def _entrees_hbp(**saisie) -> Dict[str, Any]:
+    """Saisie nommée de plan_hbp → entrées normalisées (Oui/Non → bool, optionnels par défaut)."""
+    e = {"stockage_predominant": False, "rpm_ml": None, "dysfonction_erectile": False, **saisie}
+    for nom in _BOOLEENS_HBP:
+        e[nom] = _to_bool(e[nom])
+    return e
+
+# Évaluation incrémentale : basculer `anticoag` ne recalcule que donnees + traitement (ADK et notes repris)
+PLAN_HBP = PlanIncremental(
+    [
+        Section.de("adk", eval_suspicion_adk),
+        Section.de("donnees", _donnees_hbp),
+        Section.de("traitement", _traitement_hbp),
+        Section.de("notes", _notes_hbp),
+    ],
+    normaliser=_entrees_hbp,
+    assembler=lambda v: ResultatCAT(donnees=v["donnees"], traitement=v["traitement"], notes=v["notes"]),
+)
+
+# =========================
+# ADAPTATEUR : accepte ANCIEN appel (avec lobe_median, preservation_ejac) et NOUVEL appel
+# =========================
+_PARAMS_HBP = (
+    "age", "volume_ml", "ipss", "psa_total", "tr_suspect", "anticoag", "ci_chirurgie", "refus_chir",
+    "infections_recid", "retention", "calculs", "hematurie_recid", "ir_post_obstacle", "echec_medical",
+)
+
+def _args_hbp(*args, **kwargs) -> Dict[str, Any]:
+    """
+    Ramène un appel plan_hbp (ancienne/nouvelle signature, positionnel ou mots-clés)
+    aux mots-clés de _plan_hbp_core :
+      Ancienne signature (≥16 args positionnels):
+        age, volume_ml, lobe_median, ipss, psa_total, tr_suspect, anticoag,
+        preservation_ejac, ci_chirurgie, refus_chir, infections_recid, retention,
+        calculs, hematurie_recid, ir_post_obstacle, echec_medical, [optionnels...]
+      Nouvelle signature (≥14 args positionnels, sans lobe_median/preservation_ejac):
+        age, volume_ml, ipss, psa_total, tr_suspect, anticoag, ci_chirurgie, refus_chir,
+        infections_recid, retention, calculs, hematurie_recid, ir_post_obstacle, echec_medical, [optionnels...]
+      Ou bien en mots-clés (kwargs) avec la nouvelle signature.
+    """
+    # 1) Appel 100% kwargs (nouvelle signature) — ou trop peu de positionnels : on s'en remet aux kwargs
+    if len(args) < 14:
+        return kwargs
+
+    # 2) Ancienne signature positionnelle : on retire lobe_median (args[2]) & preservation_ejac (args[7])
+    if len(args) >= 16:
+        args = args[:2] + args[3:7] + args[8:]
+
+    # 3) Nouvelle signature positionnelle (+ optionnels positionnels : stockage_predominant, rpm_ml, dysfonction_erectile)
+    noms = dict(zip(_PARAMS_HBP, args[:14]))
+    opt = list(args[14:])
+    stockage_predominant = opt[0] if len(opt) >= 1 else kwargs.pop("stockage_predominant", False)
+    rpm_ml                = opt[1] if len(opt) >= 2 else kwargs.pop("rpm_ml", None)
+    dysfonction_erectile  = opt[2] if len(opt) >= 3 else kwargs.pop("dysfonction_erectile", False)
+    noms.update(
+        stockage_predominant=_to_bool(stockage_predominant),
+        rpm_ml=rpm_ml,
+        dysfonction_erectile=_to_bool(dysfonction_erectile),
+    )
+    for k in kwargs:
+        if k in noms:
+            raise TypeError(f"plan_hbp() got multiple values for argument '{k}'")
+    noms.update(kwargs)
+    return noms
+
+def plan_hbp(*args, **kwargs) -> Dict[str, Any]:
+    """Point d'entrée HBP : accepte l'ancien et le nouvel appel (voir _args_hbp)."""
+    return _plan_hbp_core(**_args_hbp(*args, **kwargs))
+
+
+def sections_hbp(plan: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Rubriques du rapport HBP (page et export en masse)."""
+    return {
+        "Données": lignes_paires(plan["donnees"]),
+        "Traitement (options)": plan["traitement"],
+        "Notes": plan["notes"],
+    }
@@ -0,0 +1,95 @@
+# moteur/incremental.py — réévaluation incrémentale d'un plan découpé en sections
+# Chaque section déclare les entrées (ou sections) qu'elle lit. Sur une nouvelle saisie, seules les
+# sections dont une dépendance a changé sont recalculées ; les autres sont reprises de l'évaluation
+# précédente. Coupure anticipée : une section recalculée à l'identique ne propage pas le changement.
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, FrozenSet, Mapping, Optional, Sequence, Set, Tuple
+
+_ABSENT = object()
+
+
+def _cle_typee(v: Any) -> Any:
+    # comme moteur.cache : 40 et 40.0 (ou True et 1) sont égaux mais ne s'affichent pas pareil
+    return (type(v), v)
+
+
+@dataclass(frozen=True)
+class Section:
+    """Section `nom` = calcul(**{d: valeur} pour d dans `lit`) ; `lit` nomme des entrées ou des sections antérieures."""
+    nom: str
+    lit: Tuple[str, ...]
+    calcul: Callable[..., Any]
+
+    @classmethod
+    def de(cls, nom: str, calcul: Callable[..., Any]) -> "Section":
+        """Section dont les dépendances sont les paramètres de `calcul` (déclaration sans doublon)."""
+        code = calcul.__code__
+        return cls(nom, code.co_varnames[:code.co_argcount], calcul)
+
+
+@dataclass(frozen=True)
+class Evaluation:
+    entrees: Mapping[str, Any]     # entrées normalisées
+    valeurs: Mapping[str, Any]     # section → valeur
+    recalculees: FrozenSet[str]    # sections calculées lors de cette évaluation
+
+    def __getitem__(self, nom: str) -> Any:
+        return self.valeurs[nom]
+
+
+class PlanIncremental:
+    """
+    Sections évaluées dans l'ordre de déclaration (une section ne lit que des sections déclarées avant elle).
+    `normaliser` ramène la saisie brute aux entrées comparées ; `assembler` construit le résultat final.
+    """
+
+    def __init__(self, sections: Sequence[Section], normaliser: Optional[Callable[..., Dict[str, Any]]] = None,
+                 assembler: Optional[Callable[[Mapping[str, Any]], Any]] = None):
+        noms = [s.nom for s in sections]
+        doublons = {n for n in noms if noms.count(n) > 1}
+        if doublons:
+            raise ValueError(f"Section(s) déclarée(s) deux fois : {', '.join(sorted(doublons))}")
+        for i, s in enumerate(sections):
+            plus_tard = set(s.lit) & set(noms[i:])
+            if plus_tard:
+                raise ValueError(f"La section {s.nom!r} lit une section déclarée après elle : {', '.join(sorted(plus_tard))}")
+        self.sections = tuple(sections)
+        self._sections = frozenset(noms)
+        self.normaliser = normaliser
+        self.assembler = assembler
+
+    def dependances(self) -> Dict[str, FrozenSet[str]]:
+        """Entrée → sections à recalculer quand elle change (fermeture transitive, hors coupure anticipée)."""
+        touchees: Dict[str, Set[str]] = {}
+        for s in self.sections:
+            for d in s.lit:
+                for entree in ((d,) if d not in self._sections else
+                               [e for e, ss in touchees.items() if d in ss]):
+                    touchees.setdefault(entree, set()).add(s.nom)
+        return {e: frozenset(ss) for e, ss in touchees.items()}
+
+    def evaluer(self, saisie: Mapping[str, Any], precedent: Optional[Evaluation] = None) -> Evaluation:
+        """Évalue `saisie` ; avec `precedent`, ne recalcule que les sections touchées par le delta d'entrées."""
+        entrees = self.normaliser(**saisie) if self.normaliser else dict(saisie)
+        if precedent is None:
+            changees = None  # tout calculer
+        else:
+            changees = {k for k in entrees.keys() | precedent.entrees.keys()
+                        if _cle_typee(entrees.get(k, _ABSENT)) != _cle_typee(precedent.entrees.get(k, _ABSENT))}
+        valeurs: Dict[str, Any] = {}
+        recalculees = set()
+        for s in self.sections:
+            if changees is not None and changees.isdisjoint(s.lit):
+                valeurs[s.nom] = precedent.valeurs[s.nom]
+                continue
+            v = valeurs[s.nom] = s.calcul(**{d: valeurs[d] if d in self._sections else entrees[d] for d in s.lit})
+            recalculees.add(s.nom)
+            if changees is not None and _cle_typee(v) != _cle_typee(precedent.valeurs.get(s.nom, _ABSENT)):
+                changees.add(s.nom)
+        return Evaluation(MappingProxyType(entrees), MappingProxyType(valeurs), frozenset(recalculees))
+
+    def resultat(self, evaluation: Evaluation) -> Any:
+        return self.assembler(evaluation.valeurs) if self.assembler else dict(evaluation.valeurs)
+
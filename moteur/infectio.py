@@ -0,0 +1,375 @@
+# moteur/infectio.py — Infections urinaires (cystite, PNA, grossesse, prostatite)
+
+from typing import Any, Dict, List
+
+from . import textes
+from .commun import lignes_paires
+from .regles import JeuRegles, Regle
+from .resultat import ResultatCAT
+
+# =========================
+# LOGIQUE CLINIQUE — INFECTIO (Grossesse, Cystite, PNA, Prostatite)
+# =========================
+
+def _flags_severite(seps_sbp_lt90: bool, seps_hr_gt120: bool, confusion: bool, vomissements: bool, obstruction_suspecte: bool):
+    """Retourne (est_grave: bool, raisons: list[str])"""
+    raisons = []
+    if seps_sbp_lt90: raisons.append("Hypotension (sepsis/choc)")
+    if seps_hr_gt120: raisons.append("Tachycardie >120/min")
+    if confusion: raisons.append("Troubles neuro (confusion)")
+    if vomissements: raisons.append("Vomissements empêchant la voie orale")
+    if obstruction_suspecte: raisons.append("Obstacle/suspicion de colique ou anurie")
+    grave = bool(seps_sbp_lt90 or seps_hr_gt120 or confusion or obstruction_suspecte or vomissements)
+    return grave, raisons
+
+
+def _is_risque_complication(
+    homme: bool=False, grossesse: bool=False, age_ge65_fragile: bool=False, anomalies_uro: bool=False,
+    immunodep: bool=False, irc_significative: bool=False, sonde: bool=False, diabete_non_controle: bool=False
+):
+    """Facteurs de risque de complication (hors gravité)"""
+    return any([homme, grossesse, age_ge65_fragile, anomalies_uro, immunodep, irc_significative, sonde, diabete_non_controle])
+
+
+# ---------- CYSTITE (plutôt femme, hors grossesse) ----------
+
+_PREDICATS_CYSTITE = {
+    "simple": ("risque", "==", "Simple"),
+    "a_risque": ("risque", "==", "À risque de complication"),
+    "grave": ("risque", "==", "Grave"),
+}
+
+# Conduites + probabiliste selon la catégorie
+REGLES_CYSTITE = JeuRegles("infectio.cystite.options", _PREDICATS_CYSTITE, [
+    Regle("fosfomycine", "Probabiliste — Fosfomycine-trométamol (dose unique).", ("simple",)),
+    Regle("pivmecillinam", "Probabiliste — Pivmécillinam (5–7 jours).", ("simple",)),
+    Regle("nitrofurantoine", "Probabiliste — Nitrofurantoïne (5 jours).", ("simple",)),
+    Regle("fq_courte", "Alternative — Fluoroquinolone courte (si alternatives inadaptées/locales).", ("simple",)),
+    Regle("ecbu_nitrofurantoine", "ECBU avant ATB si possible, puis Probabiliste — Nitrofurantoïne (7 jours).", ("a_risque",)),
+    Regle("cefixime", "Probabiliste — Céfixime (5–7 jours) selon éco locale.", ("a_risque",)),
+    Regle("fq", "Probabiliste — Fluoroquinolone (≈5 jours) si alternatives inadaptées.", ("a_risque",)),
+    Regle("protocole_pna", "Suspect PNA/sepsis → bascule vers protocole PNA (voir rubrique PNA).", ("grave",)),
+    Regle("hospitalisation", "Hospitalisation si signes de sepsis/choc, vomissements, ou obstacle suspect.", ("grave",)),
+])
+
+NOTES_CYSTITE = JeuRegles("infectio.cystite.notes", _PREDICATS_CYSTITE, [
+    Regle("homme", "Éviter fosfomycine/nitrofurantoïne chez l’homme (préférer prostatite : voir module dédié).",
+          ("a_risque",), numerotee=False),
+    # Étapes communes
+    Regle("antibiogramme", "Toujours adapter l’antibiothérapie à l’antibiogramme (48–72 h).", ("!simple",), numerotee=False),
+])
+
+SUIVI_CYSTITE = {
+    "Simple": textes.enregistrer("infectio.cystite.suivi_simple", [
+        "ECBU non systématique si évolution typique; reconsulter si non amélioration en 48–72 h.",
+        "Si non amélioration 48–72 h : réaliser ECBU, réévaluer diagnostic, envisager écho rénale (± uro-TDM si fièvre/douleurs).",
+        "Si récidivantes : mesures hygiéno-diététiques; ECBU à chaque épisode pour différencier rechute/reinfection.",
+    ]),
+    "À risque de complication": textes.enregistrer("infectio.cystite.suivi_a_risque", [
+        "ECBU systématique AVANT antibiothérapie si possible; adapter au résultat sous 48–72 h.",
+        "Si non amélioration 48–72 h : contrôle ECBU, vérifier observance et interactions; imagerie si fièvre/douleur (écho ± uro-TDM).",
+    ]),
+    "Grave": textes.enregistrer("infectio.cystite.suivi_grave", [
+        "ECBU + hémocultures avant ATB; antibiothérapie IV probabiliste; imagerie (uro-TDM ≤24 h) si douleur/fièvre prolongée/obstacle.",
+    ]),
+}
+
+
+def plan_cystite(
+    age: int,
+    fievre_ge_38_5: bool,
+    lombalgies: bool,
+    douleurs_intenses: bool,
+    hematurie: bool,
+    recidivante: bool,
+    homme: bool,
+    grossesse: bool,
+    age_ge65_fragile: bool,
+    anomalies_uro: bool,
+    immunodep: bool,
+    irc_significative: bool,
+    sonde: bool,
+    diabete_non_controle: bool,
+    seps_sbp_lt90: bool,
+    seps_hr_gt120: bool,
+    confusion: bool,
+    vomissements: bool,
+):
+    """
+    Classe: simple / à risque de complication / grave (suspicion pyélo ou sepsis).
+    """
+    donnees = [
+        ("Âge", f"{age} ans"),
+        ("Fièvre ≥ 38,5°C", "Oui" if fievre_ge_38_5 else "Non"),
+        ("Douleur lombaire", "Oui" if lombalgies else "Non"),
+        ("Douleur intense", "Oui" if douleurs_intenses else "Non"),
+        ("Hématurie", "Oui" if hematurie else "Non"),
+        ("Récidivante", "Oui" if recidivante else "Non"),
+        ("Sexe masculin", "Oui" if homme else "Non"),
+        ("Grossesse", "Oui" if grossesse else "Non"),
+        ("≥65 ans fragile", "Oui" if age_ge65_fragile else "Non"),
+        ("Anomalies uro/obstacle", "Oui" if anomalies_uro else "Non"),
+        ("Immunodépression", "Oui" if immunodep else "Non"),
+        ("IR chronique significative", "Oui" if irc_significative else "Non"),
+        ("Sonde urinaire", "Oui" if sonde else "Non"),
+        ("Diabète non contrôlé", "Oui" if diabete_non_controle else "Non"),
+    ]
+    obstruction_suspecte = anomalies_uro
+    grave, raisons_grav = _flags_severite(seps_sbp_lt90, seps_hr_gt120, confusion, vomissements, obstruction_suspecte)
+
+    # Pyélo suspectée si fièvre/lombalgies/douleurs importantes → bascule vers prise en charge PNA
+    suspicion_pyelo = fievre_ge_38_5 or lombalgies or douleurs_intenses
+
+    risque = "Grave" if grave or suspicion_pyelo else ("À risque de complication" if _is_risque_complication(
+        homme, grossesse, age_ge65_fragile, anomalies_uro, immunodep, irc_significative, sonde, diabete_non_controle
+    ) else "Simple")
+
+    classification = [("Catégorie", risque)]
+    if grave or suspicion_pyelo:
+        classification.append(("Arguments de gravité/suspicion PNA", ", ".join(raisons_grav) if raisons_grav else "Fièvre/douleur lombaire"))
+
+    contexte = {"risque": risque}
+    options = REGLES_CYSTITE.options(contexte)
+    suivi = textes.liste(SUIVI_CYSTITE[risque])
+    notes = NOTES_CYSTITE.options(contexte)
+    return ResultatCAT(donnees=donnees, classification=classification, traitement=options, suivi=suivi, notes=notes)
+
+
+# ---------- PYÉLONÉPHRITE AIGUË (PNA) ----------
+
+_PREDICATS_CATEGORIE = {
+    "simple": ("categorie", "==", "Simple"),
+    "a_risque": ("categorie", "==", "À risque de complication"),
+    "grave": ("categorie", "==", "Grave"),
+}
+
+# Probabiliste par catégorie
+REGLES_PNA = JeuRegles("infectio.pna.options", _PREDICATS_CATEGORIE, [
+    Regle("fq", "Probabiliste — Fluoroquinolone per os (si épidémiologie locale favorable).", ("simple",)),
+    Regle("c3g_relais", "Probabiliste — C3G (ex. ceftriaxone) dose initiale IV/IM puis relais per os.", ("simple",)),
+    Regle("bl_relais", "Alternative — Bêta-lactamine parentérale en relais PO (durée totale 7–10 jours).", ("simple",)),
+    Regle("c3g_iv", "Probabiliste — C3G IV (ex. cefotaxime/ceftriaxone) ± amikacine selon gravité locale.", ("a_risque",)),
+    Regle("blse", "Alternative — BLSE suspecté : carbapénème ± amikacine.", ("a_risque",)),
+    Regle("hospitalisation", "Hospitalisation d’emblée.", ("grave",)),
+    Regle("c3g_amikacine", "Probabiliste — C3G IV + amikacine; si BLSE suspecté → carbapénème + amikacine.", ("grave",)),
+    Regle("drainage", "Drainage urgent si obstacle (JJ/néphrostomie) après avis urologique.", ("grave",)),
+])
+
+SUIVI_PNA = {
+    "Simple": textes.enregistrer("infectio.pna.suivi_simple", [
+        "ECBU systématique (avant ATB si possible).",
+        "Réévaluation clinique/biologique à 48–72 h; adapter à l’antibiogramme.",
+        "Imagerie non systématique au départ; réaliser une écho si douleur inhabituelle, calcul connu, ou si non amélioration 48–72 h.",
+    ]),
+    "À risque de complication": textes.enregistrer("infectio.pna.suivi_a_risque", [
+        "ECBU + hémocultures avant ATB; imagerie uro-TDM ≤24 h si douleur sévère, fièvre persistante, ou obstacle suspect.",
+        "Réévaluation à 48–72 h : adapter ATB; relais per os dès apyrexie/prise orale possible; durée 10–14 jours (selon molécule).",
+    ]),
+    "Grave": textes.enregistrer("infectio.pna.suivi_grave", [
+        "ECBU + hémocultures; bilan biologique complet.",
+        "Uro-TDM en urgence si obstacle suspecté; sinon ≤24 h si état sévère persistant.",
+        "Réévaluation 24–48 h : adapter; surveillance rapprochée (PA/FC/SpO2/diurèse).",
+    ]),
+}
+
+NOTES_PNA = textes.enregistrer("infectio.pna.notes", [
+    "Adapter systématiquement au résultat de l’antibiogramme (48–72 h).",
+])
+
+
+def plan_pna(
+    fievre_ge_38_5: bool,
+    douleur_lombaire: bool,
+    vomissements: bool,
+    homme: bool,
+    grossesse: bool,
+    age_ge65_fragile: bool,
+    anomalies_uro: bool,
+    immunodep: bool,
+    irc_significative: bool,
+    sonde: bool,
+    diabete_non_controle: bool,
+    seps_sbp_lt90: bool,
+    seps_hr_gt120: bool,
+    confusion: bool,
+):
+    donnees = [
+        ("Fièvre ≥ 38,5°C", "Oui" if fievre_ge_38_5 else "Non"),
+        ("Douleur lombaire", "Oui" if douleur_lombaire else "Non"),
+        ("Vomissements", "Oui" if vomissements else "Non"),
+        ("Sexe masculin", "Oui" if homme else "Non"),
+        ("Grossesse", "Oui" if grossesse else "Non"),
+        ("≥65 ans fragile", "Oui" if age_ge65_fragile else "Non"),
+        ("Anomalies uro/obstacle", "Oui" if anomalies_uro else "Non"),
+        ("Immunodépression", "Oui" if immunodep else "Non"),
+        ("IR chronique significative", "Oui" if irc_significative else "Non"),
+        ("Sonde urinaire", "Oui" if sonde else "Non"),
+        ("Diabète non contrôlé", "Oui" if diabete_non_controle else "Non"),
+    ]
+    obstruction_suspecte = anomalies_uro
+    grave, raisons_grav = _flags_severite(seps_sbp_lt90, seps_hr_gt120, confusion, vomissements, obstruction_suspecte)
+
+    if grave:
+        categorie = "Grave"
+    else:
+        categorie = "À risque de complication" if _is_risque_complication(
+            homme, grossesse, age_ge65_fragile, anomalies_uro, immunodep, irc_significative, sonde, diabete_non_controle
+        ) else "Simple"
+
+    classification = [("Catégorie", categorie)]
+    if raisons_grav:
+        classification.append(("Critères de gravité", ", ".join(raisons_grav)))
+
+    contexte = {"categorie": categorie}
+    options = REGLES_PNA.options(contexte)
+    suivi = textes.liste(SUIVI_PNA[categorie])
+    notes = textes.liste(NOTES_PNA)
+    return ResultatCAT(donnees=donnees, classification=classification, traitement=options, suivi=suivi, notes=notes)
+
+
+# ---------- GROSSESSE (bactériurie, cystite, PNA) ----------
+
+_PREDICATS_GROSSESSE = {
+    # toujours à risque (grossesse) mais hors gravité ; sinon PNA gravidique
+    "bacteriurie": ("type_tableau", "==", "Bactériurie asymptomatique"),
+    "cystite": ("type_tableau", "==", "Cystite"),
+    "bas_appareil": ("un_de", ("bacteriurie", "cystite")),
+}
+
+REGLES_GROSSESSE = JeuRegles("infectio.grossesse.options", _PREDICATS_GROSSESSE, [
+    Regle("amoxicilline", "Probabiliste — Amoxicilline / Pivmécillinam / Fosfomycine (dose unique) / Céfixime (selon contexte local).",
+          ("bas_appareil",)),
+    Regle("nitrofurantoine", "Alternative — Nitrofurantoïne (éviter au 9e mois).", ("bas_appareil", "!terme_9e_mois")),
+    Regle("trimethoprime", "Alternative — Triméthoprime (à partir du 2e trimestre) si autres CI.", ("bas_appareil",)),
+    Regle("hospitalisation", "Hospitalisation d’emblée.", ("!bas_appareil",)),
+    Regle("c3g", "Probabiliste — C3G IV (ex. ceftriaxone) ± amikacine selon gravité.", ("!bas_appareil",)),
+    Regle("aztreonam", "Alternative — Selon allergie BL, discuter aztréonam ± aminoside (avis spécialisé).", ("!bas_appareil",)),
+])
+
+NOTES_GROSSESSE = JeuRegles("infectio.grossesse.notes", {}, [
+    Regle("gravite", "Signes de gravité (ex. sepsis, vomissements) → hospitalisation et traitement IV.", ("grave",),
+          numerotee=False),
+    Regle("antibiogramme", "Adapter systématiquement à l’antibiogramme (48–72 h).", numerotee=False),
+])
+
+SUIVI_GROSSESSE = {
+    True: textes.enregistrer("infectio.grossesse.suivi_bas_appareil", [
+        "ECBU AVANT traitement; contrôle ECBU 48 h après début si symptômes persistants; ECBU de contrôle 8–10 jours après fin du traitement.",
+        "Dépistage mensuel ultérieur de la bactériurie pendant la grossesse.",
+        "Si non amélioration à 48–72 h : réévaluer, refaire ECBU, envisager écho rénale.",
+    ]),
+    False: textes.enregistrer("infectio.grossesse.suivi_pna", [
+        "ECBU + hémocultures avant ATB; surveillance obstétricale.",
+        "Imagerie en cas de non réponse 48–72 h ou douleur atypique (écho; uro-TDM si indispensable).",
+        "Durée minimale 14 jours; relais per os dès que possible; ECBU de contrôle à 8–10 jours après fin.",
+    ]),
+}
+
+
+def plan_grossesse(
+    type_tableau: str,  # "Bactériurie asymptomatique", "Cystite", "PNA"
+    terme_9e_mois: bool,
+    allergies_betalactamines: bool,
+    seps_sbp_lt90: bool,
+    seps_hr_gt120: bool,
+    vomissements: bool,
+):
+    donnees = [
+        ("Tableau", type_tableau),
+        ("9e mois (nitrofurantoïne à éviter)", "Oui" if terme_9e_mois else "Non"),
+        ("Allergie bêta-lactamines", "Oui" if allergies_betalactamines else "Non"),
+    ]
+    grave, raisons_grav = _flags_severite(seps_sbp_lt90, seps_hr_gt120, False, vomissements, False)
+
+    bas_appareil = type_tableau in ("Bactériurie asymptomatique", "Cystite")
+    contexte = {"type_tableau": type_tableau, "terme_9e_mois": terme_9e_mois, "grave": grave}
+    options = REGLES_GROSSESSE.options(contexte)
+    suivi = textes.liste(SUIVI_GROSSESSE[bas_appareil])
+    notes = NOTES_GROSSESSE.options(contexte)
+    return ResultatCAT(donnees=donnees, classification=[("Gravité", "Oui" if grave else "Non")], traitement=options, suivi=suivi, notes=notes)
+
+
+# ---------- HOMME — PROSTATITE AIGUË (IU masculine) ----------
+
+REGLES_PROSTATITE = JeuRegles("infectio.prostatite.options", _PREDICATS_CATEGORIE, [
+    Regle("fq", "Probabiliste — Fluoroquinolone (bonne diffusion prostatique) **ou** TMP-SMX (relais documenté).",
+          ("a_risque",)),
+    Regle("c3g_relais", "Alternative — Dose initiale C3G (ceftriaxone) puis relais per os (FQ/TMP-SMX) selon ATBgramme.",
+          ("a_risque",)),
+    # grave ou post-biopsie
+    Regle("hospitalisation", "Hospitalisation/prise en charge rapprochée.", ("grave",)),
+    Regle("c3g_amikacine", "Probabiliste — C3G IV + amikacine; relais per os par FQ/TMP-SMX dès amélioration.", ("grave",)),
+    Regle("post_biopsie", "Contexte post-biopsie — Bi-antibiothérapie IV d’emblée (C3G + aminoside).",
+          ("grave", "post_biopsie_prostate")),
+    Regle("drainage", "Drainage vésical (sondage sus-pubien privilégié) après avis.", ("grave", "retention")),
+])
+
+SUIVI_PROSTATITE = {
+    "À risque de complication": textes.enregistrer("infectio.prostatite.suivi_a_risque", [
+        "ECBU systématique (avant ATB si possible) ± hémocultures si fièvre.",
+        "Réévaluation 48–72 h; adapter à l’antibiogramme; durée totale ≥14 jours (souvent 14–21 jours).",
+        "Éviter nitrofurantoïne, fosfomycine, amoxicilline+acide clavulanique, céfixime (diffusion prostatique insuffisante).",
+    ]),
+    "Grave": textes.enregistrer("infectio.prostatite.suivi_grave", [
+        "ECBU + hémocultures; bilan biologique.",
+        "Échographie si rétention/douleur; uro-TDM si évolution défavorable.",
+        "Réévaluation 24–48 h; adapter ATB; durée totale 14–21 jours.",
+    ]),
+}
+
+NOTES_PROSTATITE = textes.enregistrer("infectio.prostatite.notes", [
+    "Adapter systématiquement au résultat de l’antibiogramme (48–72 h).",
+])
+
+
+def plan_prostatite(
+    fievre_ge_38_5: bool,
+    douleurs_perineales: bool,
+    dysurie: bool,
+    retention: bool,
+    post_biopsie_prostate: bool,
+    immunodep: bool,
+    irc_significative: bool,
+    seps_sbp_lt90: bool,
+    seps_hr_gt120: bool,
+    confusion: bool,
+):
+    donnees = [
+        ("Fièvre ≥ 38,5°C", "Oui" if fievre_ge_38_5 else "Non"),
+        ("Douleurs périnéales", "Oui" if douleurs_perineales else "Non"),
+        ("Dysurie", "Oui" if dysurie else "Non"),
+        ("Rétention aiguë", "Oui" if retention else "Non"),
+        ("Contexte post-biopsie", "Oui" if post_biopsie_prostate else "Non"),
+        ("Immunodépression", "Oui" if immunodep else "Non"),
+        ("IR chronique significative", "Oui" if irc_significative else "Non"),
+    ]
+    obstruction_suspecte = retention
+    grave, raisons_grav = _flags_severite(seps_sbp_lt90, seps_hr_gt120, confusion, False, obstruction_suspecte)
+
+    # Toute IU masculine = à risque; grave si sepsis/retention/post-biopsie fébrile
+    categorie = "Grave" if grave or post_biopsie_prostate else "À risque de complication"
+
+    classification = [("Catégorie", categorie)]
+    if raisons_grav or post_biopsie_prostate:
+        r = raisons_grav.copy()
+        if post_biopsie_prostate: r.append("Contexte post-biopsie")
+        classification.append(("Critères", ", ".join(r)))
+
+    contexte = {"categorie": categorie, "post_biopsie_prostate": post_biopsie_prostate, "retention": retention}
+    options = REGLES_PROSTATITE.options(contexte)
+    suivi = textes.liste(SUIVI_PROSTATITE[categorie])
+    notes = textes.liste(NOTES_PROSTATITE)
+    return ResultatCAT(donnees=donnees, classification=classification, traitement=options, suivi=suivi, notes=notes)
+
+
+# ---------- RAPPORT (rubriques communes aux quatre plans) ----------
+
+def sections_infectio(plan: Dict[str, Any], classification: str = "Stratification") -> Dict[str, List[str]]:
+    """Rubriques du rapport d'infectiologie (pages et export en masse) ; `classification` : titre de la rubrique."""
+    return {
+        "Données": lignes_paires(plan["donnees"]),
+        classification: lignes_paires(plan["classification"]),
+        "Traitement": plan["traitement"],
+        "Conduite/Follow-up": plan["suivi"],
+        "Notes": plan["notes"],
+    }
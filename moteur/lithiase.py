@@ -0,0 +1,183 @@
+# moteur/lithiase.py — Lithiase urinaire (colique néphrétique, choix technique)
+
+from typing import Any, Dict, List
+
+from . import textes
+from .commun import lignes_paires
+from .regles import JeuRegles, Regle
+from .resultat import ResultatCAT
+
+# =========================
+# LOGIQUE CLINIQUE — LITHIASE (MAJ: hygiène, antalgie si douleur, options chir précises)
+# =========================
+
+def classer_cn_severite(fievre: bool, hyperalgique: bool, oligoanurie: bool, doute_diag: bool) -> str:
+    """Retourne 'compliquée' si au moins un critère de gravité, sinon 'simple'."""
+    if fievre or hyperalgique or oligoanurie or doute_diag:
+        return "compliquée"
+    return "simple"
+
+
+# =========================
+# RÈGLES — choix de la technique selon le calcul (forme simple, taille connue)
+# CI usuelles de l'ESWL : grossesse, troubles de l'hémostase/anticoagulants non corrigés
+# =========================
+REGLES_TECHNIQUE = JeuRegles(
+    "lithiase.technique",
+    predicats={
+        "uretere": ("localisation", "commence", "Uretère"),
+        "lt_10": ("taille_mm", "<", 10),
+        "lt_20": ("taille_mm", "<", 20),
+        "ge_10": ("taille_mm", ">=", 10),
+        "eswl_possible": ("tous", ("!grossesse", "!anticoag")),
+    },
+    regles=[
+        # Urétéral < 10 mm : ESWL privilégiée, URS semi-rigide en alternative
+        Regle("u_eswl", "traitement chirurgical — LEC/ESWL (uretère < 10 mm).", ("uretere", "lt_10", "eswl_possible")),
+        Regle("u_urs_rigide", "traitement chirurgical — URS semi-rigide (urétéral < 10 mm).", ("uretere", "lt_10")),
+        # Urétéral ≥ 10 mm : URS semi-rigide en 1re intention ; ESWL discutée
+        Regle("u_urs_rigide_10", "traitement chirurgical — URS semi-rigide (uretère ≥ 10 mm).", ("uretere", "!lt_10")),
+        Regle("u_eswl_10", "traitement chirurgical — LEC/ESWL (au cas par cas selon densité/position).",
+              ("uretere", "!lt_10", "eswl_possible")),
+        # URS souple/flexible si besoin d'accès proximal/complexe
+        Regle("u_urs_souple", "traitement chirurgical — URS souple/flexible (si localisation haute/accès difficile).", ("uretere",)),
+        # Rénal (intracavitaire) < 20 mm ; mini-perc pour 10–20 mm denses/anatomie défavorable
+        Regle("r_eswl", "traitement chirurgical — LEC/ESWL (rénal < 20 mm).", ("!uretere", "lt_20", "eswl_possible")),
+        Regle("r_urs_souple", "traitement chirurgical — URS souple/flexible (rénal < 20 mm, pôle inférieur inclus).", ("!uretere", "lt_20")),
+        Regle("r_miniperc", "traitement chirurgical — Mini-perc (mini-PCNL) (rénal 10–20 mm denses ou anatomie défavorable).",
+              ("!uretere", "lt_20", "ge_10")),
+        # Rénal ≥ 20 mm : PCNL/NLPC de référence ; mini-perc si charge modérée et morphologie favorable
+        Regle("r_nlpc", "traitement chirurgical — NLPC / PCNL (≥ 20 mm, coralliformes).", ("!uretere", "!lt_20")),
+        Regle("r_miniperc_20", "traitement chirurgical — Mini-perc (mini-PCNL) (sélectionné selon charge et morphologie).",
+              ("!uretere", "!lt_20")),
+        # Contre-indications/notes générales
+        Regle("note_grossesse", "Note : Grossesse → ESWL contre-indiquée.", ("grossesse",), numerotee=False),
+        Regle("note_anticoag", "Note : Anticoagulants/troubles de l’hémostase non corrigés → corriger avant geste endoscopique/ESWL.",
+              ("anticoag",), numerotee=False),
+    ],
+)
+
+
+def choix_technique_selon_calcul(localisation: str, taille_mm: int, grossesse: bool, anticoag: bool):
+    """
+    Propose des options procédurales libellées précisément :
+    - LEC/ESWL
+    - URS semi-rigide (urétéral)
+    - URS souple/flexible (rénal ± urétéral)
+    - Mini-perc (mini-PCNL)
+    - NLPC / PCNL
+    Avec prise en compte de CI usuelles: grossesse, troubles hémostase/anticoagulants non corrigés.
+    Taille inconnue refusée : les règles « ≥ 10 mm / ≥ 20 mm » seraient retenues à tort (comparaisons fausses).
+    """
+    if taille_mm is None:
+        raise ValueError("Taille du calcul inconnue : pas de choix de technique (cf. plan_lithiase).")
+    return REGLES_TECHNIQUE.options({
+        "localisation": localisation, "taille_mm": taille_mm, "grossesse": grossesse, "anticoag": anticoag,
+    })
+
+
+# =========================
+# RÈGLES — colique néphrétique (urgence, imagerie, antalgie) ; notes ; hygiène-diététique
+# =========================
+_PREDICATS_LITHIASE = {
+    "compliquee": ("severite", "==", "compliquée"),
+    "taille_connue": ("taille_mm", "!=", None),
+}
+
+REGLES_LITHIASE = JeuRegles("lithiase.options", _PREDICATS_LITHIASE, [
+    # Forme compliquée : imagerie urgente, drainage initial (bien en évidence), ATB si fièvre, antalgie si douleur
+    Regle("imagerie_urgence_grossesse", "imagerie — Échographie ± ASP en première intention (grossesse).",
+          ("compliquee", "grossesse")),
+    Regle("imagerie_urgence", "imagerie — TDM abdomino-pelvienne sans injection en URGENCE.", ("compliquee", "!grossesse")),
+    Regle("drainage", "drainage initial en urgence — sonde JJ **ou** néphrostomie percutanée (obstacle infecté/anurie/hyperalgie).",
+          ("compliquee",)),
+    Regle("antibiotherapie", "antibiothérapie probabiliste puis adaptée à l’ECBU (si infection associée).", ("compliquee", "fievre")),
+    Regle("antalgie_urgence", "antalgie — AINS IV (ex. kétoprofène) ± paliers supérieurs si besoin, antiémétiques.",
+          ("compliquee", "douleur_actuelle")),
+    # Forme simple, taille inconnue → affiner par imagerie (hors grossesse TDM, en grossesse écho/ASP)
+    Regle("imagerie_grossesse", "imagerie — Échographie ± ASP pour préciser taille/localisation.",
+          ("!compliquee", "!taille_connue", "grossesse")),
+    Regle("imagerie", "imagerie — TDM sans injection pour préciser taille/densité/localisation.",
+          ("!compliquee", "!taille_connue", "!grossesse")),
+    Regle("antalgie", "antalgie — AINS ± morphiniques si besoin, antiémétiques.", ("!compliquee", "douleur_actuelle")),
+])
+
+NOTES_LITHIASE = JeuRegles("lithiase.notes", _PREDICATS_LITHIASE, [
+    Regle("grossesse", "Grossesse : ESWL contre-indiquée.", ("grossesse",), numerotee=False),
+    Regle("anticoag_urgence", "Anticoagulants/troubles de l’hémostase non corrigés : corriger avant tout geste.",
+          ("compliquee", "anticoag"), numerotee=False),
+    Regle("anticoag", "Anticoagulants/troubles de l’hémostase non corrigés : prudence et correction avant geste.",
+          ("!compliquee", "anticoag"), numerotee=False),
+    Regle("differe", "Le traitement lithiasique définitif est différé après contrôle de l’infection et levée de l’obstacle.",
+          ("compliquee",), numerotee=False),
+    Regle("spectrometrie", "Tout calcul extrait doit être adressé pour **étude spectrométrique** (analyse morpho-constitutionnelle).",
+          (), numerotee=False),
+])
+
+HYGIENE_LITHIASE = textes.enregistrer("lithiase.hygiene", [
+    "Hydratation : viser ≥ 2 litres/j (adapter si insuffisance cardiaque/rénale).",
+    "Réduire le sel (≈6–7 g/j) et modérer les protéines animales (<1 g/kg/j).",
+    "Limiter sucres rapides et aliments riches en oxalates si lithiase oxalo-calcique suspectée.",
+    "Activité physique régulière, éviter l’immobilisation prolongée.",
+    "À distance : bilan métabolique et **adaptation des apports** selon le type de lithiase (si identifié).",
+])
+
+
+def plan_lithiase(
+    fievre: bool,
+    hyperalgique: bool,
+    oligoanurie: bool,
+    doute_diag: bool,
+    grossesse: bool,
+    anticoag: bool,
+    localisation: str,      # "Uretère distal/moyen/proximal" ou "Rein (intracavicitaire)"
+    taille_mm: int | None,  # None si inconnue
+    douleur_actuelle: bool  # ← NOUVEAU: pour décider si on prescrit antalgie
+):
+    """
+    Retourne dict {donnees, traitement, hygiene, notes}
+    - Met en avant drainage initial si forme compliquée
+    - Antalgie seulement si douleur_actuelle = True
+    - Remplace 'suivi' par 'hygiene' (règles hygiéno-diététiques)
+    """
+    severite = classer_cn_severite(fievre, hyperalgique, oligoanurie, doute_diag)
+
+    donnees = [
+        ("Forme", severite),
+        ("Fièvre/infection", "Oui" if fievre else "Non"),
+        ("Douleur hyperalgique", "Oui" if hyperalgique else "Non"),
+        ("Oligo-anurie / IR", "Oui" if oligoanurie else "Non"),
+        ("Doute diagnostique", "Oui" if doute_diag else "Non"),
+        ("Douleur actuelle", "Oui" if douleur_actuelle else "Non"),
+        ("Grossesse", "Oui" if grossesse else "Non"),
+        ("Anticoagulants/troubles hémostase non corrigés", "Oui" if anticoag else "Non"),
+        ("Localisation du calcul", localisation),
+        ("Taille estimée", f"{taille_mm} mm" if isinstance(taille_mm, (int, float)) else "Inconnue"),
+    ]
+
+    contexte = {
+        "severite": severite, "fievre": fievre, "grossesse": grossesse, "anticoag": anticoag,
+        "taille_mm": taille_mm, "douleur_actuelle": douleur_actuelle,
+    }
+    # 1) Urgences / imagerie / drainage ; 2) forme simple : options selon taille/localisation.
+    # Le bloc technique et le bloc suivant sont chacun numérotés depuis 1 (comme jusqu'ici).
+    options = []
+    if severite != "compliquée" and taille_mm is not None:
+        options += choix_technique_selon_calcul(localisation, taille_mm, grossesse, anticoag)
+    options += REGLES_LITHIASE.options(contexte)
+
+    # 3) Hygiène-diététique (remplace 'suivi') ; 4) notes
+    hygiene = textes.liste(HYGIENE_LITHIASE)
+    notes = NOTES_LITHIASE.options(contexte)
+
+    return ResultatCAT(donnees=donnees, traitement=options, hygiene=hygiene, notes=notes)
+
+
+def sections_lithiase(plan: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Rubriques du rapport lithiase (page et export en masse)."""
+    return {
+        "Données": lignes_paires(plan["donnees"]),
+        "Conduite à tenir": plan["traitement"],
+        "Hygiène-diététique": plan["hygiene"],
+        "Notes": plan["notes"],
+    }
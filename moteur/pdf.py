@@ -0,0 +1,298 @@
+# moteur/pdf.py — export PDF des rapports CAT, en Python pur (bibliothèque standard seulement)
+# Polices standard Helvetica / Helvetica-Bold (non embarquées, encodage WinAnsi = cp1252) :
+# pas de fichier de police à lire, seules les tables de chasse (AFM) servent à la césure.
+# Gabarit, tables de chasse et objets fixes (catalogue, polices) sont préparés une fois par
+# processus (lru_cache) ; chaque rapport ne coûte plus que la mise en page et un zlib par page.
+
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+import codecs
+import io
+import unicodedata
+import zlib
+
+from .rapport import PIED_RAPPORT, entete_rapport
+
+
+# =========================
+# Gabarit de page
+# =========================
+
+@dataclass(frozen=True)
+class Gabarit:
+    """Format et typographie d'un rapport (points PDF, 1 pt = 1/72 pouce)."""
+    largeur: float = 595.28   # A4
+    hauteur: float = 841.89
+    marge_h: float = 56.0
+    marge_v: float = 56.0
+    corps_titre: float = 13.0
+    corps_date: float = 9.0
+    corps_section: float = 11.0
+    corps_texte: float = 10.0
+    corps_pied: float = 8.0
+    interligne: float = 1.3
+    retrait_puce: float = 12.0
+
+    @property
+    def largeur_utile(self) -> float:
+        return self.largeur - 2 * self.marge_h
+
+
+GABARIT = Gabarit()
+
+
+# =========================
+# Chasses Helvetica (AFM Adobe, 1/1000 d'em), codes 32–255 en WinAnsi
+# =========================
+
+_CHASSES = {
+    "Helvetica": (
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584, 350,
+        556, 350, 222, 556, 333, 1000, 556, 556, 333, 1000, 667, 333, 1000, 350, 611, 350,
+        350, 222, 222, 333, 333, 350, 556, 1000, 333, 1000, 500, 333, 944, 350, 500, 667,
+        278, 333, 556, 556, 556, 556, 260, 556, 333, 737, 370, 556, 584, 333, 737, 333,
+        400, 584, 333, 333, 333, 556, 537, 278, 333, 333, 365, 556, 834, 834, 834, 611,
+        667, 667, 667, 667, 667, 667, 1000, 722, 667, 667, 667, 667, 278, 278, 278, 278,
+        722, 722, 778, 778, 778, 778, 778, 584, 778, 722, 722, 722, 722, 667, 667, 611,
+        556, 556, 556, 556, 556, 556, 889, 500, 556, 556, 556, 556, 278, 278, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 584, 611, 556, 556, 556, 556, 500, 556, 500,
+    ),
+    "Helvetica-Bold": (
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+        975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+        333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+        611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584, 350,
+        556, 350, 278, 556, 500, 1000, 556, 556, 333, 1000, 667, 333, 1000, 350, 611, 350,
+        350, 278, 278, 500, 500, 350, 556, 1000, 333, 1000, 556, 333, 944, 350, 500, 667,
+        278, 333, 556, 556, 556, 556, 280, 556, 333, 737, 370, 556, 584, 333, 737, 333,
+        400, 584, 333, 333, 333, 611, 556, 278, 333, 333, 365, 556, 834, 834, 834, 611,
+        722, 722, 722, 722, 722, 722, 1000, 722, 667, 667, 667, 667, 278, 278, 278, 278,
+        722, 722, 778, 778, 778, 778, 778, 584, 778, 722, 722, 722, 722, 667, 667, 611,
+        556, 556, 556, 556, 556, 556, 889, 556, 556, 556, 556, 556, 278, 278, 278, 278,
+        611, 611, 611, 611, 611, 611, 611, 584, 611, 611, 611, 611, 611, 556, 611, 556,
+    ),
+}
+
+POLICES = {"F1": "Helvetica", "F2": "Helvetica-Bold"}
+
+
+@lru_cache(maxsize=None)
+def _chasses(police: str) -> Tuple[int, ...]:
+    # indexable directement par octet WinAnsi (codes de contrôle : 0)
+    return (0,) * 32 + _CHASSES[POLICES[police]]
+
+
+def largeur_texte(octets: bytes, police: str, corps: float) -> float:
+    return sum(map(_chasses(police).__getitem__, octets)) * corps / 1000
+
+
+# =========================
+# Texte → WinAnsi (cp1252)
+# =========================
+
+# caractères du moteur hors cp1252 : équivalents lisibles plutôt que « ? »
+_EQUIVALENTS = str.maketrans({
+    "→": "->", "←": "<-", "⬅": "<-", "↔": "<->", "↓": "v", "↳": "->", "⇒": "=>",
+    "≥": ">=", "≤": "<=", "≈": "~", "−": "-", "‑": "-", "∈": " dans ",
+    "α": "alpha", "Σ": "somme", "➕": "+", "️": None,
+})
+
+
+def _repli_winansi(err: UnicodeEncodeError) -> Tuple[str, int]:
+    # emoji et symboles sans équivalent : supprimés ; lettres accentuées rares : forme décomposée, sinon « ? »
+    car = err.object[err.start]
+    if unicodedata.category(car) == "So":
+        return "", err.start + 1
+    base = "".join(c for c in unicodedata.normalize("NFKD", car) if not unicodedata.combining(c))
+    try:
+        base.encode("cp1252")
+    except UnicodeEncodeError:
+        base = ""
+    return base or "?", err.start + 1
+
+
+codecs.register_error("moteur.pdf", _repli_winansi)
+
+
+def winansi(texte: Any) -> bytes:
+    return str(texte).translate(_EQUIVALENTS).encode("cp1252", "moteur.pdf")
+
+
+def _chaine_pdf(octets: bytes) -> bytes:
+    return b"(" + octets.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)") + b")"
+
+
+def couper(octets: bytes, police: str, corps: float, largeur: float) -> List[bytes]:
+    """Césure gloutonne aux espaces ; un mot plus large que la ligne est coupé au caractère."""
+    chasses = _chasses(police)
+    limite = largeur * 1000 / corps
+    espace = chasses[32]
+    lignes: List[bytes] = []
+    courante: List[bytes] = []
+    occupe = 0
+    for mot in octets.split(b" "):
+        l_mot = sum(map(chasses.__getitem__, mot))
+        if courante and occupe + espace + l_mot > limite:
+            lignes.append(b" ".join(courante))
+            courante, occupe = [], 0
+        while l_mot > limite and len(mot) > 1:
+            n, l = 0, 0
+            while n < len(mot) - 1 and l + chasses[mot[n]] <= limite:
+                l += chasses[mot[n]]
+                n += 1
+            lignes.append(mot[:max(n, 1)])
+            mot = mot[max(n, 1):]
+            l_mot = sum(map(chasses.__getitem__, mot))
+        occupe += (espace if courante else 0) + l_mot
+        courante.append(mot)
+    lignes.append(b" ".join(courante))
+    return lignes
+
+
+# =========================
+# Objets fixes (sérialisés une fois par processus)
+# =========================
+
+@lru_cache(maxsize=None)
+def _objets_polices() -> Tuple[bytes, ...]:
+    return tuple(
+        f"<< /Type /Font /Subtype /Type1 /BaseFont /{nom} /Encoding /WinAnsiEncoding >>".encode("ascii")
+        for nom in POLICES.values()
+    )
+
+
+@lru_cache(maxsize=None)
+def _ressources() -> bytes:
+    # objets 3.. = polices, dans l'ordre de POLICES
+    return ("<< /Font << " + " ".join(f"/{p} {3 + i} 0 R" for i, p in enumerate(POLICES)) + " >> >>").encode("ascii")
+
+
+def _texte_utf16(texte: str) -> bytes:
+    return b"<FEFF" + texte.encode("utf-16-be").hex().upper().encode("ascii") + b">"
+
+
+# =========================
+# Mise en page
+# =========================
+
+Ligne = Tuple[str, float, float, bytes]  # (police, corps, x, octets WinAnsi)
+
+
+def _lignes(title: str, sections: Mapping[str, Sequence[Any]], g: Gabarit) -> List[Tuple[Ligne, Optional[float]]]:
+    # (ligne, avance verticale avant elle ; None = même ligne de base), dans l'ordre du rapport texte
+    ligne_titre, ligne_date = entete_rapport(title)
+    x0 = g.marge_h
+    sortie: List[Tuple[Ligne, Optional[float]]] = []
+
+    def bloc(texte: Any, police: str, corps: float, x: float, avant: float = 0.0, prefixe: bytes = b"") -> None:
+        for i, morceau in enumerate(couper(winansi(texte), police, corps, g.largeur - g.marge_h - x)):
+            sortie.append(((police, corps, x, morceau), corps * g.interligne + (avant if i == 0 else 0.0)))
+            if i == 0 and prefixe:
+                sortie.append(((police, corps, x0, prefixe), None))  # même ligne de base que le premier morceau
+
+    bloc(ligne_titre, "F2", g.corps_titre, x0)
+    bloc(ligne_date, "F1", g.corps_date, x0)
+    for sec, arr in sections.items():
+        if not arr:
+            continue
+        bloc(sec, "F2", g.corps_section, x0, avant=g.corps_section * 0.8)
+        for item in arr:
+            bloc(item, "F1", g.corps_texte, x0 + g.retrait_puce, prefixe=b"\x95")
+    bloc(PIED_RAPPORT, "F1", g.corps_pied, x0, avant=g.corps_pied * 1.5)
+    return sortie
+
+
+def _pages(lignes: List[Tuple[Ligne, Optional[float]]], g: Gabarit) -> List[List[Tuple[Ligne, float]]]:
+    # positionne chaque ligne (ordonnée de base) et découpe en pages
+    pages: List[List[Tuple[Ligne, float]]] = [[]]
+    bas = g.marge_v + g.corps_pied * 2  # place du numéro de page
+    y = g.hauteur - g.marge_v
+    for ligne, avance in lignes:
+        if avance is None:  # puce : même ordonnée que la ligne précédente
+            pages[-1].append((ligne, y))
+            continue
+        if y - avance < bas and pages[-1]:
+            pages.append([])
+            y = g.hauteur - g.marge_v
+            avance = ligne[1] * g.interligne
+        y -= avance
+        pages[-1].append((ligne, y))
+    return pages
+
+
+def _flux_page(page: List[Tuple[Ligne, float]], numero: int, total: int, g: Gabarit) -> bytes:
+    ops = [b"BT"]
+    courant = None
+    for (police, corps, x, octets), y in page:
+        if (police, corps) != courant:
+            ops.append(b"/%s %.1f Tf" % (police.encode("ascii"), corps))
+            courant = (police, corps)
+        ops.append(b"1 0 0 1 %.2f %.2f Tm %s Tj" % (x, y, _chaine_pdf(octets)))
+    pied = f"{numero}/{total}".encode("ascii")
+    x_pied = g.largeur - g.marge_h - largeur_texte(pied, "F1", g.corps_pied)
+    ops.append(b"/F1 %.1f Tf 1 0 0 1 %.2f %.2f Tm %s Tj ET" % (g.corps_pied, x_pied, g.marge_v, _chaine_pdf(pied)))
+    return b"\n".join(ops)
+
+
+# =========================
+# Écriture
+# =========================
+
+def ecrire_pdf(title: str, sections: Mapping[str, Sequence[Any]], sink: Any, gabarit: Gabarit = GABARIT) -> int:
+    """
+    Écrit le rapport PDF dans `sink` (puits binaire : BytesIO, fichier "wb", entrée ZIP) ;
+    mêmes rubriques et même ordre que le rapport texte. Retourne le nombre d'octets écrits.
+    """
+    pages = _pages(_lignes(title, sections, gabarit), gabarit)
+    n_polices = len(POLICES)
+    premier = 3 + n_polices  # 1 catalogue, 2 arbre des pages, puis polices, puis (page, contenu) × n
+    ids_pages = [premier + 2 * i for i in range(len(pages))]
+    info = premier + 2 * len(pages)
+
+    decalages: List[int] = []
+    position = 0
+
+    def ecrire(octets: bytes) -> None:
+        nonlocal position
+        sink.write(octets)
+        position += len(octets)
+
+    def objet(corps: bytes) -> None:
+        decalages.append(position)
+        ecrire(b"%d 0 obj\n%s\nendobj\n" % (len(decalages), corps))
+
+    ecrire(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+    objet(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objet(b"<< /Type /Pages /Kids [%s] /Count %d >>"
+          % (b" ".join(b"%d 0 R" % i for i in ids_pages), len(pages)))
+    for police in _objets_polices():
+        objet(police)
+    media = b"[0 0 %.2f %.2f]" % (gabarit.largeur, gabarit.hauteur)
+    ressources = _ressources()
+    for numero, (id_page, page) in enumerate(zip(ids_pages, pages), start=1):
+        objet(b"<< /Type /Page /Parent 2 0 R /MediaBox %s /Resources %s /Contents %d 0 R >>"
+              % (media, ressources, id_page + 1))
+        flux = zlib.compress(_flux_page(page, numero, len(pages), gabarit), 6)
+        objet(b"<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream" % (len(flux), flux))
+    objet(b"<< /Title %s /Producer (Urology Assistant AI) >>" % _texte_utf16(title))
+
+    debut_xref = position
+    ecrire(b"xref\n0 %d\n0000000000 65535 f \n" % (info + 1))
+    ecrire(b"".join(b"%010d 00000 n \n" % d for d in decalages))
+    ecrire(b"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+           % (info + 1, info, debut_xref))
+    return position
+
+
+def rapport_pdf(title: str, sections: Mapping[str, Sequence[Any]], gabarit: Gabarit = GABARIT) -> bytes:
+    tampon = io.BytesIO()
+    ecrire_pdf(title, sections, tampon, gabarit)
+    return tampon.getvalue()
@@ -0,0 +1,416 @@
+# moteur/prostate.py — Cancer de la prostate (D'Amico, localisé, récidive, métastatique)
+
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Optional, Dict, Any, List, Tuple
+import os
+
+from . import textes
+from .commun import _norm, canoniseur, lignes_paires
+from .regles import JeuRegles, Regle
+from .resultat import OptionCAT, ResultatCAT
+
+# =================================
+# 1) Modèle de données / Staging
+# =================================
+class ClinicalT(str, Enum):
+    T1a = "T1a"; T1b = "T1b"; T1c = "T1c"
+    T2a = "T2a"; T2b = "T2b"; T2c = "T2c"
+    T3a = "T3a"; T3b = "T3b"; T4 = "T4"
+
+class NStage(str, Enum):
+    N0 = "N0"; N1 = "N1"; Nx = "Nx"
+
+class MStage(str, Enum):
+    M0 = "M0"; M1a = "M1a"; M1b = "M1b"; M1c = "M1c"; Mx = "Mx"
+
+class GradeGroup(int, Enum):
+    GG1 = 1; GG2 = 2; GG3 = 3; GG4 = 4; GG5 = 5
+
+@dataclass
+class PatientPCa:
+    age: int
+    psa: float  # ng/mL
+    clinical_t: ClinicalT
+    grade_group: GradeGroup
+    n_stage: NStage = NStage.N0
+    m_stage: MStage = MStage.M0
+    cores_positive: Optional[int] = None
+    cores_total: Optional[int] = None
+    max_core_involvement_pct: Optional[float] = None
+    psa_density: Optional[float] = None  # ng/mL/cc
+    life_expectancy_years: Optional[int] = None
+    ecog: Optional[int] = None
+    charlson_index: Optional[int] = None
+    preferences: Dict[str, Any] = field(default_factory=dict)
+
+# ===============================
+# 2) Normalisation et helpers cT
+# ===============================
+_CT_ORDER = {
+    "T1a":10, "T1b":11, "T1c":12,
+    "T2a":20, "T2b":21, "T2c":22,
+    "T3a":30, "T3b":31, "T4":40,
+}
+
+def _normaliser_ct(cT: str) -> str:
+    cT = (cT or "").strip().upper().replace(" ", "")
+    if len(cT) >= 3 and cT[0] == "T" and cT[2].isalpha():
+        cT = cT[:2] + cT[2].lower()
+    # Tolérance abréviations
+    if cT == "T1":
+        return "T1c"
+    if cT == "T3":
+        return "T3a"
+    return cT
+
+# Tables précompilées : une normalisation par libellé distinct, puis une simple lecture de table
+# (les chemins chauds comparent ensuite des rangs entiers aux seuils ci-dessous)
+_CT_NORMALISES = canoniseur(_normaliser_ct, prerempli=_CT_ORDER)
+_CT_RANGS = canoniseur(lambda cT: _CT_ORDER.get(_CT_NORMALISES(cT), 999), prerempli=_CT_ORDER)
+
+def normalize_cT(cT: str) -> str:
+    return _CT_NORMALISES(cT)
+
+def ct_rank(cT: str) -> int:
+    return _CT_RANGS(cT)
+
+_RANG_T2A, _RANG_T2B, _RANG_T2C, _RANG_T3A = (_CT_ORDER[t] for t in ("T2a", "T2b", "T2c", "T3a"))
+
+# ==============================
+# 3) D'AMICO (strict diapo)
+# ==============================
+
+def prostate_risk_damico(psa: float, isup: int, cT: str) -> str:
+    """
+    Catégories (STRICT sur la diapo fournie) — *Localisé*:
+    - FAIBLE        : (cT ≤ T2a) ET (ISUP = 1) ET (PSA ≤ 10)
+    - INTERMÉDIAIRE : (cT = T2b) OU (ISUP 2–3) OU (PSA 10–20)  (sans critère haut risque)
+    - ÉLEVÉ         : (cT ≥ T2c) OU (ISUP 4–5) OU (PSA > 20)
+    """
+    return _damico_rang(psa, isup, ct_rank(cT))
+
+def _damico_rang(psa: float, isup: int, r: int) -> str:
+    # mêmes règles, sur le rang cT déjà calculé
+    if (r >= _RANG_T2C) or (isup in (4,5)) or (psa > 20):
+        return "élevé"
+    if (r == _RANG_T2B) or (isup in (2,3)) or (10 <= psa <= 20):
+        return "intermédiaire"
+    if (r <= _RANG_T2A) and (isup == 1) and (psa <= 10):
+        return "faible"
+    return "intermédiaire"
+
+# Formulaire (UI) — restreint au localisé
+DAMICO_LOCALISE_FORM_SCHEMA: Dict[str, Any] = {
+    "title": "Classification de D'Amico — Localisé",
+    "type": "object",
+    "required": ["psa", "isup", "cT"],
+    "properties": {
+        "cT": {"title": "Stade clinique (cT)", "type": "string", "enum": ["T1a","T1b","T1c","T2a","T2b","T2c"]},
+        "isup": {"title": "ISUP (GG)", "type": "integer", "enum": [1,2,3,4,5]},
+        "psa": {"title": "PSA (ng/mL)", "type": "number", "minimum": 0.0}
+    }
+}
+
+def damico_localise_from_inputs(psa: float, isup: int, cT: str) -> str:
+    return prostate_risk_damico(psa=psa, isup=isup, cT=cT)
+
+# ===============================================
+# 4) Options thérapeutiques — LOCALISÉ (strict)
+# ===============================================
+
+def _is_vhr_stampede(cT: str, isup: int, psa: float, n_stage: Optional[str] = None) -> bool:
+    """Très haut risque non métastatique (style STAMPEDE): cN+ OU ≥2 (PSA>40, ISUP≥4, ≥cT3)."""
+    return _vhr_rang(ct_rank(cT), isup, psa, n_stage)
+
+def _vhr_rang(r: int, isup: int, psa: float, n_stage: Optional[str] = None) -> bool:
+    cNpos = (n_stage == "N1")
+    flags = (1 if psa > 40 else 0) + (1 if isup >= 4 else 0) + (1 if r >= _RANG_T3A else 0)
+    return bool(cNpos or flags >= 2)
+
+
+def _regles_options(espace: str, predicats: Dict[str, Any],
+                    options: List[Tuple[str, Tuple[str, ...], Dict[str, str]]]) -> Tuple[JeuRegles, Dict[str, OptionCAT]]:
+    """Jeu de règles dont chaque règle porte une option détaillée (id, quand, {label, [degre], details}).
+    Retourne (jeu, option figée par identifiant de texte) ; le texte de la règle est le libellé."""
+    jeu = JeuRegles(espace, predicats, [Regle(i, o["label"], quand, numerotee=False) for i, quand, o in options])
+    return jeu, {ident: OptionCAT(**o) for ident, (_, _, o) in zip(jeu.identifiants, options)}
+
+
+# Options par groupe de D'Amico ; intensification si très haut risque non métastatique (vhr)
+REGLES_PROSTATE_LOCALISE, OPTIONS_PROSTATE_LOCALISE = _regles_options("prostate.localise.options", {
+    "faible": ("risque", "==", "faible"),
+    "intermediaire": ("risque", "==", "intermédiaire"),
+    "eleve": ("risque", "==", "élevé"),
+}, [
+    ("faible_sa", ("faible",), {
+        "label": "Surveillance active.",
+        "details": "Bas risque pur ; suivi structuré (PSA / IRM / biopsies) pour éviter le sur‑traitement,."}),
+    ("faible_pt", ("faible",), {
+        "label": "Prostatectomie totale",
+        "details": "Alternative si refus/non‑éligibilité à la surveillance active."}),
+    ("faible_rt", ("faible",), {
+        "label": "Radiothérapie externe",
+        "details": "74–80 Gy (37–40 séances) ou 60 Gy (20 séances) ; stéréotaxie 35–40 Gy (5 séances) possible ( recommendation faible) ,Alternative si refus/non‑éligibilité à la surveillance active."}),
+    ("faible_curie", ("faible",), {
+        "label": "Curiethérapie",
+        "details": "Alternative si refus/non‑éligibilité à la surveillance active."}),
+    ("faible_abstention", ("faible",), {
+        "label": "Abstention – Surveillance (watchful waiting)",
+        "details": "Si espérance de vie limitée ou non éligible aux autres options."}),
+    ("faible_hifu", ("faible",), {
+        "label": "Cryothérapie ou HIFU",
+        "details": "Plutôt dans le cadre d’essais cliniques / registres prospectifs."}),
+    ("faible_focale", ("faible",), {
+        "label": "Thérapie focale",
+        "details": "Plutôt dans le cadre d’essais cliniques / registres prospectifs."}),
+    ("inter_pt", ("intermediaire",), {
+        "label": "Prostatectomie totale (+/− curage pelvien étendu)",
+        "details": "En fonction des estimateurs du risque d’envahissement ganglionnaire."}),
+    ("inter_rt", ("intermediaire",), {
+        "label": "Radiothérapie externe +/− hormonothérapie courte (4 à 6 mois)",
+        "details": "74–80 Gy (37–40) ou 60 Gy (20) ; Radiotherapie seule si risque intermediaire favorable ; HT courte si risque intermediaire défavorable."}),
+    ("inter_boost", ("intermediaire",), {
+        "label": "Radiothérapie avec boost de curiethérapie",
+        "details": "À privilégier en cas d’intermédiaire défavorable."}),
+    ("inter_curie", ("intermediaire",), {
+        "label": "Curiethérapie (intermédiaire favorable uniquement)",
+        "details": "Réservée aux profils intermédiaires favorables."}),
+    ("inter_sa", ("intermediaire",), {
+        "label": "Surveillance active",
+        "details": "Si faible volume tumoral, faible % d’ISUP 2 et faible densité de PSA."}),
+    ("inter_ww", ("intermediaire",), {
+        "label": "Surveillance simple (watchful waiting)",
+        "details": "Si probabilité de survie courte / non éligible aux autres options."}),
+    ("inter_hifu", ("intermediaire",), {
+        "label": "Cryothérapie ou HIFU",
+        "details": "Plutôt dans le cadre d’essais cliniques / registres prospectifs."}),
+    ("inter_focale", ("intermediaire",), {
+        "label": "Thérapie focale",
+        "details": "Plutôt dans le cadre d’essais cliniques / registres prospectifs."}),
+    # élevé / localement avancé
+    ("eleve_rt_ht", ("eleve",), {
+        "label": "Radiothérapie externe + hormonothérapie prolongée (18–36 mois)",
+        "details": "autre option : Rx + HT avec BOOST de curiethérapieSchéma de référence (radio‑hormonothérapie)."}),
+    # Intensification très haut risque non métastatique
+    ("eleve_abiraterone", ("eleve", "vhr"), {
+        "label": "Intensification par acétate d’abiratérone pendant 2 ans",
+        "details": "Si très haut risque non métastatique (cN+ ou ≥2 : PSA>40, ISUP≥4, ≥cT3)."}),
+    ("eleve_pt", ("eleve",), {
+        "label": "Prostatectomie totale avec curage pelvien +/− traitement adjuvant",
+        "details": "Décision selon résultats anatomopathologiques et facteurs de risque."}),
+    ("eleve_pt3_r1", ("eleve",), {
+        "label": "Si pT3 ou R1 : radiothérapie de rattrapage précoce en cas de récidive biologique",
+        "details": "Surveillance PSA rapprochée ; initier tôt si critères atteints."}),
+    ("eleve_pn1", ("eleve",), {
+        "label": "Si pN1 : HT adjuvante / RT pelvienne + HT / surveillance (faible envahissement)",
+        "details": "Choix selon charge ganglionnaire et comorbidités."}),
+    ("eleve_psa_post_op", ("eleve",), {
+        "label": "Si PSA post‑op détectable : radiothérapie adjuvante +/− HT",
+        "details": "À discuter en RCP selon contexte."}),
+])
+
+NOTES_PROSTATE_LOCALISE = textes.enregistrer("prostate.localise.notes", [
+    "La stratégie thérapeutique doit être discutée en réunion de concertation pluridisciplinaire et décidée avec le patient après une information claire et partagée des effets de chaque traitement .",
+])
+
+
+def plan_prostate_localise(psa: float, isup: int, cT: str, esperance_vie_ans: int) -> ResultatCAT:
+    """Retourne {donnees, risque, options, notes} — options reformattées lisibles.
+    Chaque option suit: "Label — niveau de reco : <fort/moyen/faible> --> <critères/détails>" (à rendre côté UI).
+    """
+    rang = ct_rank(cT)
+    risque = _damico_rang(psa, isup, rang)
+    contexte = {"risque": risque, "vhr": risque == "élevé" and _vhr_rang(rang, isup, psa)}
+    options = [OPTIONS_PROSTATE_LOCALISE[i] for i in REGLES_PROSTATE_LOCALISE.ids(contexte)]
+
+    donnees = [("PSA", f"{psa:.2f} ng/mL"), ("ISUP", isup), ("cT", normalize_cT(cT)), ("Espérance de vie", f"{esperance_vie_ans} ans")]
+    return ResultatCAT(donnees=donnees, risque=risque, options=options, notes=textes.liste(NOTES_PROSTATE_LOCALISE))
+
+
+def sections_prostate_localise(plan: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Rubriques du rapport prostate localisée (page et export en masse)."""
+    return {
+        "Données": lignes_paires(plan["donnees"]),
+        "Stratification": [f"Risque : {plan['risque'].upper()}"],
+        "Options": [f"{o['label']} : {o['details']}" for o in plan["options"]],
+        "Notes": plan["notes"],
+    }
+
+# ======================================
+# 5) Récidive — définitions & conduite
+# ======================================
+
+def detect_recurrence(type_initial: str, psa_actuel: float, psa_nadir_post_rt: Optional[float], confirmations: int) -> Tuple[bool, str]:
+    """Retourne (is_recurrence, résumé)."""
+    if type_initial == "Prostatectomie":
+        if psa_actuel >= 0.2 and confirmations >= 2:
+            return True, "Récidive biologique après prostatectomie (PSA ≥ 0,2 ng/mL confirmé)."
+        return False, "Pas de récidive biologique confirmée (après prostatectomie)."
+    # Radiothérapie
+    if (psa_nadir_post_rt is not None) and (psa_actuel >= psa_nadir_post_rt + 2.0):
+        return True, "Récidive biologique après radiothérapie (Phoenix : nadir + 2)."
+    return False, "Pas de récidive biologique selon Phoenix (après radiothérapie)."
+
+
+REGLES_PROSTATE_RECIDIVE, OPTIONS_PROSTATE_RECIDIVE = _regles_options("prostate.recidive.options", {
+    "prostatectomie": ("type_initial", "==", "Prostatectomie"),
+}, [
+    ("pt_rt_rattrapage", ("est_recidive", "prostatectomie"), {
+        "label": "Radiothérapie de rattrapage du lit prostatique ± bassin", "degre": "fort",
+        "details": "À initier précocement ; ± hormonothérapie courte selon facteurs."}),
+    ("pt_ht", ("est_recidive", "prostatectomie"), {
+        "label": "Hormonothérapie seule (si non éligible RT/chir ou progression)", "degre": "moyen",
+        "details": "Approche palliative selon cinétique PSA/symptômes."}),
+    ("rt_local", ("est_recidive", "!prostatectomie"), {
+        "label": "Traitement local de rattrapage (sélectionné)", "degre": "moyen",
+        "details": "Prostatectomie de rattrapage/curi/HIFU/cryothérapie selon localisation et expertise."}),
+    ("rt_ht", ("est_recidive", "!prostatectomie"), {
+        "label": "Hormonothérapie ± traitements systémiques", "degre": "moyen",
+        "details": "Selon imagerie de re-stadification (PSMA-PET/IRM) et profil de progression."}),
+    ("surveillance", ("!est_recidive",), {
+        "label": "Poursuivre la surveillance", "degre": "moyen",
+        "details": "Contrôles PSA et imagerie selon protocole ; pas d’argument de récidive."}),
+])
+
+NOTES_PROSTATE_RECIDIVE = JeuRegles("prostate.recidive.notes", {}, [
+    Regle("restadifier", "Re-stadifier (IRM, TEP-PSMA si dispo) avant rattrapage.", ("est_recidive",), numerotee=False),
+    Regle("rcp", "Discussion RCP radio-onco/uro/nucléo.", ("est_recidive",), numerotee=False),
+])
+
+
+def plan_prostate_recidive(type_initial: str, psa_actuel: float, psa_nadir_post_rt: Optional[float], confirmations: int) -> ResultatCAT:
+    est_recidive, resume = detect_recurrence(type_initial, psa_actuel, psa_nadir_post_rt, confirmations)
+    contexte = {"est_recidive": est_recidive, "type_initial": type_initial}
+    options = [OPTIONS_PROSTATE_RECIDIVE[i] for i in REGLES_PROSTATE_RECIDIVE.ids(contexte)]
+    notes = NOTES_PROSTATE_RECIDIVE.options(contexte)
+
+    return ResultatCAT(resume=resume, options=options, notes=notes)
+
+# ============================================
+# 6) Métastatique — mHSPC / mCRPC (synthèse)
+# ============================================
+
+REGLES_PROSTATE_METASTATIQUE, OPTIONS_PROSTATE_METASTATIQUE = _regles_options("prostate.metastatique.options", {}, [
+    # mHSPC
+    ("hspc_adt_arpi", ("!testosterone_castration",), {
+        "label": "ADT + ARPI (abiratérone OU enzalutamide OU apalutamide)", "degre": "fort",
+        "details": "Intensification standard de 1re ligne mHSPC."}),
+    ("hspc_docetaxel", ("!testosterone_castration", "volume_eleve"), {
+        "label": "ADT + Docétaxel (haut volume)", "degre": "moyen",
+        "details": "Bénéfice surtout en haut volume ; discuter toxicité/comorbidités."}),
+    ("hspc_adt_seule", ("!testosterone_castration", "!volume_eleve"), {
+        "label": "ADT seule (si CI à l’intensification)", "degre": "faible",
+        "details": "Moins performant ; réservé si CI/fragilité."}),
+    # mCRPC
+    ("crpc_arpi", ("testosterone_castration", "!deja_arpi"), {
+        "label": "ARPI (enzalutamide OU abiratérone)", "degre": "fort",
+        "details": "Standard mCRPC 1re ligne selon exposition antérieure."}),
+    ("crpc_docetaxel", ("testosterone_castration", "!deja_docetaxel"), {
+        "label": "Docétaxel", "degre": "fort",
+        "details": "Chimiothérapie de référence si éligible ; utile si symptomatique/progression rapide."}),
+    ("crpc_cabazitaxel", ("testosterone_castration", "deja_docetaxel"), {
+        "label": "Cabazitaxel (après docétaxel)", "degre": "fort",
+        "details": "Supérieur à switch ARPI↔ARPI dans essais comparatifs."}),
+    ("crpc_iparp", ("testosterone_castration", "alteration_HRR"), {
+        "label": "iPARP (olaparib/rucaparib) si altérations BRCA/HRR", "degre": "fort",
+        "details": "Efficacité démontrée (ex: PROfound/TRITON-3)."}),
+])
+
+ADJOINTS_PROSTATE_METASTATIQUE = JeuRegles("prostate.metastatique.adjoints", {}, [
+    Regle("os", "Soins osseux : acide zolédronique ou denosumab ; Ca/Vit D ; radiothérapie antalgique ciblée si besoin.",
+          ("symptomes_osseux",), numerotee=False),
+])
+
+NOTES_PROSTATE_METASTATIQUE = textes.enregistrer("prostate.metastatique.notes", [
+    "Décision en RCP. Séquençage selon expositions antérieures, comorbidités, préférences patient.",
+])
+
+
+def plan_prostate_metastatique(testosterone_castration: bool,
+                               volume_eleve: bool,
+                               symptomes_osseux: bool,
+                               deja_docetaxel: bool,
+                               deja_arpi: bool,
+                               alteration_HRR: bool) -> ResultatCAT:
+    profil = "mHSPC (sensible à la castration)" if not testosterone_castration else "mCRPC (résistant à la castration)"
+    contexte = {
+        "testosterone_castration": testosterone_castration,
+        "volume_eleve": volume_eleve,
+        "symptomes_osseux": symptomes_osseux,
+        "deja_docetaxel": deja_docetaxel,
+        "deja_arpi": deja_arpi,
+        "alteration_HRR": alteration_HRR,
+    }
+    options = [OPTIONS_PROSTATE_METASTATIQUE[i] for i in REGLES_PROSTATE_METASTATIQUE.ids(contexte)]
+    adjoints = ADJOINTS_PROSTATE_METASTATIQUE.options(contexte)
+    notes = textes.liste(NOTES_PROSTATE_METASTATIQUE)
+    return ResultatCAT(profil=profil, options=options, adjoints=adjoints, notes=notes)
+
+# =====================================================
+# 7) Orchestration — point d’entrée unifié (module)
+# =====================================================
+
+def recommend_from_patient(patient: PatientPCa, *, contexte: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    contexte["setting"] ∈ {"localise", "recidive", "metastatique"}
+    Champs possibles :
+      - localise : esperance_vie_ans
+      - recidive : type_initial ("Prostatectomie"/"Radiothérapie"), psa_nadir_post_rt, confirmations
+      - metastatique : testosterone_castration, volume_eleve, symptomes_osseux, deja_docetaxel, deja_arpi, alteration_HRR
+    """
+    setting = contexte.get("setting")
+    if setting == "localise":
+        ev = contexte.get("esperance_vie_ans", patient.life_expectancy_years or 10)
+        return plan_prostate_localise(psa=patient.psa, isup=int(patient.grade_group), cT=patient.clinical_t.value, esperance_vie_ans=int(ev))
+    if setting == "recidive":
+        return plan_prostate_recidive(
+            type_initial=contexte.get("type_initial", "Prostatectomie"),
+            psa_actuel=patient.psa,
+            psa_nadir_post_rt=contexte.get("psa_nadir_post_rt"),
+            confirmations=int(contexte.get("confirmations", 2))
+        )
+    if setting == "metastatique":
+        return plan_prostate_metastatique(
+            testosterone_castration=bool(contexte.get("testosterone_castration", False)),
+            volume_eleve=bool(contexte.get("volume_eleve", False)),
+            symptomes_osseux=bool(contexte.get("symptomes_osseux", False)),
+            deja_docetaxel=bool(contexte.get("deja_docetaxel", False)),
+            deja_arpi=bool(contexte.get("deja_arpi", False)),
+            alteration_HRR=bool(contexte.get("alteration_HRR", False)),
+        )
+    raise ValueError("contexte['setting'] doit être 'localise', 'recidive' ou 'metastatique'.")
+
+# ===========================
+# 8) Auto-test (optionnel)
+# ===========================
+
+def _selftest_logic() -> bool:
+    try:
+        # Bas risque localisé
+        p1 = PatientPCa(age=62, psa=7.4, clinical_t=ClinicalT.T2a, grade_group=GradeGroup.GG1, life_expectancy_years=15)
+        r1 = recommend_from_patient(p1, contexte={"setting":"localise"})
+        assert r1["risque"] == "faible" and any("surveillance active" in _norm(o["label"]) for o in r1["options"])  # insensible à la casse
+
+        # Intermédiaire localisé
+        p2 = PatientPCa(age=68, psa=12.0, clinical_t=ClinicalT.T2b, grade_group=GradeGroup.GG2, life_expectancy_years=12)
+        r2 = recommend_from_patient(p2, contexte={"setting":"localise"})
+        assert r2["risque"] == "intermédiaire" and any("radiotherapie" in _norm(o["label"]) for o in r2["options"])  # accent-insensible
+
+        # Récidive post-prostatectomie
+        p3 = PatientPCa(age=70, psa=0.25, clinical_t=ClinicalT.T1c, grade_group=GradeGroup.GG2)
+        r3 = recommend_from_patient(p3, contexte={"setting":"recidive", "type_initial":"Prostatectomie", "confirmations":2})
+        assert "recidive biologique" in _norm(r3["resume"])  # robust
+
+        # Métastatique sensible haut volume
+        p4 = PatientPCa(age=66, psa=52.0, clinical_t=ClinicalT.T3a, grade_group=GradeGroup.GG4)
+        r4 = recommend_from_patient(p4, contexte={"setting":"metastatique", "testosterone_castration":False, "volume_eleve":True, "symptomes_osseux":True})
+        assert r4["profil"].startswith("mHSPC") and any("docetaxel" in _norm(o["label"]) for o in r4["options"])  # tolère Docétaxel/docetaxel
+
+        return True
+    except AssertionError:
+        return False
+
+# Ne pas casser l'app en prod : on ne lance pas le self-test par défaut.
+if __name__ == "__main__" and os.getenv("RUN_SELFTEST", "0") == "1":
+    print("Selftest clinique:", _selftest_logic())
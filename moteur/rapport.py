@@ -0,0 +1,81 @@
+# moteur/rapport.py — mise en forme des rapports (texte, tableaux HTML, export HTML)
+# Fonctions pures, sans Streamlit : réutilisables hors UI (exports en lot, API, benchmarks).
+
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, Tuple
+import html as ihtml
+import io
+
+
+def esc(x: str) -> str:
+    return ihtml.escape(str(x))
+
+
+def _ecrivain(sink: Any) -> Callable[[str], Any]:
+    # puits texte (StringIO, fichier "w") ou binaire (BytesIO, fichier "wb", réponse HTTP) : UTF-8 à la volée
+    if isinstance(sink, io.TextIOBase):
+        return sink.write
+    return lambda s: sink.write(s.encode("utf-8"))
+
+
+PIED_RAPPORT = "Réfs : AFU/EAU — synthèse PROVISOIRE pour prototypage."
+
+
+def entete_rapport(title: str) -> Tuple[str, str]:
+    """(ligne de titre, ligne de date) communes aux exports texte, HTML et PDF."""
+    return (f"Urology Assistant AI — {title} (AFU/EAU 2024–2026 — à vérifier)",
+            f"Généré le : {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+
+
+def _morceaux_rapport(title: str, sections: Mapping[str, Sequence[Any]]) -> Iterator[str]:
+    # en-tête, puis une section à la fois, puis pied : leur concaténation est le rapport texte
+    ligne_titre, ligne_date = entete_rapport(title)
+    yield f"{ligne_titre}\n{ligne_date}\n\n"
+    for sec, arr in sections.items():
+        if not arr:
+            continue
+        yield f"== {sec} ==\n" + "".join(f"• {x}\n" for x in arr) + "\n"
+    yield PIED_RAPPORT
+
+
+def ecrire_rapport(title: str, sections: Mapping[str, Sequence[Any]], txt: Any = None, html: Any = None,
+                   basename: str = "rapport") -> None:
+    """
+    Écrit le rapport section par section dans `txt` et/ou `html` (puits fournis par l'appelant),
+    en une seule passe sur `sections` : pas de copie intégrale du texte, échappement HTML incrémental.
+    """
+    ecrire_txt = _ecrivain(txt) if txt is not None else None
+    ecrire_html = _ecrivain(html) if html is not None else None
+    if ecrire_html:
+        ecrire_html(f"<!doctype html><html lang='fr'><meta charset='utf-8'><title>{basename}</title><pre>")
+    for morceau in _morceaux_rapport(title, sections):
+        if ecrire_txt:
+            ecrire_txt(morceau)
+        if ecrire_html:
+            ecrire_html(ihtml.escape(morceau))
+    if ecrire_html:
+        ecrire_html("</pre></html>")
+
+
+def build_report_text(title: str, sections: dict) -> str:
+    tampon = io.StringIO()
+    ecrire_rapport(title, sections, txt=tampon)
+    return tampon.getvalue()
+
+
+def kv_table_html(pairs: Iterable[Sequence], col1: str = "Élément", col2: str = "Détail") -> str:
+    """Tableau HTML 2 colonnes (classe kv-table du thème) pour Données & Stratification."""
+    html = [
+        f"<div class='section-block'><table class='kv-table'><thead><tr><th>{esc(col1)}</th><th>{esc(col2)}</th></tr></thead><tbody>",
+    ]
+    for k, v in pairs:
+        html.append(f"<tr><td><strong>{esc(k)}</strong></td><td>{esc(v)}</td></tr>")
+    html.append("</tbody></table></div>")
+    return "".join(html)
+
+
+def exports(title: str, sections: Mapping[str, Sequence[Any]], basename: str) -> Tuple[io.BytesIO, io.BytesIO]:
+    """Contenus des deux téléchargements (.txt, .html), UTF-8, produits en une passe."""
+    txt, html = io.BytesIO(), io.BytesIO()
+    ecrire_rapport(title, sections, txt=txt, html=html, basename=basename)
+    return txt, html
@@ -0,0 +1,125 @@
+# moteur/rcp.py — liste de travail RCP : un fichier de dossiers multi-modules évalué en arrière-plan
+# Une ligne = un dossier ; la colonne `module` désigne le rapport (clés de moteur.export.RAPPORTS) et
+# les autres colonnes portent les entrées du module (mêmes noms que moteur.batch.MODULES_LOT).
+# Les dossiers sont soumis dans l'ordre du fichier à un pool (threads par défaut, ou tout Executor
+# fourni, p. ex. ProcessPoolExecutor) : les premières CAT sont consultables pendant que la suite calcule,
+# et une CAT terminée est relue telle quelle (pas de nouvel appel au moteur en feuilletant la liste).
+
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import os
+
+import pandas as pd
+
+from .batch import enregistrements
+from .export import RAPPORTS, sections_rapport
+
+COLONNE_MODULE = "module"
+COLONNE_ID = "id"
+TRAVAILLEURS = min(4, os.cpu_count() or 1)
+
+
+@dataclass(frozen=True)
+class CasRCP:
+    ident: str
+    module: str
+    entree: Dict[str, Any]
+
+
+# =========================
+# Lecture du fichier
+# =========================
+
+def lire_fichier(source: Any, nom: str) -> pd.DataFrame:
+    """CSV ou JSONL (une ligne = un dossier) ; `source` : chemin ou fichier ouvert (upload Streamlit)."""
+    if nom.lower().endswith((".jsonl", ".ndjson")):
+        return pd.read_json(source, lines=True, dtype=False)
+    return pd.read_csv(source)
+
+
+def _colonnes_du_groupe(df: pd.DataFrame) -> pd.DataFrame:
+    # fichier multi-modules : les colonnes des autres modules sont vides, et une colonne entière mêlée
+    # de vides a été lue en float (65 → 65.0) ; on rend leurs entiers aux colonnes complètes du groupe
+    # (colonnes encore partiellement vides : entiers déclarés rendus valeur par valeur par moteur.batch)
+    df = df.dropna(axis=1, how="all").copy()
+    for nom in df.columns[df.dtypes == "float64"]:
+        colonne = df[nom]
+        if colonne.notna().all() and (colonne % 1 == 0).all():
+            df[nom] = colonne.astype("int64")
+    return df
+
+
+def lire_cas(df: pd.DataFrame, colonne_module: str = COLONNE_MODULE,
+             colonne_id: Optional[str] = COLONNE_ID) -> List[CasRCP]:
+    """Dossiers dans l'ordre du fichier ; identifiant = colonne `colonne_id` si présente, sinon n° de ligne."""
+    if colonne_module not in df.columns:
+        raise ValueError(f"Colonne {colonne_module!r} absente (attendu : {', '.join(RAPPORTS)}).")
+    modules = df[colonne_module].astype(str).str.strip()
+    inconnus = sorted(set(modules) - set(RAPPORTS))
+    if inconnus:
+        raise ValueError(f"Module(s) inconnu(s) : {', '.join(inconnus)} (attendu : {', '.join(RAPPORTS)}).")
+    if colonne_id and colonne_id in df.columns:
+        idents = df[colonne_id].astype(str)
+    else:
+        idents = pd.Series([f"{i + 1:03d}" for i in range(len(df))], index=df.index)
+
+    cas: Dict[Any, CasRCP] = {}
+    for module, groupe in df.drop(columns=[c for c in (colonne_module, colonne_id) if c in df.columns]) \
+                            .groupby(modules, sort=False):
+        try:
+            for index, entree in zip(groupe.index, enregistrements(_colonnes_du_groupe(groupe), module)):
+                cas[index] = CasRCP(idents[index], module, entree)
+        except ValueError as e:
+            raise ValueError(f"dossiers {module} : {e}") from None
+    return [cas[i] for i in df.index]
+
+
+# =========================
+# Évaluation en arrière-plan
+# =========================
+
+def evaluer_cas(cas: CasRCP) -> Tuple[str, Dict[str, List[str]]]:
+    """(titre, sections) du dossier ; fonction de module pour rester sérialisable vers un pool de processus."""
+    return sections_rapport(cas.module, cas.entree)
+
+
+class ListeTravail:
+    """
+    Dossiers soumis au pool dès la construction, dans l'ordre ; `resultat(i)` relit la CAT calculée.
+    Une erreur sur un dossier (entrée invalide) reste attachée à ce dossier sans interrompre les autres.
+    Un `executeur` fourni reste à l'appelant (ni arrêté ni fermé ici) ; le pool par défaut est propre à la liste.
+    """
+
+    def __init__(self, cas: Sequence[CasRCP], executeur: Optional[Executor] = None):
+        self.cas = tuple(cas)
+        pool = executeur or ThreadPoolExecutor(TRAVAILLEURS, thread_name_prefix="rcp")
+        self._futurs: List[Future] = [pool.submit(evaluer_cas, c) for c in self.cas]
+        if executeur is None:
+            pool.shutdown(wait=False)  # plus de soumission ; les travaux en file continuent
+
+    def __len__(self) -> int:
+        return len(self.cas)
+
+    def pret(self, i: int) -> bool:
+        return self._futurs[i].done()
+
+    def termines(self) -> int:
+        return sum(f.done() for f in self._futurs)
+
+    @property
+    def complet(self) -> bool:
+        return all(f.done() for f in self._futurs)
+
+    def erreur(self, i: int) -> Optional[BaseException]:
+        """Exception levée par le moteur pour le dossier `i` (None si OK ; attend la fin du calcul)."""
+        return self._futurs[i].exception()
+
+    def resultat(self, i: int, timeout: Optional[float] = None) -> Tuple[str, Dict[str, List[str]]]:
+        """(titre, sections) du dossier `i` ; attend la fin de son calcul s'il est encore en file."""
+        return self._futurs[i].result(timeout)
+
+    def annuler(self) -> None:
+        """Abandonne les dossiers pas encore commencés (nouveau fichier chargé, session fermée)."""
+        for f in self._futurs:
+            f.cancel()
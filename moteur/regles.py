@@ -0,0 +1,212 @@
+# moteur/regles.py — moteur de règles déclaratives (prédicats → options) pour les plan_*
+# Les algorithmes cliniques sont décrits comme des données : des prédicats nommés sur le contexte
+# patient et des règles ordonnées (conjonction de prédicats → option). À la compilation, chaque
+# prédicat distinct reçoit un bit ; l'évaluation calcule une fois chaque prédicat, puis sert le
+# tuple d'identifiants de texte (moteur.textes) mémorisé par vecteur de bits. Le coût suit donc le nombre de
+# prédicats distincts, pas la longueur du chemin de code. Jeux de règles sérialisables en JSON.
+# Le calcul du vecteur est compilé en une fonction Python générée (pas d'interprétation par prédicat).
+# Un texte peut contenir des champs « {champ} » (ex. niveau du thrombus), complétés depuis le contexte au rendu.
+
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+import json
+import string
+
+from . import textes
+
+
+# opérateur → expression Python ({x} = valeur du champ, {k} = constante du prédicat) ;
+# comparaisons d'ordre fausses si la valeur est absente (ex. RPM non mesuré → pas « RPM < 150 »)
+OPERATEURS: Dict[str, str] = {
+    "vrai": "{x}",
+    "==": "{x} == {k}",
+    "!=": "{x} != {k}",
+    "<": "{x} is not None and {x} < {k}",
+    "<=": "{x} is not None and {x} <= {k}",
+    ">": "{x} is not None and {x} > {k}",
+    ">=": "{x} is not None and {x} >= {k}",
+    "entre": "{x} is not None and {k}[0] <= {x} <= {k}[1]",  # bornes incluses
+    "contient": "{k} in {x}",
+    "commence": "str({x}).startswith({k})",
+}
+COMPOSES = ("un_de", "tous")  # disjonction / conjonction de prédicats (littéraux « !nom » admis)
+
+TAILLE_MEMO = 4096  # vecteurs de bits distincts mémorisés par jeu
+
+
+@dataclass(frozen=True)
+class Regle:
+    """Option `texte` retenue quand tous les littéraux de `quand` sont vrais (« !nom » = négation)."""
+    id: str
+    texte: str
+    quand: Tuple[str, ...] = ()
+    numerotee: bool = True
+
+
+def _litteral(lit: str) -> Tuple[str, bool]:
+    if not isinstance(lit, str):
+        raise ValueError(f"Littéral de prédicat invalide : {lit!r}")
+    return (lit[1:], False) if lit.startswith("!") else (lit, True)
+
+
+def _champs_gabarit(texte: str) -> Tuple[str, ...]:
+    # champs « {champ} » d'un texte de règle : noms simples seulement (ni attribut, ni index, ni format)
+    champs = []
+    for _, champ, spec, conversion in string.Formatter().parse(texte):
+        if champ is None:
+            continue
+        if not champ.isidentifier() or spec or conversion:
+            raise ValueError(f"Champ de texte invalide : {{{champ}}} dans {texte!r} (identifiant attendu)")
+        champs.append(champ)
+    return tuple(champs)
+
+
+def _nom_valide(nom: Any) -> str:
+    # les noms apparaissent dans la source générée (commentaires) : identifiants Python seulement
+    if not isinstance(nom, str) or not nom.isidentifier():
+        raise ValueError(f"Nom de prédicat invalide : {nom!r} (identifiant attendu)")
+    return nom
+
+
+class JeuRegles:
+    """
+    Prédicats : nom → (champ, opérateur[, valeur]) ou ("un_de" | "tous", (littéraux…)).
+    Un nom non déclaré désigne la vérité du champ de même nom (ex. "oligo", "!io_contra").
+    Règles évaluées dans l'ordre ; leurs textes sont enregistrés au catalogue sous `espace.id`
+    et les options numérotées reçoivent « Option n : » au rendu. Les champs « {champ} » d'un texte
+    sont complétés par options() ; ids() renvoie les identifiants des gabarits non complétés.
+    """
+
+    def __init__(self, espace: str, predicats: Mapping[str, Sequence[Any]], regles: Sequence[Regle]):
+        self.espace = espace
+        self.predicats = {nom: tuple(d) for nom, d in predicats.items()}
+        self.regles = tuple(regles)
+        gabarits = [bool(_champs_gabarit(r.texte)) for r in self.regles]  # validés avant tout enregistrement
+        self._ids = tuple(textes.enregistrer(espace, {r.id: r.texte}, numerote=r.numerotee)[0] for r in self.regles)
+        self._gabarits = frozenset(i for i, g in zip(self._ids, gabarits) if g)
+        self._compiler()
+
+    # ---------- compilation ----------
+    def _compiler(self) -> None:
+        bits: Dict[str, int] = {}
+        lignes: List[str] = []
+        constantes: Dict[str, Any] = {}
+
+        def bit(nom: str, pile: Tuple[str, ...] = ()) -> int:
+            if nom in bits:
+                return bits[nom]
+            if nom in pile:
+                raise ValueError(f"Prédicat circulaire : {' → '.join(pile + (nom,))}")
+            _nom_valide(nom)
+            definition = self.predicats.get(nom, (nom, "vrai"))
+            if not definition:
+                raise ValueError(f"Prédicat {nom!r} sans définition")
+            if definition[0] in COMPOSES:
+                if len(definition) != 2 or isinstance(definition[1], str):
+                    raise ValueError(f"Prédicat composé {nom!r} : (\"{definition[0]}\", [littéraux…]) attendu")
+                pos, neg = self._masques(definition[1], lambda n: bit(n, pile + (nom,)))
+                b = bits[nom] = 1 << len(bits)
+                if definition[0] == "un_de":
+                    test = " or ".join([f"v & {pos}"] * bool(pos) + [f"~v & {neg}"] * bool(neg))
+                else:
+                    test = " and ".join([f"v & {pos} == {pos}"] * bool(pos) + [f"not v & {neg}"] * bool(neg))
+                lignes.append(f"    if {test}: v |= {b}  # {nom}")  # après ses opérandes
+                return b
+            if len(definition) not in (2, 3):
+                raise ValueError(f"Prédicat {nom!r} : (champ, opérateur[, valeur]) attendu")
+            champ, op, *valeur = definition
+            if not isinstance(champ, str):
+                raise ValueError(f"Champ invalide pour le prédicat {nom!r} : {champ!r}")
+            if not isinstance(op, str) or op not in OPERATEURS:
+                raise ValueError(f"Opérateur inconnu pour le prédicat {nom!r} : {op!r}")
+            b = bits[nom] = 1 << len(bits)
+            k = f"K{len(constantes)}"
+            constantes[k] = valeur[0] if valeur else None
+            lignes.append(f"    x = c[{champ!r}]")
+            lignes.append(f"    if {OPERATEURS[op].format(x='x', k=k)}: v |= {b}  # {nom}")
+            return b
+
+        # seuls les prédicats utilisés par au moins une règle sont compilés, chacun une fois
+        self._conditions = tuple(self._masques(r.quand, bit) for r in self.regles)
+        self._bits = bits
+        self.source = "\n".join(["def vecteur(c):", "    v = 0", *lignes, "    return v"])
+        # seules entrées de la source : bits entiers, repr() des champs, noms validés ; constantes passées
+        # par l'espace de noms (jamais écrites dans la source), builtins réduits à ce qu'utilisent les opérateurs
+        espace = {"__builtins__": {"str": str}, **constantes}
+        exec(compile(self.source, f"<règles {id(self):x}>", "exec"), espace)
+        self.vecteur = espace["vecteur"]
+        self.vecteur.__doc__ = "Vecteur de bits des prédicats pour le contexte `c` (chacun évalué une seule fois)."
+        self._memo: Dict[int, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}  # vecteur → (identifiants, rendu)
+
+    @staticmethod
+    def _masques(litteraux: Sequence[str], bit: Callable[[str], int]) -> Tuple[int, int]:
+        pos = neg = 0
+        for lit in litteraux:
+            nom, positif = _litteral(lit)
+            if positif:
+                pos |= bit(nom)
+            else:
+                neg |= bit(nom)
+        return pos, neg
+
+    @property
+    def nb_predicats(self) -> int:
+        return len(self._bits)
+
+    @property
+    def identifiants(self) -> Tuple[str, ...]:
+        """Identifiants de texte de toutes les règles, dans l'ordre des règles."""
+        return self._ids
+
+    # ---------- évaluation ----------
+    def retenues(self, contexte: Mapping[str, Any]) -> List[Regle]:
+        v = self.vecteur(contexte)
+        return [r for r, (pos, neg) in zip(self.regles, self._conditions) if (v & pos) == pos and not (v & neg)]
+
+    def _resultat(self, v: int) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        # (identifiants retenus, rendu numéroté depuis 1), calculés une fois par vecteur
+        res = self._memo.get(v)
+        if res is None:
+            ids = tuple(i for i, (pos, neg) in zip(self._ids, self._conditions) if (v & pos) == pos and not (v & neg))
+            res = (ids, textes.rendre(ids))
+            if len(self._memo) < TAILLE_MEMO:
+                self._memo[v] = res
+        return res
+
+    def ids(self, contexte: Mapping[str, Any]) -> Tuple[str, ...]:
+        """Identifiants (catalogue moteur.textes) des règles retenues, dans l'ordre des règles."""
+        return self._resultat(self.vecteur(contexte))[0]
+
+    def options(self, contexte: Mapping[str, Any], debut: int = 1) -> List[str]:
+        """Textes des règles retenues, numérotés à partir de `debut` (liste neuve à chaque appel)."""
+        ids, rendu = self._resultat(self.vecteur(contexte))
+        sortie = list(rendu) if debut == 1 else textes.liste(ids, debut)
+        if self._gabarits:
+            for i, ident in enumerate(ids):
+                if ident in self._gabarits:
+                    sortie[i] = sortie[i].format_map(contexte)
+        return sortie
+
+    # ---------- sérialisation ----------
+    def vers_dict(self) -> Dict[str, Any]:
+        return {
+            "espace": self.espace,
+            "predicats": {nom: list(d) for nom, d in self.predicats.items()},
+            "regles": [{"id": r.id, "texte": r.texte, "quand": list(r.quand), "numerotee": r.numerotee}
+                       for r in self.regles],
+        }
+
+    @classmethod
+    def depuis_dict(cls, d: Mapping[str, Any]) -> "JeuRegles":
+        return cls(
+            d["espace"],
+            {nom: tuple(tuple(x) if isinstance(x, list) else x for x in definition)
+             for nom, definition in d["predicats"].items()},
+            [Regle(r["id"], r["texte"], tuple(r.get("quand", ())), r.get("numerotee", True)) for r in d["regles"]],
+        )
+
+
+def charger(chemin: str) -> JeuRegles:
+    """Jeu de règles depuis un fichier JSON (format de JeuRegles.vers_dict)."""
+    with open(chemin, encoding="utf-8") as f:
+        return JeuRegles.depuis_dict(json.load(f))
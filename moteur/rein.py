@@ -0,0 +1,367 @@
+# moteur/rein.py — Tumeur du rein (localisé, métastatique, biopsie)
+
+from typing import Any, List, Tuple, Dict
+
+from .commun import lignes_paires
+from . import textes
+from .regles import JeuRegles, Regle
+from .resultat import ResultatCAT
+
+# =========================
+# LOGIQUE CLINIQUE — REIN (localisé, métastatique, biopsie)
+# =========================
+
+# =========================
+# RÈGLES — rein non métastatique : décision par stade cT (aucune taille en cm), notes, suivi
+# =========================
+_PREDICATS_REIN_LOCAL = {
+    "t1a": ("cT", "==", "T1a"),  # ≤ 4 cm (catégorisé par le stade)
+    "t1b": ("cT", "==", "T1b"),  # >4 à ≤7 cm
+    "t2a": ("cT", "==", "T2a"),  # >7 à ≤10 cm
+    "t2b": ("cT", "==", "T2b"),  # >10 cm
+    "t2": ("un_de", ("t2a", "t2b")),
+    "t3a": ("cT", "==", "T3a"),
+    "t3b": ("cT", "==", "T3b"),
+    "t3c": ("cT", "==", "T3c"),
+    "t3b_t3c": ("un_de", ("t3b", "t3c")),
+    "t4": ("cT", "==", "T4"),
+    "t1b_t2": ("un_de", ("t1b", "t2")),
+    "localise": ("un_de", ("t1a", "t1b_t2")),
+    "avance_ou_n_pos": ("un_de", ("!localise", "cN_pos")),  # T3/T4 ou N+
+}
+
+REGLES_REIN_LOCAL = JeuRegles("rein.local.options", _PREDICATS_REIN_LOCAL, [
+    # T1a
+    Regle("t1a_np", "traitement chirurgical — Néphrectomie partielle (standard).", ("t1a",)),
+    Regle("t1a_focal", "traitement focal — Cryoablation/RFA percutanée (lésion exophytique, plateau adapté, patient fragile).",
+          ("t1a", "exophytique")),
+    Regle("t1a_surveillance", "surveillance active — Imagerie à 3–6 mois puis 6–12 mois; déclencheurs = croissance rapide, symptômes, haut grade confirmé.",
+          ("t1a",)),
+    Regle("t1a_nt", "traitement chirurgical — Néphrectomie totale si NP non faisable (anatomie/hilaire) ou rein non fonctionnel.",
+          ("t1a",)),
+    # T1b
+    Regle("t1b_np_expert", "traitement chirurgical — Néphrectomie partielle en centre expert (préservation rénale prioritaire).",
+          ("t1b", "rein_unique_ou_CKD")),
+    Regle("t1b_nt", "traitement chirurgical — Néphrectomie totale si NP non faisable.", ("t1b", "rein_unique_ou_CKD")),
+    Regle("t1b_np_ou_nt", "traitement chirurgical — Néphrectomie partielle (sélectionnée) OU Néphrectomie totale selon complexité (hilaire/endophytique → plutôt NT).",
+          ("t1b", "!rein_unique_ou_CKD")),
+    Regle("t1b_surveillance", "surveillance active — Uniquement si comorbidités majeures/inopérable (RCP).", ("t1b",)),
+    # T2a/T2b
+    Regle("t2_np_imperative", "traitement chirurgical — Néphrectomie partielle *impérative* (centre expert) OU Néphrectomie totale si NP impossible.",
+          ("t2", "rein_unique_ou_CKD")),
+    Regle("t2_nt", "traitement chirurgical — Néphrectomie totale (standard).", ("t2", "!rein_unique_ou_CKD")),
+    Regle("t2_surveillance", "surveillance — seulement si inopérable/fragilité majeure (RCP, soins de support).", ("t2",)),
+    # T3a
+    Regle("t3a_nt", "traitement chirurgical — Néphrectomie totale avec exérèse graisse péri-rénale ± veine rénale (si envahie).",
+          ("t3a",)),
+    Regle("t3a_np_imperative", "traitement chirurgical — Néphrectomie partielle *impérative* (centre expert) si anatomie favorable.",
+          ("t3a", "rein_unique_ou_CKD")),
+    # T3b/T3c
+    Regle("t3bc_thrombectomie", "traitement chirurgical — Néphrectomie totale + thrombectomie (niveau {thrombus}). Équipe vasculaire/cardiothoracique si VCC.",
+          ("t3b_t3c",)),
+    Regle("t3bc_rcp", "stratégie — Discussion RCP spécialisée (opérabilité vs traitement systémique d’emblée).", ("t3b_t3c",)),
+    # T4
+    Regle("t4_resection", "traitement chirurgical — Résection élargie si résécable (RCP de recours).", ("t4",)),
+    Regle("t4_systemique", "stratégie — Traitement systémique d’emblée si non résécable.", ("t4",)),
+])
+
+NOTES_REIN_LOCAL = JeuRegles("rein.local.notes", {}, [
+    Regle("biopsie", "Biopsie à discuter si traitement focal/surveillance prévue, doute diagnostique, ou avant traitement systémique.",
+          ("!biopsie_dispo",), numerotee=False),
+    # Ganglions
+    Regle("curage", "Curage ganglionnaire ciblé si adénopathies cliniquement envahies; curage étendu systématique non recommandé.",
+          ("cN_pos",), numerotee=False),
+    # Adjuvant
+    Regle("adjuvant", "Adjuvant : pembrolizumab 12 mois à discuter chez ccRCC à haut risque (profils type KEYNOTE-564).",
+          numerotee=False),
+    # Haut risque opératoire — rappel d’orientation
+    Regle("haut_risque", "Haut risque opératoire : privilégier prise en charge mini-invasive si éligible (TA) ou surveillance selon stade/comorbidités, en RCP.",
+          ("haut_risque_op",), numerotee=False),
+])
+
+# Suivi post-traitement
+SUIVI_REIN_LOCAL = JeuRegles("rein.local.suivi", _PREDICATS_REIN_LOCAL, [
+    Regle("t1a_consultation", "Consultation : 3–6 mois post-op, puis 12 mois, puis annuel jusqu’à 5 ans.", ("t1a", "!cN_pos"), numerotee=False),
+    Regle("t1a_imagerie", "Imagerie : TDM/IRM abdo ± TDM thorax à 12 mois puis annuel.", ("t1a", "!cN_pos"), numerotee=False),
+    Regle("t1a_biologie", "Biologie : créat/DFG à chaque visite; PA; +/- Hb/Ca selon contexte.", ("t1a", "!cN_pos"), numerotee=False),
+    Regle("t1b_t2_consultation", "Consultation : tous les 6–12 mois pendant 3 ans, puis annuel jusqu’à 5 ans.",
+          ("t1b_t2", "!cN_pos"), numerotee=False),
+    Regle("t1b_t2_imagerie", "Imagerie : TDM abdo + TDM thorax tous les 6–12 mois (3 ans), puis annuel.",
+          ("t1b_t2", "!cN_pos"), numerotee=False),
+    Regle("t1b_t2_biologie", "Biologie : créat/DFG, +/- Hb/Ca; adapter si rein unique/CKD.", ("t1b_t2", "!cN_pos"), numerotee=False),
+    Regle("avance_consultation", "Consultation : tous les 3–6 mois pendant 3 ans, puis 6–12 mois jusqu’à 5 ans.",
+          ("avance_ou_n_pos",), numerotee=False),
+    Regle("avance_imagerie", "Imagerie : TDM TAP tous les 3–6 mois (3 ans), puis 6–12 mois.", ("avance_ou_n_pos",), numerotee=False),
+    Regle("avance_biologie", "Biologie : créat/DFG, Hb, Ca; symptômes ciblés. IRM cérébrale si clinique.",
+          ("avance_ou_n_pos",), numerotee=False),
+])
+
+
+def plan_rein_local(
+    cT: str,
+    cN_pos: bool,
+    thrombus: str,  # "Aucun", "Veine rénale", "VCC infra-hépatique", "VCC supra-hépatique/atrium"
+    rein_unique_ou_CKD: bool,
+    tumeur_hilaire: bool,
+    exophytique: bool,
+    age: int,
+    haut_risque_op: bool,
+    biopsie_dispo: bool,
+):
+    """
+    Retourne dict {donnees, traitement, suivi, notes} avec options numérotées.
+    NOTE: aucune taille en cm; les décisions se basent sur le stade cT.
+    """
+    donnees = [
+        ("cT", cT),
+        ("cN+", "Oui" if cN_pos else "Non"),
+        ("Thrombus", thrombus),
+        ("Rein unique/CKD", "Oui" if rein_unique_ou_CKD else "Non"),
+        ("Tumeur hilaire/centrale", "Oui" if tumeur_hilaire else "Non"),
+        ("Exophytique", "Oui" if exophytique else "Non"),
+        ("Âge", f"{age} ans"),
+        ("Haut risque opératoire", "Oui" if haut_risque_op else "Non"),
+        ("Biopsie disponible", "Oui" if biopsie_dispo else "Non"),
+    ]
+
+    contexte = {"cT": cT, "cN_pos": cN_pos, "thrombus": thrombus, "rein_unique_ou_CKD": rein_unique_ou_CKD,
+                "exophytique": exophytique, "haut_risque_op": haut_risque_op, "biopsie_dispo": biopsie_dispo}
+    options: List[str] = REGLES_REIN_LOCAL.options(contexte)
+    notes: List[str] = NOTES_REIN_LOCAL.options(contexte)
+    suivi: List[str] = SUIVI_REIN_LOCAL.options(contexte)
+
+    return ResultatCAT(donnees=donnees, traitement=options, suivi=suivi, notes=notes)
+
+
+def sections_rein_local(plan: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Rubriques du rapport rein non métastatique (page et export en masse)."""
+    return {
+        "Données": lignes_paires(plan["donnees"]),
+        "Traitement (options)": plan["traitement"],
+        "Modalités de suivi": plan["suivi"],
+        "Notes": plan["notes"],
+    }
+
+
+# ——— inchangé ci-dessous ———
+
+def calc_imdc(
+    karnofsky_lt80: bool,
+    time_to_systemic_le_12mo: bool,
+    hb_basse: bool,
+    calcium_haut: bool,
+    neutro_hauts: bool,
+    plaquettes_hautes: bool,
+):
+    """Heng/IMDC : 6 facteurs (KPS<80, délai<1 an, Hb basse, Ca haut, neutros hautes, plaquettes hautes)."""
+    score = sum([karnofsky_lt80, time_to_systemic_le_12mo, hb_basse, calcium_haut, neutro_hauts, plaquettes_hautes])
+    if score == 0:
+        groupe = "Bon pronostic (0)"
+    elif score in (1, 2):
+        groupe = "Intermédiaire (1–2)"
+    else:
+        groupe = "Mauvais (≥3)"
+    return score, groupe
+
+
+def calc_mskcc(
+    karnofsky_lt80: bool,
+    time_to_systemic_le_12mo: bool,
+    hb_basse: bool,
+    calcium_haut: bool,
+    ldh_haut: bool,
+):
+    """MSKCC/Motzer : 5 facteurs (KPS<80, délai<1 an, Hb basse, Ca haut, LDH élevé)."""
+    score = sum([karnofsky_lt80, time_to_systemic_le_12mo, hb_basse, calcium_haut, ldh_haut])
+    if score == 0:
+        groupe = "Bon pronostic (0)"
+    elif score in (1, 2):
+        groupe = "Intermédiaire (1–2)"
+    else:
+        groupe = "Mauvais (≥3)"
+    return score, groupe
+
+
+# =========================
+# RÈGLES — rein métastatique : cytoréduction, 1re ligne, 2e ligne ; notes des sites spéciaux
+# =========================
+_PREDICATS_REIN_META = {
+    "ccRCC": ("histo", "==", "ccRCC"),
+    "bon": ("group", "contient", "Bon"),
+    "intermediaire": ("group", "contient", "Intermédiaire"),
+    "mauvais": ("group", "contient", "Mauvais"),
+    "bon_oligo": ("tous", ("bon", "oligo")),
+    "intermediaire_ou_mauvais": ("un_de", ("intermediaire", "mauvais")),
+}
+
+REGLES_REIN_META = JeuRegles("rein.meta.options", _PREDICATS_REIN_META, [
+    # Cytoréduction
+    Regle("cn_immediate", "néphrectomie de cytoréduction **immédiate** (bon pronostic, tumeur rénale dominante, faible charge).",
+          ("bon_oligo",)),
+    Regle("cn_differee", "néphrectomie de cytoréduction **différée** après réponse au traitement systémique (sélectionnés).",
+          ("!bon_oligo", "intermediaire_ou_mauvais")),
+    # 1re ligne — ccRCC, bon pronostic
+    Regle("l1_bon_pembro_axi", "1re ligne — Pembrolizumab + Axitinib.", ("ccRCC", "bon", "!io_contra")),
+    Regle("l1_bon_pembro_lenva", "1re ligne — Pembrolizumab + Lenvatinib.", ("ccRCC", "bon", "!io_contra")),
+    Regle("l1_bon_nivo_cabo", "1re ligne — Nivolumab + Cabozantinib.", ("ccRCC", "bon", "!io_contra")),
+    Regle("l1_bon_surveillance", "stratégie — Surveillance rapprochée (maladie indolente, faible charge).", ("ccRCC", "bon", "!io_contra")),
+    Regle("l1_bon_tki", "1re ligne — TKI seul (Axitinib, Pazopanib, Sunitinib, Tivozanib) si CI à l’immunothérapie.", ("ccRCC", "bon")),
+    # 1re ligne — ccRCC, intermédiaire/mauvais
+    Regle("l1_nivo_ipi", "1re ligne — Nivolumab + Ipilimumab.", ("ccRCC", "!bon", "!io_contra")),
+    Regle("l1_pembro_lenva", "1re ligne — Pembrolizumab + Lenvatinib.", ("ccRCC", "!bon", "!io_contra")),
+    Regle("l1_nivo_cabo", "1re ligne — Nivolumab + Cabozantinib.", ("ccRCC", "!bon", "!io_contra")),
+    Regle("l1_pembro_axi", "1re ligne — Pembrolizumab + Axitinib.", ("ccRCC", "!bon", "!io_contra")),
+    Regle("l1_tki", "1re ligne — TKI seul (Cabozantinib, Axitinib, Sunitinib, Tivozanib) si CI à l’immunothérapie.", ("ccRCC", "!bon")),
+    # 1re ligne — non-ccRCC
+    Regle("l1_nc_cabo", "1re ligne — Cabozantinib (préférence papillaire).", ("!ccRCC",)),
+    Regle("l1_nc_pembro_lenva", "1re ligne — Pembrolizumab + Lenvatinib.", ("!ccRCC",)),
+    Regle("l1_nc_suni_pazo", "1re ligne — Sunitinib ou Pazopanib.", ("!ccRCC",)),
+    Regle("l1_nc_lenva_evero", "1re ligne — Lenvatinib + Everolimus (sélectionné).", ("!ccRCC",)),
+    Regle("l1_nc_chimio", "chimiothérapie — Gemcitabine + (Cisplatine/Carboplatine) pour sous-types agressifs.", ("!ccRCC",)),
+    Regle("l1_nc_essai", "stratégie — Essai clinique si disponible.", ("!ccRCC",)),
+    # 2e ligne
+    Regle("l2_cabo", "2e ligne — Cabozantinib.", ("ccRCC",)),
+    Regle("l2_lenva_evero", "2e ligne — Lenvatinib + Everolimus.", ("ccRCC",)),
+    Regle("l2_tivo", "2e ligne — Tivozanib.", ("ccRCC",)),
+    Regle("l2_belzutifan", "2e ligne — Belzutifan (si disponible).", ("ccRCC",)),
+    Regle("l2_nc_cabo_lenva", "2e ligne — Cabozantinib / Lenvatinib + Everolimus.", ("!ccRCC",)),
+    Regle("l2_nc_essai", "2e ligne — Essai clinique fortement recommandé.", ("!ccRCC",)),
+])
+
+NOTES_REIN_META = JeuRegles("rein.meta.notes", {}, [
+    Regle("oligo", "Maladie oligométastatique : à discuter métastasectomie et/ou radiothérapie stéréotaxique.", ("oligo",), numerotee=False),
+    Regle("os", "Os : acide zolédronique ou denosumab + Ca/Vit D; radiothérapie antalgique si douloureux.", ("bone",), numerotee=False),
+    Regle("cerveau", "Cerveau : stéréotaxie/chirurgie + stéroïdes selon symptômes; coordination neuro-oncologie.", ("brain",), numerotee=False),
+])
+
+SUIVI_REIN_META = textes.enregistrer("rein.meta.suivi", [
+    "Avant et pendant traitement : PA/poids, symptômes; NFS, créat/DFG, transaminases, phosphatases, Ca; TSH (IO/TKI).",
+    "Protéinurie et TA à chaque visite sous TKI; ECG/risques CV si nécessaire.",
+    "Imagerie de réévaluation : TDM TAP toutes 8–12 semaines les 6–9 premiers mois, puis espacer selon réponse/clinique.",
+    "IRM cérébrale si symptômes ou lésions traitées (toutes 8–12 semaines au début).",
+])
+
+
+def plan_rein_meta(
+    histo: str,             # "ccRCC" ou "non-ccRCC"
+    score: int,
+    group: str,
+    score_system_label: str,
+    oligo: bool,
+    bone: bool,
+    brain: bool,
+    liver: bool,
+    io_contra: bool,
+):
+    """
+    Retourne dict {donnees, stratification, traitement, suivi, notes}.
+    Inclut la néphrectomie de cytoréduction comme option selon IMDC/MSKCC et charge tumorale.
+    """
+    donnees = [
+        ("Histologie", histo),
+        (f"{score_system_label} score", str(score)),
+        (f"Groupe {score_system_label}", group),
+        ("Oligométastatique", "Oui" if oligo else "Non"),
+        ("Métastases osseuses", "Oui" if bone else "Non"),
+        ("Cérébrales", "Oui" if brain else "Non"),
+        ("Hépatiques", "Oui" if liver else "Non"),
+        ("CI immunothérapie", "Oui" if io_contra else "Non"),
+    ]
+
+    contexte = {"histo": histo, "group": group, "oligo": oligo, "bone": bone, "brain": brain, "io_contra": io_contra}
+    options: List[str] = REGLES_REIN_META.options(contexte)
+    notes: List[str] = NOTES_REIN_META.options(contexte)
+
+    # Suivi métastatique
+    suivi = textes.liste(SUIVI_REIN_META)
+
+    return ResultatCAT(
+        donnees=donnees,
+        stratification=[(score_system_label, f"{group} (score {score})")],
+        traitement=options,
+        suivi=suivi,
+        notes=notes,
+    )
+
+
+# =========================
+# RÈGLES — biopsie percutanée d'une masse rénale
+# =========================
+_PREDICATS_REIN_BIOPSIE = {
+    "indications_fortes": ("un_de", ("indication_systemique", "indication_ablation", "inoperable_haut_risque",
+                                     "lesion_indet", "suspicion_lymphome_metastase_infection", "rein_unique_ou_ckd")),
+    "bosniak_iii": ("bosniak", "==", "III"),
+    "bosniak_iv": ("bosniak", "==", "IV"),
+    "bosniak_iii_iv": ("un_de", ("bosniak_iii", "bosniak_iv")),
+}
+
+REGLES_REIN_BIOPSIE = JeuRegles("rein.biopsie.options", _PREDICATS_REIN_BIOPSIE, [
+    # CI immédiate
+    Regle("coagulation", "corriger les troubles de coagulation **avant** toute biopsie; sinon différer.",
+          ("troubles_coag_non_corriges",)),
+    Regle("biopsie", "Biopsie rénale percutanée guidée (TDM/écho), 2–3 carottes, histo + IHC si besoin.", ("indications_fortes",)),
+    Regle("rcp", "Discussion RCP — Biopsie **ou** surveillance/traitement selon préférences et risque.",
+          ("!indications_fortes", "!petite_masse_typique_et_chirurgie_prevue")),
+    # Non nécessaire d’emblée
+    Regle("non_necessaire", "Pas d’indication routinière à la biopsie si chirurgie partielle déjà prévue chez patient apte (petite masse solide typique).",
+          ("!indications_fortes", "petite_masse_typique_et_chirurgie_prevue")),
+])
+
+NOTES_REIN_BIOPSIE = JeuRegles("rein.biopsie.notes", _PREDICATS_REIN_BIOPSIE, [
+    Regle("bosniak", "Kystique Bosniak III/IV : la biopsie peut avoir un rendement limité; décision RCP (biopsie vs chirurgie d’emblée).",
+          ("bosniak_iii_iv",), numerotee=False),
+    Regle("ci_relatives", "CI relatives : infection cutanée au point de ponction, impossibilité de coopération/apnée, anticoagulation non interrompue.",
+          numerotee=False),
+    Regle("rendements", "Informer sur rendements : meilleurs pour masses solides; plus limité pour kystiques complexes.",
+          numerotee=False),
+])
+
+SUIVI_REIN_BIOPSIE = textes.enregistrer("rein.biopsie.suivi", [
+    "Après biopsie : surveillance du point de ponction, contrôle Hb si risque saignement.",
+    "Si surveillance active choisie : imagerie à 3–6 mois puis tous les 6–12 mois; re-biopsie si évolution atypique.",
+    "Si ablation après biopsie : TDM/IRM à 3 mois, puis 6–12 mois les 2 premières années.",
+])
+
+
+def plan_rein_biopsy(
+    indication_systemique: bool,
+    indication_ablation: bool,
+    inoperable_haut_risque: bool,
+    lesion_indet: bool,
+    suspicion_lymphome_metastase_infection: bool,
+    rein_unique_ou_ckd: bool,
+    petite_masse_typique_et_chirurgie_prevue: bool,
+    bosniak: str,  # "II", "IIF", "III", "IV", "Non applicable"
+    troubles_coag_non_corriges: bool,
+):
+    """
+    Retourne dict {donnees, conduite, suivi, notes} pour les indications de biopsie percutanée d'une masse rénale.
+    """
+    donnees = [
+        ("Avant traitement systémique (métastatique)", "Oui" if indication_systemique else "Non"),
+        ("Avant traitement focal (cryo/RFA) prévu", "Oui" if indication_ablation else "Non"),
+        ("Patient inopérable/haut risque chirurgical", "Oui" if inoperable_haut_risque else "Non"),
+        ("Lésion indéterminée en imagerie", "Oui" if lesion_indet else "Non"),
+        ("Suspicion lymphome / métastase / infection", "Oui" if suspicion_lymphome_metastase_infection else "Non"),
+        ("Rein unique / CKD significative", "Oui" if rein_unique_ou_ckd else "Non"),
+        ("Petite masse typique et chirurgie déjà prévue", "Oui" if petite_masse_typique_et_chirurgie_prevue else "Non"),
+        ("Bosniak (si kystique)", bosniak),
+        ("Troubles de coagulation non corrigés", "Oui" if troubles_coag_non_corriges else "Non"),
+    ]
+
+    contexte = {
+        "indication_systemique": indication_systemique,
+        "indication_ablation": indication_ablation,
+        "inoperable_haut_risque": inoperable_haut_risque,
+        "lesion_indet": lesion_indet,
+        "suspicion_lymphome_metastase_infection": suspicion_lymphome_metastase_infection,
+        "rein_unique_ou_ckd": rein_unique_ou_ckd,
+        "petite_masse_typique_et_chirurgie_prevue": petite_masse_typique_et_chirurgie_prevue,
+        "bosniak": bosniak,
+        "troubles_coag_non_corriges": troubles_coag_non_corriges,
+    }
+    options: List[str] = REGLES_REIN_BIOPSIE.options(contexte)
+    notes: List[str] = NOTES_REIN_BIOPSIE.options(contexte)
+    suivi = textes.liste(SUIVI_REIN_BIOPSIE)
+
+    return ResultatCAT(donnees=donnees, conduite=options, suivi=suivi, notes=notes)
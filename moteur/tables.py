@@ -0,0 +1,160 @@
+# moteur/tables.py — tables de décision précalculées pour les modules à entrées finies
+# Les modules qui ne prennent que des booléens et de petites énumérations ont au plus
+# quelques centaines de combinaisons : on les énumère une fois (au premier appel), on
+# stocke les résultats distincts et on sert ensuite par index compacté (1 bit par booléen).
+# Résultats figés (lecture seule) car partagés entre tous les appels.
+# Chaque table n'importe sa spécialité qu'au premier accès (moteur.tables.plan_tvim → moteur.vessie seul).
+
+from array import array
+from importlib import import_module
+from itertools import compress, product
+import inspect
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .commun import figer, lieur
+
+BOOL = (False, True)
+
+
+class TableDecision:
+    """
+    Table exhaustive d'une fonction plan_* : index = Σ code(param_i) × pas_i (base mixte ;
+    un booléen occupe exactement un bit). Valeur hors domaine → repli sur l'appel direct.
+    """
+
+    def __init__(self, fonction: Callable[..., Any], params: Sequence[str], domaines: Dict[str, Tuple[Any, ...]]):
+        self.fonction = fonction
+        self.params = tuple(params)
+        sig = inspect.signature(fonction)
+        if tuple(sig.parameters) != self.params:
+            raise ValueError(f"Paramètres de table {self.params} ≠ signature de {fonction.__name__} {tuple(sig.parameters)}")
+        self._lier = lieur(sig)  # mots-clés vérifiés comme par l'appel direct (TypeError)
+        self.domaines = tuple(domaines.get(p, BOOL) for p in self.params)
+        self._codes = tuple(None if d is BOOL else {v: i for i, v in enumerate(d)} for d in self.domaines)
+        pas, n = [], 1
+        for d in self.domaines:
+            pas.append(n)
+            n *= len(d)
+        self._pas = tuple(pas)
+        self._tout_bool = all(c is None for c in self._codes)
+        self.taille = n
+        self._indices: Optional[array] = None
+        self._resultats: List[Any] = []
+        self.__name__ = getattr(fonction, "__name__", "table")
+        self.__doc__ = fonction.__doc__
+
+    # ---------- construction (une fois par processus) ----------
+    def construire(self) -> "TableDecision":
+        resultats: List[Any] = []
+        vus: Dict[str, int] = {}
+        indices = array("H" if self.taille < 65536 else "I", [0]) * self.taille
+        for combinaison in product(*self.domaines):
+            idx = self._index(combinaison)
+            res = self.fonction(*combinaison)
+            cle = repr(res)
+            if cle not in vus:
+                vus[cle] = len(resultats)
+                resultats.append(figer(res))
+            indices[idx] = vus[cle]
+        self._resultats = resultats
+        self._indices = indices
+        return self
+
+    def _index(self, valeurs: Sequence[Any]) -> Optional[int]:
+        idx = 0
+        for v, codes, pas in zip(valeurs, self._codes, self._pas):
+            if codes is None:
+                if v:
+                    idx += pas
+            else:
+                c = codes.get(v)
+                if c is None:
+                    return None
+                idx += c * pas
+        return idx
+
+    # ---------- chemin chaud ----------
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        if kwargs or len(args) != len(self._pas):
+            args = self._lier(args, kwargs)
+        if self._indices is None:
+            self.construire()
+        if self._tout_bool and len(args) == len(self._pas):
+            # tout booléen : index = somme des bits des paramètres vrais (boucle en C)
+            return self._resultats[self._indices[sum(compress(self._pas, args))]]
+        idx = self._index(args)
+        if idx is None:
+            return figer(self.fonction(*args))
+        return self._resultats[self._indices[idx]]
+
+    @property
+    def nb_resultats_distincts(self) -> int:
+        return len(self._resultats)
+
+
+# =========================
+# Tables des modules à entrées finies
+# =========================
+
+# nom → (spécialité, paramètres dans l'ordre de la signature, domaines non booléens)
+DEFINITIONS: Dict[str, Tuple[str, Tuple[str, ...], Dict[str, Tuple[Any, ...]]]] = {
+    "plan_tves_metastatique": ("tves", (
+        "ev_pembro_eligible", "cis_eligible", "carbo_eligible", "platinum_naif",
+        "fgfr_alt", "prior_platinum", "prior_io", "use_cis_gem_nivo",
+    ), {}),
+    "plan_prostate_metastatique": ("prostate", (
+        "testosterone_castration", "volume_eleve", "symptomes_osseux",
+        "deja_docetaxel", "deja_arpi", "alteration_HRR",
+    ), {}),
+    "plan_rein_biopsy": ("rein", (
+        "indication_systemique", "indication_ablation", "inoperable_haut_risque", "lesion_indet",
+        "suspicion_lymphome_metastase_infection", "rein_unique_ou_ckd",
+        "petite_masse_typique_et_chirurgie_prevue", "bosniak", "troubles_coag_non_corriges",
+    ), {"bosniak": ("II", "IIF", "III", "IV", "Non applicable")}),
+    "plan_meta": ("vessie", (
+        "cis_eligible", "carbo_eligible", "platinum_naive", "pdl1_pos",
+        "prior_platinum", "prior_cpi", "bone_mets",
+    ), {}),
+    "plan_tvim": ("vessie", (
+        "t_cat", "cN_pos", "metastases", "cis_eligible", "hydron",
+        "bonne_fct_v", "cis_diffus", "post_op_high_risk", "neo_adjuvant_fait",
+    ), {"t_cat": ("T2", "T3", "T4a")}),
+    "plan_prostatite": ("infectio", (
+        "fievre_ge_38_5", "douleurs_perineales", "dysurie", "retention", "post_biopsie_prostate",
+        "immunodep", "irc_significative", "seps_sbp_lt90", "seps_hr_gt120", "confusion",
+    ), {}),
+}
+
+TABLES: Dict[str, TableDecision] = {}  # tables déjà instanciées (spécialité importée)
+
+
+def table(nom: str) -> TableDecision:
+    """Table `nom`, instanciée au premier accès (import de la seule spécialité concernée)."""
+    t = TABLES.get(nom)
+    if t is None:
+        specialite, params, domaines = DEFINITIONS[nom]
+        fonction = getattr(import_module(f".{specialite}", __package__), nom)
+        t = TABLES[nom] = TableDecision(fonction, params, domaines)
+        globals()[nom] = t
+    return t
+
+
+def __getattr__(nom: str) -> TableDecision:
+    # PEP 562 : `from moteur.tables import plan_tvim` passe par ici la première fois
+    if nom in DEFINITIONS:
+        return table(nom)
+    raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+
+
+def construire_tables() -> Dict[str, TableDecision]:
+    """Étape de construction explicite (ex. au démarrage d'un worker) : énumère toutes les tables."""
+    for nom in DEFINITIONS:
+        t = table(nom)
+        if t._indices is None:
+            t.construire()
+    return TABLES
+
+
+if __name__ == "__main__":
+    for nom, t in construire_tables().items():
+        print(f"{nom:28s} {t.taille:5d} combinaisons → {t.nb_resultats_distincts:4d} résultats distincts")
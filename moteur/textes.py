@@ -0,0 +1,59 @@
+# moteur/textes.py — catalogue des fragments de texte (options, notes, suivis) référencés par identifiant
+# Chaque libellé est enregistré une fois à l'import de sa spécialité (chaîne internée, immuable) ;
+# les moteurs raisonnent sur des tuples d'identifiants (légers, hachables, comparables en O(1))
+# et la numérotation « Option n : » n'est appliquée qu'au rendu, lui-même mémorisé par tuple.
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Mapping, Sequence, Tuple, Union
+import sys
+
+GABARIT_OPTION = "Option {n} : {texte}"
+
+CATALOGUE: Dict[str, str] = {}
+_NUMEROTES: set = set()
+
+
+def enregistrer(espace: str, textes: Union[Sequence[str], Mapping[str, str]],
+                numerote: bool = False) -> Tuple[str, ...]:
+    """
+    Ajoute des fragments sous `espace` (clés `espace.cle`, ou `espace.1`, `espace.2`… pour une séquence)
+    et retourne leurs identifiants dans l'ordre. `numerote` : fragment rendu « Option n : … ».
+    """
+    paires = textes.items() if isinstance(textes, Mapping) else ((str(i), t) for i, t in enumerate(textes, 1))
+    ids = []
+    for cle, texte in paires:
+        ident = sys.intern(f"{espace}.{cle}")
+        deja = CATALOGUE.get(ident)
+        if deja is not None and deja != texte:
+            raise ValueError(f"Identifiant de texte déjà utilisé avec un autre libellé : {ident!r}")
+        CATALOGUE[ident] = sys.intern(texte)
+        if numerote:
+            _NUMEROTES.add(ident)
+        ids.append(ident)
+    return tuple(ids)
+
+
+def texte(ident: str) -> str:
+    return CATALOGUE[ident]
+
+
+def numerotes() -> FrozenSet[str]:
+    return frozenset(_NUMEROTES)
+
+
+@lru_cache(maxsize=4096)
+def rendre(ids: Tuple[str, ...], debut: int = 1) -> Tuple[str, ...]:
+    """Textes des fragments `ids` ; les fragments numérotés reçoivent « Option n : » à partir de `debut`."""
+    sortie, n = [], debut
+    for ident in ids:
+        if ident in _NUMEROTES:
+            sortie.append(GABARIT_OPTION.format(n=n, texte=CATALOGUE[ident]))
+            n += 1
+        else:
+            sortie.append(CATALOGUE[ident])
+    return tuple(sortie)
+
+
+def liste(ids: Tuple[str, ...], debut: int = 1) -> List[str]:
+    """Rendu sous forme de liste neuve (forme des dictionnaires renvoyés par les plan_*)."""
+    return list(rendre(ids, debut))
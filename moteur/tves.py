@@ -0,0 +1,268 @@
+# moteur/tves.py — Tumeurs des voies excrétrices supérieures (localisé & métastatique)
+
+from typing import Any, Dict, List
+
+from . import textes
+from .commun import lignes_paires
+from .regles import JeuRegles, Regle
+from .resultat import ResultatCAT
+
+# =========================
+# LOGIQUE CLINIQUE — TVES (localisé & métastatique)
+# =========================
+
+def stratifier_tves_risque(
+    grade_biopsie: str,          # "Bas grade", "Haut grade", "Indéterminé"
+    cytologie_hg_positive: bool,
+    taille_cm: float,
+    multifocal: bool,
+    invasion_imagerie: bool,
+    hydron: bool,
+    kss_faisable: bool,          # possibilité de traitement conservateur endoscopique/segmentaire complet
+    accepte_suivi_strict: bool,
+):
+    """
+    Règles (synthèse) :
+      BAS RISQUE si TOUT est réuni :
+        - Bas grade à la biopsie URSS
+        - Cytologie haut grade négative
+        - Lésion non infiltrante à l’imagerie (pas d’invasion) et PAS d’hydronéphrose
+        - Taille < 2 cm
+        - Unifocale (multifocal = False)
+        - Traitement conservateur réalisable (kss_faisable = True)
+        - Patient accepte le suivi strict (accepte_suivi_strict = True)
+      Sinon = HAUT RISQUE
+    """
+    conditions_bas = [
+        grade_biopsie == "Bas grade",
+        not cytologie_hg_positive,
+        not invasion_imagerie,
+        not hydron,
+        taille_cm < 2.0,
+        not multifocal,
+        kss_faisable,
+        accepte_suivi_strict,
+    ]
+    return "Bas risque" if all(conditions_bas) else "Haut risque"
+
+
+# =========================
+# RÈGLES — TVES localisé : KSS prioritaire si bas risque, NUT sinon
+# =========================
+_PREDICATS_TVES_LOCALISE = {
+    "bas_risque": ("risque", "==", "Bas risque"),
+    "uretere_distal": ("localisation", "contient", "Uretère distal"),
+}
+
+REGLES_TVES_LOCALISE = JeuRegles("tves.localise.options", _PREDICATS_TVES_LOCALISE, [
+    # KSS prioritaire
+    Regle("kss", "traitement conservateur endoscopique (URSS laser/ablation) avec second look à 6–8 semaines.", ("bas_risque",)),
+    Regle("segmentaire", "chirurgie conservatrice — Urétérectomie segmentaire + réimplantation (sélectionné).",
+          ("bas_risque", "uretere_distal")),
+    # Si KSS impossible malgré critères bas risque → NUT
+    Regle("nut_si_echec", "Néphro-urétérectomie totale (NUT) si KSS non réalisable/échec.", ("bas_risque",)),
+    # Haut risque
+    Regle("nut", "Néphro-urétérectomie totale (NUT) avec collerette vésicale en bloc ± curage selon topographie.", ("!bas_risque",)),
+])
+
+NOTES_TVES_LOCALISE = JeuRegles("tves.localise.notes", _PREDICATS_TVES_LOCALISE, [
+    # Adjuvants/préventions
+    Regle("instillation_kss", "Après NUT : instillation intravésicale unique (ex. mitomycine) 2–10 jours post-op pour ↓ récidives vésicales.",
+          ("bas_risque",), numerotee=False),
+    Regle("topiques", "Topiques réno-urétéraux (ex. MMC/gel) après KSS selon centres/disponibilité.", ("bas_risque",), numerotee=False),
+    # (Néoadjuvant possible selon centre; souvent adjuvant privilégié POUT)
+    Regle("adjuvant", "Adjuvant : chimiothérapie sels de platine (schéma basé cisplatine si DFG suffisant) à discuter pour pT2–T4 et/ou pN+ (type POUT).",
+          ("!bas_risque",), numerotee=False),
+    Regle("instillation_nut", "Après NUT : instillation intravésicale unique (ex. mitomycine) 2–10 jours post-op pour ↓ récidive vésicale.",
+          ("!bas_risque",), numerotee=False),
+])
+
+# Suivi selon le traitement de référence du groupe de risque (KSS si bas risque, NUT sinon)
+SUIVI_TVES_LOCALISE = {
+    "Bas risque": textes.enregistrer("tves.localise.suivi_kss", [
+        "URSS (± biopsies) + cytologie *in situ* : à 6–8 semaines (second look), puis à 3 et 6 mois, ensuite annuelle si stable.",
+        "Cystoscopie : à 3 et 6 mois, puis annuelle.",
+        "Imagerie (uro-TDM) : à 3 et 6 mois, puis annuelle.",
+        "Biologie : créat/DFG, selon contexte.",
+    ]),
+    "Haut risque": textes.enregistrer("tves.localise.suivi_nut", [
+        "Cystoscopie + cytologie : tous les 3 mois pendant 1 an, puis tous les 6 mois pendant 2 ans, puis annuelle (durée prolongée > 5–10 ans).",
+        "Imagerie (uro-TDM ± TDM thorax) : tous les 6 mois pendant 4 ans, puis annuelle.",
+        "Biologie : créat/DFG à chaque visite; adapter si rein unique/CKD.",
+    ]),
+}
+
+
+def plan_tves_localise(
+    grade_biopsie: str,
+    cytologie_hg_positive: bool,
+    taille_cm: float,
+    multifocal: bool,
+    invasion_imagerie: bool,
+    hydron: bool,
+    kss_faisable: bool,
+    accepte_suivi_strict: bool,
+    localisation: str,  # "Bassinets/caliciel", "Uretère proximal", "Uretère moyen", "Uretère distal"
+):
+    """
+    Renvoie dict {donnees, stratification, traitement, suivi, notes}
+    - Options numérotées si plusieurs possibilités ; sinon conduite directe.
+    """
+    risque = stratifier_tves_risque(
+        grade_biopsie, cytologie_hg_positive, taille_cm, multifocal,
+        invasion_imagerie, hydron, kss_faisable, accepte_suivi_strict
+    )
+
+    donnees = [
+        ("Risque estimé", risque),
+        ("Grade biopsie URSS", grade_biopsie),
+        ("Cytologie haut grade positive", "Oui" if cytologie_hg_positive else "Non"),
+        ("Taille lésion", f"{taille_cm:.1f} cm"),
+        ("Multifocale", "Oui" if multifocal else "Non"),
+        ("Invasion suspecte à l’imagerie", "Oui" if invasion_imagerie else "Non"),
+        ("Hydronéphrose", "Oui" if hydron else "Non"),
+        ("KSS (conservateur) faisable", "Oui" if kss_faisable else "Non"),
+        ("Acceptation suivi strict", "Oui" if accepte_suivi_strict else "Non"),
+        ("Localisation", localisation),
+    ]
+
+    contexte = {"risque": risque, "localisation": localisation}
+    traitement = REGLES_TVES_LOCALISE.options(contexte)  # une seule ligne (conduite) ou plusieurs "Option x"
+    notes = NOTES_TVES_LOCALISE.options(contexte)
+    suivi = textes.liste(SUIVI_TVES_LOCALISE[risque])
+
+    return ResultatCAT(
+        donnees=donnees,
+        stratification=[("Risque", risque)],
+        traitement=traitement,
+        suivi=suivi,
+        notes=notes,
+    )
+
+
+def sections_tves_localise(plan: Dict[str, Any]) -> Dict[str, List[str]]:
+    """Rubriques du rapport TVES localisé (page et export en masse)."""
+    return {
+        "Données": lignes_paires(plan["donnees"]),
+        "Stratification": lignes_paires(plan["stratification"]),
+        "Traitement": plan["traitement"],
+        "Modalités de suivi": plan["suivi"],
+        "Notes": plan["notes"],
+    }
+
+
+# =========================
+# RÈGLES — TVES métastatique (séquences de lignes selon éligibilités)
+# =========================
+REGLES_TVES_META = JeuRegles(
+    "tves.meta.options",
+    predicats={
+        "triplet": ("tous", ("use_cis_gem_nivo", "cis_eligible")),  # CheckMate-901
+    },
+    regles=[
+        # Patient non naïf de platine (par ex. rechute post-chimio antérieure)
+        Regle("pembro", "Pembrolizumab (si IO non reçue).", ("!platinum_naif", "!prior_io")),
+        Regle("ev", "Enfortumab védotin (EV).", ("!platinum_naif",)),
+        Regle("erda", "Erdafitinib (si altération FGFR2/3).", ("!platinum_naif", "fgfr_alt")),
+        # Vraie 1re ligne, éligible EV + Pembro : 1L préférentielle puis 2L / 3L selon progression
+        Regle("ev_pembro_1l", "1L — Enfortumab védotin + Pembrolizumab (préférentiel).", ("platinum_naif", "ev_pembro_eligible")),
+        Regle("ev_pembro_2l", "2L — Platine + Gemcitabine (cis si éligible, sinon carbo).", ("platinum_naif", "ev_pembro_eligible")),
+        Regle("ev_pembro_erda", "2L/3L — Erdafitinib (si FGFR2/3 altéré).", ("platinum_naif", "ev_pembro_eligible", "fgfr_alt")),
+        Regle("ev_pembro_3l", "3L — EV (si stratégie monothérapie envisageable) ou autre séquence selon tolérance.",
+              ("platinum_naif", "ev_pembro_eligible")),
+        # Non éligible EV + Pembro, triplet Cisplatine + Gemcitabine + Nivolumab
+        Regle("triplet_1l", "1L — Cisplatine + Gemcitabine + Nivolumab.", ("platinum_naif", "!ev_pembro_eligible", "triplet")),
+        Regle("triplet_2l", "2L — Enfortumab védotin (EV).", ("platinum_naif", "!ev_pembro_eligible", "triplet")),
+        Regle("triplet_erda", "Ligne dédiée — Erdafitinib (si FGFR2/3 altéré).",
+              ("platinum_naif", "!ev_pembro_eligible", "triplet", "fgfr_alt")),
+        # Non éligible EV + Pembro, platine-gem conventionnelle avec maintenance avelumab si contrôle
+        Regle("gem_cis", "1L — Gemcitabine + Cisplatine.", ("platinum_naif", "!ev_pembro_eligible", "!triplet", "cis_eligible")),
+        Regle("gem_carbo", "1L — Gemcitabine + Carboplatine.",
+              ("platinum_naif", "!ev_pembro_eligible", "!triplet", "!cis_eligible", "carbo_eligible")),
+        Regle("sans_platine", "1L — (si aucun platine) discuter alternatives/essai clinique.",
+              ("platinum_naif", "!ev_pembro_eligible", "!triplet", "!cis_eligible", "!carbo_eligible")),
+        Regle("controle", "Contrôle après 4–6 cycles — TDM TAP.", ("platinum_naif", "!ev_pembro_eligible", "!triplet")),
+        Regle("avelumab", "Maintenance — Avelumab si maladie contrôlée (RC/PR/SD) après 4–6 cycles.",
+              ("platinum_naif", "!ev_pembro_eligible", "!triplet")),
+        Regle("pembro_2l", "2L — Pembrolizumab en cas de progression sous/à l’issue de chimio.",
+              ("platinum_naif", "!ev_pembro_eligible", "!triplet")),
+        Regle("ev_2l3l", "2L/3L — Enfortumab védotin (EV) en cas de progression après IO.",
+              ("platinum_naif", "!ev_pembro_eligible", "!triplet")),
+        Regle("platine_erda", "Ligne dédiée — Erdafitinib (si FGFR2/3 altéré).",
+              ("platinum_naif", "!ev_pembro_eligible", "!triplet", "fgfr_alt")),
+    ],
+)
+
+NOTES_TVES_META = JeuRegles("tves.meta.notes", {}, [
+    Regle("sequence", "Séquence ultérieure selon réponses et tolérance; envisager essais cliniques.",
+          ("!platinum_naif",), numerotee=False),
+])
+
+# Suivi détaillé (commun aux schémas)
+SUIVI_TVES_META = textes.enregistrer("tves.meta.suivi", [
+    "Évaluation d’efficacité: TDM TAP toutes 8–12 semaines (au démarrage), puis adapter selon réponse/clinique.",
+    "Si 1L platine-gem: TDM TAP après 4–6 cycles pour décider maintenance Avelumab ou bascule 2L.",
+    "Biologie récurrente: NFS, créat/DFG, bilan hépatique; glycémie (EV), phosphatémie et bilan ophtalmo (FGFRi), TSH ± enzymes pancréatiques (IO).",
+    "Toxicités à surveiller: EV (éruption cutanée, neuropathie, hyperglycémie); IO (dermatites, colite, pneumonite, endocrinopathies); FGFRi (hyperphosphatémie, toxicité oculaire).",
+    "Soins de support: prise en charge douleur, diététique, activité adaptée; évaluation gériatrique si besoin.",
+])
+
+
+def plan_tves_metastatique(
+    ev_pembro_eligible: bool,
+    cis_eligible: bool,
+    carbo_eligible: bool,
+    platinum_naif: bool,
+    fgfr_alt: bool,
+    prior_platinum: bool,
+    prior_io: bool,
+    use_cis_gem_nivo: bool,   # ← nouveau paramètre (pour le bras "Cisplatine Gem Nivo")
+):
+    """
+    Aligne la CAT sur l’algorithme fourni pour carcinome urothélial métastatique:
+
+    - Si éligible EV + Pembro → 1L = EV + Pembrolizumab (option préférentielle)
+        • Progression → 2L: Platine-Gemcitabine (cis/carbo selon éligibilité)
+        • (FGFR alt) → Erdafitinib possible (2L/3L)
+        • Progression ultérieure → 3L: EV (si non déjà exploitable en monothérapie) ± Erdafitinib si FGFR alt non utilisé
+
+    - Si NON éligible EV + Pembro:
+        • Option A (si cis éligible ET choisi): 1L = Cisplatine + Gemcitabine + Nivolumab
+              ↳ Progression → EV  ± Erdafitinib (si FGFR alt)
+        • Option B (par défaut): 1L = Platine-Gemcitabine (cis si possible, sinon carbo)
+              ↳ TDM TAP après 4–6 cycles:
+                    - maladie contrôlée (RC/PR/SD) → maintenance Avelumab
+                    - progression → Pembrolizumab
+              ↳ Progression après maintenance/IO → EV  ± Erdafitinib (si FGFR alt)
+
+    - Si patient NON naïf de platine: orienter directement vers Pembro (si pas d’IO antérieure),
+      sinon EV / Erdafitinib selon FGFR.
+
+    Renvoie: dict {donnees, traitement (options numérotées), suivi (détaillé), notes}
+    """
+    donnees = [
+        ("Éligible EV + Pembrolizumab", "Oui" if ev_pembro_eligible else "Non"),
+        ("Éligible Cisplatine", "Oui" if cis_eligible else "Non"),
+        ("Éligible Carboplatine", "Oui" if carbo_eligible else "Non"),
+        ("Naïf de platine (1re ligne)", "Oui" if platinum_naif else "Non"),
+        ("Altérations FGFR2/3", "Oui" if fgfr_alt else "Non"),
+        ("Platines déjà reçus", "Oui" if prior_platinum else "Non"),
+        ("Immunothérapie déjà reçue", "Oui" if prior_io else "Non"),
+        ("Choix 1L Cis-Gem-Nivo", "Oui" if use_cis_gem_nivo else "Non"),
+    ]
+
+    contexte = {
+        "ev_pembro_eligible": ev_pembro_eligible, "cis_eligible": cis_eligible, "carbo_eligible": carbo_eligible,
+        "platinum_naif": platinum_naif, "fgfr_alt": fgfr_alt, "prior_io": prior_io,
+        "use_cis_gem_nivo": use_cis_gem_nivo,
+    }
+    options = REGLES_TVES_META.options(contexte)
+    notes = NOTES_TVES_META.options(contexte)
+    suivi = textes.liste(SUIVI_TVES_META)
+
+    return ResultatCAT(
+        donnees=donnees,
+        traitement=options,
+        suivi=suivi,
+        notes=notes,
+    )
@@ -0,0 +1,112 @@
+# moteur/vectorise.py — stratifications vectorisées (colonnes entières en une passe NumPy)
+# Mêmes catégories que les versions scalaires (prostate_risk_damico, stratifier_tvnim,
+# stratifier_tves_risque, calc_imdc, calc_mskcc), pour les audits de registres.
+# Entrées : listes, tableaux NumPy ou Series pandas de même longueur. Sorties : tableaux NumPy.
+
+from typing import Any, Tuple
+
+import numpy as np
+
+from .prostate import ct_rank
+
+_DAMICO = np.array(["faible", "intermédiaire", "élevé"], dtype=object)
+_TVNIM = np.array(["faible", "intermédiaire", "élevé"], dtype=object)
+_TVES = np.array(["Bas risque", "Haut risque"], dtype=object)
+_PRONOSTIC = np.array(["Bon pronostic (0)", "Intermédiaire (1–2)", "Mauvais (≥3)"], dtype=object)
+
+
+def _bool(x: Any) -> np.ndarray:
+    # même sémantique que `if x` côté scalaire (vérité Python de chaque valeur)
+    return np.asarray(x).astype(bool)
+
+
+def ct_rank_vect(cT: Any) -> np.ndarray:
+    """Rang cT pour toute une colonne : normalisation faite une fois par valeur distincte."""
+    uniques, inverse = np.unique(np.asarray(cT, dtype=object).astype(str), return_inverse=True)
+    rangs = np.array([ct_rank(u) for u in uniques], dtype=np.int16)
+    return rangs[inverse.reshape(-1)]
+
+
+# ==============================
+# D'AMICO (localisé)
+# ==============================
+
+def damico_code_vect(psa: Any, isup: Any, rang_ct: Any) -> np.ndarray:
+    """Codes D'Amico (0 faible, 1 intermédiaire, 2 élevé) à partir des rangs cT déjà calculés."""
+    psa = np.asarray(psa, dtype=float)
+    isup = np.asarray(isup)
+    r = np.asarray(rang_ct)
+    eleve = (r >= ct_rank("T2c")) | np.isin(isup, (4, 5)) | (psa > 20)
+    inter = (r == ct_rank("T2b")) | np.isin(isup, (2, 3)) | ((psa >= 10) & (psa <= 20))
+    faible = (r <= ct_rank("T2a")) & (isup == 1) & (psa <= 10)
+    # ordre d'évaluation identique au scalaire : élevé, puis intermédiaire, puis faible, sinon intermédiaire
+    return np.select([eleve, inter, faible], [2, 1, 0], default=1).astype(np.int8)
+
+
+def prostate_risk_damico_vect(psa: Any, isup: Any, cT: Any) -> np.ndarray:
+    """Version colonne de prostate_risk_damico → tableau de "faible"/"intermédiaire"/"élevé"."""
+    return _DAMICO[damico_code_vect(psa, isup, ct_rank_vect(cT))]
+
+
+# ==============================
+# TVNIM
+# ==============================
+
+def stratifier_tvnim_vect(stade: Any, grade: Any, taille_mm: Any, nombre: Any,
+                          cis_associe: Any, lvi: Any, urethre_prostatique: Any, formes_agressives: Any) -> np.ndarray:
+    """Version colonne de stratifier_tvnim → tableau de "faible"/"intermédiaire"/"élevé"."""
+    stade = np.asarray(stade, dtype=object)
+    eleve = (stade == "pT1") | _bool(cis_associe) | _bool(lvi) | _bool(urethre_prostatique) | _bool(formes_agressives)
+    faible = (
+        (np.asarray(grade, dtype=object) == "Bas grade")
+        & (np.asarray(taille_mm, dtype=float) < 30)
+        & (np.asarray(nombre, dtype=object) == "Unique")
+    )
+    code = np.select([eleve, faible], [2, 0], default=1)
+    return _TVNIM[code]
+
+
+# ==============================
+# TVES (UTUC localisé)
+# ==============================
+
+def stratifier_tves_risque_vect(grade_biopsie: Any, cytologie_hg_positive: Any, taille_cm: Any, multifocal: Any,
+                                invasion_imagerie: Any, hydron: Any, kss_faisable: Any,
+                                accepte_suivi_strict: Any) -> np.ndarray:
+    """Version colonne de stratifier_tves_risque → tableau de "Bas risque"/"Haut risque"."""
+    bas = (
+        (np.asarray(grade_biopsie, dtype=object) == "Bas grade")
+        & ~_bool(cytologie_hg_positive)
+        & ~_bool(invasion_imagerie)
+        & ~_bool(hydron)
+        & (np.asarray(taille_cm, dtype=float) < 2.0)
+        & ~_bool(multifocal)
+        & _bool(kss_faisable)
+        & _bool(accepte_suivi_strict)
+    )
+    return _TVES[(~bas).astype(np.int8)]
+
+
+# ==============================
+# Rein métastatique — IMDC / MSKCC
+# ==============================
+
+def _groupe_pronostic(score: np.ndarray) -> np.ndarray:
+    code = np.select([score == 0, (score == 1) | (score == 2)], [0, 1], default=2)
+    return _PRONOSTIC[code]
+
+
+def calc_imdc_vect(karnofsky_lt80: Any, time_to_systemic_le_12mo: Any, hb_basse: Any, calcium_haut: Any,
+                   neutro_hauts: Any, plaquettes_hautes: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Version colonne de calc_imdc → (scores, groupes)."""
+    score = sum(np.asarray(x, dtype=np.int64) for x in (
+        karnofsky_lt80, time_to_systemic_le_12mo, hb_basse, calcium_haut, neutro_hauts, plaquettes_hautes))
+    return score, _groupe_pronostic(score)
+
+
+def calc_mskcc_vect(karnofsky_lt80: Any, time_to_systemic_le_12mo: Any, hb_basse: Any, calcium_haut: Any,
+                    ldh_haut: Any) -> Tuple[np.ndarray, np.ndarray]:
+    """Version colonne de calc_mskcc → (scores, groupes)."""
+    score = sum(np.asarray(x, dtype=np.int64) for x in (
+        karnofsky_lt80, time_to_systemic_le_12mo, hb_basse, calcium_haut, ldh_haut))
+    return score, _groupe_pronostic(score)
@@ -0,0 +1,204 @@
+# moteur/vessie.py — Tumeur de la vessie (TVNIM, TVIM, métastatique)
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from . import textes
+from .commun import lignes_paires
+from .regles import JeuRegles, Regle
+from .resultat import ResultatCAT
+
+# =========================
+# LOGIQUE CLINIQUE — TVNIM (simplifiée pour prototypage)
+# =========================
+
+def stratifier_tvnim(stade: str, grade: str, taille_mm: int, nombre: str,
+                     cis_associe: bool, lvi: bool, urethre_prostatique: bool, formes_agressives: bool) -> str:
+    """Retourne "faible", "intermédiaire" ou "élevé" (simplifié)."""
+    if stade == "pT1" or cis_associe or lvi or urethre_prostatique or formes_agressives:
+        return "élevé"
+    multiple = (nombre != "Unique")
+    if grade == "Bas grade" and (taille_mm < 30) and not multiple:
+        return "faible"
+    return "intermédiaire"
+
+
+def plan_tvnim(risque: str):
+    traitement, suivi, protocoles, notes = [], [], [], []
+    if risque == "faible":
+        traitement = [
+            "RTUV complète.",
+            " il est recommandé de réaliser une instillation postopératoire précoce (IPOP) . Aucun autre traitement complémentaire n’est nécessaire. Une surveillance simple selon le schéma proposé  est nécessaire pour une durée totale de 5 ans.",
+        ]
+        suivi = [
+            "3e et 12e mois Puis 1×/an pendant 5 ans .",
+            
+        ]
+    elif risque == "intermédiaire":
+        traitement = [
+            "RTUV complète.",
+            "instillations endovésicales par chimiothérapie (mitomycine, épirubicine, gemcitabine) selon un schéma de 6-8 instillations d’induction+ traitement d’entretien peut être discuté pour les patients les plus à risque de récidive. Une alternative thérapeutique est la BCG-thérapie avec un entretien de 1 an  pour diminuer le risque de récidive.",
+        ]
+        suivi = ["3e et 6e mois puis tous les 6 mois pendant 2 ans Puis 1×/an , + cytologie urinaire."]
+        protocoles = ["BCG : induction (6 instillations) + maintenance (~1 an)."]
+    else:  # élevé
+        traitement = [
+            "RTUV complète avec re‑résection (second look) .",
+            "BCG : induction 6 seances  + entretien prolongée (3 ans selon dispo/tolérance).",
+            "Discuter cystectomie précoce si T1 haut grade avec facteurs défavorables ( très haut risque).",
+        ]
+        suivi = [
+            "Cysto + cytologie rapprochées (ex3e et 6e mois puis tous les 3 mois pendant 2 ans puis tous les 6 mois jusqu’à 5 ans puis 1×/an a vie ).",
+            "Imagerie selon facteurs/symptômes.",
+        ]
+        protocoles = ["BCG : induction (6) + maintenance prolongée."]
+        notes = ["Second look recommandé si T1 haut grade (2–6 semaines)."]
+
+    notes_second_look = notes or [
+        "Second look : à envisager si résection incomplète ou doute sur le stade, ou muscle non vue a l'anapath;."
+    ]
+    return traitement, suivi, protocoles, notes_second_look
+
+
+def donnees_tvnim(stade: str, grade: str, taille_mm: int, nombre: str, cis_associe: bool = False, lvi: bool = False,
+                  urethre_prostatique: bool = False, formes_agressives: bool = False) -> List[Tuple[str, Any]]:
+    """Données saisies (facteurs aggravants listés seulement pour un pT1 haut grade)."""
+    donnees = [("Stade", stade), ("Grade", grade), ("Taille maximale", f"{taille_mm} mm"), ("Nombre", nombre)]
+    if stade == "pT1" and grade == "Haut grade":
+        for present, libelle in ((cis_associe, "CIS associé"), (lvi, "LVI"),
+                                 (urethre_prostatique, "Atteinte urètre prostatique"),
+                                 (formes_agressives, "Formes anatomo-path. agressives")):
+            if present:
+                donnees.append((libelle, "Oui"))
+    return donnees
+
+
+def sections_tvnim(donnees: Sequence[Tuple[str, Any]], risque: str, traitement: Sequence[str], suivi: Sequence[str],
+                   protocoles: Sequence[str], notes_second_look: Sequence[str]) -> Dict[str, List[str]]:
+    """Rubriques du rapport TVNIM (page et export en masse) ; arguments : donnees_tvnim, risque, plan_tvnim(risque)."""
+    return {
+        "Données": lignes_paires(donnees),
+        "Stratification": [f"Risque estimé : {risque.upper()}"],
+        "Traitement recommandé": [*traitement, *(["Schémas BCG :", *protocoles] if protocoles else [])],
+        "Modalités de suivi": suivi,
+        "Rappels second look": notes_second_look,
+    }
+
+
+# =========================
+# LOGIQUE CLINIQUE — TVIM (simplifiée pour prototypage)
+# =========================
+
+# =========================
+# RÈGLES — TVIM : chimio néoadjuvante / cystectomie, alternative TMT stricte, notes et surveillance
+# =========================
+_PREDICATS_TVIM = {
+    "t2": ("t_cat", "==", "T2"),
+    "t3": ("t_cat", "==", "T3"),
+    "t2_t3": ("un_de", ("t2", "t3")),
+    "neo_adjuvant": ("tous", ("cis_eligible", "!neo_adjuvant_fait")),
+    # ALTERNATIVE TMT : T2–T3, N0, M0, pas de CIS diffus ni d'hydronéphrose, bonne fonction vésicale
+    "tmt_ok": ("tous", ("t2_t3", "!cN_pos", "!metastases", "!cis_diffus", "!hydron", "bonne_fct_v")),
+}
+
+REGLES_TVIM = JeuRegles("vessie.tvim.traitement", _PREDICATS_TVIM, [
+    # Maladie métastatique : pas d'alternative TMT ni de chirurgie curative
+    Regle("metastatique", "Maladie métastatique → voir module dédié.", ("metastases",), numerotee=False),
+    # Standard : chimio néoadjuvante si éligible, puis cystectomie
+    Regle("neo_adjuvant", "Chimiothérapie néoadjuvante à base de cisplatine (MVAC dose-dense ou GemCis).",
+          ("!metastases", "neo_adjuvant"), numerotee=False),
+    Regle("cystectomie_differee", "→ Puis cystectomie radicale + curage ganglionnaire (10–12 semaines après la dernière cure).",
+          ("!metastases", "neo_adjuvant"), numerotee=False),
+    Regle("cystectomie", "Cystectomie radicale + curage ganglionnaire (< 3 mois après le diagnostic de TVIM).",
+          ("!metastases", "!neo_adjuvant"), numerotee=False),
+    Regle("tmt", "Alternative : TMT à base de RTUTV itératives + chimiothérapie et radiothérapie + surveillance, "
+                 "à condition que les RTUTV soient toujours complètes et que le patient soit informé et compliant.",
+          ("tmt_ok",), numerotee=False),
+])
+
+NOTES_TVIM = JeuRegles("vessie.tvim.notes", {}, [
+    # Notes adjuvant si haut risque post-op
+    Regle("adjuvant", "Risque post-op élevé (pT3–4/pN+) : discuter traitement adjuvant (ex. immunothérapie adjuvante).",
+          ("!metastases", "post_op_high_risk"), numerotee=False),
+])
+
+SURVEILLANCE_TVIM = JeuRegles("vessie.tvim.surveillance", {}, [
+    Regle("protocole", "Suivi clinique, imagerie et biologie selon protocole (tous les 3–6 mois les 2 premières années).",
+          ("!metastases",), numerotee=False),
+])
+
+
+def plan_tvim(
+    t_cat: str,
+    cN_pos: bool,
+    metastases: bool,
+    cis_eligible: bool,
+    hydron: bool,
+    bonne_fct_v: bool,
+    cis_diffus: bool,
+    post_op_high_risk: bool,
+    neo_adjuvant_fait: bool,
+    # critères pour l'alternative TMT
+    
+):
+    """
+    Alternative TMT affichée seulement si TOUS les critères sont satisfaits :
+      - T2–T3 (ou t2_localise = True)
+      - N0 (cN_pos = False)
+      - M0 (metastases = False)
+      - Pas de CIS diffus
+      - Pas d’hydronéphrose
+      - Bonne fonction vésicale
+    """
+    contexte = {
+        "t_cat": t_cat.upper(),
+        "cN_pos": cN_pos,
+        "metastases": metastases,
+        "cis_eligible": cis_eligible,
+        "hydron": hydron,
+        "bonne_fct_v": bonne_fct_v,
+        "cis_diffus": cis_diffus,
+        "post_op_high_risk": post_op_high_risk,
+        "neo_adjuvant_fait": neo_adjuvant_fait,
+    }
+    traitement = REGLES_TVIM.options(contexte)
+    surveillance = SURVEILLANCE_TVIM.options(contexte)
+    notes = NOTES_TVIM.options(contexte)
+    return ResultatCAT(traitement=traitement, surveillance=surveillance, notes=notes)
+
+
+# =========================
+# LOGIQUE CLINIQUE — Vessie métastatique (simplifiée pour prototypage)
+# =========================
+
+REGLES_META = JeuRegles("vessie.meta.traitement", {
+    "apres_platine": ("tous", ("prior_platinum", "!prior_cpi")),
+}, [
+    Regle("l1_adc_io", "1re ligne (naïf platine) : combinaison récente anticorps‑conjugué + immunothérapie (selon accès).",
+          ("platinum_naive",), numerotee=False),
+    Regle("l1_platine", "Alternative : Gemcitabine + Cisplatine (ou Carboplatine si non éligible Cisplatine), puis maintenance IO si RC/PR/SD.",
+          ("platinum_naive",), numerotee=False),
+    Regle("apres_platine", "Après platine : immunothérapie (PD‑1/PD‑L1) si non déjà reçue.",
+          ("!platinum_naive", "apres_platine"), numerotee=False),
+    Regle("apres_io", "Après immunothérapie : envisager anticorps‑conjugué (Nectin‑4/Trop‑2) selon disponibilité.",
+          ("!platinum_naive", "prior_cpi"), numerotee=False),
+])
+
+NOTES_META = JeuRegles("vessie.meta.notes", {}, [
+    Regle("os", "Métastases osseuses : envisager traitement osseux (acide zolédronique/denosumab) + Ca/Vit D, prévention SDS.",
+          ("bone_mets",), numerotee=False),
+])
+
+SUIVI_META = textes.enregistrer("vessie.meta.suivi", [
+    "Réévaluation toutes 6–8 semaines au début (clinique/imagerie/biologie).",
+])
+
+
+def plan_meta(cis_eligible: bool, carbo_eligible: bool, platinum_naive: bool, pdl1_pos: bool,
+              prior_platinum: bool, prior_cpi: bool, bone_mets: bool):
+    contexte = {"platinum_naive": platinum_naive, "prior_platinum": prior_platinum, "prior_cpi": prior_cpi,
+                "bone_mets": bone_mets}
+    traitement = REGLES_META.options(contexte)
+    notes = NOTES_META.options(contexte)
+    suivi = textes.liste(SUIVI_META)
+
+    return ResultatCAT(traitement=traitement, suivi=suivi, notes=notes)
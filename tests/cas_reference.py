@@ -0,0 +1,126 @@
+# tests/cas_reference.py — jeu de cas de référence (graine fixe) pour les tests d'équivalence
+# Les sorties de ces cas par le script monolithique d'origine (app2.py avant découpage en moteur/)
+# sont résumées par fonction dans reference_plans.json (empreintes SHA-256, cf. empreintes()).
+
+import hashlib
+import itertools
+import json
+import random
+from typing import Any, Callable, Dict, List, Tuple
+
+GRAINE = 1234
+Cas = Tuple[str, tuple, dict]
+
+
+def cas() -> List[Cas]:
+    R = random.Random(GRAINE)
+    B = [True, False]
+    out = []
+    for _ in range(3000):
+        args = (R.randint(40,90), R.choice([0,20,35,45,70,90,120]), R.randint(0,35), R.choice([1.0,3.5,4.0,6.0,12.0,25.0]),
+                *[R.choice(B) for _ in range(10)])
+        kw = dict(stockage_predominant=R.choice(B), rpm_ml=R.choice([None,100,200]), dysfonction_erectile=R.choice(B))
+        out.append(("plan_hbp", args, kw))
+        out.append(("plan_hbp", args[:2]+("x",)+args[2:6]+("y",)+args[6:], {}))
+    for psa in [1, 4.0, 9.99, 10, 15, 20, 20.5, 41, 50]:
+        for isup in [1,2,3,4,5]:
+            for ct in ["T1","T1a","T1c","t2a","T2b","T2c","T3","T3a","T3b","T4","", "T 2 B"]:
+                out.append(("plan_prostate_localise", (psa, isup, ct, 10), {}))
+                out.append(("prostate_risk_damico", (psa, isup, ct), {}))
+                out.append(("_is_vhr_stampede", (ct, isup, psa), {}))
+    for t in ["Prostatectomie","Radiothérapie"]:
+        for p in [0.1,0.2,0.5,2.5,5]:
+            for nad in [None,0.1,1.0]:
+                for c in [1,2,3]:
+                    out.append(("plan_prostate_recidive",(t,p,nad,c),{}))
+    for bs in itertools.product(B, repeat=6):
+        out.append(("plan_prostate_metastatique", bs, {}))
+        out.append(("calc_imdc", bs, {}))
+        out.append(("calc_mskcc", bs[:5], {}))
+    for ct in ["T1a","T1b","T2a","T2b","T3a","T3b","T3c","T4"]:
+        for th in ["Aucun","Veine rénale"]:
+            for bs in itertools.product(B, repeat=6):
+                out.append(("plan_rein_local",(ct,bs[0],th,bs[1],bs[2],bs[3],60,bs[4],bs[5]),{}))
+    for histo in ["ccRCC","non-ccRCC"]:
+        for sc, grp in [(0,"Bon pronostic (0)"),(1,"Intermédiaire (1–2)"),(3,"Mauvais (≥3)")]:
+            for lab in ["IMDC (Heng)","MSKCC (Motzer)"]:
+                for bs in itertools.product(B, repeat=5):
+                    out.append(("plan_rein_meta",(histo,sc,grp,lab)+bs,{}))
+    for bos in ["II","IIF","III","IV","Non applicable"]:
+        for bs in itertools.product(B, repeat=8):
+            out.append(("plan_rein_biopsy", bs[:7]+(bos,bs[7]), {}))
+    for st_ in ["pTa","pT1"]:
+        for g in ["Bas grade","Haut grade"]:
+            for t in [5,29,30,60]:
+                for n in ["Unique","Multiple","Papillomatose vésicale"]:
+                    for bs in itertools.product(B, repeat=4):
+                        out.append(("stratifier_tvnim",(st_,g,t,n)+bs,{}))
+    for r in ["faible","intermédiaire","élevé"]:
+        out.append(("plan_tvnim",(r,),{}))
+    for t in ["T2","T3","T4a","t2"]:
+        for bs in itertools.product(B, repeat=8):
+            out.append(("plan_tvim",(t,)+bs,{}))
+    for bs in itertools.product(B, repeat=7):
+        out.append(("plan_meta",bs,{}))
+    for g in ["Bas grade","Haut grade","Indéterminé"]:
+        for tc in [0.5,1.99,2.0,3.0]:
+            for loc in ["Bassinets/caliciel","Uretère distal"]:
+                for bs in itertools.product(B, repeat=6):
+                    a=(g,bs[0],tc,bs[1],bs[2],bs[3],bs[4],bs[5])
+                    out.append(("stratifier_tves_risque",a,{}))
+                    out.append(("plan_tves_localise",a+(loc,),{}))
+    for bs in itertools.product(B, repeat=8):
+        out.append(("plan_tves_metastatique",bs,{}))
+    for loc in ["Uretère distal","Uretère moyen","Uretère proximal","Rein (intracavicitaire)"]:
+        for tm in [None,0,3,9,10,15,19,20,30]:
+            for bs in itertools.product(B, repeat=7):
+                out.append(("plan_lithiase",bs[:6]+(loc,tm,bs[6]),{}))
+                if tm is not None:
+                    out.append(("choix_technique_selon_calcul",(loc,tm,bs[4],bs[5]),{}))
+    for _ in range(4000):
+        out.append(("plan_cystite",(R.randint(15,90),)+tuple(R.random()<0.2 for _ in range(17)),{}))
+        out.append(("plan_pna",tuple(R.random()<0.25 for _ in range(14)),{}))
+    for tt in ["Bactériurie asymptomatique","Cystite","PNA"]:
+        for bs in itertools.product(B, repeat=5):
+            out.append(("plan_grossesse",(tt,)+bs,{}))
+    for bs in itertools.product(B, repeat=10):
+        out.append(("plan_prostatite",bs,{}))
+    for bs in itertools.product(B, repeat=4):
+        out.append(("classer_cn_severite",bs,{}))
+    for i in [0,7,8,19,20,35]:
+        out.append(("classer_ipss",(i,),{}))
+    for psa in [2,4,8]:
+        for v in [0,None,30,60]:
+            for tr in [True,False,"Oui","Non"]:
+                out.append(("eval_suspicion_adk",(psa,v,tr),{}))
+    return out
+
+def normaliser(x):
+    """Résultat → structures simples (Mapping, ResultatCAT, listes) comparables à la référence."""
+    from collections.abc import Mapping
+    if hasattr(x, "to_dict") and not isinstance(x, dict):
+        x = x.to_dict()
+    if isinstance(x, Mapping):
+        return {k: normaliser(v) for k, v in x.items() if v is not None or k not in ()}
+    if isinstance(x, (list, tuple)):
+        return [normaliser(v) for v in x]
+    return x
+
+
+def resultat(fonction: Callable[..., Any], args: tuple, kwargs: dict) -> Any:
+    try:
+        return normaliser(fonction(*args, **kwargs))
+    except Exception as e:  # l'exception attendue fait partie de la référence
+        return ["EXC", type(e).__name__]
+
+
+def empreintes(resultats: List[Tuple[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """nom de fonction → {nombre de cas, SHA-256 des résultats sérialisés dans l'ordre des cas}."""
+    par_nom: Dict[str, List[Any]] = {}
+    for nom, r in resultats:
+        par_nom.setdefault(nom, []).append(r)
+    return {
+        nom: {"cas": len(rs), "sha256": hashlib.sha256(
+            json.dumps(rs, ensure_ascii=False, sort_keys=True, default=repr).encode("utf-8")).hexdigest()}
+        for nom, rs in sorted(par_nom.items())
+    }
@@ -0,0 +1,71 @@
+# tests/test_api.py — service ASGI (api.application) via le client en processus
+
+import pytest
+
+from api.application import ApplicationCAT
+from api.client import ClientLocal
+from moteur.prostate import plan_prostate_localise
+
+CORPS_LOCALISE = {"psa": 12.5, "isup": 2, "cT": "T2b", "esperance_vie_ans": 15}
+
+
+@pytest.fixture(scope="module")
+def client():
+    with ClientLocal(ApplicationCAT(["plan_prostate_localise", "plan_pna"])) as c:
+        yield c
+
+
+def _erreur(reponse, statut):
+    assert reponse.statut == statut
+    assert reponse.entetes["content-type"].startswith("application/json")
+    corps = reponse.json()
+    assert isinstance(corps["erreur"], str) and corps["erreur"]
+    return corps
+
+
+def test_200_resultat_du_moteur(client):
+    reponse = client.post("/v1/plan_prostate_localise", CORPS_LOCALISE)
+    assert reponse.statut == 200
+    assert int(reponse.entetes["content-length"]) == len(reponse.contenu)
+    assert reponse.json() == {"resultat": plan_prostate_localise(**CORPS_LOCALISE).vers_dict()}
+    assert client.get("/sante").json() == {"statut": "ok"}
+    assert [e["chemin"] for e in client.get("/v1").json()["endpoints"]] == ["/v1/plan_prostate_localise", "/v1/plan_pna"]
+
+
+def test_400_json_invalide(client):
+    _erreur(client.requete("POST", "/v1/plan_pna", b'{"fievre_ge_38_5": tru'), 400)
+
+
+@pytest.mark.parametrize("chemin", ["/v1/plan_inconnu", "/autre", "/v1/plan_hbp"])
+def test_404_chemin_ou_endpoint_inconnu(client, chemin):
+    _erreur(client.post(chemin, {}), 404)  # plan_hbp : non exposé par cette application
+
+
+def test_405_methode(client):
+    reponse = client.get("/v1/plan_pna")
+    _erreur(reponse, 405)
+    assert reponse.entetes["allow"] == "POST"
+
+
+def test_413_corps_trop_volumineux():
+    with ClientLocal(ApplicationCAT(["plan_pna"], taille_max_corps=64)) as c:
+        corps = _erreur(c.requete("POST", "/v1/plan_pna", b'{"x": "' + b"a" * 100 + b'"}'), 413)
+        assert "64" in corps["erreur"]
+
+
+def test_422_corps_hors_signature(client):
+    corps = _erreur(client.post("/v1/plan_prostate_localise", {**CORPS_LOCALISE, "isup": "deux", "inconnu": 1}), 422)
+    assert corps["details"]
+
+
+def test_500_exception_du_moteur(monkeypatch):
+    app = ApplicationCAT(["plan_pna"])
+
+    def panne(**_):
+        raise RuntimeError("panne du moteur")
+
+    monkeypatch.setattr(app.endpoints["plan_pna"], "fonction", panne)
+    valide = {champ["nom"]: False for champ in app.endpoints["plan_pna"].schema.decrire()}
+    with ClientLocal(app) as c:
+        corps = _erreur(c.post("/v1/plan_pna", valide), 500)
+    assert "panne" not in corps["erreur"]  # pas de détail interne exposé au client
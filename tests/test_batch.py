@@ -0,0 +1,87 @@
+# tests/test_batch.py — évaluation en lot (moteur.batch)
+
+import io
+
+import pandas as pd
+import pytest
+
+from moteur.batch import MODULES_LOT, enregistrements, evaluer_lot, evaluer_par_morceaux
+from moteur.export import sections_rapport
+from moteur.generateur import generer
+from moteur.hbp import plan_hbp
+from moteur.rcp import lire_cas
+
+
+def _cohorte(module, n=400):
+    return pd.DataFrame(list(generer(module, n, graine=7)))
+
+
+def _ligne_a_ligne(df, module):
+    spec = MODULES_LOT[module]
+    return [tuple(spec.evaluer(**e)) for e in enregistrements(df, module)]
+
+
+def _lignes(res):
+    return list(zip(res["categorie"], res["options"], res["notes"]))
+
+
+@pytest.mark.parametrize("module", sorted(MODULES_LOT))
+def test_parite_ligne_a_ligne(module):
+    df = _cohorte(module)
+    df.index = df.index * 3 + 1  # index quelconque : conservé tel quel
+    res = evaluer_lot(df, module)
+    assert list(res.index) == list(df.index)
+    assert _lignes(res) == _ligne_a_ligne(df, module)
+    distincts = len(set(map(tuple, df[list(MODULES_LOT[module].colonnes)].astype(str).values.tolist())))
+    assert res.attrs["profils_distincts"] <= distincts
+
+
+@pytest.mark.parametrize("module", ["hbp", "prostate_localise", "tvnim"])
+def test_par_morceaux_identique_au_lot_entier(module):
+    df = _cohorte(module, 1000)
+    morceaux = [df.iloc[i:i + 128] for i in range(0, len(df), 128)]
+    res = pd.concat(list(evaluer_par_morceaux(morceaux, module)))
+    assert _lignes(res) == _lignes(evaluer_lot(df, module))
+
+
+def test_profils_dupliques_evalues_une_fois():
+    df = pd.concat([_cohorte("prostate_localise", 50)] * 4, ignore_index=True)
+    res = evaluer_lot(df, "prostate_localise")
+    assert res.attrs["profils_distincts"] <= 50
+    assert _lignes(res) == _ligne_a_ligne(df, "prostate_localise")
+
+
+def test_entier_et_flottant_restent_distincts():
+    df = pd.DataFrame({"psa": pd.Series([10, 10.0], dtype=object), "isup": [2, 2], "cT": ["T2a", "T2a"],
+                       "esperance_vie_ans": [12, 12]})
+    res = evaluer_lot(df, "prostate_localise")
+    assert res.attrs["profils_distincts"] == 2
+    assert _lignes(res) == _ligne_a_ligne(df, "prostate_localise")
+
+
+def test_entiers_rendus_malgre_valeurs_facultatives_manquantes():
+    # rpm_ml vide sur une ligne : pandas lit la colonne en float64 (69 → 69.0)
+    csv = io.StringIO(
+        "age,volume_ml,ipss,psa_total,tr_suspect,anticoag,ci_chirurgie,refus_chir,infections_recid,retention,"
+        "calculs,hematurie_recid,ir_post_obstacle,echec_medical,rpm_ml\n"
+        "67,45,12,2.5,Non,Non,Non,Non,Non,Non,Non,Non,Non,Non,69\n"
+        "71,,20,1.8,Non,Non,Non,Non,Non,Non,Non,Non,Non,Non,\n"
+    )
+    df = pd.read_csv(csv)
+    assert df["rpm_ml"].dtype == "float64"
+    premier, second = enregistrements(df, "hbp")
+    assert type(premier["rpm_ml"]) is int and type(premier["volume_ml"]) is int and type(premier["age"]) is int
+    assert second["rpm_ml"] is None  # vide → défaut
+    donnees = dict(plan_hbp(**premier)["donnees"])
+    assert donnees["Résidu post-mictionnel (RPM)"] == "69 mL" and donnees["Volume prostatique"] == "45 mL"
+
+
+def test_entiers_valeur_par_valeur_dans_un_fichier_rcp():
+    csv = io.StringIO(
+        "module,fievre,hyperalgique,oligoanurie,doute_diag,grossesse,anticoag,localisation,taille_mm,douleur_actuelle\n"
+        "lithiase,Non,Non,Non,Non,Non,Non,Uretère distal,12,Oui\n"
+        "lithiase,Non,Non,Non,Non,Non,Non,Uretère distal,,Oui\n"
+    )
+    premier, second = lire_cas(pd.read_csv(csv))
+    assert type(premier.entree["taille_mm"]) is int and second.entree["taille_mm"] is None
+    assert any("12 mm" in ligne for ligne in sections_rapport("lithiase", premier.entree)[1]["Données"])
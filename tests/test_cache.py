@@ -0,0 +1,84 @@
+# tests/test_cache.py — mémoïsation LRU devant les plan_* (moteur.cache)
+
+from importlib import import_module
+import inspect
+
+import pytest
+
+import moteur.cache as cache
+from moteur.cache import CacheLRU, memoiser
+from moteur.commun import figer
+from cas_reference import cas, resultat
+
+MEMOISES = sorted(cache.PLANS_MEMOISES)
+
+
+@pytest.fixture(autouse=True)
+def cache_vide():
+    cache.CACHE_PLANS.vider()
+    yield
+    cache.CACHE_PLANS.vider()
+
+
+def _directe(nom):
+    return getattr(import_module(f"moteur.{cache.PLANS_MEMOISES[nom][0]}"), nom)
+
+
+@pytest.mark.parametrize("nom", MEMOISES)
+def test_parite_positionnels_et_mots_cles(nom):
+    directe, memo = _directe(nom), getattr(cache, nom)
+    sig = inspect.signature(directe)
+    for n, args, kwargs in cas():
+        if n != nom:
+            continue
+        attendu = resultat(directe, args, kwargs)
+        mots_cles = dict(sig.bind(*args, **kwargs).arguments)
+        premier, *_ = mots_cles
+        assert resultat(memo, args, kwargs) == attendu
+        assert resultat(memo, (), mots_cles) == attendu  # même clé : relu dans le cache
+        assert resultat(memo, args[:1], {k: v for k, v in mots_cles.items() if k != premier}) == attendu
+    assert cache.CACHE_PLANS.hits > 0
+
+
+def test_parite_plan_hbp_anciennes_et_nouvelles_signatures():
+    hbp = import_module("moteur.hbp")
+    for n, args, kwargs in cas():
+        if n == "plan_hbp":
+            assert resultat(cache.plan_hbp, args, kwargs) == resultat(hbp.plan_hbp, args, kwargs)
+
+
+def test_cle_typee_et_normalisee():
+    prostate = import_module("moteur.prostate")
+    assert cache.plan_prostate_localise(10, 2, "T2a", 12) == figer(prostate.plan_prostate_localise(10, 2, "T2a", 12))
+    assert cache.plan_prostate_localise(10.0, 2, "T2a", 12) == figer(prostate.plan_prostate_localise(10.0, 2, "T2a", 12))
+    assert cache.CACHE_PLANS.misses == 2  # 10 et 10.0 s'affichent différemment : deux entrées
+    cache.plan_prostate_localise(10.0, 2, "t2A", 12)
+    assert cache.CACHE_PLANS.hits == 1  # cT normalisé : même entrée
+
+
+@pytest.mark.parametrize("appel", [
+    lambda f: f(10, 2, "T2a"),                          # argument manquant
+    lambda f: f(10, 2, "T2a", 12, 5),                   # trop de positionnels
+    lambda f: f(10, 2, "T2a", 12, psa=10),              # valeur en double
+    lambda f: f(10, 2, "T2a", esperance_vie=12),        # mot-clé inconnu
+])
+def test_memes_erreurs_que_l_appel_direct(appel):
+    with pytest.raises(TypeError):
+        appel(import_module("moteur.prostate").plan_prostate_localise)
+    with pytest.raises(TypeError):
+        appel(cache.plan_prostate_localise)
+
+
+def test_lru_borne_et_non_hachable():
+    appels = []
+
+    def carre(x: int, liste=None):
+        appels.append(x)
+        return [x * x]
+
+    lru = CacheLRU(2)
+    f = memoiser(carre, cache=lru)
+    assert [f(1), f(2), f(1), f(3), f(2)] == [(1,), (4,), (1,), (9,), (4,)]
+    assert appels == [1, 2, 3, 2]  # 2 évincé par 3 (1 relu entre-temps)
+    assert lru.stats()["evictions"] == 2 and len(lru._donnees) == 2
+    assert f(5, liste=[1]) == (25,) and appels[-1] == 5  # argument non hachable : appel direct
@@ -0,0 +1,102 @@
+# tests/test_cohorte.py — cohorte prostate en colonnes (moteur.cohorte) contre le chemin par patient
+
+import random
+
+import numpy as np
+import pytest
+
+from moteur.cohorte import CohortePCa, recommend_from_cohort
+from moteur.prostate import MStage, _is_vhr_stampede, prostate_risk_damico, recommend_from_patient
+
+CT = ["T1a", "T1c", "t2A", "T2b", "T2c", "T3", "T3b", "T4", "Tx", None]  # Tx / None : cT inconnu (code -1)
+PSA = [0.5, 4.0, 9.99, 10.0, 10.01, 19.99, 20.0, 20.01, 40.0, 40.01, 150.0]
+N = ["N0", "N1", "Nx", None]
+M = ["M0", "M1a", "M1b", "M1c", "Mx", None]
+
+
+def _colonnes(n=600, graine=11):
+    rng = random.Random(graine)
+    return {
+        "age": [rng.randint(45, 90) for _ in range(n)],
+        "psa": [rng.choice(PSA) for _ in range(n)],
+        "clinical_t": [rng.choice(CT) for _ in range(n)],
+        "grade_group": [rng.randint(1, 5) for _ in range(n)],
+        "n_stage": [rng.choice(N) for _ in range(n)],
+        "m_stage": [rng.choice(M) for _ in range(n)],
+        "psa_density": [rng.choice([None, 0.1, 0.15, 0.16]) for _ in range(n)],
+    }
+
+
+@pytest.fixture(scope="module")
+def colonnes():
+    return _colonnes()
+
+
+@pytest.fixture(scope="module")
+def cohorte(colonnes):
+    return CohortePCa.depuis_colonnes(**colonnes)
+
+
+def test_settings_et_risques_comme_le_scalaire(colonnes, cohorte):
+    reco = recommend_from_cohort(cohorte)
+    settings, risques = reco.settings(), reco.risques()
+    for i in range(len(cohorte)):
+        m = colonnes["m_stage"][i]
+        metastatique = m is not None and MStage(m).value.startswith("M1")
+        assert settings[i] == ("metastatique" if metastatique else "localise")
+        densite = colonnes["psa_density"][i]
+        assert reco.psad_suspecte[i] == (densite is not None and densite > 0.15)  # même seuil que le triage ADK
+        if metastatique:
+            assert risques[i] is None and not reco.tres_haut_risque[i]
+            continue
+        cT, psa, isup = colonnes["clinical_t"][i] or "", colonnes["psa"][i], colonnes["grade_group"][i]
+        assert risques[i] == prostate_risk_damico(psa, isup, cT)
+        assert reco.tres_haut_risque[i] == _is_vhr_stampede(cT, isup, psa, colonnes["n_stage"][i])
+
+
+def test_parite_recommend_from_patient(cohorte):
+    reco = recommend_from_cohort(cohorte, contexte={"setting": "localise"})
+    connus = np.flatnonzero(cohorte.clinical_t >= 0)
+    assert 0 < len(connus) < len(cohorte)  # la cohorte contient des cT inconnus
+    for i in connus:
+        attendu = recommend_from_patient(cohorte.patient(int(i)), contexte={"setting": "localise"})
+        assert reco.risques()[i] == attendu["risque"]
+
+
+def test_ct_inconnu(cohorte):
+    inconnus = np.flatnonzero(cohorte.clinical_t == -1)
+    reco = recommend_from_cohort(cohorte, contexte={"setting": "localise"})
+    for i in inconnus:
+        assert reco.risques()[i] == prostate_risk_damico(float(cohorte.psa[i]), int(cohorte.grade_group[i]), "Tx")
+        with pytest.raises(ValueError):
+            cohorte.patient(int(i))
+
+
+@pytest.mark.parametrize("setting", ["localise", "recidive", "metastatique"])
+def test_setting_impose(cohorte, setting):
+    reco = recommend_from_cohort(cohorte, contexte={"setting": setting})
+    assert set(reco.settings()) == {setting}
+    if setting != "localise":
+        assert set(reco.risques()) == {None} and not reco.tres_haut_risque.any()
+    assert sum(reco.effectifs().values()) == len(cohorte)
+
+
+def test_setting_inconnu_refuse(cohorte):
+    with pytest.raises(ValueError):
+        recommend_from_cohort(cohorte, contexte={"setting": "adjuvant"})
+
+
+def test_aller_retour_patient(cohorte):
+    connus = [int(i) for i in np.flatnonzero(cohorte.clinical_t >= 0)]
+    relue = CohortePCa.depuis_patients(cohorte.patient(i) for i in connus)
+    for nom in CohortePCa.__dataclass_fields__:
+        np.testing.assert_array_equal(getattr(relue, nom), getattr(cohorte, nom)[connus])
+    a, b = recommend_from_cohort(relue), recommend_from_cohort(cohorte)
+    np.testing.assert_array_equal(a.risque, b.risque[connus])
+    np.testing.assert_array_equal(a.tres_haut_risque, b.tres_haut_risque[connus])
+    np.testing.assert_array_equal(a.psad_suspecte, b.psad_suspecte[connus])
+
+
+def test_stade_m_non_reconnu_refuse():
+    with pytest.raises(ValueError):
+        CohortePCa.depuis_colonnes(age=[70], psa=[5.0], clinical_t=["T2a"], grade_group=[1], m_stage=["M1"])
@@ -0,0 +1,57 @@
+# tests/test_contexte_patient.py — contexte patient partagé entre pages (moteur.contexte, vues.commun)
+
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from moteur.contexte import ContextePatient
+
+APP = str(Path(__file__).resolve().parent.parent / "app2.py")
+
+
+def _page(at: AppTest, page: str) -> AppTest:
+    at.session_state["page"] = page
+    return at.run()
+
+
+def test_valeur_bornee():
+    ctx = ContextePatient(psa=150.0, age=12)
+    assert ctx.valeur("psa", 3.5, 0.0, 100.0) == 100.0
+    assert ctx.valeur("age", 65, 18, 100) == 18
+    assert ctx.valeur("volume_ml", 40, 0, 300) == 40
+
+
+def test_derives_bornes_et_relus():
+    from moteur.prostate import prostate_risk_damico
+    ctx = ContextePatient(volume_ml=40, tr_suspect=False, isup=2, cT="T2a")
+    for i in range(500):
+        ctx.maj(psa=1.0 + i / 10)
+        assert ctx.risque_damico() == prostate_risk_damico(ctx.psa, 2, "T2a")
+        ctx.psad()
+        ctx.imdc(i % 2, False, False, False, False, False)
+    assert set(ctx._derives) == {"adk", "damico", "imdc"}  # une entrée par stratification
+    ctx.maj(cT="T2A")  # même cT normalisé : relu sans recalcul
+    assert ctx.risque_damico() is ctx._derives["damico"][1]
+    assert ctx._derives["damico"][0] == (ctx.psa, 2, "T2a")
+
+
+def test_suspicion_adk_suit_le_tr_oui_non():
+    from moteur.hbp import eval_suspicion_adk
+    ctx = ContextePatient(psa=2.0, volume_ml=40)
+    for tr in ["Oui", "Non", "Oui", "Non", True, "Non", False]:
+        ctx.maj(tr_suspect=tr)
+        assert ctx.suspicion_adk() == eval_suspicion_adk(2.0, 40, tr)
+        assert ctx.suspicion_adk()[0] is (tr in ("Oui", True))
+
+
+def test_psa_eleve_saisi_en_prostate_ne_bloque_pas_hbp():
+    at = _page(AppTest.from_file(APP, default_timeout=30), "Prostate: Localisée")
+    at.number_input[0].set_value(150.0)
+    at.button[-1].click().run()  # soumission du formulaire
+    assert not at.exception
+    assert at.session_state["patient"].psa == 150.0
+
+    at = _page(at, "Hypertrophie bénigne de la prostate (HBP)")
+    assert not at.exception
+    psa = next(w for w in at.number_input if w.label.startswith("PSA"))
+    assert psa.value == 100.0
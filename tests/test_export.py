@@ -0,0 +1,54 @@
+# tests/test_export.py — export en masse (moteur.export)
+
+import zipfile
+
+import pandas as pd
+
+import moteur.cache as cache
+from moteur.export import exporter_zip, sections_rapport, slug_identifiant
+from moteur.prostate import sections_prostate_localise
+from moteur.vessie import donnees_tvnim, plan_tvnim, sections_tvnim, stratifier_tvnim
+
+COHORTE = pd.DataFrame({
+    "id": ["P1", "P1", "../../etc/passwd", "a/b", "é l", ".."],
+    "psa": [5.0, 12.0, 25.0, 8.0, 3.0, 7.0],
+    "isup": [1, 2, 4, 1, 1, 3],
+    "cT": ["T1c", "T2b", "T3a", "T2a", "T1", "T2c"],
+    "esperance_vie_ans": [15, 12, 8, 20, 25, 10],
+})
+
+
+def _listes(sections):
+    return {k: list(v) for k, v in sections.items()}
+
+
+def test_sections_export_identiques_a_la_page():
+    # la page passe le plan mémoïsé (figé) au même constructeur que l'export
+    for e in COHORTE.drop(columns="id").to_dict("records"):
+        page = sections_prostate_localise(cache.plan_prostate_localise(**e))
+        assert _listes(page) == _listes(sections_rapport("prostate_localise", e)[1])
+    e = dict(stade="pT1", grade="Haut grade", taille_mm=35, nombre="Multiple", cis_associe=True, lvi=False,
+             urethre_prostatique=True, formes_agressives=False)
+    risque = stratifier_tvnim(*e.values())
+    page = sections_tvnim(donnees_tvnim(*e.values()), risque, *plan_tvnim(risque))
+    assert page == sections_rapport("tvnim", e)[1]
+    assert page["Données"][-2:] == ["CIS associé: Oui", "Atteinte urètre prostatique: Oui"]
+
+
+def test_slug_identifiant():
+    assert slug_identifiant("P 12/3") == "P_12_3"
+    assert slug_identifiant("../x") == "x"
+    assert slug_identifiant("") == "patient"
+    assert "/" not in slug_identifiant("a/../b") and ".." not in slug_identifiant("a/../b")
+
+
+def test_zip_noms_surs_et_uniques(tmp_path):
+    sortie = tmp_path / "export.zip"
+    n = exporter_zip([COHORTE], str(sortie), "prostate_localise", ("txt", "html"), processus=1, colonne_id="id")
+    assert n == len(COHORTE)
+    with zipfile.ZipFile(sortie) as zf:
+        noms = zf.namelist()
+    assert len(noms) == len(set(noms)) == 2 * len(COHORTE)
+    assert all("/" not in nom and ".." not in nom and not nom.startswith(".") for nom in noms)
+    assert {"P1_CAT_Prostate_Localisee.txt", "P1-2_CAT_Prostate_Localisee.txt",
+            "etc_passwd_CAT_Prostate_Localisee.txt", "e_l_CAT_Prostate_Localisee.txt"} <= set(noms)
@@ -0,0 +1,70 @@
+# tests/test_incremental.py — réévaluation incrémentale par sections (moteur.incremental)
+
+import pytest
+
+from moteur.generateur import generer
+from moteur.hbp import PLAN_HBP, _plan_hbp_core
+from moteur.incremental import PlanIncremental, Section
+
+
+def _affiche(x):
+    return f"{x} mL"
+
+
+def _longueur(affiche):
+    return len(affiche)
+
+
+def _positif(y):
+    return y > 0
+
+
+def _conclusion(positif, longueur):
+    return f"{'positif' if positif else 'négatif'} ({longueur})"
+
+
+PLAN = PlanIncremental([
+    Section.de("affiche", _affiche),
+    Section.de("longueur", _longueur),
+    Section.de("positif", _positif),
+    Section.de("conclusion", _conclusion),
+])
+
+
+def test_entrees_inchangees():
+    e = PLAN.evaluer({"x": 40, "y": 3})
+    assert e.recalculees == {"affiche", "longueur", "positif", "conclusion"}
+    relue = PLAN.evaluer({"x": 40, "y": 3}, e)
+    assert relue.recalculees == frozenset() and relue.valeurs == e.valeurs
+
+
+def test_une_entree_changee_et_coupure_anticipee():
+    e = PLAN.evaluer({"x": 40, "y": 3})
+    e2 = PLAN.evaluer({"x": 40, "y": 5}, e)
+    assert e2.recalculees == {"positif"}  # positif recalculé à l'identique : conclusion reprise
+    e3 = PLAN.evaluer({"x": 40, "y": -1}, e2)
+    assert e3.recalculees == {"positif", "conclusion"} and e3["conclusion"] == "négatif (5)"
+
+
+@pytest.mark.parametrize("avant, apres", [(40, 40.0), (1, True), (0.0, False)])
+def test_changement_de_type_seul(avant, apres):
+    e = PLAN.evaluer({"x": avant, "y": 3})
+    e2 = PLAN.evaluer({"x": apres, "y": 3}, e)
+    assert "affiche" in e2.recalculees
+    assert e2.valeurs == PLAN.evaluer({"x": apres, "y": 3}).valeurs  # comme une évaluation complète
+
+
+def test_plan_hbp_volume_entier_puis_flottant():
+    saisie = next(iter(generer("hbp", 1, graine=3)))
+    e = PLAN_HBP.evaluer({**saisie, "volume_ml": 40})
+    e2 = PLAN_HBP.evaluer({**saisie, "volume_ml": 40.0}, e)
+    assert "donnees" in e2.recalculees and "adk" in e2.recalculees
+    assert PLAN_HBP.resultat(e2) == _plan_hbp_core(**{**saisie, "volume_ml": 40.0})
+    assert ("Volume prostatique", "40.0 mL") in PLAN_HBP.resultat(e2)["donnees"]
+
+
+def test_declarations_invalides():
+    with pytest.raises(ValueError):
+        PlanIncremental([Section.de("affiche", _affiche), Section.de("affiche", _affiche)])
+    with pytest.raises(ValueError):
+        PlanIncremental([Section.de("longueur", _longueur), Section.de("affiche", _affiche)])
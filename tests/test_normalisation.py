@@ -0,0 +1,33 @@
+# tests/test_normalisation.py — canoniseurs précompilés (_to_bool, normalize_cT, ct_rank)
+
+import inspect
+import math
+
+import pytest
+
+from moteur.commun import _to_bool
+from moteur.prostate import _CT_ORDER, _normaliser_ct, ct_rank, normalize_cT
+
+
+def test_signatures_publiques_conservees():
+    assert list(inspect.signature(normalize_cT).parameters) == ["cT"]
+    assert list(inspect.signature(ct_rank).parameters) == ["cT"]
+    assert normalize_cT(cT="t2 b") == "T2b"
+    assert ct_rank(cT="T2a") == _CT_ORDER["T2a"]
+
+
+@pytest.mark.parametrize("brut", ["T1", "t1c", " T2B ", "t2 b", "T3", "T3b", "T4", "", None, "T9", "X"])
+def test_table_identique_au_calcul(brut):
+    for _ in range(2):  # premier appel : calcul ; second : lecture de table
+        assert normalize_cT(brut) == _normaliser_ct(brut)
+        assert ct_rank(brut) == _CT_ORDER.get(_normaliser_ct(brut), 999)
+
+
+@pytest.mark.parametrize("brut, attendu", [
+    ("Oui", True), (" yes ", True), ("VRAI", True), ("1", True), ("Non", False), ("", False), ("0", False),
+    (True, True), (False, False), (1, True), (0, False), (2.5, True), (0.0, False), (math.nan, True),
+    (None, False), ([], False), ([1], True),
+])
+def test_to_bool(brut, attendu):
+    assert _to_bool(brut) is attendu
+    assert _to_bool(x=brut) is attendu
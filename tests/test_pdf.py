@@ -0,0 +1,75 @@
+# tests/test_pdf.py — export PDF en Python pur (moteur.pdf) : structure du fichier et encodage WinAnsi
+
+import io
+import re
+import zlib
+
+from moteur.pdf import GABARIT, couper, ecrire_pdf, largeur_texte, rapport_pdf, winansi
+
+SECTIONS = {
+    "Données": [f"PSA ≥ {i} ng/mL → contrôle à 3 mois (ligne {i})" for i in range(60)],
+    "Traitement": ["Option 1 : α-bloquant ≤ 8 semaines " * 12, "Option 2 : surveillance (réévaluer) \\ RCP"],
+    "Vide": [],
+    "Notes": [f"Note {i} : « guillemets », œ, € ✅ 🩺" for i in range(60)],
+}
+
+
+def _objets(pdf):
+    # objets indirects : numéro → corps ; décalages lus dans la table xref
+    debut_xref = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", pdf).group(1))
+    assert pdf[debut_xref:].startswith(b"xref\n")
+    entete = re.match(rb"xref\n0 (\d+)\n0000000000 65535 f \n", pdf[debut_xref:])
+    n = int(entete.group(1))
+    entrees = pdf[debut_xref + entete.end():].split(b"\n")[:n - 1]
+    objets = {}
+    for numero, entree in enumerate(entrees, start=1):
+        assert re.fullmatch(rb"\d{10} 00000 n ", entree)
+        decalage = int(entree[:10])
+        assert pdf[decalage:].startswith(b"%d 0 obj\n" % numero)  # décalage exact
+        objets[numero] = pdf[decalage:pdf.index(b"\nendobj\n", decalage)]
+    assert re.search(rb"trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>" % (n, n - 1), pdf)
+    return objets
+
+
+def _flux(corps):
+    brut = corps[corps.index(b"stream\n") + 7:corps.rindex(b"\nendstream")]
+    longueur = int(re.search(rb"/Length (\d+)", corps).group(1))
+    assert len(brut) == longueur
+    return zlib.decompress(brut)
+
+
+def test_rapport_multipage_structure():
+    tampon = io.BytesIO()
+    taille = ecrire_pdf("Rapport — PSA ≥ 10 → IRM", SECTIONS, tampon)
+    pdf = tampon.getvalue()
+    assert taille == len(pdf) and pdf == rapport_pdf("Rapport — PSA ≥ 10 → IRM", SECTIONS)
+    assert pdf.startswith(b"%PDF-1.4\n")
+    objets = _objets(pdf)
+
+    pages = [n for n, corps in objets.items() if b"/Type /Page " in corps]
+    count = int(re.search(rb"/Count (\d+)", objets[2]).group(1))
+    kids = [int(k) for k in re.findall(rb"(\d+) 0 R", re.search(rb"/Kids \[([^\]]*)\]", objets[2]).group(1))]
+    assert count == len(pages) == len(kids) >= 3 and kids == pages
+
+    flux = [_flux(objets[int(re.search(rb"/Contents (\d+) 0 R", objets[p]).group(1))]) for p in pages]
+    for numero, contenu in enumerate(flux, start=1):
+        assert contenu.startswith(b"BT") and contenu.endswith(b"(%d/%d) Tj ET" % (numero, count))
+    texte = b"".join(flux)
+    assert b"(Vide)" not in texte  # rubrique vide omise
+    assert b"PSA >= 59 ng/mL -> contr\xf4le" in texte  # ≥ et → remplacés, ô en WinAnsi
+    assert b"surveillance \\(r\xe9\xe9valuer\\) \\\\ RCP" in texte  # parenthèses et antislash échappés
+    assert "Rapport — PSA ≥ 10 → IRM".encode("utf-16-be").hex().upper().encode() in objets[max(objets)]  # /Title
+
+
+def test_winansi_hors_cp1252_sans_erreur():
+    assert winansi("PSA ≥ 4 → IRM ; ≤ 0,15 ; α-bloquant") == b"PSA >= 4 -> IRM ; <= 0,15 ; alpha-bloquant"
+    assert winansi("€ œ « » é") == "€ œ « » é".encode("cp1252")
+    assert winansi("✅ ok 🩺") == b" ok "  # symboles sans équivalent supprimés
+    assert winansi("ą ǆ 中") == b"a dz ?"  # décomposition, sinon « ? »
+
+
+def test_cesure_dans_la_largeur_utile():
+    octets = winansi("mot " * 200 + "x" * 400)
+    lignes = couper(octets, "F1", GABARIT.corps_texte, GABARIT.largeur_utile)
+    assert b" ".join(lignes).replace(b" ", b"") == octets.replace(b" ", b"")
+    assert all(largeur_texte(l, "F1", GABARIT.corps_texte) <= GABARIT.largeur_utile for l in lignes)
@@ -0,0 +1,24 @@
+# tests/test_rcp.py — liste de travail RCP (moteur.rcp)
+
+from concurrent.futures import ThreadPoolExecutor
+
+from moteur.export import sections_rapport
+from moteur.rcp import CasRCP, ListeTravail
+
+CAS = [CasRCP(f"P{i}", "prostate_localise", dict(psa=4.0 + i, isup=1 + i % 5, cT="T2a", esperance_vie_ans=12))
+       for i in range(6)]
+
+
+def test_resultats_dans_l_ordre():
+    liste = ListeTravail(CAS)
+    assert [liste.resultat(i, timeout=10) for i in range(len(CAS))] == \
+        [sections_rapport(c.module, c.entree) for c in CAS]
+    assert liste.complet and liste.termines() == len(CAS)
+
+
+def test_executeur_fourni_reste_utilisable():
+    with ThreadPoolExecutor(2) as pool:
+        premiere = ListeTravail(CAS, pool)
+        seconde = ListeTravail(CAS, pool)  # lèverait RuntimeError si la première liste avait arrêté le pool
+        assert premiere.resultat(0, timeout=10) == seconde.resultat(0, timeout=10)
+        assert pool.submit(len, CAS).result(timeout=10) == len(CAS)
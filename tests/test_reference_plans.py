@@ -0,0 +1,28 @@
+# tests/test_reference_plans.py — équivalence des fonctions du moteur avec le script d'origine
+# Pour chaque fonction, les sorties du jeu de cas de référence doivent avoir la même empreinte
+# que celles du monolithe avant découpage (reference_plans.json).
+
+import json
+from pathlib import Path
+
+import pytest
+
+import moteur
+import moteur.prostate
+from cas_reference import cas, empreintes, resultat
+
+REFERENCE = json.loads((Path(__file__).parent / "reference_plans.json").read_text(encoding="utf-8"))
+
+
+def _fonction(nom: str):
+    return getattr(moteur, nom, None) or getattr(moteur.prostate, nom)
+
+
+@pytest.fixture(scope="module")
+def obtenues():
+    return empreintes([(nom, resultat(_fonction(nom), a, kw)) for nom, a, kw in cas()])
+
+
+@pytest.mark.parametrize("nom", sorted(REFERENCE))
+def test_equivalence_reference(nom, obtenues):
+    assert obtenues[nom] == REFERENCE[nom]
@@ -0,0 +1,95 @@
+# tests/test_regles.py — moteur de règles déclaratives (moteur.regles)
+
+import json
+
+import pytest
+
+from moteur import hbp, infectio, lithiase, prostate, rein, textes, tves, vessie
+from moteur.regles import JeuRegles, Regle, charger
+
+JEUX = [hbp.REGLES_HBP, infectio.REGLES_CYSTITE, infectio.NOTES_CYSTITE, infectio.REGLES_PNA,
+        infectio.REGLES_GROSSESSE, infectio.NOTES_GROSSESSE, infectio.REGLES_PROSTATITE, lithiase.REGLES_TECHNIQUE,
+        lithiase.REGLES_LITHIASE, lithiase.NOTES_LITHIASE, prostate.REGLES_PROSTATE_LOCALISE,
+        prostate.REGLES_PROSTATE_RECIDIVE, prostate.NOTES_PROSTATE_RECIDIVE, prostate.REGLES_PROSTATE_METASTATIQUE,
+        prostate.ADJOINTS_PROSTATE_METASTATIQUE, rein.REGLES_REIN_LOCAL, rein.NOTES_REIN_LOCAL, rein.SUIVI_REIN_LOCAL,
+        rein.REGLES_REIN_META, rein.NOTES_REIN_META, rein.REGLES_REIN_BIOPSIE, rein.NOTES_REIN_BIOPSIE,
+        tves.REGLES_TVES_LOCALISE, tves.NOTES_TVES_LOCALISE, tves.REGLES_TVES_META, tves.NOTES_TVES_META,
+        vessie.REGLES_TVIM, vessie.NOTES_TVIM, vessie.SURVEILLANCE_TVIM, vessie.REGLES_META, vessie.NOTES_META]
+
+
+def _jeu(predicats, quand=("p",)):
+    return JeuRegles("test.regles", predicats, [Regle("r1", "Option test", tuple(quand))])
+
+
+def test_operateurs():
+    jeu = JeuRegles("test.operateurs", {
+        "petit": ("taille", "<", 10),
+        "moyen": ("taille", "entre", (10, 20)),
+        "urgent": ("un_de", ("fievre", "!apyretique")),
+    }, [Regle("a", "A", ("petit",)), Regle("b", "B", ("moyen", "!urgent")), Regle("c", "C", ("urgent",))])
+    assert jeu.ids({"taille": 5, "fievre": False, "apyretique": True}) == ("test.operateurs.a",)
+    assert jeu.ids({"taille": 15, "fievre": False, "apyretique": True}) == ("test.operateurs.b",)
+    assert jeu.ids({"taille": None, "fievre": True, "apyretique": True}) == ("test.operateurs.c",)
+
+
+@pytest.mark.parametrize("jeu", JEUX, ids=lambda j: j.espace)
+def test_aller_retour_json(jeu, tmp_path):
+    chemin = tmp_path / "regles.json"
+    chemin.write_text(json.dumps(jeu.vers_dict(), ensure_ascii=False), encoding="utf-8")
+    relu = charger(str(chemin))
+    assert relu.source == jeu.source
+    assert relu.vers_dict() == jeu.vers_dict()
+
+
+@pytest.mark.parametrize("predicats, quand", [
+    ({"p": ("x", "vrai"), "q\nimport os\nos._exit(3)\n#": ("x", "vrai")}, ("p", "q\nimport os\nos._exit(3)\n#")),
+    ({"p": ("x", "vrai")}, ("p", "!a b")),
+    ({"p": (["x"], "vrai")}, ("p",)),
+    ({"p": ("x", "== 1 or __import__('os')")}, ("p",)),
+    ({"p": ("x", "==", 1, 2)}, ("p",)),
+    ({"p": ("un_de", "abc")}, ("p",)),
+    ({"p": ("x", "vrai")}, (["p"],)),
+])
+def test_definitions_invalides_refusees(predicats, quand):
+    with pytest.raises(ValueError):
+        _jeu(predicats, quand)
+
+
+def test_injection_depuis_fichier_refusee(tmp_path):
+    jeu = _jeu({"p": ("x", "vrai")}).vers_dict()
+    jeu["predicats"]["p\n    open('/tmp/regles_injection', 'w')\n#"] = ["x", "vrai"]
+    jeu["regles"][0]["quand"] = ["p\n    open('/tmp/regles_injection', 'w')\n#"]
+    chemin = tmp_path / "regles.json"
+    chemin.write_text(json.dumps(jeu), encoding="utf-8")
+    with pytest.raises(ValueError):
+        charger(str(chemin))
+
+
+def test_constantes_hors_source():
+    jeu = _jeu({"p": ("x", "==", "'); import os; ('")})
+    assert "import" not in jeu.source
+    assert jeu.ids({"x": "'); import os; ('"}) == ("test.regles.r1",)
+
+
+def test_gabarit_complete_au_rendu():
+    jeu = JeuRegles("test.gabarit", {}, [Regle("a", "Thrombectomie (niveau {thrombus}).", ("p",)),
+                                         Regle("b", "Sans champ.", ("p",))])
+    assert jeu.options({"p": True, "thrombus": "Veine rénale"}) == [
+        "Option 1 : Thrombectomie (niveau Veine rénale).", "Option 2 : Sans champ."]
+    assert jeu.options({"p": True, "thrombus": "{x}"}, debut=3)[0] == "Option 3 : Thrombectomie (niveau {x})."
+    assert jeu.ids({"p": True, "thrombus": "Aucun"}) == ("test.gabarit.a", "test.gabarit.b")  # non complétés
+
+
+@pytest.mark.parametrize("texte", ["{c.__class__}", "{c[0]}", "{c!r}", "{c:>10}", "{}", "{0}"])
+def test_gabarit_champ_invalide_refuse(texte):
+    with pytest.raises(ValueError):
+        JeuRegles("test.gabarit_invalide", {}, [Regle("a", texte)])
+    assert "test.gabarit_invalide.a" not in textes.CATALOGUE
+
+
+@pytest.mark.parametrize("localisation", ["Uretère distal", "Rein (intracavicitaire)"])
+def test_taille_inconnue_sans_option_de_taille(localisation):
+    with pytest.raises(ValueError):
+        lithiase.choix_technique_selon_calcul(localisation, None, False, False)
+    plan = lithiase.plan_lithiase(False, False, False, False, False, False, localisation, None, False)
+    assert not any("mm" in x or "PCNL" in x for x in plan["traitement"])
@@ -0,0 +1,182 @@
+# tests/test_resultat.py — modèle de résultat commun (moteur.resultat) : Mapping, hachage, pickle, JSON, MessagePack
+
+import json
+import pickle
+import struct
+
+import pytest
+
+from moteur.prostate import plan_prostate_localise, plan_prostate_metastatique
+from moteur.resultat import OptionCAT, ResultatCAT
+
+
+def _lire(tampon, i=0):
+    """Décodeur de référence du sous-ensemble MessagePack écrit par vers_msgpack → (valeur, position)."""
+    o = tampon[i]
+    i += 1
+    if o <= 0x7F:
+        return o, i
+    if o >= 0xE0:
+        return o - 0x100, i
+    if 0xA0 <= o <= 0xBF or o in (0xD9, 0xDA, 0xDB):
+        if o <= 0xBF:
+            n = o & 0x1F
+        else:
+            taille = {0xD9: 1, 0xDA: 2, 0xDB: 4}[o]
+            n, i = int.from_bytes(tampon[i:i + taille], "big"), i + taille
+        return tampon[i:i + n].decode("utf-8"), i + n
+    if 0x90 <= o <= 0x9F or o in (0xDC, 0xDD):
+        if o <= 0x9F:
+            n = o & 0x0F
+        else:
+            taille = 2 if o == 0xDC else 4
+            n, i = int.from_bytes(tampon[i:i + taille], "big"), i + taille
+        valeurs = []
+        for _ in range(n):
+            v, i = _lire(tampon, i)
+            valeurs.append(v)
+        return valeurs, i
+    if 0x80 <= o <= 0x8F or o == 0xDE:
+        if o <= 0x8F:
+            n = o & 0x0F
+        else:
+            n, i = int.from_bytes(tampon[i:i + 2], "big"), i + 2
+        d = {}
+        for _ in range(n):
+            k, i = _lire(tampon, i)
+            d[k], i = _lire(tampon, i)
+        return d, i
+    if o == 0xC0:
+        return None, i
+    if o in (0xC2, 0xC3):
+        return o == 0xC3, i
+    if o == 0xCB:
+        return struct.unpack(">d", tampon[i:i + 8])[0], i + 8
+    if o == 0xD3:
+        return struct.unpack(">q", tampon[i:i + 8])[0], i + 8
+    raise AssertionError(f"octet de type inattendu : {o:#x}")
+
+
+def _msgpack(objet):
+    valeur, fin = _lire(objet.vers_msgpack())
+    assert fin == len(objet.vers_msgpack())
+    return valeur
+
+
+PLANS = [
+    plan_prostate_localise(12.5, 2, "T2b", 15),
+    plan_prostate_localise(45.0, 4, "T3a", 10),  # donnees avec entier (ISUP)
+    plan_prostate_metastatique(True, False, True, False, True, True),
+    ResultatCAT(donnees=[("PSA", 3.25), ("Âge", -7), ("Volume", 1 << 40), ("Mesuré", None), ("TR", True)],
+                traitement=["Option 1 : « guillemets » \"échappés\"\n"], notes=[]),
+]
+
+
+# ---------- Mapping : mêmes accès que les anciens dictionnaires ----------
+
+def test_mapping_comme_l_ancien_dict():
+    ancien = {"donnees": [("Âge", "70 ans")], "traitement": ["Option 1 : A", "Option 2 : B"], "notes": []}
+    plan = ResultatCAT(**ancien)
+    assert list(plan) == list(ancien) and len(plan) == 3
+    assert plan["traitement"] == ("Option 1 : A", "Option 2 : B")
+    assert plan.get("suivi") is None and plan.get("suivi", []) == [] and "suivi" not in plan
+    assert "notes" in plan and plan["notes"] == ()
+    with pytest.raises(KeyError):
+        plan["suivi"]  # champ connu mais absent
+    with pytest.raises(KeyError):
+        plan["inconnu"]
+    assert plan.vers_dict() == {"donnees": [["Âge", "70 ans"]], "traitement": ["Option 1 : A", "Option 2 : B"],
+                                "notes": []}
+    assert dict(plan).keys() == ancien.keys()
+    assert plan == ResultatCAT(**{k: ancien[k] for k in reversed(list(ancien))})  # ordre des mots-clés indifférent
+    assert plan == dict(plan) and plan != ancien  # égalité Mapping : listes figées en tuples
+
+
+def test_options_structurees():
+    plan = PLANS[0]
+    option = plan["options"][0]
+    assert isinstance(option, OptionCAT) and set(option) == {"label", "details"}
+    assert [f"{o['label']} : {o['details']}" for o in plan["options"]]  # forme utilisée par les rapports
+    assert ResultatCAT(options=[dict(option)])["options"][0] == option  # dict → OptionCAT
+
+
+def test_champ_inconnu_et_immuabilite():
+    with pytest.raises(TypeError):
+        ResultatCAT(inconnu=[])
+    plan = ResultatCAT(notes=["a"])
+    with pytest.raises(AttributeError):
+        plan.notes = ("b",)
+    with pytest.raises(AttributeError):
+        del plan.notes
+    with pytest.raises(AttributeError):
+        plan.__dict__
+
+
+# ---------- hachage et pickle ----------
+
+@pytest.mark.parametrize("plan", PLANS)
+def test_hachage(plan):
+    copie = ResultatCAT.depuis_dict(plan.vers_dict())
+    assert copie == plan and hash(copie) == hash(plan)
+    assert len({plan, copie}) == 1
+    assert hash(ResultatCAT(notes=["a"])) != hash(OptionCAT(details=("a",)))  # type dans le hachage
+
+
+@pytest.mark.parametrize("protocole", range(pickle.HIGHEST_PROTOCOL + 1))
+@pytest.mark.parametrize("plan", PLANS)
+def test_pickle(plan, protocole):
+    relu = pickle.loads(pickle.dumps(plan, protocol=protocole))
+    assert type(relu) is ResultatCAT and relu == plan and hash(relu) == hash(plan)
+    assert all(type(a) is type(b) for a, b in zip(relu.get("options", ()), plan.get("options", ())))
+
+
+# ---------- JSON ----------
+
+@pytest.mark.parametrize("plan", PLANS)
+def test_json_aller_retour(plan):
+    texte = plan.vers_json()
+    assert json.loads(texte) == plan.vers_dict()
+    assert json.loads(texte) == json.loads(json.dumps(plan.vers_dict()))  # même document que json.dumps
+    assert ResultatCAT.depuis_json(texte) == plan
+
+
+# ---------- MessagePack ----------
+
+@pytest.mark.parametrize("plan", PLANS)
+def test_msgpack_meme_document_que_vers_dict(plan):
+    assert _msgpack(plan) == plan.vers_dict()
+    assert ResultatCAT.depuis_dict(_msgpack(plan)) == plan
+
+
+@pytest.mark.parametrize("n, entete", [
+    (0, b"\xa0"), (31, b"\xbf"), (32, b"\xd9\x20"), (255, b"\xd9\xff"),
+    (256, b"\xda\x01\x00"), (65535, b"\xda\xff\xff"), (65536, b"\xdb\x00\x01\x00\x00"),
+])
+def test_msgpack_longueur_des_chaines(n, entete):
+    plan = ResultatCAT(resume="é" * (n // 2) + "x" * (n % 2))  # é : 2 octets UTF-8
+    octets = plan.vers_msgpack()
+    assert octets[:len(b"\x81\xa6resume")] == b"\x81\xa6resume"
+    assert octets[len(b"\x81\xa6resume"):].startswith(entete)
+    assert ResultatCAT.depuis_dict(_msgpack(plan)) == plan
+
+
+@pytest.mark.parametrize("n, entete", [
+    (0, b"\x90"), (15, b"\x9f"), (16, b"\xdc\x00\x10"), (65535, b"\xdc\xff\xff"), (65536, b"\xdd\x00\x01\x00\x00"),
+])
+def test_msgpack_longueur_des_listes(n, entete):
+    plan = ResultatCAT(notes=[str(i % 7) for i in range(n)])
+    octets = plan.vers_msgpack()
+    assert octets[len(b"\x81\xa5notes"):].startswith(entete)
+    assert ResultatCAT.depuis_dict(_msgpack(plan)) == plan
+
+
+def test_msgpack_table_de_tous_les_champs():
+    # ResultatCAT a 14 champs au plus : la table courte (fixmap) suffit, on vérifie la borne
+    plan = ResultatCAT(**{c: [c] for c in ResultatCAT.CHAMPS})
+    assert plan.vers_msgpack()[0] == 0x80 | len(ResultatCAT.CHAMPS)
+    assert ResultatCAT.depuis_dict(_msgpack(plan)) == plan
+
+
+def test_msgpack_type_non_pris_en_charge():
+    with pytest.raises(TypeError):
+        ResultatCAT(resume={1, 2}).vers_msgpack()
@@ -0,0 +1,42 @@
+# tests/test_tables.py — tables de décision précalculées (moteur.tables)
+
+from importlib import import_module
+from itertools import product
+
+import pytest
+
+from moteur import tables
+from moteur.commun import figer
+
+
+def _directe(nom):
+    return getattr(import_module(f"moteur.{tables.DEFINITIONS[nom][0]}"), nom)
+
+
+@pytest.mark.parametrize("nom", sorted(tables.DEFINITIONS))
+def test_parite_exhaustive(nom):
+    table, directe = tables.table(nom), _directe(nom)
+    for combinaison in product(*table.domaines):
+        attendu = figer(directe(*combinaison))
+        assert table(*combinaison) == attendu
+        assert table(**dict(zip(table.params, combinaison))) == attendu
+        assert table(*combinaison[:2], **dict(zip(table.params[2:], combinaison[2:]))) == attendu
+
+
+def test_hors_domaine_appel_direct():
+    assert tables.plan_tvim("t2", *[False] * 8) == figer(_directe("plan_tvim")("t2", *[False] * 8))
+
+
+@pytest.mark.parametrize("appel", [
+    lambda t: t(*[True] * 6),                                   # argument manquant
+    lambda t: t(*[True] * 8),                                   # trop de positionnels
+    lambda t: t(*[True] * 7, cis_eligible=True),                # valeur en double
+    lambda t: t(*[True] * 7, bone_mets=True),                   # bone_mets déjà positionnel
+    lambda t: t(*[True] * 6, bone_mest=True),                   # faute de frappe
+    lambda t: t(*[True] * 7, inconnu=True),                     # mot-clé inconnu
+])
+def test_memes_erreurs_que_l_appel_direct(appel):
+    with pytest.raises(TypeError):
+        appel(_directe("plan_meta"))
+    with pytest.raises(TypeError):
+        appel(tables.plan_meta)
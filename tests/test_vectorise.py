@@ -0,0 +1,66 @@
+# tests/test_vectorise.py — stratifications vectorisées (moteur.vectorise) contre les versions scalaires
+
+from itertools import product
+import math
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from moteur import vectorise
+from moteur.prostate import prostate_risk_damico
+from moteur.rein import calc_imdc, calc_mskcc
+from moteur.tves import stratifier_tves_risque
+from moteur.vessie import stratifier_tvnim
+
+NAN = float("nan")
+
+
+def _colonnes(lignes):
+    return [list(c) for c in zip(*lignes)]
+
+
+def test_damico_bornes_ct_inconnu_et_psa_manquant():
+    psa = [0.0, 9.99, 10, 10.0, 10.01, 19.99, 20, 20.0, 20.01, 40.0, NAN]
+    cT = ["T1a", "T1c", "T1", "T2a", "t2b", "T2c", "T3", "T3b", "T4", "Tx", "", "inconnu"]
+    lignes = list(product(psa, range(1, 6), cT))
+    attendu = [prostate_risk_damico(*ligne) for ligne in lignes]
+    p, i, t = _colonnes(lignes)
+    assert vectorise.prostate_risk_damico_vect(p, i, t).tolist() == attendu
+    assert vectorise.prostate_risk_damico_vect(pd.Series(p), np.array(i), pd.Series(t)).tolist() == attendu
+    # PSA manquant : comparaisons fausses des deux côtés (jamais « faible »)
+    assert all(r != "faible" for (ps, _, _), r in zip(lignes, attendu) if math.isnan(ps))
+
+
+def test_ct_rank_vect():
+    cT = ["T2a", "t2A", "T3", "Tx", None, "T1"]
+    assert vectorise.ct_rank_vect(cT).tolist() == [20, 20, 30, 999, 999, 12]
+
+
+def test_tvnim_bornes_de_taille():
+    tailles = [0, 10, 20, 29, 29.9, 30, 31]
+    lignes = [
+        (stade, grade, taille, nombre, *drapeaux)
+        for stade, grade, taille, nombre, drapeaux in product(
+            ["pTa", "pT1"], ["Bas grade", "Haut grade"], tailles, ["Unique", "2–7", "≥8"],
+            product([False, True], [0, 1], [False, True], [0, 1]))
+    ]
+    attendu = [stratifier_tvnim(*ligne) for ligne in lignes]
+    assert vectorise.stratifier_tvnim_vect(*_colonnes(lignes)).tolist() == attendu
+
+
+def test_tves_bornes_de_taille():
+    lignes = list(product(["Bas grade", "Haut grade", "Indéterminé"], [False, True], [0.5, 1.99, 2.0, 2.01, 10],
+                          [False, True], [False, True], [0, 1], [True, False], [1, 0]))
+    attendu = [stratifier_tves_risque(*ligne) for ligne in lignes]
+    assert vectorise.stratifier_tves_risque_vect(*_colonnes(lignes)).tolist() == attendu
+
+
+@pytest.mark.parametrize("scalaire, vect, n", [
+    (calc_imdc, vectorise.calc_imdc_vect, 6),
+    (calc_mskcc, vectorise.calc_mskcc_vect, 5),
+])
+def test_scores_pronostiques(scalaire, vect, n):
+    lignes = list(product([False, True], repeat=n))
+    scores, groupes = vect(*_colonnes(lignes))
+    assert list(zip(scores.tolist(), groupes.tolist())) == [scalaire(*ligne) for ligne in lignes]
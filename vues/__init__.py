@@ -0,0 +1,68 @@
+# vues — pages Streamlit, une par spécialité
+# Registre clé de page → (module, fonction) : le module n'est importé qu'à la première visite
+# (importlib garde ensuite l'objet module dans sys.modules, donc pas de ré-import aux reruns).
+# NB : le paquet ne s'appelle pas "pages" pour ne pas déclencher le mode multipage de Streamlit.
+
+import importlib
+from typing import Callable, Dict, Tuple
+
+from .diagnostics import chrono, instrumenter_module
+
+PAGES: Dict[str, Tuple[str, str]] = {
+    "Accueil": ("vues.accueil", "render_home"),
+    # Vessie
+    "Tumeur de la vessie": ("vues.vessie", "render_vessie_menu"),
+    "Vessie: TVNIM": ("vues.vessie", "render_tvnim_page"),
+    "Vessie: TVIM": ("vues.vessie", "render_tvim_page"),
+    "Vessie: Métastatique": ("vues.vessie", "render_vessie_meta_page"),
+    # Rein
+    "Tumeur du rein": ("vues.rein", "render_kidney_menu"),
+    "Rein: Non métastatique": ("vues.rein", "render_kidney_local_page"),
+    "Rein: Métastatique": ("vues.rein", "render_kidney_meta_page"),
+    "Rein: Biopsie": ("vues.rein", "render_kidney_biopsy_page"),
+    # TVES
+    "Tumeurs des voies excrétrices": ("vues.tves", "render_tves_menu"),
+    "TVES: Localisé": ("vues.tves", "render_tves_local_page"),
+    "TVES: Métastatique": ("vues.tves", "render_tves_meta_page"),
+    # Infectiologie
+    "Infectiologie": ("vues.infectio", "render_infectio_menu"),
+    "IU: Grossesse": ("vues.infectio", "render_infectio_grossesse_page"),
+    "IU: Cystite": ("vues.infectio", "render_infectio_cystite_page"),
+    "IU: PNA": ("vues.infectio", "render_infectio_pna_page"),
+    "IU: Prostatite": ("vues.infectio", "render_infectio_homme_page"),
+    # HBP / Lithiase
+    "Hypertrophie bénigne de la prostate (HBP)": ("vues.hbp", "render_hbp_page"),
+    "Lithiase": ("vues.lithiase", "render_lithiase_page"),
+    # Prostate
+    "Tumeur de la prostate": ("vues.prostate", "render_prostate_menu"),
+    "Prostate: Localisée": ("vues.prostate", "render_prostate_localise_page"),
+    "Prostate: Récidive": ("vues.prostate", "render_prostate_recidive_page"),
+    "Prostate: Métastatique": ("vues.prostate", "render_prostate_meta_page"),
+    # RCP : liste de travail multi-dossiers
+    "RCP: Liste de travail": ("vues.rcp", "render_rcp_page"),
+    # Page cachée (hors menus) : mesures de l'instrumentation VUES_DIAGNOSTICS
+    "Diagnostics": ("vues.diagnostics", "render_diagnostics_page"),
+}
+
+_RENDUS: Dict[str, Callable[[], None]] = {}
+
+
+def resoudre_page(page: str) -> Callable[[], None]:
+    """Renvoie la fonction de rendu de `page` (import du module à la première visite)."""
+    rendu = _RENDUS.get(page)
+    if rendu is None:
+        module, fonction = PAGES[page]
+        module = importlib.import_module(module)
+        instrumenter_module(module)  # no-op hors VUES_DIAGNOSTICS
+        rendu = _RENDUS[page] = getattr(module, fonction)
+    return rendu
+
+
+def afficher_page(page: str) -> None:
+    """Rend la page demandée ; clé inconnue → page générique « en construction »."""
+    if page in PAGES:
+        with chrono("page", page):
+            resoudre_page(page)()
+    else:
+        from .accueil import render_generic
+        render_generic(page)
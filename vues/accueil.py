@@ -0,0 +1,22 @@
+# vues/accueil.py — pages Streamlit : accueil et page générique
+
+import streamlit as st
+
+from .commun import APP_SUBTITLE, MODULES, PALETTE, category_button, go_module, top_header, btn_home_and_back
+
+def render_home():
+    top_header()
+    st.markdown("### Sélectionnez une rubrique")
+    st.caption(APP_SUBTITLE)
+    col1, col2 = st.columns(2)
+    for i, mod in enumerate(MODULES):
+        with (col1 if i % 2 == 0 else col2):
+            category_button(mod, PALETTE[mod], key=f"btn_{i}")
+    st.markdown("### Séance RCP")
+    if st.button("📋 Liste de travail (plusieurs dossiers)", key="btn_rcp", use_container_width=True):
+        go_module("RCP: Liste de travail")
+
+def render_generic(page_label: str):
+    btn_home_and_back()
+    st.header(page_label)
+    st.info("Module en cours de construction.")
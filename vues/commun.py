@@ -0,0 +1,126 @@
+# vues/commun.py — helpers UI partagés par toutes les pages (navigation, tableaux, exports)
+# moteur.rapport / moteur.pdf ne sont importés qu'au premier tableau ou export : l'accueil
+# (premier écran après un réveil à froid) ne les charge pas.
+
+import streamlit as st
+
+from .diagnostics import chrono
+
+APP_TITLE = "Urology Assistant AI"
+APP_SUBTITLE = "Assistant intelligent pour la décision clinique — *démo, ne remplace pas les RBP officielles*"
+
+MODULES = [
+    "Tumeur de la vessie",
+    "Tumeurs des voies excrétrices",
+    "Tumeur de la prostate",
+    "Tumeur du rein",
+    "Hypertrophie bénigne de la prostate (HBP)",
+    "Lithiase",
+    "Infectiologie",
+]
+PALETTE = {m: "#DFF3E6" for m in MODULES}
+
+# =========================
+# HELPERS UI
+# =========================
+
+def go_home():
+    st.session_state["page"] = "Accueil"
+    st.rerun()
+
+
+def go_module(label: str):
+    st.session_state["page"] = label
+    st.rerun()
+
+
+def category_button(label: str, color: str, key: str):
+    with st.container():
+        clicked = st.button(f"{label}  ›", key=key, use_container_width=True)
+        st.markdown(f"<div class='cat-bar' style='background:{color}'></div>", unsafe_allow_html=True)
+        if clicked:
+            go_module(label)
+
+
+def top_header():
+    st.markdown(
+        f"<div class='header-green'><h1 style='margin:0;font-weight:800;font-size:28px'>{APP_TITLE}</h1></div>",
+        unsafe_allow_html=True,
+    )
+
+
+def btn_home_and_back(show_back: bool = False, back_label: str = "Tumeur de la vessie"):
+    cols = st.columns([1, 3])
+    with cols[0]:
+        st.button("🏠 Accueil", on_click=go_home)
+    if show_back:
+        with cols[1]:
+            st.button(f"⬅️ Retour : {back_label}", on_click=lambda: go_module(back_label))
+
+
+# ===== Tableaux (HTML 2 colonnes) — pour Données & Stratification =====
+
+def render_kv_table(title, pairs, col1="Élément", col2="Détail", html=None):
+    # `html` : tableau déjà rendu (rendu_section), sinon construit ici
+    if not pairs:
+        return
+    from moteur.rapport import esc, kv_table_html
+    st.markdown(f"### {esc(title)}")
+    st.markdown(html or kv_table_html(pairs, col1, col2), unsafe_allow_html=True)
+
+
+def rendu_section(cle, evaluation, section, rendre):
+    """Rendu d'une section de plan incrémental (moteur.incremental), refait seulement si la section a été recalculée."""
+    rendus = st.session_state.setdefault("_rendus_sections", {})
+    if section in evaluation.recalculees or (cle, section) not in rendus:
+        rendus[(cle, section)] = rendre()
+    return rendus[(cle, section)]
+
+
+# ===== Contexte patient (partagé entre modules, cf. moteur.contexte) =====
+
+def patient():
+    """ContextePatient de la session (créé au premier appel)."""
+    ctx = st.session_state.get("patient")
+    if ctx is None:
+        from moteur.contexte import ContextePatient
+        ctx = st.session_state["patient"] = ContextePatient()
+    return ctx
+
+
+def bandeau_patient(zone=None):
+    """Bandeau « patient en cours » ; rappeler avec la zone renvoyée pour le rafraîchir après une saisie."""
+    ctx = patient()
+    if zone is None:
+        cols = st.columns([5, 1])
+        zone = cols[0].empty()
+        if ctx.renseigne:
+            cols[1].button("🗑️ Nouveau patient", on_click=ctx.vider, key="nouveau_patient")
+    if ctx.renseigne:
+        zone.info("👤 Patient en cours — " + " · ".join(f"{k} : {v}" for k, v in ctx.resume()))
+    return zone
+
+
+# ===== Export helpers (download_button) =====
+
+def offer_exports(title: str, sections: dict, basename: str):
+    # .txt et .html écrits en une passe sur `sections` (moteur.rapport.ecrire_rapport) ; .pdf par moteur.pdf
+    from moteur.rapport import exports
+    from moteur.pdf import rapport_pdf
+    with chrono("export:txt+html"):
+        txt, html = exports(title, sections, basename)
+    with chrono("export:pdf"):
+        pdf = rapport_pdf(title, sections)
+    st.download_button("📝 Télécharger le rapport .txt", data=txt, file_name=f"{basename}.txt")
+    st.download_button(
+        "📄 Télécharger le rapport .html",
+        data=html,
+        file_name=f"{basename}.html",
+        mime="text/html",
+    )
+    st.download_button(
+        "🧾 Télécharger le rapport .pdf",
+        data=pdf,
+        file_name=f"{basename}.pdf",
+        mime="application/pdf",
+    )
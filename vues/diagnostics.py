@@ -0,0 +1,191 @@
+# vues/diagnostics.py — instrumentation optionnelle des reruns (VUES_DIAGNOSTICS=1)
+# Chronomètres haute résolution autour des pages, des appels au moteur (plan_*, calc_*, stratifier_*),
+# de render_kv_table et des exports ; agrégés par page dans st.session_state, consultables sur la page
+# cachée « Diagnostics » (?diagnostics dans l'URL) et en texte Prometheus. Désactivée : aucune enveloppe
+# n'est posée et chrono() renvoie un contexte vide.
+
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from time import perf_counter_ns
+from types import ModuleType
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+import os
+import threading
+
+import streamlit as st
+
+ACTIF = os.getenv("VUES_DIAGNOSTICS", "") not in ("", "0")
+PAGE = "Diagnostics"
+CLE_ETAT = "_diagnostics"
+TAILLE_ECHANTILLON = 512  # dernières durées conservées par mesure (centiles glissants)
+CENTILES = (50, 90, 99)
+
+# noms globaux d'un module de page → catégorie de la mesure
+_PREFIXES = {"plan_": "moteur", "calc_": "moteur", "stratifier_": "moteur"}
+_NOMS = {"render_kv_table": "rendu", "offer_exports": "export"}
+
+
+class Serie:
+    """Compteur, cumul, maximum et échantillon glissant des durées (ns) d'une mesure."""
+    __slots__ = ("n", "total_ns", "max_ns", "echantillon")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.echantillon: Deque[int] = deque(maxlen=TAILLE_ECHANTILLON)
+
+    def ajouter(self, duree_ns: int) -> None:
+        self.n += 1
+        self.total_ns += duree_ns
+        if duree_ns > self.max_ns:
+            self.max_ns = duree_ns
+        self.echantillon.append(duree_ns)
+
+    def centiles(self) -> Dict[int, float]:
+        from statistics import quantiles  # ~1 ms d'import : seulement à l'affichage
+        valeurs = list(self.echantillon)
+        if len(valeurs) < 2:
+            return {c: float(valeurs[0]) if valeurs else 0.0 for c in CENTILES}
+        q = quantiles(valeurs, n=100, method="inclusive")
+        return {c: q[c - 1] for c in CENTILES}
+
+
+# =========================
+# Enregistrement (par page courante, dans la session)
+# =========================
+
+def _series() -> Dict[str, Dict[str, Serie]]:
+    return st.session_state.setdefault(CLE_ETAT, {})
+
+
+def enregistrer(mesure: str, duree_ns: int, page: Optional[str] = None) -> None:
+    page = page or st.session_state.get("page", "Accueil")
+    _series().setdefault(page, {}).setdefault(mesure, Serie()).ajouter(duree_ns)
+
+
+_local = threading.local()  # une session Streamlit = un thread de script : pile de mesures par thread
+
+
+@contextmanager
+def _chrono(mesure: str, page: Optional[str] = None) -> Iterator[None]:
+    # pile : durée cumulée des mesures imbriquées, par niveau ouvert
+    pile = _local.__dict__.setdefault("pile", [])
+    pile.append([0])
+    t0 = perf_counter_ns()
+    try:
+        yield
+    finally:
+        duree = perf_counter_ns() - t0
+        enfants = pile.pop()[0]
+        if pile:
+            pile[-1][0] += duree
+        enregistrer(mesure, duree, page)
+        if mesure == "page":
+            # temps propre de la page : construction du formulaire et widgets hors mesures imbriquées
+            enregistrer("page:formulaire", duree - enfants, page)
+
+
+def chrono(mesure: str, page: Optional[str] = None):
+    """Contexte chronométré sous `mesure` (no-op si l'instrumentation est désactivée)."""
+    return _chrono(mesure, page) if ACTIF else nullcontext()
+
+
+def instrumenter(fonction: Callable[..., Any], mesure: str) -> Callable[..., Any]:
+    @wraps(fonction)
+    def enveloppe(*args: Any, **kwargs: Any) -> Any:
+        with _chrono(mesure):
+            return fonction(*args, **kwargs)
+    enveloppe.instrumentee = True
+    return enveloppe
+
+
+def instrumenter_module(module: ModuleType) -> None:
+    """Enveloppe une fois les appels moteur, render_kv_table et offer_exports importés par une page."""
+    if not ACTIF or getattr(module, "_diagnostics", False):
+        return
+    for nom, valeur in list(vars(module).items()):
+        if not callable(valeur) or getattr(valeur, "instrumentee", False):
+            continue
+        categorie = _NOMS.get(nom) or next((c for p, c in _PREFIXES.items() if nom.startswith(p)), None)
+        if categorie and (categorie != "moteur" or getattr(valeur, "__module__", "").startswith("moteur")):
+            setattr(module, nom, instrumenter(valeur, f"{categorie}:{nom}"))
+    module._diagnostics = True
+
+
+def reinitialiser() -> None:
+    st.session_state[CLE_ETAT] = {}
+
+
+# =========================
+# Sorties : tableau et texte Prometheus
+# =========================
+
+def lignes(series: Dict[str, Dict[str, Serie]]) -> List[Dict[str, Any]]:
+    """Une ligne par (page, mesure) : n, centiles et maximum en millisecondes."""
+    sortie = []
+    for page, mesures in series.items():
+        for mesure, s in sorted(mesures.items()):
+            sortie.append({
+                "page": page, "mesure": mesure, "n": s.n,
+                **{f"p{c} (ms)": round(v / 1e6, 3) for c, v in s.centiles().items()},
+                "max (ms)": round(s.max_ns / 1e6, 3),
+            })
+    return sortie
+
+
+def _etiquette(v: str) -> str:
+    return v.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def texte_prometheus(series: Dict[str, Dict[str, Serie]], cache: Optional[Dict[str, Any]] = None) -> str:
+    """Format d'exposition texte Prometheus : résumé des durées par (page, mesure) + compteurs du cache moteur."""
+    out = [
+        "# HELP urologie_duree_secondes Durée des étapes d'un rerun (échantillon glissant pour les quantiles).",
+        "# TYPE urologie_duree_secondes summary",
+    ]
+    for page, mesures in series.items():
+        for mesure, s in sorted(mesures.items()):
+            lab = f'page="{_etiquette(page)}",mesure="{_etiquette(mesure)}"'
+            for c, v in s.centiles().items():
+                out.append(f'urologie_duree_secondes{{{lab},quantile="{c / 100:g}"}} {v / 1e9:.9f}')
+            out.append(f"urologie_duree_secondes_sum{{{lab}}} {s.total_ns / 1e9:.9f}")
+            out.append(f"urologie_duree_secondes_count{{{lab}}} {s.n}")
+    if cache:
+        for cle in ("hits", "misses", "evictions"):
+            out += [f"# TYPE urologie_cache_{cle}_total counter", f"urologie_cache_{cle}_total {cache[cle]}"]
+        for cle in ("taille", "taille_max"):
+            out += [f"# TYPE urologie_cache_{cle} gauge", f"urologie_cache_{cle} {cache[cle]}"]
+    return "\n".join(out) + "\n"
+
+
+# =========================
+# Page cachée (hors menus)
+# =========================
+
+def render_diagnostics_page():
+    from moteur.cache import stats
+    from .commun import btn_home_and_back
+
+    btn_home_and_back()
+    st.header("🩺 Diagnostics — temps par rerun")
+    if not ACTIF:
+        st.info("Instrumentation désactivée : lancer l'application avec VUES_DIAGNOSTICS=1.")
+        return
+
+    series = _series()
+    cache = stats()
+    st.caption(f"Cache moteur : {cache['hits']} hits / {cache['misses']} misses "
+               f"(taux {cache['taux_hit']:.0%}), {cache['taille']}/{cache['taille_max']} entrées.")
+    tableau = lignes({p: m for p, m in series.items() if p != PAGE})
+    if tableau:
+        st.dataframe(tableau, use_container_width=True, hide_index=True)
+    else:
+        st.info("Aucune mesure pour l'instant : parcourir les pages puis revenir ici.")
+
+    texte = texte_prometheus(series, cache)
+    st.download_button("📈 Télécharger (format Prometheus)", data=texte, file_name="diagnostics.prom", mime="text/plain")
+    with st.expander("Texte Prometheus"):
+        st.code(texte, language="text")
+    st.button("♻️ Réinitialiser les mesures", on_click=reinitialiser)
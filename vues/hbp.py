@@ -0,0 +1,68 @@
+# vues/hbp.py — pages Streamlit : HBP
+
+import streamlit as st
+
+from moteur.hbp import PLAN_HBP, sections_hbp
+from moteur.rapport import kv_table_html
+from .commun import btn_home_and_back, render_kv_table, offer_exports, patient, bandeau_patient, rendu_section
+from .diagnostics import chrono
+
+# =========================
+# 3) PAGE STREAMLIT — UI (aucun argument)
+# =========================
+def render_hbp_page():
+    btn_home_and_back(show_back=True, back_label="Urologie")
+    st.header("🔷 Hypertrophie bénigne de la prostate (HBP)")
+    ctx = patient()
+    bandeau = bandeau_patient()
+
+    with st.form("hbp_form"):
+        age = st.number_input("Âge (ans)", min_value=18, max_value=100, value=ctx.valeur("age", 65, 18, 100))
+        volume_ml = st.number_input("Volume prostatique (mL)", min_value=0, max_value=300, value=ctx.valeur("volume_ml", 40, 0, 300), step=1)
+        ipss = st.number_input("Score IPSS (0–35)", min_value=0, max_value=35, value=12, step=1)
+        psa_total = st.number_input("PSA total (ng/mL)", min_value=0.0, max_value=100.0, value=ctx.valeur("psa", 3.5, 0.0, 100.0), step=0.1)
+        tr_suspect = st.radio("Toucher rectal suspect ?", ["Non","Oui"], index=int(ctx.valeur("tr_suspect", False)), horizontal=True) == "Oui"
+
+        st.markdown("#### Terrain / contre-indications")
+        anticoag = st.radio("Anticoagulants/antiagrégants ?", ["Non","Oui"], horizontal=True) == "Oui"
+        ci_chirurgie = st.radio("Contre-indication à la chirurgie ?", ["Non","Oui"], horizontal=True) == "Oui"
+        refus_chir = st.radio("Refus de la chirurgie ?", ["Non","Oui"], horizontal=True) == "Oui"
+
+        st.markdown("#### Complications HBP")
+        infections_recid = st.radio("Infections urinaires récidivantes ?", ["Non","Oui"], horizontal=True) == "Oui"
+        retention = st.radio("Rétention compliquée / sevrage impossible ?", ["Non","Oui"], horizontal=True) == "Oui"
+        calculs = st.radio("Calculs vésicaux ?", ["Non","Oui"], horizontal=True) == "Oui"
+        hematurie_recid = st.radio("Hématurie récidivante liée à l’HBP ?", ["Non","Oui"], horizontal=True) == "Oui"
+        ir_post_obstacle = st.radio("Altération rénale post-obstructive ?", ["Non","Oui"], horizontal=True) == "Oui"
+        echec_medical = st.radio("Échec / intolérance du traitement médical ?", ["Non","Oui"], horizontal=True) == "Oui"
+
+       
+
+        submitted = st.form_submit_button("🔎 Générer la CAT – HBP")
+
+    if submitted:
+        ctx.maj(age=age, volume_ml=volume_ml, psa=psa_total, tr_suspect=tr_suspect)
+        bandeau_patient(bandeau)
+        # évaluation incrémentale : seules les sections dont une entrée a changé depuis la dernière CAT
+        # sont recalculées (moteur.hbp.PLAN_HBP), et leur rendu refait
+        with chrono("moteur:PLAN_HBP"):
+            evaluation = st.session_state["hbp_evaluation"] = PLAN_HBP.evaluer(dict(
+                age=age, volume_ml=volume_ml, ipss=ipss, psa_total=psa_total, tr_suspect=tr_suspect,
+                anticoag=anticoag, ci_chirurgie=ci_chirurgie, refus_chir=refus_chir,
+                infections_recid=infections_recid, retention=retention, calculs=calculs,
+                hematurie_recid=hematurie_recid, ir_post_obstacle=ir_post_obstacle, echec_medical=echec_medical,
+            ), st.session_state.get("hbp_evaluation"))
+        plan = PLAN_HBP.resultat(evaluation)
+        donnees_html = rendu_section("hbp", evaluation, "donnees",
+                                     lambda: kv_table_html(plan["donnees"], "Élément", "Détail"))
+
+        render_kv_table("🧾 Données saisies", plan["donnees"], html=donnees_html)
+        st.markdown("### 💊 Traitement — Options numérotées")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+        if plan.get("notes"):
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        st.markdown("### 📤 Export"); offer_exports("CAT HBP", sections_hbp(plan), "CAT_HBP")
@@ -0,0 +1,221 @@
+# vues/infectio.py — pages Streamlit : Infectiologie (cystite, PNA, grossesse, prostatite)
+
+import streamlit as st
+
+from moteur.cache import plan_cystite, plan_pna, plan_grossesse, plan_prostatite
+from moteur.infectio import sections_infectio
+from .commun import go_module, btn_home_and_back, render_kv_table, offer_exports
+
+def render_infectio_menu():
+    btn_home_and_back()
+    st.markdown("## Infectiologie — Infections urinaires")
+    st.caption("Choisissez le sous-module")
+    c1, c2 = st.columns(2)
+    with c1:
+        st.button("Grossesse", use_container_width=True, on_click=lambda: go_module("IU: Grossesse"))
+        st.button("Cystite", use_container_width=True, on_click=lambda: go_module("IU: Cystite"))
+    with c2:
+        st.button("Pyélonéphrite aiguë (PNA)", use_container_width=True, on_click=lambda: go_module("IU: PNA"))
+        st.button("Infection masculine (Prostatite)", use_container_width=True, on_click=lambda: go_module("IU: Prostatite"))
+
+
+# ---------- UI — Cystite ----------
+def render_infectio_cystite_page():
+    btn_home_and_back(show_back=True, back_label="Infectiologie")
+    st.header("🔷 Cystite (hors grossesse) — triage simple / à risque / grave")
+
+    with st.form("cystite_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            age = st.number_input("Âge", min_value=12, max_value=100, value=28)
+            fievre_ge_38_5 = st.radio("Fièvre ≥ 38,5°C ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            lombalgies = st.radio("Douleur lombaire ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            douleurs_intenses = st.radio("Douleur intense ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            hematurie = st.radio("Hématurie ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            recidivante = st.radio("Cystites récidivantes ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with col2:
+            age_ge65_fragile = st.radio("≥65 ans fragile ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            anomalies_uro = st.radio("Anomalies uro/obstacle connu ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            immunodep = st.radio("Immunodépression ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            irc_significative = st.radio("IR chronique importante ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            sonde = st.radio("Sonde urinaire ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            diabete_non_controle = st.radio("Diabète non contrôlé ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with col3:
+            homme = st.radio("Sexe masculin ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            grossesse = st.radio("Grossesse ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            seps_sbp_lt90 = st.radio("TAS < 90 mmHg ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            seps_hr_gt120 = st.radio("FC > 120/min ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            confusion = st.radio("Confusion ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            vomissements = st.radio("Vomissements majeurs ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        submitted = st.form_submit_button("🔎 Générer la CAT — Cystite")
+
+    if submitted:
+        plan = plan_cystite(
+            age, fievre_ge_38_5, lombalgies, douleurs_intenses, hematurie, recidivante,
+            homme, grossesse, age_ge65_fragile, anomalies_uro, immunodep, irc_significative,
+            sonde, diabete_non_controle, seps_sbp_lt90, seps_hr_gt120, confusion, vomissements
+        )
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        render_kv_table("📊 Stratification", plan["classification"], "Élément", "Résultat")
+
+        st.markdown("### 💊 Options probabilistes / conduite")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 📅 Conduite et suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = sections_infectio(plan)
+        st.markdown("### 📤 Export")
+        offer_exports("CAT — Cystite", sections, "CAT_Cystite")
+
+
+
+# ---------- UI — PNA ----------
+def render_infectio_pna_page():
+    btn_home_and_back(show_back=True, back_label="Infectiologie")
+    st.header("🔷 Pyélonéphrite aiguë (PNA) — triage simple / à risque / grave")
+
+    with st.form("pna_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            fievre_ge_38_5 = st.radio("Fièvre ≥ 38,5°C ?", ["Oui", "Non"], horizontal=True) == "Oui"
+            douleur_lombaire = st.radio("Douleur lombaire ?", ["Oui", "Non"], horizontal=True) == "Oui"
+            vomissements = st.radio("Vomissements majeurs ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            homme = st.radio("Sexe masculin ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            grossesse = st.radio("Grossesse ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with col2:
+            age_ge65_fragile = st.radio("≥65 ans fragile ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            anomalies_uro = st.radio("Anomalies uro/obstacle ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            immunodep = st.radio("Immunodépression ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            irc_significative = st.radio("IR chronique importante ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            sonde = st.radio("Sonde urinaire ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            diabete_non_controle = st.radio("Diabète non contrôlé ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with col3:
+            seps_sbp_lt90 = st.radio("TAS < 90 mmHg ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            seps_hr_gt120 = st.radio("FC > 120/min ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            confusion = st.radio("Confusion ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        submitted = st.form_submit_button("🔎 Générer la CAT — PNA")
+
+    if submitted:
+        plan = plan_pna(
+            fievre_ge_38_5, douleur_lombaire, vomissements, homme, grossesse, age_ge65_fragile,
+            anomalies_uro, immunodep, irc_significative, sonde, diabete_non_controle,
+            seps_sbp_lt90, seps_hr_gt120, confusion
+        )
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        render_kv_table("📊 Stratification", plan["classification"], "Élément", "Résultat")
+
+        st.markdown("### 💊 Options probabilistes / conduite")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 📅 Conduite et suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = sections_infectio(plan)
+        st.markdown("### 📤 Export")
+        offer_exports("CAT — PNA", sections, "CAT_PNA")
+
+
+
+# ---------- UI — Grossesse ----------
+def render_infectio_grossesse_page():
+    btn_home_and_back(show_back=True, back_label="Infectiologie")
+    st.header("🔷 Infection urinaire au cours de la grossesse")
+
+    with st.form("iu_grossesse_form"):
+        type_tableau = st.selectbox("Tableau clinique", ["Bactériurie asymptomatique", "Cystite", "PNA"])
+        terme_9e_mois = st.radio("9e mois de grossesse ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        allergies_betalactamines = st.radio("Allergie bêta-lactamines ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        seps_sbp_lt90 = st.radio("TAS < 90 mmHg ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        seps_hr_gt120 = st.radio("FC > 120/min ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        vomissements = st.radio("Vomissements majeurs ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        submitted = st.form_submit_button("🔎 Générer la CAT — Grossesse")
+
+    if submitted:
+        plan = plan_grossesse(
+            type_tableau, terme_9e_mois, allergies_betalactamines,
+            seps_sbp_lt90, seps_hr_gt120, vomissements
+        )
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        render_kv_table("📊 Gravité", plan["classification"], "Élément", "Résultat")
+
+        st.markdown("### 💊 Options probabilistes / conduite")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 📅 Conduite et suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = sections_infectio(plan, "Gravité")
+        st.markdown("### 📤 Export")
+        offer_exports("CAT — IU Grossesse", sections, "CAT_IU_Grossesse")
+
+
+# ---------- UI — Prostatite ----------
+def render_infectio_homme_page():
+    btn_home_and_back(show_back=True, back_label="Infectiologie")
+    st.header("🔷 Infection masculine — Prostatite aiguë")
+
+    with st.form("iu_homme_form"):
+        col1, col2 = st.columns(2)
+        with col1:
+            fievre_ge_38_5 = st.radio("Fièvre ≥ 38,5°C ?", ["Oui", "Non"], horizontal=True) == "Oui"
+            douleurs_perineales = st.radio("Douleurs périnéales ?", ["Oui", "Non"], horizontal=True) == "Oui"
+            dysurie = st.radio("Dysurie ?", ["Oui", "Non"], horizontal=True) == "Oui"
+            retention = st.radio("Rétention aiguë ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            post_biopsie_prostate = st.radio("Post-biopsie prostatique récente ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with col2:
+            immunodep = st.radio("Immunodépression ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            irc_significative = st.radio("IR chronique importante ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            seps_sbp_lt90 = st.radio("TAS < 90 mmHg ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            seps_hr_gt120 = st.radio("FC > 120/min ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            confusion = st.radio("Confusion ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        submitted = st.form_submit_button("🔎 Générer la CAT — Prostatite")
+
+    if submitted:
+        plan = plan_prostatite(
+            fievre_ge_38_5, douleurs_perineales, dysurie, retention, post_biopsie_prostate,
+            immunodep, irc_significative, seps_sbp_lt90, seps_hr_gt120, confusion
+        )
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        render_kv_table("📊 Stratification", plan["classification"], "Élément", "Résultat")
+
+        st.markdown("### 💊 Options probabilistes / conduite")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 📅 Conduite et suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = sections_infectio(plan)
+        st.markdown("### 📤 Export")
+        offer_exports("CAT — Prostatite aiguë", sections, "CAT_Prostatite")
@@ -0,0 +1,73 @@
+# vues/lithiase.py — pages Streamlit : Lithiase urinaire
+
+import streamlit as st
+
+from moteur.cache import plan_lithiase
+from moteur.lithiase import sections_lithiase
+from .commun import btn_home_and_back, render_kv_table, offer_exports
+
+# -------------------------
+# LITHIASE (UI) — MAJ
+# -------------------------
+def render_lithiase_page():
+    btn_home_and_back()
+    st.header("🔷 Lithiase urinaire — Conduite à tenir")
+
+    with st.form("lithiase_form"):
+        st.markdown("#### Triage initial")
+        c1, c2, c3, c4 = st.columns(4)
+        with c1: fievre = st.radio("Fièvre / infection ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with c2: hyperalgique = st.radio("Douleur hyperalgique ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with c3: oligoanurie = st.radio("Oligo-anurie / IR ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with c4: doute_diag = st.radio("Doute diagnostique ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        st.markdown("#### Contexte")
+        c5, c6, c7 = st.columns(3)
+        with c5: grossesse = st.radio("Grossesse ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with c6: anticoag = st.radio("Anticoagulants / troubles hémostase non corrigés ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        with c7: douleur_actuelle = st.radio("Douleur actuelle ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        st.markdown("#### Calcul (si connu)")
+        c8, c9 = st.columns(2)
+        with c8:
+            localisation = st.selectbox(
+                "Localisation",
+                ["Uretère distal", "Uretère moyen", "Uretère proximal", "Rein (intracavicitaire)"],
+                index=0
+            )
+        with c9:
+            taille_mm = st.number_input("Taille estimée (mm)", min_value=0, max_value=40, value=5, step=1)
+
+        submitted = st.form_submit_button("🔎 Générer la CAT – Lithiase")
+
+    if submitted:
+        plan = plan_lithiase(
+            fievre=fievre,
+            hyperalgique=hyperalgique,
+            oligoanurie=oligoanurie,
+            doute_diag=doute_diag,
+            grossesse=grossesse,
+            anticoag=anticoag,
+            localisation=localisation,
+            taille_mm=taille_mm if taille_mm > 0 else None,
+            douleur_actuelle=douleur_actuelle,
+        )
+
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+
+        st.markdown("### 💊 Conduite à tenir (options classées)")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 🍽️ Règles hygiéno-diététiques")
+        for x in plan["hygiene"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        # Export
+        st.markdown("### 📤 Export")
+        offer_exports("CAT Lithiase", sections_lithiase(plan), "CAT_Lithiase")
@@ -0,0 +1,125 @@
+# vues/prostate.py — pages Streamlit : Tumeur de la prostate
+
+import streamlit as st
+
+from moteur.cache import plan_prostate_localise, plan_prostate_recidive, plan_prostate_metastatique
+from moteur.prostate import sections_prostate_localise
+from .commun import go_module, btn_home_and_back, render_kv_table, offer_exports, patient, bandeau_patient
+
+# =========================
+# PAGES — PROSTATE (UI)
+# =========================
+
+def render_prostate_menu():
+    btn_home_and_back()
+    st.markdown("## Tumeur de la prostate")
+    st.caption("Choisissez le sous-module")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.button("Localisée", use_container_width=True, on_click=lambda: go_module("Prostate: Localisée"))
+    with c2:
+        st.button("Récidive", use_container_width=True, on_click=lambda: go_module("Prostate: Récidive"))
+    with c3:
+        st.button("Métastatique", use_container_width=True, on_click=lambda: go_module("Prostate: Métastatique"))
+
+
+def render_prostate_localise_page():
+    btn_home_and_back(show_back=True, back_label="Tumeur de la prostate")
+    st.header("🔷 Prostate localisée — stratification & CAT")
+    ctx = patient()
+    bandeau = bandeau_patient()
+    stades = ["T1", "T2a", "T2b", "T2c", "T3a", "T3b", "T4"]
+    with st.form("prost_loc_form"):
+        cT = st.selectbox("Stade clinique (cT)", stades, index=stades.index(ctx.valeur("cT", "T1")))
+        psa = st.number_input("PSA (ng/mL)", min_value=0.0, step=0.1, value=float(ctx.valeur("psa", 7.0, 0.0)))
+        isup = st.selectbox("ISUP (1–5)", [1, 2, 3, 4, 5], index=ctx.valeur("isup", 1) - 1)
+        exp = st.number_input("Espérance de vie estimée (ans)", min_value=1, max_value=30, value=ctx.valeur("esperance_vie_ans", 12, 1, 30))
+        submitted = st.form_submit_button("🔎 Générer la CAT — Localisée")
+
+    if submitted:
+        ctx.maj(psa=psa, cT=cT, isup=isup, esperance_vie_ans=exp)
+        ctx.risque_damico()  # mémorisé pour les pages suivantes (bandeau, récidive)
+        bandeau_patient(bandeau)
+        plan = plan_prostate_localise(psa, isup, cT, exp)
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        render_kv_table("📊 Stratification", [("Risque", plan["risque"].upper())], "Élément", "Résultat")
+        st.markdown("### 💊 Options de traitement")
+        for x in plan["options"]:
+            st.markdown(f"- **{x['label']}** : {x['details']}")
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for n in plan["notes"]:
+                st.markdown(f"- {n}")
+
+        sections = sections_prostate_localise(plan)
+        st.markdown("### 📤 Export"); offer_exports("CAT Prostate Localisée", sections, "CAT_Prostate_Localisee")
+
+
+def render_prostate_recidive_page():
+    btn_home_and_back(show_back=True, back_label="Tumeur de la prostate")
+    st.header("🔷 Prostate — Récidive (biologique)")
+    bandeau_patient()  # rappel du risque initial (D'Amico) déjà calculé
+
+    with st.form("prost_rec_form"):
+        type_initial = st.selectbox("Traitement initial", ["Prostatectomie", "Radiothérapie"])
+        psa_actuel = st.number_input("PSA actuel (ng/mL)", min_value=0.0, step=0.01, value=0.18)
+        psa_nadir = None
+        conf = st.number_input("Nombre de dosages confirmant (si prostatectomie)", min_value=1, max_value=3, value=1)
+        if type_initial == "Radiothérapie":
+            psa_nadir = st.number_input("PSA nadir post-RT (si connu)", min_value=0.0, step=0.01, value=0.1)
+        submitted = st.form_submit_button("🔎 Évaluer la récidive")
+
+    if submitted:
+        plan = plan_prostate_recidive(type_initial, psa_actuel, psa_nadir, conf)
+        st.markdown(f"**Résumé :** {plan['resume']}")
+        st.markdown("### 💊 Options")
+        for x in plan["options"]:
+            st.markdown(f"- **{x['label']}** — *{x['degre']}*  \n  {x['details']}")
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for n in plan["notes"]:
+                st.markdown(f"- {n}")
+
+        sections = {
+            "Résumé": [plan["resume"]],
+            "Options": [f"{o['label']} — {o['degre']} : {o['details']}" for o in plan["options"]],
+            "Notes": plan["notes"],
+        }
+        st.markdown("### 📤 Export"); offer_exports("CAT Prostate Récidive", sections, "CAT_Prostate_Recidive")
+
+
+def render_prostate_meta_page():
+    btn_home_and_back(show_back=True, back_label="Tumeur de la prostate")
+    st.header("🔷 Prostate métastatique — mHSPC / mCRPC")
+
+    with st.form("prost_meta_form"):
+        testo_castration = st.radio("Testostérone < 50 ng/dL (castration) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        volume_eleve = st.radio("Volume de la maladie élevé (ex : haut volume) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        sympt_os = st.radio("Symptômes osseux ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        deja_doc = st.radio("Docétaxel déjà reçu ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        deja_arpi = st.radio("ARPI (abiratérone/enzalutamide/apalutamide) déjà reçu ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        alt_HRR = st.radio("Altération gènes HRR (BRCA/ATM) connue ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        submitted = st.form_submit_button("🔎 Générer la CAT — Métastatique")
+
+    if submitted:
+        plan = plan_prostate_metastatique(testo_castration, volume_eleve, sympt_os, deja_doc, deja_arpi, alt_HRR)
+        render_kv_table("🧾 Profil", [("Statut", plan["profil"])])
+        st.markdown("### 💊 Options")
+        for x in plan["options"]:
+            st.markdown(f"- **{x['label']}** — *{x['degre']}*  \n  {x['details']}")
+        if plan["adjoints"]:
+            st.markdown("### ➕ Mesures adjointes")
+            for a in plan["adjoints"]:
+                st.markdown(f"- {a}")
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for n in plan["notes"]:
+                st.markdown(f"- {n}")
+
+        sections = {
+            "Profil": [plan["profil"]],
+            "Options": [f"{o['label']} — {o['degre']} : {o['details']}" for o in plan["options"]],
+            "Mesures adjointes": plan["adjoints"],
+            "Notes": plan["notes"],
+        }
+        st.markdown("### 📤 Export"); offer_exports("CAT Prostate Métastatique", sections, "CAT_Prostate_Metastatique")
@@ -0,0 +1,120 @@
+# vues/rcp.py — page Streamlit : liste de travail RCP (dossiers multi-modules, évaluation en arrière-plan)
+# Le fichier chargé est évalué par moteur.rcp.ListeTravail (pool de threads) ; la liste est gardée en
+# session : feuilleter les dossiers relit les CAT déjà calculées, sans rappeler le moteur.
+
+import streamlit as st
+
+from .commun import btn_home_and_back, offer_exports
+
+CLE_LISTE = "rcp_liste"
+CLE_SIGNATURE = "rcp_signature"
+CLE_INDEX = "rcp_index"
+RAFRAICHISSEMENT_S = 0.5  # période de sondage de l'avancement tant que des dossiers sont en file
+
+
+def _charger(fichier):
+    """Nouvelle liste si le fichier a changé (les reruns réutilisent la liste en cours)."""
+    from moteur.rcp import ListeTravail, lire_cas, lire_fichier
+
+    signature = (fichier.name, fichier.size, getattr(fichier, "file_id", None))
+    if st.session_state.get(CLE_SIGNATURE) == signature:
+        return st.session_state.get(CLE_LISTE)
+    precedente = st.session_state.pop(CLE_LISTE, None)
+    if precedente is not None:
+        precedente.annuler()
+    st.session_state[CLE_SIGNATURE] = signature
+    st.session_state[CLE_INDEX] = 0
+    try:
+        cas = lire_cas(lire_fichier(fichier, fichier.name))
+    except ValueError as e:
+        st.error(f"Fichier non exploitable : {e}")
+        return None
+    if not cas:
+        st.warning("Aucun dossier dans le fichier.")
+        return None
+    liste = st.session_state[CLE_LISTE] = ListeTravail(cas)
+    return liste
+
+
+def _statut(liste, i):
+    if not liste.pret(i):
+        return "⏳ en cours"
+    return "⚠️ erreur" if liste.erreur(i) else "✅ prête"
+
+
+def _avancement(liste):
+    from moteur.export import RAPPORTS
+
+    n = liste.termines()
+    st.progress(n / len(liste), text=f"{n}/{len(liste)} CAT calculées")
+    with st.expander("📋 Dossiers de la séance", expanded=False):
+        st.dataframe(
+            [{"Dossier": c.ident, "Module": RAPPORTS[c.module].titre, "Statut": _statut(liste, i)}
+             for i, c in enumerate(liste.cas)],
+            use_container_width=True, hide_index=True,
+        )
+    if liste.complet and n and st.session_state.get("_rcp_sondage"):
+        st.session_state["_rcp_sondage"] = False
+        st.rerun()  # fin du calcul : rerun complet pour arrêter le sondage
+
+
+def _deplacer(pas, n):
+    st.session_state[CLE_INDEX] = min(max(st.session_state.get(CLE_INDEX, 0) + pas, 0), n - 1)
+
+
+def _afficher_cas(liste, i):
+    from moteur.export import RAPPORTS, slug_identifiant
+
+    cas = liste.cas[i]
+    if liste.pret(i):
+        erreur = liste.erreur(i)
+    else:
+        with st.spinner("CAT en cours de calcul…"):
+            erreur = liste.erreur(i)  # attend la fin du calcul de ce dossier
+    if erreur is not None:
+        st.error(f"Dossier {cas.ident} : évaluation impossible ({erreur}).")
+        return
+    titre, sections = liste.resultat(i)
+    st.subheader(f"Dossier {cas.ident} — {titre}")
+    for rubrique, lignes in sections.items():
+        if lignes:
+            st.markdown(f"### {rubrique}")
+            for x in lignes:
+                st.markdown("- " + x)
+    st.markdown("### 📤 Export")
+    offer_exports(titre, sections, f"{slug_identifiant(cas.ident)}_{RAPPORTS[cas.module].nom_fichier}")
+
+
+def render_rcp_page():
+    from moteur.batch import MODULES_LOT
+    from moteur.export import RAPPORTS
+
+    btn_home_and_back()
+    st.header("📋 RCP — liste de travail")
+    st.caption("Un fichier CSV ou JSONL, une ligne par dossier : colonne `module`, colonne `id` facultative, "
+               "puis les entrées du module. Les CAT sont calculées en arrière-plan dès le chargement.")
+    with st.expander("Modules et colonnes attendues"):
+        for module in RAPPORTS:
+            st.markdown(f"- **{module}** ({RAPPORTS[module].titre}) : " + ", ".join(MODULES_LOT[module].colonnes))
+
+    fichier = st.file_uploader("Liste des dossiers", type=["csv", "jsonl", "ndjson"], key="rcp_fichier")
+    if fichier is None:
+        st.info("Charger la liste de la séance pour lancer l'évaluation.")
+        return
+    liste = _charger(fichier)
+    if liste is None:
+        return
+
+    sondage = not liste.complet
+    st.session_state["_rcp_sondage"] = sondage
+    st.fragment(run_every=RAFRAICHISSEMENT_S if sondage else None)(_avancement)(liste)
+
+    n = len(liste)
+    c1, c2, c3 = st.columns([1, 4, 1])
+    c1.button("◀ Précédent", on_click=_deplacer, args=(-1, n), disabled=st.session_state.get(CLE_INDEX, 0) == 0,
+              use_container_width=True)
+    c2.selectbox("Dossier", range(n), key=CLE_INDEX, label_visibility="collapsed",
+                 format_func=lambda i: f"{i + 1}/{n} — {liste.cas[i].ident} · {RAPPORTS[liste.cas[i].module].titre}")
+    c3.button("Suivant ▶", on_click=_deplacer, args=(1, n), disabled=st.session_state.get(CLE_INDEX, 0) >= n - 1,
+              use_container_width=True)
+    _afficher_cas(liste, st.session_state[CLE_INDEX])
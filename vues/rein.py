@@ -0,0 +1,167 @@
+# vues/rein.py — pages Streamlit : Tumeur du rein
+
+import streamlit as st
+
+from moteur.rein import calc_mskcc, sections_rein_local
+from moteur.cache import plan_rein_local, plan_rein_meta
+from .commun import go_module, btn_home_and_back, render_kv_table, offer_exports, patient, bandeau_patient
+
+# -------------------------
+# cancer du rein  (UI)
+# -------------------------
+def render_kidney_menu():
+    btn_home_and_back()
+    st.markdown("## Tumeur du rein")
+    st.caption("Choisissez le sous-module")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.button("Non métastatique", use_container_width=True, on_click=lambda: go_module("Rein: Non métastatique"))
+    with c2:
+        st.button("Métastatique", use_container_width=True, on_click=lambda: go_module("Rein: Métastatique"))
+    with c3:
+        st.button("Indications de biopsie", use_container_width=True, on_click=lambda: go_module("Rein: Biopsie"))
+
+
+def render_kidney_local_page():
+    btn_home_and_back(show_back=True, back_label="Tumeur du rein")
+    st.header("🔷 Rein — tumeur non métastatique")
+
+    # Mapping libellé → cT
+    ct_labels = [
+        "Localisé — T1a (≤ 4 cm)",
+        "Localisé — T1b (> 4 à ≤ 7 cm)",
+        "Localisé — T2a (> 7 à ≤ 10 cm)",
+        "Localisé — T2b (> 10 cm)",
+        "Localement avancé — T3a",
+        "Localement avancé — T3b",
+        "Localement avancé — T3c",
+        "Localement avancé — T4",
+    ]
+    ct_map = {
+        "Localisé — T1a (≤ 4 cm)": "T1a",
+        "Localisé — T1b (> 4 à ≤ 7 cm)": "T1b",
+        "Localisé — T2a (> 7 à ≤ 10 cm)": "T2a",
+        "Localisé — T2b (> 10 cm)": "T2b",
+        "Localement avancé — T3a": "T3a",
+        "Localement avancé — T3b": "T3b",
+        "Localement avancé — T3c": "T3c",
+        "Localement avancé — T4": "T4",
+    }
+
+    with st.form("kidney_local_form"):
+        cT_label = st.selectbox("Catégorie (sans saisie de taille)", ct_labels, index=0)
+        cT = ct_map[cT_label]
+
+        cN_pos = st.radio("Adénopathies cliniques (cN+) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        thrombus = st.selectbox("Thrombus veineux", ["Aucun", "Veine rénale", "VCC infra-hépatique", "VCC supra-hépatique/atrium"])
+        rein_unique_ou_CKD = st.radio("Rein unique ou CKD significative ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        tumeur_hilaire = st.radio("Tumeur hilaire/centrale ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        exophytique = st.radio("Tumeur exophytique ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        age = st.number_input("Âge (ans)", min_value=18, max_value=100, value=62)
+        haut_risque_op = st.radio("Haut risque opératoire ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        biopsie_dispo = st.radio("Biopsie disponible ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        submitted = st.form_submit_button("🔎 Générer la CAT – Rein non métastatique")
+
+    if submitted:
+        plan = plan_rein_local(
+            cT, cN_pos, thrombus, rein_unique_ou_CKD, tumeur_hilaire,
+            exophytique, age, haut_risque_op, biopsie_dispo
+        )
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        st.markdown("### 💊 Traitement — Options numérotées")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+        st.markdown("### 📅 Modalités de suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+        sections = sections_rein_local(plan)
+        st.markdown("### 📤 Export"); offer_exports("CAT Rein non métastatique", sections, "CAT_Rein_Non_Metastatique")
+
+
+def render_kidney_meta_page():
+    btn_home_and_back(show_back=True, back_label="Tumeur du rein")
+    st.header("🔷 Rein — tumeur métastatique")
+    bandeau = bandeau_patient()
+    with st.form("kidney_meta_form"):
+        histo = st.selectbox("Histologie présumée/confirmée", ["ccRCC", "non-ccRCC (papillaire/chromophobe/autre)"])
+        risk_system = st.radio("Classification pronostique", ["IMDC (Heng)", "MSKCC (Motzer)"], horizontal=True)
+
+        st.markdown("#### Variables communes")
+        kps = st.slider("Karnofsky (%)", 50, 100, 90, step=10)
+        karnofsky_lt80 = (kps < 80)
+        time_le_12 = st.radio("Délai diagnostic → traitement systémique ≤ 12 mois ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        hb_basse = st.radio("Hb < LSN ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        ca_haut = st.radio("Calcium corrigé > LSN ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        if risk_system.startswith("IMDC"):
+            st.markdown("#### Variables spécifiques IMDC (Heng)")
+            neutro_hauts = st.radio("Neutrophiles > LSN ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            plaquettes_hautes = st.radio("Plaquettes > LSN ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            ldh_haut = False
+        else:
+            st.markdown("#### Variables spécifiques MSKCC (Motzer)")
+            ldh_haut = st.radio("LDH > LSN ?", ["Non", "Oui"], horizontal=True) == "Oui"
+            neutro_hauts = False
+            plaquettes_hautes = False
+
+        st.markdown("#### Charge tumorale & sites")
+        oligo = st.radio("Oligométastatique (nombre limité, résécable/irradiable) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        bone = st.radio("Métastases osseuses ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        brain = st.radio("Métastases cérébrales ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        liver = st.radio("Métastases hépatiques ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        io_contra = st.radio("Contre-indication à l’immunothérapie ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        submitted = st.form_submit_button("🔎 Générer la CAT – Rein métastatique")
+
+    if submitted:
+        if risk_system.startswith("IMDC"):
+            score, group = patient().imdc(karnofsky_lt80, time_le_12, hb_basse, ca_haut, neutro_hauts, plaquettes_hautes)
+            label = "IMDC (Heng)"
+        else:
+            score, group = calc_mskcc(karnofsky_lt80, time_le_12, hb_basse, ca_haut, ldh_haut)
+            label = "MSKCC (Motzer)"
+        bandeau_patient(bandeau)
+
+        plan = plan_rein_meta(
+            "ccRCC" if "ccRCC" in histo else "non-ccRCC",
+            score, group, label, oligo, bone, brain, liver, io_contra
+        )
+
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        render_kv_table("📊 Stratification", plan["stratification"], "Système", "Résultat")
+        st.markdown("### 💊 Traitement — Options numérotées")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+        st.markdown("### 📅 Modalités de suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = {
+            "Données": [f"{k}: {v}" for k, v in plan["donnees"]],
+            "Stratification": [f"{label}: {group} (score {score})"],
+            "Traitement (options)": plan["traitement"],
+            "Modalités de suivi": plan["suivi"],
+            "Notes": plan["notes"],
+        }
+        st.markdown("### 📤 Export"); offer_exports("CAT Rein métastatique", sections, "CAT_Rein_Metastatique")
+
+
+def render_kidney_biopsy_page():
+    btn_home_and_back(show_back=True, back_label="Tumeur du rein")
+    st.header("🔷 Rein — Indications de biopsie percutanée")
+    st.markdown("Les indications suivantes s’appliquent :")
+    st.markdown("- **Avant un traitement médical** en l’absence de diagnostic histologique ;")
+    st.markdown("- **Avant un traitement focal** (radiofréquence, curiethérapie ou radiothérapie) ;")
+    st.markdown("- **Avant une néphrectomie élargie** pour tumeur localisée si la néphrectomie partielle est jugée non réalisable (**cT1, cT2**) ;")
+    st.markdown("- **Avant une néphrectomie partielle** pour tumeur de complexité chirurgicale élevée et risque de totalisation ;")
+    st.markdown("- **En cas d’indication impérative**, de rein unique et de tumeurs bilatérales ;")
+    st.markdown("- **En cas d’incertitude diagnostique** (lymphome, métastase d’un autre cancer, carcinome urothélial, sarcome).")
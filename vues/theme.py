@@ -0,0 +1,42 @@
+# vues/theme.py — thème clair (vert) : feuille de style statique plutôt que <style> à chaque rerun
+
+from hashlib import sha1
+from pathlib import Path
+
+import streamlit as st
+
+FICHIER_CSS = Path(__file__).resolve().parent.parent / "static" / "theme.css"
+URL_CSS = "app/static/theme.css"
+# premières versions du service statique : .css renvoyé en text/plain + nosniff → ignoré par le navigateur.
+# 1.65 vérifiée (text/css) ; minimum aussi fixé dans requirements.txt
+STREAMLIT_CSS_STATIQUE = (1, 65)
+
+
+def _version_streamlit() -> tuple:
+    # "1.65.0" → (1, 65) ; suffixes (rc, dev) ignorés
+    return tuple(int("".join(c for c in x if c.isdigit()) or 0) for x in st.__version__.split(".")[:2])
+
+
+@st.cache_resource
+def _css() -> str:
+    # lu une seule fois par processus serveur
+    return FICHIER_CSS.read_text(encoding="utf-8")
+
+
+@st.cache_resource
+def _version() -> str:
+    # change à chaque modification du CSS → le navigateur ne garde pas une ancienne version
+    return sha1(_css().encode("utf-8")).hexdigest()[:10]
+
+
+def appliquer_theme() -> None:
+    """
+    Injecte le thème. Avec server.enableStaticServing (cf. .streamlit/config.toml), seul un <link>
+    de ~60 octets part à chaque rerun (il doit être renvoyé, sinon Streamlit retire l'élément du DOM) ;
+    le CSS lui-même est mis en cache par le navigateur. Sans service statique, ou avec un Streamlit trop ancien
+    pour servir le .css en text/css : repli sur le <style> en ligne.
+    """
+    if st.get_option("server.enableStaticServing") and _version_streamlit() >= STREAMLIT_CSS_STATIQUE:
+        st.markdown(f'<link rel="stylesheet" href="{URL_CSS}?v={_version()}">', unsafe_allow_html=True)
+    else:
+        st.markdown(f"<style>\n{_css()}</style>", unsafe_allow_html=True)
@@ -0,0 +1,119 @@
+# vues/tves.py — pages Streamlit : Tumeurs des voies excrétrices
+
+import streamlit as st
+
+from moteur.cache import plan_tves_localise, plan_tves_metastatique
+from moteur.tves import sections_tves_localise
+from .commun import go_module, btn_home_and_back, render_kv_table, offer_exports
+
+def render_tves_menu():
+    btn_home_and_back()
+    st.markdown("## Tumeurs des voies excrétrices")
+    st.caption("Choisissez le sous-module")
+    c1, c2 = st.columns(2)
+    with c1:
+        st.button("Localisé (non métastatique)", use_container_width=True, on_click=lambda: go_module("TVES: Localisé"))
+    with c2:
+        st.button("Métastatique", use_container_width=True, on_click=lambda: go_module("TVES: Métastatique"))
+
+
+def render_tves_local_page():
+    btn_home_and_back(show_back=True, back_label="Tumeurs des voies excrétrices")
+    st.header("🔷 TVES — localisé (UTUC non métastatique)")
+    with st.form("tves_local_form"):
+        grade_biopsie = st.selectbox("Grade biopsie URSS", ["Bas grade", "Haut grade", "Indéterminé"])
+        cytologie_hg_positive = st.radio("Cytologie haut grade positive ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        taille_cm = st.number_input("Taille lésion (cm)", min_value=0.2, max_value=10.0, value=1.5, step=0.1)
+        multifocal = st.radio("Multifocale ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        invasion_imagerie = st.radio("Invasion suspecte à l’imagerie (uro-TDM/IRM) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        hydron = st.radio("Hydronéphrose ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        kss_faisable = st.radio("Traitement conservateur complet réalisable ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        accepte_suivi_strict = st.radio("Patient accepte le suivi strict endoscopique/imagerie ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        localisation = st.selectbox("Localisation", ["Bassinets/caliciel", "Uretère proximal", "Uretère moyen", "Uretère distal"])
+        submitted = st.form_submit_button("🔎 Générer la CAT – TVES localisé")
+
+    if submitted:
+        plan = plan_tves_localise(
+            grade_biopsie, cytologie_hg_positive, taille_cm, multifocal,
+            invasion_imagerie, hydron, kss_faisable, accepte_suivi_strict,
+            localisation
+        )
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        render_kv_table("📊 Stratification", plan["stratification"], "Élément", "Résultat")
+
+        if len(plan["traitement"]) == 1:
+            st.markdown("### 🧭 Conduite recommandée")
+            for x in plan["traitement"]:
+                st.markdown("- " + x)
+        else:
+            st.markdown("### 💊 Traitement — Options numérotées")
+            for x in plan["traitement"]:
+                st.markdown("- " + x)
+
+        st.markdown("### 📅 Modalités de suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = sections_tves_localise(plan)
+        st.markdown("### 📤 Export"); offer_exports("CAT TVES localisé", sections, "CAT_TVES_Localise")
+
+def render_tves_meta_page():
+    btn_home_and_back(show_back=True, back_label="Tumeurs des voies excrétrices")
+    st.header("🔷 TVES — métastatique (algorithme EV+Pembro / Platine-Gem / Cis-Gem-Nivo)")
+
+    with st.form("tves_meta_form"):
+        ev_pembro_eligible = st.radio("Éligible à EV + Pembrolizumab (1L préférentielle) ?", ["Oui", "Non"], horizontal=True) == "Oui"
+
+        if not ev_pembro_eligible:
+            st.markdown("#### Si EV+Pembro non éligible :")
+            cis_eligible = st.radio("Éligible Cisplatine ?", ["Oui", "Non"], horizontal=True) == "Oui"
+            carbo_eligible = st.radio("Éligible Carboplatine ?", ["Oui", "Non"], horizontal=True) == "Oui"
+            use_cis_gem_nivo = False
+            if cis_eligible:
+                use_cis_gem_nivo = st.radio("Choisir 1L **Cisplatine + Gemcitabine + Nivolumab** ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        else:
+            # Valeurs par défaut si EV+Pembro éligible
+            cis_eligible = False
+            carbo_eligible = False
+            use_cis_gem_nivo = False
+
+        st.markdown("#### Historique & biomarqueurs")
+        platinum_naif = st.radio("Naïf de platine (vraie 1re ligne) ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        prior_platinum = st.radio("A déjà reçu une chimio à base de platine ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        prior_io = st.radio("A déjà reçu une immunothérapie (PD-1/PD-L1) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        fgfr_alt = st.radio("Altérations FGFR2/3 connues ?", ["Non", "Oui"], horizontal=True) == "Oui"
+
+        submitted = st.form_submit_button("🔎 Générer la CAT – TVES métastatique")
+
+    if submitted:
+        plan = plan_tves_metastatique(
+            ev_pembro_eligible, cis_eligible, carbo_eligible, platinum_naif,
+            fgfr_alt, prior_platinum, prior_io, use_cis_gem_nivo
+        )
+
+        render_kv_table("🧾 Données saisies", plan["donnees"])
+        st.markdown("### 💊 Traitement — Options numérotées")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 📅 Modalités de suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = {
+            "Données": [f"{k}: {v}" for k, v in plan["donnees"]],
+            "Traitement (options)": plan["traitement"],
+            "Modalités de suivi": plan["suivi"],
+            "Notes": plan["notes"],
+        }
+        st.markdown("### 📤 Export"); offer_exports("CAT TVES métastatique (algorithme actualisé)", sections, "CAT_TVES_Metastatique")
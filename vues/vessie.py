@@ -0,0 +1,161 @@
+# vues/vessie.py — pages Streamlit : Tumeur de la vessie (TVNIM, TVIM, métastatique)
+
+import streamlit as st
+
+from moteur.vessie import donnees_tvnim, sections_tvnim, stratifier_tvnim
+from moteur.cache import plan_tvnim, plan_tvim, plan_meta
+from .commun import go_module, btn_home_and_back, render_kv_table, offer_exports
+
+def render_vessie_menu():
+    btn_home_and_back()
+    st.markdown("## Tumeur de la vessie")
+    st.caption("Choisissez le sous-module")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        st.button("TVNIM", use_container_width=True, on_click=lambda: go_module("Vessie: TVNIM"))
+    with c2:
+        st.button("TVIM", use_container_width=True, on_click=lambda: go_module("Vessie: TVIM"))
+    with c3:
+        st.button("Métastatique", use_container_width=True, on_click=lambda: go_module("Vessie: Métastatique"))
+
+
+def render_tvnim_page():
+    btn_home_and_back(show_back=True)
+    st.header("🔷 TVNIM (tumeur n’infiltrant pas le muscle)")
+    with st.form("tvnim_form"):
+        stade = st.selectbox("Stade tumoral", ["pTa", "pT1"])
+        grade = st.selectbox("Grade tumoral", ["Bas grade", "Haut grade"])
+        taille = st.slider("Taille maximale (mm)", 1, 100, 10)
+        nombre = st.selectbox("Nombre de tumeurs", ["Unique", "Multiple", "Papillomatose vésicale"])
+        cis_associe = lvi = urethre_prostatique = formes_agressives = False
+        if stade == "pT1" and grade == "Haut grade":
+            st.markdown("#### Facteurs aggravants (pT1 haut grade) — cochez s’ils sont présents")
+            c1, c2 = st.columns(2)
+            with c1:
+                cis_associe = st.checkbox("CIS associé")
+                lvi = st.checkbox("Envahissement lymphovasculaire (LVI)")
+            with c2:
+                urethre_prostatique = st.checkbox("Atteinte de l’urètre prostatique")
+                formes_agressives = st.checkbox("Formes anatomo-pathologiques agressives")
+        submitted = st.form_submit_button("🔎 Générer la CAT")
+    if submitted:
+        risque = stratifier_tvnim(stade, grade, taille, nombre, cis_associe, lvi, urethre_prostatique, formes_agressives)
+        traitement, suivi, protocoles, notes_second_look = plan_tvnim(risque)
+        donnees_pairs = donnees_tvnim(stade, grade, taille, nombre, cis_associe, lvi, urethre_prostatique, formes_agressives)
+        render_kv_table("🧾 Données saisies", donnees_pairs)
+        render_kv_table("📊 Stratification", [("Risque estimé", risque.upper())], "Élément", "Résultat")
+        st.markdown("### 💊 Traitement recommandé")
+        for t in traitement: st.markdown("- " + t)
+        if protocoles:
+            st.markdown("### 📦 Schémas BCG (sans dose)")
+            for p in protocoles: st.markdown("- " + p)
+        st.markdown("### 📅 Modalités de suivi")
+        for s in suivi: st.markdown("- " + s)
+        st.markdown("### 📝 RTUV de second look — rappels")
+        for n in notes_second_look: st.markdown("- " + n)
+        sections = sections_tvnim(donnees_pairs, risque, traitement, suivi, protocoles, notes_second_look)
+        st.markdown("### 📤 Export"); offer_exports("CAT TVNIM", sections, "CAT_TVNIM")
+
+
+def render_tvim_page():
+    btn_home_and_back(show_back=True)
+    st.header("🔷 TVIM (tumeur infiltrant le muscle)")
+    with st.form("tvim_form"):
+        t_cat = st.selectbox("T (clinique)", ["T2", "T3", "T4a"])
+        cN_pos = st.radio("Atteinte ganglionnaire clinique (cN+) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        metastases = st.radio("Métastases à distance ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        st.markdown("#### Éligibilités & contexte")
+        cis_eligible = st.radio("Éligible Cisplatine (PS 0–1, DFG ≥50–60…)?", ["Oui", "Non"], horizontal=True) == "Oui"
+        hydron = st.radio("Hydronéphrose ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        bonne_fct_v = st.radio("Bonne fonction vésicale ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        cis_diffus = st.radio("CIS diffus ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        post_op_high_risk = st.radio("pT3–4 et/ou pN+ attendu/identifié ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        neo_adjuvant_fait = st.radio("Néoadjuvant déjà réalisé ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        submitted = st.form_submit_button("🔎 Générer la CAT – TVIM")
+    if submitted:
+        plan = plan_tvim(
+            t_cat, cN_pos, metastases, cis_eligible, hydron,
+            bonne_fct_v, cis_diffus, post_op_high_risk, neo_adjuvant_fait
+        )
+        donnees_pairs = [
+            ("T", t_cat), ("cN+", "Oui" if cN_pos else "Non"), ("Métastases", "Oui" if metastases else "Non"),
+            ("Éligible Cisplatine", "Oui" if cis_eligible else "Non"),
+            ("Hydronéphrose", "Oui" if hydron else "Non"),
+            ("Bonne fonction vésicale", "Oui" if bonne_fct_v else "Non"),
+            ("CIS diffus", "Oui" if cis_diffus else "Non"),
+            ("pT3–4/pN+ attendu/identifié", "Oui" if post_op_high_risk else "Non"),
+            ("NAC déjà faite", "Oui" if neo_adjuvant_fait else "Non"),
+        ]
+        render_kv_table("🧾 Données saisies", donnees_pairs)
+
+        st.markdown("### 💊 Traitement recommandé")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 📅 Modalités de suivi")
+        for x in plan["surveillance"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = {
+            "Données":[f"{k}: {v}" for k,v in donnees_pairs],
+            "Traitement recommandé": plan["traitement"],
+            "Modalités de suivi": plan["surveillance"],
+            "Notes": plan["notes"],
+        }
+        st.markdown("### 📤 Export")
+        offer_exports("CAT TVIM", sections, "CAT_TVIM")
+
+
+
+def render_vessie_meta_page():
+    btn_home_and_back(show_back=True)
+    st.header("🔷 Tumeur de la vessie métastatique")
+    with st.form("meta_form"):
+        st.markdown("#### Contexte & éligibilité")
+        platinum_naive = st.radio("Jamais traité par platine (1re ligne) ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        cis_eligible = st.radio("Éligible Cisplatine ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        carbo_eligible = st.radio("Éligible Carboplatine ?", ["Oui", "Non"], horizontal=True) == "Oui"
+        pdl1_pos = st.radio("PD-L1 positif (si dispo) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        prior_platinum = st.radio("A déjà reçu un platine ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        prior_cpi = st.radio("A déjà reçu une immunothérapie (CPI) ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        bone_mets = st.radio("Métastases osseuses ?", ["Non", "Oui"], horizontal=True) == "Oui"
+        submitted = st.form_submit_button("🔎 Générer la CAT – Métastatique")
+    if submitted:
+        plan = plan_meta(cis_eligible, carbo_eligible, platinum_naive, pdl1_pos, prior_platinum, prior_cpi, bone_mets)
+        donnees_pairs = [
+            ("1re ligne (naïf platine)", "Oui" if platinum_naive else "Non"),
+            ("Éligible Cisplatine", "Oui" if cis_eligible else "Non"),
+            ("Éligible Carboplatine", "Oui" if carbo_eligible else "Non"),
+            ("PD-L1 positif", "Oui" if pdl1_pos else "Non"),
+            ("Platines reçus", "Oui" if prior_platinum else "Non"),
+            ("CPI reçu", "Oui" if prior_cpi else "Non"),
+            ("Métastases osseuses", "Oui" if bone_mets else "Non"),
+        ]
+        render_kv_table("🧾 Données saisies", donnees_pairs)
+
+        st.markdown("### 💊 Traitement recommandé")
+        for x in plan["traitement"]:
+            st.markdown("- " + x)
+
+        st.markdown("### 📅 Modalités de suivi")
+        for x in plan["suivi"]:
+            st.markdown("- " + x)
+
+        if plan["notes"]:
+            st.markdown("### 📝 Notes")
+            for x in plan["notes"]:
+                st.markdown("- " + x)
+
+        sections = {
+            "Données":[f"{k}: {v}" for k,v in donnees_pairs],
+            "Traitement recommandé": plan["traitement"],
+            "Modalités de suivi": plan["suivi"],
+            "Notes": plan["notes"],
+        }
+        st.markdown("### 📤 Export")
+        offer_exports("CAT Vessie Métastatique", sections, "CAT_Vessie_Metastatique")